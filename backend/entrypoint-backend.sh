@@ -28,4 +28,4 @@ if [ -f "/app/scripts/init-shared-data.sh" ]; then
 fi
 
 # Run the original entrypoint (start.sh will load the secrets)
-exec /start.sh
\ No newline at end of file
+exec /start.sh "$@"
\ No newline at end of file
@@ -34,6 +34,17 @@ fi
 # Activate virtual environment
 export PATH="/app/.venv/bin:$PATH"
 
+# Worker mode: the background job workers run as their own compose service
+# (restarted by Docker on exit). The backend service applies migrations and
+# setup; the worker only waits for it to be healthy.
+if [ "$1" = "worker" ]; then
+    export DJANGO_API_KEY
+    export SECRET_KEY
+    export THOTH_JOB_RUNNER=external
+    echo "Starting background job workers..."
+    exec /app/.venv/bin/python manage.py run_workers --threads 2
+fi
+
 # Ensure backend database directory exists
 mkdir -p /app/backend_db
 
@@ -419,6 +430,9 @@ echo "DEBUG: SECRET_KEY value is: ${SECRET_KEY:0:20}..."
 export DJANGO_API_KEY
 export SECRET_KEY
 
+# Background jobs run in the worker service, not in the web workers
+export THOTH_JOB_RUNNER=external
+
 # Start Django with Gunicorn for production
 echo "Starting Gunicorn production server..."
 
@@ -0,0 +1,70 @@
+import threading
+import time
+
+import pytest
+
+from thoth_ai_backend import mermaid_utils
+from thoth_core.thoth_ai import artifact_cache
+from thoth_core.thoth_ai.artifact_cache import cached_sections
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("THOTH_ARTIFACT_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(artifact_cache, "ENABLED", True)
+    return tmp_path
+
+
+def test_only_changed_sections_are_rendered():
+    rendered = []
+
+    def render(table):
+        rendered.append(table)
+        return f"<h3>{table}</h3>"
+
+    first = cached_sections("doc_tables", "1_en", [("a1", "a"), ("b1", "b")], render)
+    assert first == ["<h3>a</h3>", "<h3>b</h3>"]
+
+    second = cached_sections("doc_tables", "1_en", [("a1", "a"), ("b2", "b*")], render)
+    assert second == ["<h3>a</h3>", "<h3>b*</h3>"]
+    assert rendered == ["a", "b", "b*"]
+
+
+def test_diagrams_render_concurrently_and_once(monkeypatch):
+    calls = []
+    lock = threading.Lock()
+
+    def fake_request(content, extension):
+        with lock:
+            calls.append((content, extension))
+        time.sleep(0.2)
+        return f"{extension}:{content}".encode("utf-8")
+
+    monkeypatch.setattr(mermaid_utils, "_request_mermaid_image", fake_request)
+    diagrams = [("erDiagram A", "svg"), ("erDiagram A", "png"), ("erDiagram B", "svg")]
+
+    started = time.perf_counter()
+    results = mermaid_utils.generate_mermaid_images(diagrams)
+    assert time.perf_counter() - started < 0.5
+    assert all(success for success, _, _ in results)
+    with open(results[1][1], "rb") as f:
+        assert f.read() == b"png:erDiagram A"
+
+    assert mermaid_utils.generate_mermaid_images(diagrams) == results
+    assert len(calls) == 3
+
+
+def test_failed_render_is_reported_and_not_cached(monkeypatch):
+    def failing_request(content, extension):
+        raise mermaid_utils.MermaidServiceError("Mermaid service returned status 500")
+
+    monkeypatch.setattr(mermaid_utils, "_request_mermaid_image", failing_request)
+    assert mermaid_utils.generate_mermaid_image("erDiagram C") == (
+        False,
+        None,
+        "Mermaid service returned status 500",
+    )
+
+    monkeypatch.setattr(mermaid_utils, "_request_mermaid_image", lambda content, ext: b"<svg/>")
+    success, path, _ = mermaid_utils.generate_mermaid_image("erDiagram C")
+    assert success and path.endswith(".svg")
@@ -0,0 +1,92 @@
+import pytest
+
+from thoth_core.bulk_csv_import import (
+    ImportStats,
+    ReferenceMap,
+    SkipRow,
+    bulk_import_csv,
+    iter_csv_chunks,
+)
+from thoth_core.models import SqlDb, SqlTable
+
+
+def test_iter_csv_chunks_streams_rows_in_chunks(tmp_path):
+    path = tmp_path / "tables.csv"
+    path.write_text("id,name\n" + "".join(f"{i},t{i}\n" for i in range(5)))
+
+    chunks = list(iter_csv_chunks(str(path), chunk_size=2))
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert chunks[2][0] == {"id": "4", "name": "t4"}
+
+
+def test_reference_map_resolves_known_references_without_queries():
+    tables = ReferenceMap(SqlTable)
+    tables.add("284", 284)
+    tables.load(["284", " 284 "])
+
+    assert tables.resolve(" 284", "Table") == 284
+    with pytest.raises(SkipRow, match="Missing Table"):
+        tables.resolve("", "Table")
+
+
+def test_import_stats_summary_reports_rows_per_second():
+    stats = ImportStats(rows=500, created=400, updated=100, seconds=0.5)
+
+    assert stats.rows_per_sec == 1000.0
+    assert "1000.0 rows/sec" in stats.summary("Columns")
+
+
+def import_tables(path):
+    # The row builder of the import_sqltable command
+    databases = ReferenceMap(SqlDb, fallback_field="name")
+
+    def build_row(row):
+        return {
+            "id": row.get("id"),
+            "name": row["name"],
+            "sql_db_id": databases.resolve(row.get("sql_db"), "SqlDb"),
+            "description": row.get("description", ""),
+        }
+
+    return bulk_import_csv(
+        str(path),
+        SqlTable,
+        build_row,
+        update_fields=["name", "sql_db", "description"],
+        references={"sql_db": databases},
+        match_on=("name", "sql_db_id"),
+        chunk_size=2,
+        label="SqlTable",
+    )
+
+
+@pytest.mark.django_db
+def test_bulk_import_is_idempotent_and_resolves_references(tmp_path):
+    db = SqlDb.objects.create(name="california_schools", db_name="california_schools")
+    path = tmp_path / "sqltable.csv"
+    rows = (
+        "id,name,sql_db,description\n"
+        f"9101,schools,{db.pk},Schools\n"
+        # Older exports reference the database by name
+        "9102,frpm,california_schools,Free meals\n"
+        f",satscores,{db.pk},SAT scores\n"
+        "9103,orphan,999999,No such database\n"
+    )
+    path.write_text(rows)
+
+    first = import_tables(path)
+    assert (first.created, first.updated, first.skipped, first.errors) == (3, 0, 1, 0)
+    assert "SqlDb '999999' not found" in first.warnings[0]
+
+    path.write_text(rows.replace("Free meals", "Free or reduced price meals"))
+    second = import_tables(path)
+    assert (second.created, second.updated, second.skipped, second.errors) == (0, 3, 1, 0)
+
+    tables = {table.name: table for table in SqlTable.objects.filter(sql_db=db)}
+    assert sorted(tables) == ["frpm", "satscores", "schools"]
+    assert SqlTable.objects.filter(sql_db=db).count() == 3
+    assert tables["schools"].pk == 9101
+    assert tables["frpm"].pk == 9102
+    assert tables["frpm"].description == "Free or reduced price meals"
+    assert not SqlTable.objects.filter(name="orphan").exists()
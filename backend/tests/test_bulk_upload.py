@@ -0,0 +1,78 @@
+import threading
+
+from thoth_qdrant import EvidenceDocument, ThothType
+
+from thoth_ai_backend.preprocessing.bulk_upload import content_document_id, sync_documents
+
+
+class FakeVectorStore:
+    def __init__(self):
+        self.documents = {}
+        self.bulk_calls = []
+        self.lock = threading.Lock()
+
+    def get_documents_by_type(self, thoth_type):
+        return [
+            doc for doc in self.documents.values() if doc.thoth_type in (thoth_type, thoth_type.value)
+        ]
+
+    def bulk_add_documents(self, documents, policy=None):
+        with self.lock:
+            self.bulk_calls.append(len(documents))
+            for doc in documents:
+                self.documents[doc.id] = doc
+        return [doc.id for doc in documents]
+
+    def delete_document(self, doc_id):
+        with self.lock:
+            self.documents.pop(doc_id, None)
+
+
+def evidence_docs(texts):
+    for text in texts:
+        yield EvidenceDocument(
+            id=content_document_id(ThothType.EVIDENCE, text), evidence=text, text=text
+        )
+
+
+def test_content_document_id_is_stable_and_whitespace_insensitive():
+    assert content_document_id(ThothType.EVIDENCE, "a  b") == content_document_id(
+        ThothType.EVIDENCE, " a b\n"
+    )
+    assert content_document_id(ThothType.EVIDENCE, "a b") != content_document_id(
+        ThothType.SQL, "a b"
+    )
+
+
+def test_sync_uploads_in_batches_and_skips_unchanged():
+    store = FakeVectorStore()
+    texts = [f"evidence {i}" for i in range(25)]
+
+    stats = sync_documents(store, ThothType.EVIDENCE, evidence_docs(texts), batch_size=10)
+    assert stats["uploaded"] == 25
+    assert sorted(store.bulk_calls) == [5, 10, 10]
+
+    progress = []
+    stats = sync_documents(
+        store,
+        ThothType.EVIDENCE,
+        evidence_docs(texts),
+        on_progress=lambda *counts: progress.append(counts),
+        batch_size=10,
+    )
+    assert stats["uploaded"] == 0
+    assert stats["skipped"] == 25
+    assert len(store.bulk_calls) == 3
+    assert progress[-1] == (25, 25, 0)
+
+
+def test_sync_deletes_documents_no_longer_in_source():
+    store = FakeVectorStore()
+    sync_documents(store, ThothType.EVIDENCE, evidence_docs(["a", "b", "c"]))
+
+    stats = sync_documents(store, ThothType.EVIDENCE, evidence_docs(["b", "c", "d", "d"]))
+
+    assert stats["uploaded"] == 1
+    assert stats["skipped"] == 3
+    assert stats["deleted"] == 1
+    assert sorted(doc.evidence for doc in store.documents.values()) == ["b", "c", "d"]
@@ -0,0 +1,93 @@
+import threading
+import time
+from types import SimpleNamespace
+
+from thoth_core.thoth_ai.thoth_workflow import comment_engine
+from thoth_core.thoth_ai.thoth_workflow.comment_engine import (
+    RateLimiter,
+    prefetch_tables,
+    run_llm_calls,
+)
+from thoth_core.thoth_ai.thoth_workflow.create_table_comments import CircuitBreaker
+
+
+def test_llm_calls_run_concurrently():
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    def call(value):
+        with lock:
+            active.append(value)
+            peak.append(len(active))
+        time.sleep(0.05)
+        with lock:
+            active.remove(value)
+        return value * 2
+
+    results = run_llm_calls(
+        {i: i for i in range(8)}, call, CircuitBreaker(), concurrency=4, rate_limiter=RateLimiter(0)
+    )
+
+    assert {key: r.output for key, r in results.items()} == {i: i * 2 for i in range(8)}
+    assert max(peak) == 4
+
+
+def test_open_circuit_fails_remaining_calls_fast():
+    calls = []
+
+    def call(value):
+        calls.append(value)
+        raise RuntimeError("provider down")
+
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60)
+    results = run_llm_calls(
+        {i: i for i in range(5)}, call, breaker, concurrency=1, rate_limiter=RateLimiter(0)
+    )
+
+    assert calls == [0, 1]
+    assert [results[i].circuit_open for i in range(5)] == [False, False, True, True, True]
+    assert results[0].error == "provider down"
+
+
+def test_rate_limiter_spaces_calls_after_burst():
+    limiter = RateLimiter(per_minute=600, burst=2)
+    assert limiter.acquire() == 0.0
+    assert limiter.acquire() == 0.0
+    assert limiter.acquire() > 0.05
+
+
+def test_prefetch_opens_one_manager_per_database(monkeypatch):
+    opened = []
+
+    class FakeManager:
+        def get_table_schema(self, table_name):
+            return f"CREATE TABLE {table_name}"
+
+        def get_example_data(self, table_name, rows):
+            if table_name == "broken":
+                raise RuntimeError("permission denied")
+            return {"id": list(range(rows))}
+
+    def setup(sql_db):
+        opened.append(sql_db.name)
+        if sql_db.name == "offline":
+            raise RuntimeError("connection refused")
+        return FakeManager()
+
+    monkeypatch.setattr(comment_engine, "setup_sql_db", setup)
+    shop = SimpleNamespace(name="shop")
+    offline = SimpleNamespace(name="offline")
+    tables = [
+        SimpleNamespace(id=1, name="orders", sql_db_id=1, sql_db=shop),
+        SimpleNamespace(id=2, name="broken", sql_db_id=1, sql_db=shop),
+        SimpleNamespace(id=3, name="items", sql_db_id=2, sql_db=offline),
+    ]
+
+    prefetched = prefetch_tables(tables, example_rows=3, max_connections=2)
+
+    assert opened == ["shop", "offline"]
+    assert prefetched[1].schema == "CREATE TABLE orders"
+    assert prefetched[1].example_data == {"id": [0, 1, 2]}
+    assert prefetched[2].example_error == "permission denied"
+    assert "connection refused" in prefetched[3].error
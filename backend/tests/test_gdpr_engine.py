@@ -0,0 +1,69 @@
+import re
+
+from thoth_core.thoth_ai.thoth_workflow.gdpr_engine import GDPRClassifier, detect_content_types
+from thoth_core.thoth_ai.thoth_workflow.gdpr_scanner import (
+    GDPR_PATTERNS,
+    ID_PATTERNS,
+    identify_sensitive_column,
+)
+
+NAMES = [
+    "first_name", "Email_Address", "phone_number", "street", "iban", "credit_card",
+    "ip_address", "diagnosis", "religion", "salary", "latitude", "employee_code",
+    "customer_id", "userid", "pk_orders", "ID", "amount", "status", "created_at",
+    "description", "correo", "Date_Of_Birth", "session_token", "", "nom",
+]
+
+
+def legacy_identify(column_name):
+    for pattern in ID_PATTERNS:
+        if re.search(pattern, column_name, re.IGNORECASE):
+            return []
+    matches = []
+    for category_group, patterns_dict in GDPR_PATTERNS.items():
+        for pattern_type, pattern_info in patterns_dict.items():
+            if any(re.search(pattern, column_name) for pattern in pattern_info["patterns"]):
+                matches.append((pattern_type, category_group, pattern_info["sensitivity"]))
+    return matches
+
+
+def test_compiled_classifier_matches_per_pattern_search():
+    classifier = GDPRClassifier(GDPR_PATTERNS, ID_PATTERNS)
+    for name in NAMES:
+        compiled = [(m["pattern_type"], m["category_group"], m["sensitivity"]) for m in classifier.identify(name)]
+        assert compiled == legacy_identify(name), name
+
+
+def test_id_columns_are_never_reported():
+    assert identify_sensitive_column("customer_id") == []
+    assert identify_sensitive_column("FK_PERSON") == []
+    assert identify_sensitive_column("email")[0]["score"] == 3
+
+
+def test_content_detection_by_sampled_values():
+    samples = {
+        "contact": ["anna@example.com", "bob@example.org", None, ""],
+        "acct": ["IT60 X054 2811 1010 0000 0123 456", "de89370400440532013000"],
+        "mobile": ["+39 333 123 4567", "+44 20 7946 0958", "n/a"],
+        "created": ["2024-01-05", "2024-02-11"],
+        "notes": ["call anna@example.com", "ok"],
+        "amount": [12.5, 3],
+    }
+    assert detect_content_types(samples) == {"contact": "email", "acct": "banking", "mobile": "phone"}
+
+
+def test_content_detection_batches_tables():
+    samples = {(1, "a"): ["x@y.io"], (2, "a"): ["plain"], (2, "b"): ["+4915112345678"]}
+    assert detect_content_types(samples) == {(1, "a"): "email", (2, "b"): "phone"}
+    assert detect_content_types({}) == {}
+
+
+def test_phone_detection_ignores_dates_decimals_and_ranges():
+    samples = {
+        "dotted_date": ["01.02.2023", "15.03.2024"],
+        "decimal": ["1234.56", "99.10"],
+        "range": ["10-20", "30-40"],
+        "long_decimal": ["12345678.90", "87654321.01"],
+        "landline": ["055 123 4567", "(02) 1234 5678"],
+    }
+    assert detect_content_types(samples) == {"landline": "phone"}
@@ -0,0 +1,96 @@
+import threading
+import time
+from types import SimpleNamespace
+
+from thoth_core.health_check import (
+    HealthCheckStatus,
+    HealthProber,
+    ProbeTarget,
+    probe_vector_database,
+)
+
+
+class FakeProber(HealthProber):
+    def __init__(self, probes, **kwargs):
+        super().__init__(**kwargs)
+        self.probes = probes
+        self.calls = []
+        self._calls_lock = threading.Lock()
+
+    def load_targets(self):
+        def make(name, probe):
+            def run():
+                with self._calls_lock:
+                    self.calls.append(name)
+                return probe()
+
+            return ProbeTarget(f"sql:{name}", name, "PostgreSQL", "db", run)
+
+        return {
+            "sql_databases": [make(name, probe) for name, probe in self.probes.items()],
+            "vector_databases": [],
+        }
+
+
+def slow(seconds, healthy=True):
+    def probe():
+        time.sleep(seconds)
+        return healthy, "ok"
+
+    return probe
+
+
+def test_probes_run_concurrently_with_per_target_timeout():
+    prober = FakeProber(
+        {"a": slow(0.1), "b": slow(0.1), "c": slow(0.1), "hung": slow(1.0)},
+        interval=0,
+        timeout=0.3,
+        concurrency=4,
+    )
+    started = time.perf_counter()
+    section = prober.get_section("sql_databases")
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.6
+    assert section["status"] == HealthCheckStatus.DEGRADED
+    assert section["healthy_count"] == 3
+    hung = next(d for d in section["databases"] if d["name"] == "hung")
+    assert hung["status"] == HealthCheckStatus.UNHEALTHY
+    assert hung["message"] == "No response within 0.3s"
+    prober.stop()
+
+
+def test_cached_results_are_served_until_refresh():
+    prober = FakeProber({"a": slow(0), "b": lambda: (_ for _ in ()).throw(OSError("refused"))}, interval=0, timeout=1)
+
+    first = prober.get_section("sql_databases")
+    assert sorted(prober.calls) == ["a", "b"]
+    assert first["databases"][1]["message"] == "Connection failed: refused"
+
+    prober.get_section("sql_databases")
+    assert len(prober.calls) == 2
+
+    prober.get_section("sql_databases", refresh=True)
+    assert len(prober.calls) == 4
+    prober.stop()
+
+
+def test_hung_probe_is_not_started_twice():
+    release = threading.Event()
+
+    def blocked():
+        release.wait(2)
+        return True, "ok"
+
+    prober = FakeProber({"hung": blocked}, interval=0, timeout=0.1)
+    prober.refresh()
+    prober.refresh()
+    assert prober.calls == ["hung"]
+    release.set()
+    prober.stop()
+
+
+def test_vector_probe_without_host_only_validates_configuration():
+    local = SimpleNamespace(name="docs", vect_type="Qdrant", host="", port=None, url="")
+    assert probe_vector_database(local) == (True, "Configuration valid (local storage)")
+    assert probe_vector_database(SimpleNamespace(name="", vect_type="Qdrant"))[0] is False
@@ -0,0 +1,160 @@
+import threading
+from datetime import timedelta
+from types import SimpleNamespace
+
+import pytest
+from django.utils import timezone
+
+from thoth_core import job_queue
+from thoth_core.job_queue import (
+    JobCancelled,
+    JobContext,
+    JobInterrupted,
+    _parse_concurrency,
+    cancel_job,
+    claim_next_job,
+    concurrency_limit,
+    enqueue,
+    get_job_for_task_id,
+    requeue_stale_jobs,
+)
+from thoth_core.models import BackgroundJob, JobStatus
+
+
+def make_job(**overrides):
+    values = {"pk": 7, "payload": {"workspace_id": 3}, "checkpoint": None, "cancel_requested": False}
+    values.update(overrides)
+    job = SimpleNamespace(**values)
+    job.task_id = f"job-{job.pk}"
+    return job
+
+
+def test_parse_concurrency_ignores_invalid_entries():
+    assert _parse_concurrency("preprocessing=2, evidence_upload = 0,bogus,db_elements=x") == {
+        "preprocessing": 2,
+        "evidence_upload": 1,
+    }
+    assert concurrency_limit("table_comments") == 1
+
+
+def test_context_raises_on_cancel_and_shutdown():
+    stop_event = threading.Event()
+    context = JobContext(make_job(), stop_event)
+    assert not context.resumed
+    context.raise_if_cancelled()
+
+    stop_event.set()
+    with pytest.raises(JobInterrupted):
+        context.raise_if_cancelled()
+
+    context.mark_cancelled()
+    with pytest.raises(JobCancelled):
+        context.raise_if_cancelled()
+
+
+def test_context_of_cancelled_job_with_checkpoint():
+    context = JobContext(make_job(cancel_requested=True, checkpoint={"done_ids": [1]}))
+    assert context.resumed
+    assert context.cancelled
+    assert context.task_id == "job-7"
+
+
+def test_task_ids_not_written_by_jobs_are_ignored():
+    assert get_job_for_task_id(None) is None
+    assert get_job_for_task_id("3f0c2a1e-uuid") is None
+    assert get_job_for_task_id("job-abc") is None
+
+
+@pytest.fixture
+def queue(monkeypatch):
+    # Keep enqueue() from waking an embedded worker pool
+    monkeypatch.setattr(job_queue, "RUNNER_MODE", "external")
+    abandoned = []
+    monkeypatch.setattr(job_queue, "_run_abandon_hook", abandoned.append)
+    return abandoned
+
+
+def make_stale(job):
+    BackgroundJob.objects.filter(pk=job.pk).update(
+        heartbeat_at=timezone.now() - timedelta(minutes=10)
+    )
+
+
+@pytest.mark.django_db
+def test_jobs_are_claimed_oldest_first(queue):
+    first = enqueue("evidence_upload", {"workspace_id": 1})
+    second = enqueue("evidence_upload", {"workspace_id": 2})
+
+    claimed = claim_next_job("worker-a")
+    assert claimed.pk == first.pk
+    assert claimed.status == JobStatus.RUNNING
+    assert claimed.worker_id == "worker-a"
+    assert claimed.attempts == 1
+    assert claim_next_job("worker-b").pk == second.pk
+    assert claim_next_job("worker-c") is None
+
+
+@pytest.mark.django_db
+def test_claim_respects_per_type_concurrency(queue):
+    first = enqueue("preprocessing", {"workspace_id": 1})
+    enqueue("preprocessing", {"workspace_id": 2})
+    upload = enqueue("evidence_upload", {"workspace_id": 1})
+
+    assert claim_next_job("worker-a").pk == first.pk
+    # preprocessing allows one running job; the upload is claimed instead
+    assert claim_next_job("worker-b").pk == upload.pk
+    assert claim_next_job("worker-c") is None
+    assert claim_next_job("worker-c", job_types=["evidence_upload"]) is None
+
+
+@pytest.mark.django_db
+def test_stale_job_is_requeued_and_claimed_again(queue):
+    job = enqueue("questions_upload", {"workspace_id": 1})
+    claim_next_job("worker-a")
+    make_stale(job)
+
+    assert requeue_stale_jobs(stale_after=60) == 1
+    job.refresh_from_db()
+    assert job.status == JobStatus.QUEUED
+    assert job.worker_id == ""
+
+    reclaimed = claim_next_job("worker-b")
+    assert reclaimed.pk == job.pk
+    assert reclaimed.attempts == 2
+    assert queue == []
+
+
+@pytest.mark.django_db
+def test_stale_job_without_attempts_left_fails(queue):
+    job = enqueue("questions_upload", {"workspace_id": 1}, max_attempts=1)
+    claim_next_job("worker-a")
+    make_stale(job)
+
+    assert requeue_stale_jobs(stale_after=60) == 0
+    job.refresh_from_db()
+    assert job.status == JobStatus.FAILED
+    assert "no attempts are left" in job.error
+    assert job.finished_at is not None
+    assert [j.pk for j in queue] == [job.pk]
+    assert claim_next_job("worker-b") is None
+
+
+@pytest.mark.django_db
+def test_cancel_queued_and_running_jobs(queue):
+    running = enqueue("evidence_upload", {"workspace_id": 1})
+    queued = enqueue("evidence_upload", {"workspace_id": 2})
+    claim_next_job("worker-a")
+
+    assert cancel_job(queued.pk)
+    queued.refresh_from_db()
+    assert queued.status == JobStatus.CANCELLED
+    assert [j.pk for j in queue] == [queued.pk]
+
+    # A running job is only asked to stop at its next checkpoint
+    assert cancel_job(running.pk)
+    running.refresh_from_db()
+    assert running.status == JobStatus.RUNNING
+    assert running.cancel_requested
+
+    assert claim_next_job("worker-b") is None
+    assert not cancel_job(queued.pk)
@@ -0,0 +1,95 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from thoth_core.latency_rollup import ALL, PIPELINE_PHASES, bucket_start, group_samples, percentile, summarize
+from thoth_core.models import PipelineLatencyRollup, RollupGranularity
+from thoth_core.serializers import ThothLogSerializer
+
+
+def test_percentile_matches_linear_interpolation():
+    values = list(range(1, 101))
+
+    assert percentile(values, 50) == 50
+    assert percentile(values, 90) == 90
+    assert percentile(values, 99) == 99
+    assert percentile([], 90) == 0
+    assert percentile([42], 99) == 42
+
+
+def test_summarize_reports_percentiles_and_bounds():
+    summary = summarize([300, 100, 200])
+
+    assert summary["sample_count"] == 3
+    assert summary["min_ms"] == 100
+    assert summary["max_ms"] == 300
+    assert summary["p50_ms"] == 200
+    assert summary["mean_ms"] == 200
+
+
+def test_bucket_start_truncates_to_utc_hour_and_day():
+    rome = timezone(timedelta(hours=2))
+    value = datetime(2025, 6, 1, 1, 45, 12, tzinfo=rome)
+
+    assert bucket_start(value, RollupGranularity.HOUR) == datetime(
+        2025, 5, 31, 23, 0, tzinfo=timezone.utc
+    )
+    assert bucket_start(value, RollupGranularity.DAY) == datetime(
+        2025, 5, 31, tzinfo=timezone.utc
+    )
+
+
+def test_group_samples_by_agent_identifier():
+    durations = [0] * len(PIPELINE_PHASES)
+    durations[list(PIPELINE_PHASES).index("sql_generation")] = 100
+    rows = [("ws", "sql_expert", *durations), ("ws", "sql_expert", *durations), ("ws", "", *durations)]
+
+    samples = group_samples(rows)
+
+    assert samples[("sql_generation", "ws", "sql_expert")] == [100, 100]
+    assert samples[("sql_generation", ALL, ALL)] == [100, 100, 100]
+    assert {agent for _, _, agent in samples} == {ALL, "sql_expert"}
+
+
+def test_serializer_accepts_long_selection_reason():
+    serializer = ThothLogSerializer(
+        data={
+            "username": "user",
+            "workspace": "ws",
+            "started_at": "2025-06-01T10:05:00Z",
+            "question": "How many schools?",
+            "db_language": "en",
+            "question_language": "en",
+            "successful_agent_name": "Selected from 5 candidates - Belt and Suspenders: " + "x" * 1000,
+            "sql_agent_name": "sql_expert",
+        }
+    )
+
+    assert serializer.is_valid(), serializer.errors
+
+
+@pytest.mark.django_db
+def test_latency_endpoint_rejects_bad_since_and_clamps_limit(authenticated_api_client):
+    for hour in (1, 2):
+        PipelineLatencyRollup.objects.create(
+            granularity=RollupGranularity.HOUR,
+            bucket_start=datetime(2025, 6, 1, hour, tzinfo=timezone.utc),
+            phase="sql_generation",
+            sample_count=1,
+            computed_at=datetime(2025, 6, 1, 3, tzinfo=timezone.utc),
+        )
+    url = "/api/thoth-logs/latency/"
+
+    for since in ("yesterday", "2025-13-01T00:00:00"):
+        response = authenticated_api_client.get(url, {"since": since})
+        assert response.status_code == 400
+
+    response = authenticated_api_client.get(url, {"limit": "-1"})
+    assert response.status_code == 200
+    assert len(response.json()) == 1
+
+    response = authenticated_api_client.get(url, {"since": "2025-06-01T02:00:00"})
+    assert response.status_code == 200
+    assert [datetime.fromisoformat(row["bucket_start"]) for row in response.json()] == [
+        datetime(2025, 6, 1, 2, tzinfo=timezone.utc)
+    ]
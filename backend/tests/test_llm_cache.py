@@ -0,0 +1,35 @@
+from types import SimpleNamespace
+
+from thoth_core.thoth_ai.llm_cache import LLMCacheStats, cache_key
+
+
+def make_client(model="gpt-4o", temperature=0.2):
+    return SimpleNamespace(provider="OPENAI", model_name=model, temperature=temperature)
+
+
+MESSAGES = [{"role": "user", "content": "Describe table orders"}]
+
+
+def test_key_is_stable_for_identical_requests():
+    assert cache_key("table_comment", make_client(), MESSAGES, 2000) == cache_key(
+        "table_comment", make_client(), [dict(m) for m in MESSAGES], 2000
+    )
+
+
+def test_key_changes_with_prompt_model_and_kind():
+    base = cache_key("table_comment", make_client(), MESSAGES, 2000)
+    changed_prompt = [{"role": "user", "content": "Describe table orders "}]
+
+    assert cache_key("table_comment", make_client(), changed_prompt, 2000) != base
+    assert cache_key("table_comment", make_client(model="gpt-4.1"), MESSAGES, 2000) != base
+    assert cache_key("table_comment", make_client(temperature=0.7), MESSAGES, 2000) != base
+    assert cache_key("column_comment", make_client(), MESSAGES, 2000) != base
+    assert cache_key("table_comment", make_client(), MESSAGES, 3000) != base
+
+
+def test_stats_summary():
+    stats = LLMCacheStats()
+    assert stats.summary() == "LLM cache: 0 hits, 0 misses (hit rate n/a)"
+    stats.record(True, 3)
+    stats.record(False)
+    assert stats.summary() == "LLM cache: 3 hits, 1 misses (hit rate 75%)"
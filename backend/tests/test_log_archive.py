@@ -0,0 +1,48 @@
+from datetime import datetime, timezone
+
+from thoth_core.log_archive import (
+    _append_records,
+    archive_file_path,
+    load_archived_detail,
+)
+from thoth_core.models import ThothLog
+
+
+def test_archive_file_path_is_partitioned_by_utc_day(tmp_path):
+    started_at = datetime(2025, 3, 9, 23, 30, tzinfo=timezone.utc)
+
+    path = archive_file_path(started_at, str(tmp_path))
+
+    assert path == str(tmp_path / "2025" / "03" / "thoth_logs_2025-03-09.jsonl.gz")
+
+
+def test_load_archived_detail_returns_latest_record(tmp_path):
+    started_at = datetime(2025, 3, 9, 12, 0, tzinfo=timezone.utc)
+    archived_at = datetime(2025, 4, 9, 12, 0, tzinfo=timezone.utc)
+    path = archive_file_path(started_at, str(tmp_path))
+
+    _append_records(
+        path,
+        [
+            {"id": 7, "started_at": started_at, "archived_at": archived_at,
+             "detail": {"reduced_schema": "old"}},
+            {"id": 17, "started_at": started_at, "archived_at": archived_at,
+             "detail": {"reduced_schema": "other"}},
+        ],
+    )
+    # A retried batch appends a second gzip member for the same log
+    _append_records(
+        path,
+        [{"id": 7, "started_at": started_at, "archived_at": archived_at,
+          "detail": {"reduced_schema": "new"}}],
+    )
+
+    log = ThothLog(id=7, started_at=started_at, archived_at=archived_at)
+
+    assert load_archived_detail(log, str(tmp_path)) == {"reduced_schema": "new"}
+
+
+def test_load_archived_detail_skips_non_archived_logs(tmp_path):
+    log = ThothLog(id=1, started_at=datetime(2025, 3, 9, tzinfo=timezone.utc))
+
+    assert load_archived_detail(log, str(tmp_path)) is None
@@ -0,0 +1,135 @@
+import pytest
+
+from thoth_ai_backend.utils.progress_backends import (
+    MemoryProgressBackend,
+    RedisProgressBackend,
+    SharedMemoryProgressBackend,
+)
+from thoth_ai_backend.utils.progress_tracker import ProgressTracker
+
+
+class CountingBackend(MemoryProgressBackend):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def set(self, key, data):
+        self.writes += 1
+        super().set(key, data)
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def set(self, key, value, ex=None):
+        self.store[key] = value.encode("utf-8")
+
+    def delete(self, key):
+        self.store.pop(key, None)
+
+
+@pytest.fixture
+def backend():
+    backend = CountingBackend()
+    ProgressTracker.set_backend(backend)
+    yield backend
+    ProgressTracker.set_backend(None)
+
+
+@pytest.mark.parametrize(
+    "make_backend",
+    [
+        lambda tmp_path: MemoryProgressBackend(),
+        lambda tmp_path: SharedMemoryProgressBackend(str(tmp_path)),
+        lambda tmp_path: RedisProgressBackend(client=FakeRedis()),
+    ],
+)
+def test_backends_round_trip(tmp_path, make_backend):
+    store = make_backend(tmp_path)
+    assert store.get("progress_evidence_1") is None
+
+    store.set("progress_evidence_1", {"processed_items": 3, "status": "processing"})
+    assert store.get("progress_evidence_1") == {
+        "processed_items": 3,
+        "status": "processing",
+    }
+
+    store.delete("progress_evidence_1")
+    assert store.get("progress_evidence_1") is None
+
+
+def test_update_progress_coalesces_backend_writes(backend):
+    ProgressTracker.init_progress(1, "evidence", 0)
+    ProgressTracker.set_total(1, "evidence", 1000)
+    writes_before = backend.writes
+
+    for processed in range(1, 1000):
+        ProgressTracker.update_progress(1, "evidence", processed, processed, 0)
+
+    # Updates within the flush interval stay local to the writing process
+    assert backend.writes - writes_before < 10
+    assert ProgressTracker.get_progress(1, "evidence")["processed_items"] == 999
+
+    ProgressTracker.flush(1, "evidence")
+    assert backend.get("progress_evidence_1")["processed_items"] == 999
+
+    # Completion is always published immediately
+    ProgressTracker.update_progress(1, "evidence", 1000, 1000, 0)
+    stored = backend.get("progress_evidence_1")
+    assert stored["status"] == "completed"
+    assert stored["percentage"] == 100
+
+
+def test_mark_failed_keeps_counters(backend):
+    ProgressTracker.init_progress(2, "questions", 10)
+    ProgressTracker.update_progress(2, "questions", 4, 3, 1)
+
+    ProgressTracker.mark_failed(2, "questions", RuntimeError("vector db down"))
+
+    stored = backend.get("progress_questions_2")
+    assert stored["status"] == "failed"
+    assert stored["error"] == "vector db down"
+    assert stored["processed_items"] == 4
+
+    ProgressTracker.clear_progress(2, "questions")
+    assert ProgressTracker.get_progress(2, "questions") is None
+
+
+def _process_tracker(backend):
+    """A ProgressTracker with its own per-process buffers, like another worker."""
+    tracker = type(
+        "ProcessTracker",
+        (ProgressTracker,),
+        {"_local_state": {}, "_last_flush": {}, "_pending": set()},
+    )
+    tracker.set_backend(backend)
+    return tracker
+
+
+def test_progress_published_by_another_process_is_visible():
+    shared = MemoryProgressBackend()
+    web = _process_tracker(shared)
+    worker = _process_tracker(shared)
+
+    # The view initialises the operation, the job runs in the worker process
+    web.init_progress(3, "evidence", 0)
+    worker.set_total(3, "evidence", 100)
+    assert web.get_progress(3, "evidence")["total_items"] == 100
+
+    worker.update_progress(3, "evidence", 1, 1, 0)
+    worker.update_progress(3, "evidence", 50, 50, 0)
+    # A coalesced update is only visible to the process that made it
+    assert worker.get_progress(3, "evidence")["processed_items"] == 50
+    assert web.get_progress(3, "evidence")["processed_items"] == 1
+
+    worker.flush(3, "evidence")
+    assert web.get_progress(3, "evidence")["processed_items"] == 50
+
+    worker.update_progress(3, "evidence", 100, 100, 0)
+    progress = web.get_progress(3, "evidence")
+    assert progress["status"] == "completed"
+    assert progress["processed_items"] == 100
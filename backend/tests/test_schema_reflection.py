@@ -0,0 +1,73 @@
+from types import SimpleNamespace
+
+from thoth_core.schema_reflection import reflect_catalog
+
+
+class FakeAdapter:
+    schema = "public"
+
+    def __init__(self):
+        self.column_calls = []
+        self.queries = []
+
+    def get_tables_as_documents(self):
+        return [
+            SimpleNamespace(table_name="customers", comment="People"),
+            SimpleNamespace(table_name="orders", comment=""),
+        ]
+
+    def execute_query(self, query, params=None):
+        self.queries.append(params)
+        return [
+            SimpleNamespace(table_name="customers", column_name="id", data_type="integer", comment="", is_pk=True),
+            SimpleNamespace(table_name="orders", column_name="id", data_type="integer", comment="", is_pk=True),
+            SimpleNamespace(table_name="orders", column_name="customer_id", data_type="integer", comment="FK", is_pk=False),
+        ]
+
+    def get_columns_as_documents(self, table_name):
+        self.column_calls.append(table_name)
+        return [
+            SimpleNamespace(column_name="id", data_type="INTEGER", comment=None, is_pk=True)
+        ]
+
+    def get_foreign_keys_as_documents(self):
+        return [
+            SimpleNamespace(
+                source_table_name="orders",
+                source_column_name="customer_id",
+                target_table_name="customers",
+                target_column_name="id",
+            )
+        ]
+
+
+def make_sqldb(db_type):
+    return SimpleNamespace(name="shop", db_type=db_type, schema="public")
+
+
+def test_postgresql_columns_are_read_with_one_query():
+    adapter = FakeAdapter()
+    catalog = reflect_catalog(make_sqldb("PostgreSQL"), db_manager=SimpleNamespace(adapter=adapter))
+
+    assert adapter.queries == [{"schema": "public"}]
+    assert adapter.column_calls == []
+    assert catalog.tables["customers"].comment == "People"
+    assert [c.name for c in catalog.tables["orders"].columns] == ["id", "customer_id"]
+    assert catalog.tables["orders"].columns[1].comment == "FK"
+    assert catalog.foreign_keys[0].target_table == "customers"
+
+
+def test_other_backends_read_columns_per_table_on_the_same_manager():
+    adapter = FakeAdapter()
+    catalog = reflect_catalog(
+        make_sqldb("SQLite"),
+        db_manager=SimpleNamespace(adapter=adapter),
+        include_foreign_keys=False,
+        table_names={"orders"},
+    )
+
+    assert adapter.queries == []
+    assert adapter.column_calls == ["orders"]
+    assert catalog.tables["orders"].columns[0].is_pk
+    assert catalog.tables["customers"].columns == []
+    assert catalog.foreign_keys == []
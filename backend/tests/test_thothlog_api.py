@@ -0,0 +1,59 @@
+from datetime import datetime, timezone
+
+import pytest
+from rest_framework.exceptions import ValidationError
+from rest_framework.test import APIRequestFactory
+from rest_framework.request import Request
+
+from thoth_core.models import ThothLog
+from thoth_core.pagination import ThothLogCursorPagination
+from thoth_core.serializers import ThothLogSerializer
+from thoth_core.views import ThothLogListCreateView
+
+
+def _make_view(query_string):
+    factory = APIRequestFactory()
+    view = ThothLogListCreateView()
+    view.request = Request(factory.get(f"/api/thoth-logs/?{query_string}"))
+    return view
+
+
+def test_serializer_projection_limits_fields():
+    log = ThothLog(
+        id=1,
+        username="user",
+        workspace="ws",
+        started_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        question="How many schools?",
+        reduced_schema="x" * 1000,
+    )
+
+    data = ThothLogSerializer(log, fields=["id", "started_at", "question"]).data
+
+    assert set(data) == {"id", "started_at", "question"}
+
+
+def test_projection_always_includes_cursor_fields():
+    view = _make_view("fields=question,workspace")
+
+    assert view.get_projection() == ["id", "started_at", "question", "workspace"]
+
+
+def test_projection_with_exclude_defers_large_fields():
+    view = _make_view("exclude=reduced_schema,used_mschema,started_at")
+    projection = view.get_projection()
+
+    assert "reduced_schema" not in projection
+    assert "used_mschema" not in projection
+    assert "started_at" in projection
+
+
+def test_projection_rejects_unknown_fields():
+    view = _make_view("fields=question,not_a_field")
+
+    with pytest.raises(ValidationError):
+        view.get_projection()
+
+
+def test_cursor_pagination_orders_by_started_at_and_id():
+    assert ThothLogCursorPagination.ordering == ("-started_at", "-id")
@@ -0,0 +1,56 @@
+import sqlite3
+
+import numpy as np
+
+from thoth_ai_backend.preprocessing.db_values.trigram_index import (
+    build_trigram_index,
+    value_grams,
+)
+
+UNIQUE_VALUES = {
+    "schools": {
+        "County": ["Alameda", "Alpine", "Amador"],
+        "State": ["CA", ""],
+    },
+    "frpm": {"School Type": ["High Schools (Public)", "  "]},
+}
+
+
+def test_value_grams_are_padded_and_case_insensitive():
+    assert value_grams("CA") == {" ca", "ca "}
+    assert value_grams("High  School") == value_grams("high school")
+    assert value_grams("   ") == set()
+
+
+def test_postings_list_every_value_containing_a_gram(tmp_path):
+    path = tmp_path / "db_trigrams.sqlite3"
+    assert build_trigram_index(UNIQUE_VALUES, path) == 5
+    assert not (tmp_path / "db_trigrams.sqlite3.tmp").exists()
+
+    conn = sqlite3.connect(path)
+    values = {
+        row[0]: row[1:]
+        for row in conn.execute("SELECT id, table_name, column_name, value, grams FROM value_index")
+    }
+    postings = {
+        gram: np.frombuffer(ids, dtype="<u4").tolist()
+        for gram, ids in conn.execute("SELECT gram, ids FROM postings")
+    }
+    assert dict(conn.execute("SELECT key, value FROM meta"))["values"] == "5"
+    conn.close()
+
+    assert [v[2] for v in values.values()] == ["Alameda", "Alpine", "Amador", "CA", "High Schools (Public)"]
+    for value_id, (_, _, value, grams) in values.items():
+        assert grams == len(value_grams(value))
+        for gram in value_grams(value):
+            assert value_id in postings[gram]
+    assert postings[" al"] == [0, 1]
+
+
+def test_rebuild_replaces_the_index(tmp_path):
+    path = tmp_path / "db_trigrams.sqlite3"
+    build_trigram_index(UNIQUE_VALUES, path)
+    build_trigram_index({"t": {"c": ["Butte"]}}, path)
+    conn = sqlite3.connect(path)
+    assert conn.execute("SELECT value FROM value_index").fetchall() == [("Butte",)]
+    conn.close()
@@ -0,0 +1,95 @@
+import pytest
+from qdrant_client import QdrantClient
+from qdrant_client.models import Distance, VectorParams
+from thoth_qdrant import EvidenceDocument, SqlDocument
+from thoth_qdrant.adapter.qdrant_native import QdrantNativeAdapter
+
+from thoth_ai_backend.backend_utils import vector_store_utils
+from thoth_ai_backend.backend_utils.vector_csv_import import (
+    VectorBulkImporter,
+    VectorImportStats,
+)
+
+IDS = [f"00000000-0000-0000-0000-{i:012d}" for i in range(12)]
+
+
+class CountingEmbeddings:
+    def __init__(self):
+        self.batches = []
+
+    def encode_texts(self, texts):
+        self.batches.append(len(texts))
+        return [[1.0, float(len(text))] for text in texts]
+
+
+@pytest.fixture
+def vector_store():
+    client = QdrantClient(":memory:")
+    client.create_collection("docs", vectors_config=VectorParams(size=2, distance=Distance.COSINE))
+    store = object.__new__(QdrantNativeAdapter)
+    store.client = client
+    store.collection_name = "docs"
+    store.embedding_manager = CountingEmbeddings()
+    store.embedding_provider = "openai"
+    store.embedding_model = "text-embedding-3-small"
+    yield store
+    client.close()
+
+
+def run_import(store, docs, chunk_size=5, embed_batch_size=4):
+    importer = VectorBulkImporter(store, VectorImportStats(), chunk_size, embed_batch_size)
+    for doc in docs:
+        importer.add(doc)
+    return importer.finish()
+
+
+def test_reimport_skips_unchanged_and_embeds_only_changed_text(vector_store):
+    docs = [EvidenceDocument(id=i, evidence=f"fact {n}") for n, i in enumerate(IDS)]
+    first = run_import(vector_store, docs)
+    assert (first.inserted, first.updated, first.skipped, first.embedded) == (12, 0, 0, 12)
+    assert vector_store.embedding_manager.batches == [4, 1, 4, 1, 2]
+
+    vector_store.embedding_manager.batches.clear()
+    docs[3] = EvidenceDocument(id=IDS[3], evidence="fact three, reworded")
+    second = run_import(vector_store, docs)
+    assert (second.inserted, second.updated, second.skipped, second.embedded) == (0, 1, 11, 1)
+    assert vector_store.embedding_manager.batches == [1]
+    assert vector_store.get_document(IDS[3]).evidence == "fact three, reworded"
+
+
+def test_payload_change_keeps_vector_without_embedding(vector_store):
+    run_import(vector_store, [SqlDocument(id=IDS[0], question="How many orders?", sql="SELECT 1")])
+    vector_store.embedding_manager.batches.clear()
+
+    # The SQL is not part of the embedded text
+    stats = run_import(vector_store, [SqlDocument(id=IDS[0], question="How many orders?", sql="SELECT COUNT(*) FROM orders")])
+
+    assert (stats.updated, stats.embedded) == (1, 0)
+    assert vector_store.get_document(IDS[0]).sql == "SELECT COUNT(*) FROM orders"
+    point = vector_store.client.retrieve("docs", ids=[IDS[0]], with_vectors=True)[0]
+    assert point.vector is not None
+
+
+def test_csv_import_reports_counts(vector_store, tmp_path, monkeypatch):
+    csv_path = tmp_path / "evidence.csv"
+    csv_path.write_text(f"id,evidence\n{IDS[0]},alpha\n,orphan\n{IDS[1]},beta\n", encoding="utf-8")
+    monkeypatch.setattr(vector_store_utils, "_get_csv_file_path", lambda *args: str(csv_path))
+
+    result = vector_store_utils.import_evidence_from_csv_file(vector_store)
+    assert (result["inserted_count"], result["error_count"]) == (2, 1)
+    assert result["messages"][0].startswith("Successfully imported 2 evidence (2 new, 0 updated, 0 unchanged)")
+
+    result = vector_store_utils.import_evidence_from_csv_file(vector_store)
+    assert (result["imported_count"], result["skipped_count"]) == (0, 2)
+
+
+def test_failed_chunk_is_retried_row_by_row(vector_store):
+    docs = [EvidenceDocument(id=i, evidence=f"fact {n}") for n, i in enumerate(IDS[:5])]
+    docs[2].id = "not-a-valid-point-id"
+
+    stats = run_import(vector_store, docs)
+
+    assert (stats.inserted, stats.errors) == (4, 1)
+    assert len(stats.messages) == 1
+    assert "not-a-valid-point-id" in stats.messages[0]
+    assert vector_store.get_document(IDS[4]).evidence == "fact 4"
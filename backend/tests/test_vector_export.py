@@ -0,0 +1,105 @@
+import csv
+import io
+import os
+
+import pytest
+from qdrant_client import QdrantClient
+from qdrant_client.models import Distance, PointStruct, VectorParams
+from thoth_qdrant import ThothType
+from thoth_qdrant.adapter.qdrant_native import QdrantNativeAdapter
+
+from thoth_ai_backend.backend_utils.vector_store_utils import (
+    export_evidence_to_csv_file,
+    iter_documents_by_type,
+    open_csv_export,
+)
+
+
+@pytest.fixture
+def vector_store():
+    client = QdrantClient(":memory:")
+    client.create_collection("docs", vectors_config=VectorParams(size=2, distance=Distance.COSINE))
+    points = [
+        PointStruct(
+            id=i,
+            vector=[1.0, float(i)],
+            payload={"thoth_type": "evidence", "thoth_id": f"e{i}", "text": f"fact {i}", "evidence": f"fact {i}"},
+        )
+        for i in range(250)
+    ]
+    points.append(
+        PointStruct(
+            id=1000,
+            vector=[0.0, 1.0],
+            payload={"thoth_type": "sql", "thoth_id": "q1", "question": "How many?", "sql": "SELECT 1"},
+        )
+    )
+    client.upsert("docs", points)
+
+    store = object.__new__(QdrantNativeAdapter)
+    store.client = client
+    store.collection_name = "docs"
+    yield store
+    client.close()
+
+
+def test_documents_are_scrolled_by_type_in_pages(vector_store):
+    pages = []
+    scroll = vector_store.client.scroll
+
+    def counting_scroll(**kwargs):
+        records, offset = scroll(**kwargs)
+        pages.append((len(records), kwargs["with_vectors"]))
+        return records, offset
+
+    vector_store.client.scroll = counting_scroll
+    documents = list(iter_documents_by_type(vector_store, ThothType.EVIDENCE, page_size=100))
+
+    assert len(documents) == 250
+    assert pages == [(100, False), (100, False), (50, False)]
+
+
+def test_streamed_chunks_match_saved_file(vector_store, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    filepath, chunks = open_csv_export(vector_store, "questions", page_size=10)
+    streamed = "".join(chunks)
+
+    with open(filepath, newline="", encoding="utf-8") as f:
+        assert f.read() == streamed
+    assert list(csv.reader(io.StringIO(streamed))) == [
+        ["id", "question", "sql", "evidence"],
+        ["q1", "How many?", "SELECT 1", ""],
+    ]
+    assert export_evidence_to_csv_file(vector_store) == os.path.join("exports", "qdrant", "evidence_export.csv")
+
+
+def test_interrupted_export_keeps_previous_file(vector_store, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    filepath = export_evidence_to_csv_file(vector_store)
+    with open(filepath, encoding="utf-8") as f:
+        previous = f.read()
+
+    # Force several chunks, then stop after the first as a disconnecting client would
+    monkeypatch.setattr(
+        "thoth_ai_backend.backend_utils.vector_store_utils.CSV_EXPORTS",
+        {"evidence": _with_long_rows()},
+    )
+    filepath, chunks = open_csv_export(vector_store, "evidence", page_size=10)
+    chunks.close()
+
+    with open(filepath, encoding="utf-8") as f:
+        assert f.read() == previous
+    assert not os.path.exists(f"{filepath}.part")
+
+
+def _with_long_rows():
+    from thoth_ai_backend.backend_utils.vector_store_utils import CSV_EXPORTS, CsvExport
+
+    export = CSV_EXPORTS["evidence"]
+    return CsvExport(
+        export.filename,
+        export.thoth_type,
+        export.document_class,
+        export.header,
+        lambda doc: [doc.id, doc.evidence * 1000],
+    )
@@ -13,8 +13,12 @@
 import logging
 import os
 from django.utils import timezone
+from thoth_core.job_queue import JobCancelled, JobInterrupted
 from thoth_core.models import Workspace
 from .preprocessing.preprocess import preprocess
+from .preprocessing.upload_evidence import upload_evidence_to_vectordb
+from .preprocessing.upload_questions import upload_questions_to_vectordb
+from .utils.progress_tracker import ProgressTracker
 
 # New plugin-based imports
 from thoth_dbmanager import ThothDbFactory
@@ -27,16 +31,21 @@ from .backend_utils.vectordb_config_utils import get_vectordb_config
 logger = logging.getLogger(__name__)
 
 
-def run_preprocessing_task(workspace_id):
+def run_preprocessing_task(workspace_id, job=None):
     """
-    The actual preprocessing function that will be run in a background thread.
+    The actual preprocessing function, run by the job queue (see
+    run_preprocessing_job) or directly.
     """
     try:
         workspace = Workspace.objects.get(id=workspace_id)
 
         # Set status to RUNNING
         workspace.preprocessing_status = Workspace.PreprocessingStatus.RUNNING
-        workspace.last_preprocess_log = "Preprocessing started..."
+        workspace.last_preprocess_log = (
+            "Preprocessing resumed..." if job is not None and job.resumed else "Preprocessing started..."
+        )
+        if job is not None:
+            workspace.task_id = job.task_id
         workspace.save()
 
         sql_db_obj = workspace.sql_db
@@ -173,7 +182,9 @@ def run_preprocessing_task(workspace_id):
             logger.warning(f"Could not delete existing COLUMN_NAME collection: {e}")
 
         # Run the actual preprocessing with workspace_id for progress tracking
-        preprocess(sql_db, vector_db, sql_db_params, setting, workspace_id=workspace_id)
+        preprocess(
+            sql_db, vector_db, sql_db_params, setting, workspace_id=workspace_id, job=job
+        )
 
         # If successful, update status and timestamp
         workspace.preprocessing_status = Workspace.PreprocessingStatus.COMPLETED
@@ -183,6 +194,15 @@ def run_preprocessing_task(workspace_id):
         workspace.save()
         logger.info(f"Preprocessing completed for workspace {workspace_id}")
 
+    except JobInterrupted:
+        # The worker is stopping; the job is requeued and resumes from its checkpoint
+        raise
+    except JobCancelled:
+        workspace.preprocessing_status = Workspace.PreprocessingStatus.FAILED
+        workspace.last_preprocess_log = "Preprocessing cancelled."
+        workspace.task_id = None
+        workspace.save()
+        raise
     except Exception as e:
         logger.error(
             f"Error during background preprocessing for workspace {workspace_id}: {e}",
@@ -194,3 +214,48 @@ def run_preprocessing_task(workspace_id):
             workspace.last_preprocess_log = f"Error during preprocessing: {e}"
             workspace.task_id = None  # Clear task ID
             workspace.save()
+
+
+def run_preprocessing_job(job):
+    """Job queue handler for workspace preprocessing."""
+    workspace_id = job.payload["workspace_id"]
+    run_preprocessing_task(workspace_id, job=job)
+
+    workspace = Workspace.objects.get(id=workspace_id)
+    if workspace.preprocessing_status == Workspace.PreprocessingStatus.FAILED:
+        raise RuntimeError(workspace.last_preprocess_log)
+    return {"workspace_id": workspace_id}
+
+
+def run_upload_job(job):
+    """Job queue handler for evidence and questions uploads."""
+    workspace_id = job.payload["workspace_id"]
+    operation_type = job.payload["operation_type"]
+    upload = {
+        "evidence": upload_evidence_to_vectordb,
+        "questions": upload_questions_to_vectordb,
+    }[operation_type]
+
+    try:
+        successful, total = upload(workspace_id, job=job)
+    except JobInterrupted:
+        # The job goes back to the queue with its attempt given back; publish
+        # the counters reached so far, the next attempt resumes from them
+        ProgressTracker.flush(workspace_id, operation_type)
+        raise
+    except JobCancelled:
+        ProgressTracker.mark_failed(workspace_id, operation_type, "Upload cancelled")
+        raise
+    except Exception as e:
+        logger.error(f"Error in background upload for {operation_type}: {e}")
+        ProgressTracker.mark_failed(workspace_id, operation_type, e)
+        raise
+    return {"workspace_id": workspace_id, "successful": successful, "total": total}
+
+
+def abandon_upload_job(job):
+    """Close the progress of an upload job that will not run again."""
+    reason = job.error or "Upload cancelled"
+    ProgressTracker.mark_failed(
+        job.payload["workspace_id"], job.payload["operation_type"], reason
+    )
@@ -0,0 +1,226 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Chunked, idempotent import of documents into a Qdrant vector store.
+
+The CSV importers used to call add_evidence()/add_column_description()/
+add_sql() per row: one embedding request and one upsert per document, even
+when the stored point already held the same text. VectorBulkImporter
+collects documents in chunks and, for each chunk:
+
+- renders the payload the adapter would store and hashes it twice: the
+  embedded text (with the embedding model) and the whole payload;
+- fetches the stored hashes of the chunk's ids with one retrieve() that
+  returns no vectors;
+- skips unchanged points, re-uses the stored vector of points whose
+  payload changed but whose text did not, and embeds only new or
+  re-worded documents, in batches;
+- upserts the chunk with a single request.
+
+A chunk that fails is retried one document at a time, so only the rows
+that fail on their own are counted as errors.
+
+Hashes are stored in the point payload (text_hash, content_hash); points
+written before they existed are re-embedded once. Stores that are not
+backed by Qdrant fall back to bulk_add_documents().
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+from qdrant_client import QdrantClient
+from qdrant_client.models import PointStruct
+
+logger = logging.getLogger(__name__)
+
+IMPORT_CHUNK_SIZE = max(1, int(os.getenv("THOTH_VECTOR_IMPORT_CHUNK_SIZE", "256")))
+EMBED_BATCH_SIZE = max(1, int(os.getenv("THOTH_VECTOR_EMBED_BATCH_SIZE", "64")))
+
+TEXT_HASH_KEY = "text_hash"
+CONTENT_HASH_KEY = "content_hash"
+
+
+@dataclass
+class VectorImportStats:
+    """Counters collected while importing one CSV file."""
+
+    rows: int = 0
+    inserted: int = 0
+    updated: int = 0
+    skipped: int = 0
+    errors: int = 0
+    embedded: int = 0
+    seconds: float = 0.0
+    messages: List[str] = field(default_factory=list)
+
+    @property
+    def imported(self) -> int:
+        return self.inserted + self.updated
+
+    @property
+    def rows_per_sec(self) -> float:
+        return round(self.rows / self.seconds, 1) if self.seconds > 0 else 0.0
+
+    def summary(self, label: str) -> str:
+        return (
+            f"{label}: inserted {self.inserted}, updated {self.updated}, "
+            f"unchanged {self.skipped}, errors {self.errors}, embedded {self.embedded} "
+            f"({self.rows} rows in {self.seconds:.2f}s, {self.rows_per_sec} rows/sec)"
+        )
+
+
+def _sha256(value: str) -> str:
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+
+class VectorBulkImporter:
+    """
+    Buffers documents with add() and writes them chunk by chunk; call
+    finish() once all rows are added to flush the last chunk.
+    """
+
+    def __init__(
+        self,
+        vector_store,
+        stats: VectorImportStats,
+        chunk_size: int = IMPORT_CHUNK_SIZE,
+        embed_batch_size: int = EMBED_BATCH_SIZE,
+    ):
+        self.vector_store = vector_store
+        self.stats = stats
+        self.chunk_size = chunk_size
+        self.embed_batch_size = embed_batch_size
+        self.native = isinstance(getattr(vector_store, "client", None), QdrantClient)
+        self.model_id = (
+            f"{getattr(vector_store, 'embedding_provider', '')}:"
+            f"{getattr(vector_store, 'embedding_model', '')}"
+        )
+        self._pending: Dict[str, object] = {}
+        self._started = time.perf_counter()
+
+    def add(self, doc) -> None:
+        # Later rows with the same id replace earlier ones, as upserts would
+        self._pending[str(doc.id)] = doc
+        if len(self._pending) >= self.chunk_size:
+            self.flush()
+
+    def finish(self) -> VectorImportStats:
+        self.flush()
+        self.stats.seconds = time.perf_counter() - self._started
+        return self.stats
+
+    def flush(self) -> None:
+        docs = list(self._pending.values())
+        self._pending = {}
+        if not docs:
+            return
+        try:
+            self._write(docs)
+        except Exception as e:
+            if len(docs) == 1:
+                self._record_error(docs[0], e)
+                return
+            # Find the offending rows: retry the chunk one document at a time
+            logger.warning(
+                f"Chunk of {len(docs)} documents failed ({e}); retrying row by row"
+            )
+            for doc in docs:
+                try:
+                    self._write([doc])
+                except Exception as e_row:
+                    self._record_error(doc, e_row)
+
+    def _write(self, docs: List) -> None:
+        if self.native:
+            self._write_chunk(docs)
+        else:
+            self.vector_store.bulk_add_documents(docs)
+            self.stats.inserted += len(docs)
+
+    def _record_error(self, doc, error: Exception) -> None:
+        logger.error(f"Error importing row (ID: {doc.id}): {error}")
+        self.stats.errors += 1
+        self.stats.messages.append(f"Error for ID {doc.id}: {error}")
+
+    def _write_chunk(self, docs: List) -> None:
+        store = self.vector_store
+        payloads = {}
+        for doc in docs:
+            payload = store._document_to_payload(doc)
+            payload[TEXT_HASH_KEY] = _sha256(f"{self.model_id}\n{payload['text']}")
+            payload[CONTENT_HASH_KEY] = _sha256(json.dumps(payload, sort_keys=True, default=str))
+            payloads[str(doc.id)] = payload
+
+        stored = {
+            str(point.id): point.payload or {}
+            for point in store.client.retrieve(
+                collection_name=store.collection_name,
+                ids=list(payloads),
+                with_payload=[TEXT_HASH_KEY, CONTENT_HASH_KEY],
+                with_vectors=False,
+            )
+        }
+
+        to_embed = []
+        keep_vector = []
+        inserted = updated = skipped = 0
+        for doc_id, payload in payloads.items():
+            previous = stored.get(doc_id)
+            if previous is None:
+                to_embed.append(doc_id)
+                inserted += 1
+            elif previous.get(CONTENT_HASH_KEY) == payload[CONTENT_HASH_KEY]:
+                skipped += 1
+            elif previous.get(TEXT_HASH_KEY) == payload[TEXT_HASH_KEY]:
+                keep_vector.append(doc_id)
+                updated += 1
+            else:
+                to_embed.append(doc_id)
+                updated += 1
+
+        vectors = {}
+        if keep_vector:
+            for point in store.client.retrieve(
+                collection_name=store.collection_name,
+                ids=keep_vector,
+                with_payload=False,
+                with_vectors=True,
+            ):
+                vectors[str(point.id)] = point.vector
+            vectors = {doc_id: vectors.get(doc_id) for doc_id in keep_vector}
+            # A vector that could not be read back is recomputed
+            to_embed.extend(doc_id for doc_id, vector in vectors.items() if vector is None)
+
+        for start in range(0, len(to_embed), self.embed_batch_size):
+            batch = to_embed[start:start + self.embed_batch_size]
+            embeddings = store.embedding_manager.encode_texts([payloads[i]["text"] for i in batch])
+            vectors.update(zip(batch, embeddings))
+
+        points = [
+            PointStruct(id=doc_id, vector=vectors[doc_id], payload=payloads[doc_id])
+            for doc_id in payloads
+            if vectors.get(doc_id) is not None
+        ]
+        if points:
+            store.client.upsert(collection_name=store.collection_name, points=points)
+
+        # Counted once the chunk is stored, so a failed chunk only counts as errors
+        self.stats.inserted += inserted
+        self.stats.updated += updated
+        self.stats.skipped += skipped
+        self.stats.embedded += len(to_embed)
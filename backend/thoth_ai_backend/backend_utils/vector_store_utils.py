@@ -14,14 +14,19 @@
 # Import new vector store plugin architecture
 from thoth_qdrant import VectorStoreFactory
 from thoth_qdrant import EvidenceDocument, ColumnNameDocument, SqlDocument, ThothType
+from qdrant_client import QdrantClient
+from qdrant_client.models import FieldCondition, Filter, MatchValue
 
 from thoth_core.models import VectorDbChoices
 from .session_utils import get_current_workspace
+from .vector_csv_import import VectorBulkImporter, VectorImportStats
 
 import csv
 import io
 import os
 import logging
+from dataclasses import dataclass
+from typing import Any, Callable, List
 
 logger = logging.getLogger(__name__)
 
@@ -258,6 +263,215 @@ def get_vector_store(request):
         raise
 
 
+EXPORT_PAGE_SIZE = int(os.getenv("THOTH_VECTOR_EXPORT_PAGE_SIZE", "256"))
+
+
+@dataclass(frozen=True)
+class CsvExport:
+    """How one document type is written to CSV."""
+
+    filename: str
+    thoth_type: ThothType
+    document_class: type
+    header: List[str]
+    row: Callable[[Any], List[Any]]
+
+
+CSV_EXPORTS = {
+    "evidence": CsvExport(
+        "evidence_export.csv",
+        ThothType.EVIDENCE,
+        EvidenceDocument,
+        ["id", "evidence"],
+        lambda doc: [getattr(doc, "id", ""), getattr(doc, "evidence", "")],
+    ),
+    "columns": CsvExport(
+        "columns_export.csv",
+        ThothType.COLUMN_NAME,
+        ColumnNameDocument,
+        [
+            "id",
+            "table_name",
+            "original_column_name",
+            "column_description",
+            "value_description",
+        ],
+        lambda doc: [
+            getattr(doc, "id", ""),
+            getattr(doc, "table_name", ""),
+            getattr(doc, "column_name", ""),
+            getattr(doc, "column_description", ""),
+            getattr(doc, "value_description", ""),
+        ],
+    ),
+    "questions": CsvExport(
+        "questions_export.csv",
+        ThothType.SQL,
+        SqlDocument,
+        ["id", "question", "sql", "evidence"],
+        lambda doc: [
+            getattr(doc, "id", ""),
+            getattr(doc, "question", ""),
+            getattr(doc, "sql", ""),
+            getattr(doc, "evidence", ""),
+        ],
+    ),
+}
+
+
+def iter_documents_by_type(vector_store, thoth_type, page_size=EXPORT_PAGE_SIZE):
+    """
+    Yield the documents of one type, reading the collection one page at a
+    time. Qdrant stores are scrolled with a type filter and without vectors,
+    so only `page_size` payloads are held in memory; other stores fall back
+    to their get_all_*_documents() method.
+    """
+    client = getattr(vector_store, "client", None)
+    to_document = getattr(vector_store, "_payload_to_document", None)
+    if not isinstance(client, QdrantClient) or to_document is None:
+        getters = {
+            ThothType.EVIDENCE: "get_all_evidence_documents",
+            ThothType.COLUMN_NAME: "get_all_column_documents",
+            ThothType.SQL: "get_all_sql_documents",
+        }
+        yield from getattr(vector_store, getters[thoth_type])()
+        return
+
+    type_filter = Filter(
+        must=[FieldCondition(key="thoth_type", match=MatchValue(value=thoth_type.value))]
+    )
+    offset = None
+    while True:
+        records, offset = client.scroll(
+            collection_name=vector_store.collection_name,
+            scroll_filter=type_filter,
+            limit=page_size,
+            offset=offset,
+            with_payload=True,
+            with_vectors=False,
+        )
+        for record in records:
+            doc = to_document(record.payload)
+            if doc is not None:
+                yield doc
+        if offset is None:
+            break
+
+
+def _get_export_dir(request=None):
+    """Directory of CSV exports: IO_DIR based when possible, else exports/qdrant."""
+    # Use new path resolution if request is provided
+    if request is not None:
+        try:
+            return get_csv_export_path(request)
+        except Exception as e:
+            logger.warning(
+                f"Failed to get new CSV export path: {e}. Falling back to old method."
+            )
+
+    # Use qdrant as the folder name for Qdrant-based vector stores
+    vector_db_type_folder = "qdrant"
+
+    # Sanitize the folder name to ensure it's valid for directory creation
+    # Replace non-alphanumeric characters (except underscore) with an underscore
+    vector_db_type_folder = "".join(
+        c if c.isalnum() else "_" for c in vector_db_type_folder
+    ).strip("_")
+    if not vector_db_type_folder:  # If sanitization results in an empty string
+        vector_db_type_folder = "default_vdb_type"
+
+    return os.path.join("exports", vector_db_type_folder)
+
+
+def _stream_csv_export(vector_store, export, filepath, page_size):
+    partial_path = f"{filepath}.part"
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(export.header)  # CSV Headers
+    count = 0
+    try:
+        with open(partial_path, "w", newline="", encoding="utf-8") as f:
+            for doc in iter_documents_by_type(vector_store, export.thoth_type, page_size):
+                if isinstance(doc, export.document_class):
+                    writer.writerow(export.row(doc))
+                    count += 1
+                else:
+                    logger.warning(
+                        f"Skipping document of type {type(doc)} during {export.filename} export, expected {export.document_class.__name__}."
+                    )
+                if buffer.tell() >= 64 * 1024:
+                    chunk = buffer.getvalue()
+                    buffer.seek(0)
+                    buffer.truncate()
+                    f.write(chunk)
+                    yield chunk
+            chunk = buffer.getvalue()
+            f.write(chunk)
+        # Replace the previous export only once this one is complete
+        os.replace(partial_path, filepath)
+        logger.info(f"{count} rows exported to {filepath}")
+    except BaseException as e:
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+        if isinstance(e, GeneratorExit):
+            logger.warning(f"Export to {filepath} interrupted after {count} rows")
+        else:
+            logger.error(f"Error during CSV export to {filepath}: {e}", exc_info=True)
+        raise
+    yield chunk
+
+
+def open_csv_export(vector_store, kind, request=None, page_size=EXPORT_PAGE_SIZE):
+    """
+    Start exporting the `kind` documents ("evidence", "columns" or
+    "questions") of vector_store to CSV.
+
+    Returns (filepath, chunks): iterating `chunks` yields the CSV text page
+    by page while writing it to filepath, so it can feed a
+    StreamingHttpResponse with memory bounded by the page size. The file
+    is written under a temporary name and replaces the previous export
+    only when complete. The first page is read before returning, so
+    connection errors are raised here rather than mid-download.
+    """
+    export = CSV_EXPORTS[kind]
+    export_dir = _get_export_dir(request)
+
+    # Create directories if they don't exist
+    os.makedirs(export_dir, exist_ok=True)
+    filepath = os.path.join(export_dir, export.filename)  # No timestamp, overwrite
+
+    chunks = _stream_csv_export(vector_store, export, filepath, page_size)
+    first = next(chunks)
+    return filepath, CsvExportStream(first, chunks)
+
+
+class CsvExportStream:
+    """
+    The chunks of an export whose first chunk was already read. close()
+    (called by StreamingHttpResponse when the client goes away) stops the
+    export and discards the partial file.
+    """
+
+    def __init__(self, first, chunks):
+        self.first = first
+        self.chunks = chunks
+
+    def __iter__(self):
+        yield self.first
+        yield from self.chunks
+
+    def close(self):
+        self.chunks.close()
+
+
+def _export_to_csv_file(vector_store, kind, request=None):
+    filepath, chunks = open_csv_export(vector_store, kind, request)
+    for _ in chunks:
+        pass
+    logger.info(f"{kind.capitalize()} CSV successfully saved to {filepath}")
+    return filepath
+
+
 def export_evidence_to_csv_file(vector_store, request=None):
     """
     Exports all evidence from the given vector_store to a CSV file.
@@ -267,71 +481,9 @@ def export_evidence_to_csv_file(vector_store, request=None):
         request: The HTTP request object (optional, for new path resolution)
 
     Returns:
-        A tuple (filepath, csv_content_string) if successful,
-        otherwise raises an exception.
+        The path of the saved file; raises an exception on failure.
     """
-    try:
-        evidence_documents = vector_store.get_all_evidence_documents()
-
-        # Use new path resolution if request is provided
-        if request is not None:
-            try:
-                export_dir = get_csv_export_path(request)
-            except Exception as e:
-                logger.warning(
-                    f"Failed to get new CSV export path: {e}. Falling back to old method."
-                )
-                request = None  # Fall back to old method
-
-        # Fallback to old method if request not provided or new method failed
-        if request is None:
-            # Use qdrant as the folder name for Qdrant-based vector stores
-            vector_db_type_folder = "qdrant"
-
-            # Sanitize the folder name to ensure it's valid for directory creation
-            # Replace non-alphanumeric characters (except underscore) with an underscore
-            vector_db_type_folder = "".join(
-                c if c.isalnum() else "_" for c in vector_db_type_folder
-            ).strip("_")
-            if not vector_db_type_folder:  # If sanitization results in an empty string
-                vector_db_type_folder = "default_vdb_type"
-
-            export_base_dir = "exports"
-            export_dir = os.path.join(export_base_dir, vector_db_type_folder)
-
-        # Create directories if they don't exist
-        os.makedirs(export_dir, exist_ok=True)
-
-        csv_filename = "evidence_export.csv"  # No timestamp, overwrite
-        filepath = os.path.join(export_dir, csv_filename)
-
-        output = io.StringIO()
-        writer = csv.writer(output)
-        writer.writerow(["id", "evidence"])  # CSV Headers
-
-        for doc in evidence_documents:
-            if isinstance(
-                doc, EvidenceDocument
-            ):  # Ensure it's the correct document type
-                writer.writerow([getattr(doc, "id", ""), getattr(doc, "evidence", "")])
-            else:
-                logger.warning(
-                    f"Skipping document of type {type(doc)} during evidence export, expected EvidenceDocument."
-                )
-
-        csv_content_string = output.getvalue()
-        output.close()
-
-        # Save the file to the server, overwriting if it exists
-        with open(filepath, "w", newline="", encoding="utf-8") as f:
-            f.write(csv_content_string)
-
-        logger.info(f"Evidence CSV successfully saved to {filepath}")
-        return filepath, csv_content_string
-
-    except Exception as e:
-        logger.error(f"Error during evidence CSV export process: {e}", exc_info=True)
-        raise  # Re-raise the exception to be handled by the calling view
+    return _export_to_csv_file(vector_store, "evidence", request)
 
 
 # --- DELETE ALL FUNCTIONS ---
@@ -459,245 +611,162 @@ def _get_csv_file_path(vector_store, filename_suffix, request=None):
     return filepath
 
 
-def import_evidence_from_csv_file(vector_store, request=None):
-    """
-    Imports evidence from a CSV file into the vector store.
-    Assumes CSV has 'id' and 'evidence' columns.
-    Uses the ID from CSV for potential overwrites based on vector_store's DuplicatePolicy.
+class SkipRow(Exception):
+    """Raised by a row builder to skip a CSV row with a message."""
 
-    Args:
-        vector_store: The vector store instance
-        request: The HTTP request object (optional, for new path resolution)
+
+def _import_documents_from_csv(vector_store, filepath, label, required_headers, build_document):
     """
-    filepath = _get_csv_file_path(vector_store, "evidence", request)
-    imported_count = 0
-    error_count = 0
-    messages = []
+    Read `filepath` and import the documents returned by build_document(row)
+    with a VectorBulkImporter: rows are written in chunks and unchanged rows
+    are neither re-embedded nor rewritten.
+    """
+    stats = VectorImportStats()
 
     if not os.path.exists(filepath):
-        messages.append(f"Error: File not found at {filepath}")
-        logger.error(f"Evidence import CSV file not found: {filepath}")
-        return {"imported_count": 0, "error_count": 1, "messages": messages}
+        stats.messages.append(f"Error: File not found at {filepath}")
+        logger.error(f"{label.capitalize()} import CSV file not found: {filepath}")
+        return {"imported_count": 0, "error_count": 1, "messages": stats.messages}
 
     try:
         with open(filepath, "r", newline="", encoding="utf-8") as f:
             reader = csv.DictReader(f)
-            if "id" not in reader.fieldnames or "evidence" not in reader.fieldnames:
-                msg = "Error: CSV file for evidence must contain 'id' and 'evidence' columns."
-                messages.append(msg)
+            if not all(header in (reader.fieldnames or []) for header in required_headers):
+                msg = f"Error: CSV file for {label} must contain all expected columns: {', '.join(required_headers)}."
+                stats.messages.append(msg)
                 logger.error(msg + f" File: {filepath}")
-                return {"imported_count": 0, "error_count": 1, "messages": messages}
+                return {"imported_count": 0, "error_count": 1, "messages": stats.messages}
 
+            importer = VectorBulkImporter(vector_store, stats)
             for row in reader:
+                stats.rows += 1
                 try:
-                    evidence_id = row.get("id")
-                    evidence_text = row.get("evidence")
-                    if (
-                        not evidence_id or evidence_text is None
-                    ):  # evidence_text can be empty string
-                        logger.warning(
-                            f"Skipping evidence row due to missing id or evidence key: {row}"
-                        )
-                        error_count += 1
-                        messages.append(
-                            f"Skipped evidence row: missing id or evidence data - ID: {evidence_id if evidence_id else 'N/A'}"
-                        )
-                        continue
-
-                    evidence_doc = EvidenceDocument(
-                        id=evidence_id, evidence=evidence_text
-                    )
-                    vector_store.add_evidence(evidence_doc)
-                    imported_count += 1
+                    importer.add(build_document(row))
+                except SkipRow as skip:
+                    logger.warning(f"Skipping {label} row: {skip} - {row}")
+                    stats.errors += 1
+                    stats.messages.append(f"Skipped {label} row: {skip}")
                 except Exception as e_row:
-                    logger.error(
-                        f"Error importing evidence row (ID: {evidence_id}): {e_row}"
-                    )
-                    error_count += 1
-                    messages.append(f"Error for evidence ID {evidence_id}: {e_row}")
-        if error_count > 0:
-            messages.insert(0, f"Import process completed with {error_count} errors.")
-        messages.insert(0, f"Successfully imported {imported_count} evidence items.")
-        logger.info(
-            f"Evidence import complete. Imported: {imported_count}, Errors: {error_count} from {filepath}"
+                    logger.error(f"Error importing {label} row (ID: {row.get('id')}): {e_row}")
+                    stats.errors += 1
+                    stats.messages.append(f"Error for {label} ID {row.get('id')}: {e_row}")
+            importer.finish()
+
+        if stats.errors > 0:
+            stats.messages.insert(0, f"Import process completed with {stats.errors} errors.")
+        stats.messages.insert(
+            0,
+            f"Successfully imported {stats.imported} {label} ({stats.inserted} new, "
+            f"{stats.updated} updated, {stats.skipped} unchanged) in {stats.seconds:.1f}s "
+            f"({stats.rows_per_sec} rows/sec).",
         )
+        logger.info(stats.summary(f"{label.capitalize()} import from {filepath}"))
     except Exception as e_file:
-        logger.error(f"Error processing CSV file {filepath} for evidence: {e_file}")
-        error_count += 1  # This might double count if an error also happened per row
-        messages.append(f"Failed to process CSV file {filepath}: {e_file}")
+        logger.error(f"Error processing CSV file {filepath} for {label}: {e_file}")
+        stats.errors += 1
+        stats.messages.append(f"Failed to process CSV file {filepath}: {e_file}")
 
     return {
-        "imported_count": imported_count,
-        "error_count": error_count,
-        "messages": messages,
+        "imported_count": stats.imported,
+        "inserted_count": stats.inserted,
+        "updated_count": stats.updated,
+        "skipped_count": stats.skipped,
+        "error_count": stats.errors,
+        "rows_per_sec": stats.rows_per_sec,
+        "messages": stats.messages,
     }
 
 
-def import_columns_from_csv_file(vector_store, request=None):
+def _evidence_from_row(row):
+    evidence_id = row.get("id")
+    evidence_text = row.get("evidence")
+    if not evidence_id or evidence_text is None:  # evidence_text can be empty string
+        raise SkipRow(
+            f"missing id or evidence data - ID: {evidence_id if evidence_id else 'N/A'}"
+        )
+    return EvidenceDocument(id=evidence_id, evidence=evidence_text)
+
+
+def _column_from_row(row):
+    col_id = row.get("id")
+    if not col_id:
+        raise SkipRow(f"missing id - Name: {row.get('original_column_name', 'N/A')}")
+
+    # Ensure required string fields get strings, not None.
+    original_column_name = row.get("original_column_name") or ""
+    return ColumnNameDocument(
+        id=col_id,
+        table_name=row.get("table_name") or "",
+        column_name=original_column_name,  # Fed from CSV's original_column_name
+        original_column_name=original_column_name,
+        column_description=row.get("column_description") or "",
+        value_description=row.get("value_description") or "",
+    )
+
+
+def _question_from_row(row):
+    q_id = row.get("id")
+    q_text = row.get("question")
+    q_sql = row.get("sql")
+    if not q_id or q_text is None or q_sql is None:  # question and sql can be empty strings
+        raise SkipRow(
+            f"missing id, question or sql data - ID: {q_id if q_id else 'N/A'}"
+        )
+    return SqlDocument(id=q_id, question=q_text, sql=q_sql)
+
+
+def import_evidence_from_csv_file(vector_store, request=None):
     """
-    Imports column documents from a CSV file into the vector store.
-    Uses IDs from CSV for potential overwrites.
+    Imports evidence from a CSV file into the vector store.
+    Assumes CSV has 'id' and 'evidence' columns.
+    Uses the ID from CSV, so re-importing a file overwrites the same points
+    and skips the rows whose content is unchanged.
 
     Args:
         vector_store: The vector store instance
         request: The HTTP request object (optional, for new path resolution)
     """
-    filepath = _get_csv_file_path(vector_store, "columns", request)
-    imported_count = 0
-    error_count = 0
-    messages = []
-
-    if not os.path.exists(filepath):
-        messages.append(f"Error: File not found at {filepath}")
-        logger.error(f"Columns import CSV file not found: {filepath}")
-        return {"imported_count": 0, "error_count": 1, "messages": messages}
-
-    try:
-        with open(filepath, "r", newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            expected_headers = [
-                "id",
-                "table_name",
-                "original_column_name",
-                "column_description",
-                "value_description",
-            ]
-            if not all(header in reader.fieldnames for header in expected_headers):
-                msg = f"Error: CSV file for columns must contain all expected columns: {', '.join(expected_headers)}."
-                messages.append(msg)
-                logger.error(msg + f" File: {filepath}")
-                return {"imported_count": 0, "error_count": 1, "messages": messages}
+    filepath = _get_csv_file_path(vector_store, "evidence", request)
+    return _import_documents_from_csv(
+        vector_store, filepath, "evidence", ["id", "evidence"], _evidence_from_row
+    )
 
-            for row in reader:
-                try:
-                    col_id = row.get("id")
-                    if not col_id:
-                        logger.warning(f"Skipping column row due to missing id: {row}")
-                        error_count += 1
-                        messages.append(
-                            f"Skipped column row: missing id - Name: {row.get('original_column_name', 'N/A')}"
-                        )
-                        continue
-
-                    table_name_val = row.get("table_name")
-                    original_column_name_val = row.get("original_column_name")
-                    column_description_val = row.get("column_description")
-                    value_description_val = row.get("value_description")
-
-                    # Ensure required string fields get strings, not None.
-                    # This addresses potential string_type errors and the "missing" error if it was due to None for a required string.
-                    csv_original_col_name = (
-                        original_column_name_val
-                        if original_column_name_val is not None
-                        else ""
-                    )
-                    csv_value_desc = (
-                        value_description_val
-                        if value_description_val is not None
-                        else ""
-                    )
 
-                    column_doc = ColumnNameDocument(
-                        id=col_id,
-                        table_name=table_name_val if table_name_val else "",
-                        column_name=csv_original_col_name,  # Fed from CSV's original_column_name
-                        original_column_name=csv_original_col_name,  # Fed from CSV's original_column_name
-                        column_description=column_description_val
-                        if column_description_val
-                        else "",
-                        value_description=csv_value_desc,
-                    )
-                    vector_store.add_column_description(column_doc)
-                    imported_count += 1
-                except Exception as e_row:
-                    logger.error(f"Error importing column row (ID: {col_id}): {e_row}")
-                    error_count += 1
-                    messages.append(f"Error for column ID {col_id}: {e_row}")
-        if error_count > 0:
-            messages.insert(0, f"Import process completed with {error_count} errors.")
-        messages.insert(0, f"Successfully imported {imported_count} columns.")
-        logger.info(
-            f"Column import complete. Imported: {imported_count}, Errors: {error_count} from {filepath}"
-        )
-    except Exception as e_file:
-        logger.error(f"Error processing CSV file {filepath} for columns: {e_file}")
-        messages.append(f"Failed to process CSV file {filepath}: {e_file}")
+def import_columns_from_csv_file(vector_store, request=None):
+    """
+    Imports column documents from a CSV file into the vector store.
+    Uses IDs from CSV for overwrites; unchanged rows are skipped.
 
-    return {
-        "imported_count": imported_count,
-        "error_count": error_count,
-        "messages": messages,
-    }
+    Args:
+        vector_store: The vector store instance
+        request: The HTTP request object (optional, for new path resolution)
+    """
+    filepath = _get_csv_file_path(vector_store, "columns", request)
+    expected_headers = [
+        "id",
+        "table_name",
+        "original_column_name",
+        "column_description",
+        "value_description",
+    ]
+    return _import_documents_from_csv(
+        vector_store, filepath, "columns", expected_headers, _column_from_row
+    )
 
 
 def import_questions_from_csv_file(vector_store, request=None):
     """
     Imports SQL documents (questions) from a CSV file into the vector store.
-    Uses IDs from CSV for potential overwrites.
+    Uses IDs from CSV for overwrites; unchanged rows are skipped.
 
     Args:
         vector_store: The vector store instance
         request: The HTTP request object (optional, for new path resolution)
     """
     filepath = _get_csv_file_path(vector_store, "questions", request)
-    imported_count = 0
-    error_count = 0
-    messages = []
-
-    if not os.path.exists(filepath):
-        messages.append(f"Error: File not found at {filepath}")
-        logger.error(f"Questions import CSV file not found: {filepath}")
-        return {"imported_count": 0, "error_count": 1, "messages": messages}
-
-    try:
-        with open(filepath, "r", newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            expected_headers = ["id", "question", "sql"]
-            if not all(header in reader.fieldnames for header in expected_headers):
-                msg = f"Error: CSV file for questions must contain all expected columns: {', '.join(expected_headers)}."
-                messages.append(msg)
-                logger.error(msg + f" File: {filepath}")
-                return {"imported_count": 0, "error_count": 1, "messages": messages}
-
-            for row in reader:
-                try:
-                    q_id = row.get("id")
-                    q_text = row.get("question")
-                    q_sql = row.get("sql")
-                    if (
-                        not q_id or q_text is None or q_sql is None
-                    ):  # question and sql can be empty strings
-                        logger.warning(
-                            f"Skipping question row due to missing id, question key, or sql key: {row}"
-                        )
-                        error_count += 1
-                        messages.append(
-                            f"Skipped question row: missing id, question or sql data - ID: {q_id if q_id else 'N/A'}"
-                        )
-                        continue
-
-                    question_doc = SqlDocument(id=q_id, question=q_text, sql=q_sql)
-                    vector_store.add_sql(question_doc)
-                    imported_count += 1
-                except Exception as e_row:
-                    logger.error(f"Error importing question row (ID: {q_id}): {e_row}")
-                    error_count += 1
-                    messages.append(f"Error for question ID {q_id}: {e_row}")
-        if error_count > 0:
-            messages.insert(0, f"Import process completed with {error_count} errors.")
-        messages.insert(0, f"Successfully imported {imported_count} questions.")
-        logger.info(
-            f"Questions import complete. Imported: {imported_count}, Errors: {error_count} from {filepath}"
-        )
-    except Exception as e_file:
-        logger.error(f"Error processing CSV file {filepath} for questions: {e_file}")
-        messages.append(f"Failed to process CSV file {filepath}: {e_file}")
-
-    return {
-        "imported_count": imported_count,
-        "error_count": error_count,
-        "messages": messages,
-    }
+    return _import_documents_from_csv(
+        vector_store, filepath, "questions", ["id", "question", "sql"], _question_from_row
+    )
 
 
 def export_columns_to_csv_file(vector_store, request=None):
@@ -709,81 +778,9 @@ def export_columns_to_csv_file(vector_store, request=None):
         request: The HTTP request object (optional, for new path resolution)
 
     Returns:
-        A tuple (filepath, csv_content_string) if successful,
-        otherwise raises an exception.
+        The path of the saved file; raises an exception on failure.
     """
-    try:
-        column_documents = vector_store.get_all_column_documents()
-
-        # Use new path resolution if request is provided
-        if request is not None:
-            try:
-                export_dir = get_csv_export_path(request)
-            except Exception as e:
-                logger.warning(
-                    f"Failed to get new CSV export path: {e}. Falling back to old method."
-                )
-                request = None  # Fall back to old method
-
-        # Fallback to old method if request not provided or new method failed
-        if request is None:
-            # Use qdrant as the folder name for Qdrant-based vector stores
-            vector_db_type_folder = "qdrant"
-
-            vector_db_type_folder = "".join(
-                c if c.isalnum() else "_" for c in vector_db_type_folder
-            ).strip("_")
-            if not vector_db_type_folder:
-                vector_db_type_folder = "default_vdb_type"
-
-            export_base_dir = "exports"
-            export_dir = os.path.join(export_base_dir, vector_db_type_folder)
-
-        os.makedirs(export_dir, exist_ok=True)
-
-        csv_filename = "columns_export.csv"
-        filepath = os.path.join(export_dir, csv_filename)
-
-        output = io.StringIO()
-        writer = csv.writer(output)
-        writer.writerow(
-            [
-                "id",
-                "table_name",
-                "original_column_name",
-                "column_description",
-                "value_description",
-            ]
-        )  # CSV Headers
-
-        for doc in column_documents:
-            if isinstance(doc, ColumnNameDocument):
-                writer.writerow(
-                    [
-                        getattr(doc, "id", ""),
-                        getattr(doc, "table_name", ""),
-                        getattr(doc, "column_name", ""),
-                        getattr(doc, "column_description", ""),
-                        getattr(doc, "value_description", ""),
-                    ]
-                )
-            else:
-                logger.warning(
-                    f"Skipping document of type {type(doc)} during column export, expected ColumnNameDocument."
-                )
-
-        csv_content_string = output.getvalue()
-        output.close()
-
-        with open(filepath, "w", newline="", encoding="utf-8") as f:
-            f.write(csv_content_string)
-
-        logger.info(f"Columns CSV successfully saved to {filepath}")
-        return filepath, csv_content_string
-
-    except Exception as e:
-        logger.error(f"Error during columns CSV export process: {e}", exc_info=True)
-        raise
+    return _export_to_csv_file(vector_store, "columns", request)
 
 
 def export_questions_to_csv_file(vector_store, request=None):
@@ -795,69 +792,6 @@ def export_questions_to_csv_file(vector_store, request=None):
         request: The HTTP request object (optional, for new path resolution)
 
     Returns:
-        A tuple (filepath, csv_content_string) if successful,
-        otherwise raises an exception.
+        The path of the saved file; raises an exception on failure.
     """
-    try:
-        sql_documents = vector_store.get_all_sql_documents()
-
-        # Use new path resolution if request is provided
-        if request is not None:
-            try:
-                export_dir = get_csv_export_path(request)
-            except Exception as e:
-                logger.warning(
-                    f"Failed to get new CSV export path: {e}. Falling back to old method."
-                )
-                request = None  # Fall back to old method
-
-        # Fallback to old method if request not provided or new method failed
-        if request is None:
-            # Use qdrant as the folder name for Qdrant-based vector stores
-            vector_db_type_folder = "qdrant"
-
-            vector_db_type_folder = "".join(
-                c if c.isalnum() else "_" for c in vector_db_type_folder
-            ).strip("_")
-            if not vector_db_type_folder:
-                vector_db_type_folder = "default_vdb_type"
-
-            export_base_dir = "exports"
-            export_dir = os.path.join(export_base_dir, vector_db_type_folder)
-
-        os.makedirs(export_dir, exist_ok=True)
-
-        csv_filename = "questions_export.csv"
-        filepath = os.path.join(export_dir, csv_filename)
-
-        output = io.StringIO()
-        writer = csv.writer(output)
-        writer.writerow(["id", "question", "sql", "evidence"])  # CSV Headers
-
-        for doc in sql_documents:
-            if isinstance(doc, SqlDocument):
-                writer.writerow(
-                    [
-                        getattr(doc, "id", ""),
-                        getattr(doc, "question", ""),
-                        getattr(doc, "sql", ""),
-                        getattr(doc, "evidence", ""),
-                    ]
-                )
-            else:
-                logger.warning(
-                    f"Skipping document of type {type(doc)} during questions export, expected SqlDocument."
-                )
-
-        csv_content_string = output.getvalue()
-        output.close()
-
-        with open(filepath, "w", newline="", encoding="utf-8") as f:
-            f.write(csv_content_string)
-
-        logger.info(f"Questions CSV successfully saved to {filepath}")
-        return filepath, csv_content_string
-
-    except Exception as e:
-        logger.error(f"Error during questions CSV export process: {e}", exc_info=True)
-        raise
+    return _export_to_csv_file(vector_store, "questions", request)
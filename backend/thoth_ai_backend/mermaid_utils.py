@@ -11,11 +11,10 @@
 # limitations under the License.
 
 import os
-import time
 import logging
 import requests
-from typing import Optional, Tuple
-from django.conf import settings
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
 from django.http import HttpResponse
 from reportlab.lib.pagesizes import A4
 from reportlab.platypus import SimpleDocTemplate, Image, Paragraph, Spacer
@@ -23,6 +22,14 @@ from reportlab.lib.styles import getSampleStyleSheet
 from reportlab.lib.units import inch
 from io import BytesIO
 
+from thoth_core.thoth_ai.artifact_cache import (
+    artifact_path,
+    cached_artifact,
+    fingerprint,
+    read_artifact,
+    write_artifact,
+)
+
 logger = logging.getLogger(__name__)
 
 # Mermaid service configuration
@@ -33,6 +40,7 @@ else:
     _default_service_url = _default_local_url
 
 MERMAID_SERVICE_URL = os.environ.get('MERMAID_SERVICE_URL', _default_service_url)
+MERMAID_RENDER_WORKERS = max(1, int(os.environ.get('THOTH_MERMAID_RENDER_WORKERS', '4')))
 
 
 class MermaidServiceError(Exception):
@@ -277,6 +285,28 @@ def convert_erd_to_vertical_flowchart(mermaid_content: str) -> str:
     return "\n".join(flowchart_lines)
 
 
+def _request_mermaid_image(mermaid_content: str, file_extension: str) -> bytes:
+    """Render a diagram through the Mermaid service and return the file content."""
+    headers = {'Content-Type': 'text/plain; charset=utf-8'}
+    # Make HTTP request to local mermaid service
+    response = requests.post(
+        f"{MERMAID_SERVICE_URL}/{file_extension}",
+        data=mermaid_content.encode('utf-8'),
+        headers=headers,
+        timeout=20,
+    )
+
+    if response.status_code != 200:
+        error_msg = f"Mermaid service returned status {response.status_code}"
+        if response.text:
+            error_msg += f": {response.text}"
+        raise MermaidServiceError(error_msg)
+
+    if file_extension == "svg":
+        return response.text.encode("utf-8")
+    return response.content
+
+
 def generate_mermaid_image(
     mermaid_content: str,
     output_format: str = "svg",
@@ -286,6 +316,10 @@ def generate_mermaid_image(
     """
     Generate an image from Mermaid diagram content using local mermaid service.
 
+    Images are stored in the artifact cache keyed by the diagram content,
+    so an unchanged diagram is returned without calling the service. The
+    returned file belongs to the cache and must not be deleted.
+
     Args:
         mermaid_content (str): The Mermaid diagram content
         output_format (str): Output format ('svg', 'png', 'pdf')
@@ -298,53 +332,29 @@ def generate_mermaid_image(
     if not mermaid_content or not mermaid_content.strip():
         return False, None, "Empty Mermaid content provided"
 
+    # Choose the appropriate endpoint based on format, PNG for other formats
+    file_extension = "svg" if output_format.lower() == "svg" else "png"
+
     try:
-        # Choose the appropriate endpoint based on format
-        if output_format.lower() == "svg":
-            url = f"{MERMAID_SERVICE_URL}/svg"
-            file_extension = "svg"
-            content_type = "image/svg+xml"
-        else:  # Default to PNG for other formats
-            url = f"{MERMAID_SERVICE_URL}/png"
-            file_extension = "png"
-            content_type = "image/png"
-
-        headers = {'Content-Type': 'text/plain; charset=utf-8'}
-        # Make HTTP request to local mermaid service
-        response = requests.post(
-            url,
-            data=mermaid_content.encode('utf-8'),
-            headers=headers,
-            timeout=20,
+        key = fingerprint("mermaid", mermaid_content, file_extension)
+        cached = os.path.exists(artifact_path("erd", key, file_extension))
+        output_path = cached_artifact(
+            "erd",
+            key,
+            file_extension,
+            lambda: _request_mermaid_image(mermaid_content, file_extension),
         )
 
-        if response.status_code != 200:
-            error_msg = f"Mermaid service returned status {response.status_code}"
-            if response.text:
-                error_msg += f": {response.text}"
-            logger.error(error_msg)
-            return False, None, error_msg
-
-        # Create temporary file to save the response
-        exports_dir = os.path.join(settings.BASE_DIR, "exports")
-        os.makedirs(exports_dir, exist_ok=True)
-
-        # Save response to file
-        output_filename = f"erd_{int(time.time())}.{file_extension}"
-        output_path = os.path.join(exports_dir, output_filename)
-
-        if content_type == "image/svg+xml":
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(response.text)
-        else:
-            with open(output_path, "wb") as f:
-                f.write(response.content)
-
-        logger.info(
-            f"Successfully generated Mermaid {file_extension.upper()}: {output_path}"
-        )
+        if not cached:
+            logger.info(
+                f"Successfully generated Mermaid {file_extension.upper()}: {output_path}"
+            )
         return True, output_path, None
 
+    except MermaidServiceError as e:
+        error_msg = str(e)
+        logger.error(error_msg)
+        return False, None, error_msg
     except requests.exceptions.Timeout:
         error_msg = "Diagram generation service is temporarily unavailable. Please try again later."
         logger.warning("Mermaid service timeout")
@@ -363,12 +373,43 @@ def generate_mermaid_image(
         return False, None, error_msg
 
 
+def generate_mermaid_images(
+    diagrams: List[Tuple[str, str]],
+) -> List[Tuple[bool, Optional[str], Optional[str]]]:
+    """
+    Generate several (mermaid_content, output_format) images concurrently.
+
+    Returns:
+        List of (success, output_path, error_message), in the order of `diagrams`.
+    """
+    if len(diagrams) <= 1:
+        return [generate_mermaid_image(content, fmt) for content, fmt in diagrams]
+    with ThreadPoolExecutor(max_workers=min(len(diagrams), MERMAID_RENDER_WORKERS)) as pool:
+        return list(pool.map(lambda diagram: generate_mermaid_image(*diagram), diagrams))
+
+
+def prerender_erd(mermaid_content: str) -> bool:
+    """
+    Render the SVG shown by the ERD page and the PNG used by the PDF export
+    in parallel, so both are served from the cache afterwards.
+    """
+    if not mermaid_content or not mermaid_content.strip():
+        return False
+    results = generate_mermaid_images([(mermaid_content, "svg"), (mermaid_content, "png")])
+    for success, _, error_msg in results:
+        if not success:
+            logger.warning(f"Could not pre-render ERD image: {error_msg}")
+    return all(success for success, _, _ in results)
+
+
 def generate_erd_pdf(
     mermaid_content: str, db_name: str
 ) -> Tuple[bool, Optional[HttpResponse], Optional[str]]:
     """
     Generate A4-optimized PDF from ERD Mermaid content.
 
+    PDFs are cached by diagram content and database name.
+
     Args:
         mermaid_content (str): The Mermaid diagram content
         db_name (str): Database name for the title
@@ -380,58 +421,57 @@ def generate_erd_pdf(
         return False, None, "No ERD diagram available"
 
     try:
-        # Generate PNG image using the HTTP service
-        success, image_path, error_msg = generate_mermaid_image(
-            mermaid_content, output_format="png"
-        )
-
-        if not success:
-            return False, None, error_msg or "Failed to generate ERD image"
-
-        # Create PDF
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(
-            buffer,
-            pagesize=A4,
-            rightMargin=0.75 * inch,
-            leftMargin=0.75 * inch,
-            topMargin=1 * inch,
-            bottomMargin=0.75 * inch,
-        )
-
-        # Prepare content
-        styles = getSampleStyleSheet()
-        story = []
-
-        # Title
-        title = Paragraph(f"{db_name} - Entity Relationship Diagram", styles["Title"])
-        story.append(title)
-        story.append(Spacer(1, 0.3 * inch))
-
-        # Image - fit to page width while maintaining aspect ratio
-        try:
-            img = Image(image_path)
-            img._restrictSize(doc.width, doc.height - 2 * inch)  # Leave space for title
-            story.append(img)
-        except Exception as e:
-            logger.error(f"Error adding image to PDF: {e}")
-            return False, None, f"Error creating PDF: {str(e)}"
-
-        # Build PDF
-        doc.build(story)
-
-        # Clean up temporary image file
-        try:
-            os.unlink(image_path)
-        except Exception:
-            pass
+        pdf_key = fingerprint("erd_pdf", mermaid_content, db_name)
+        pdf_content = read_artifact("erd", pdf_key, "pdf")
+
+        if pdf_content is None:
+            # Generate PNG image using the HTTP service
+            success, image_path, error_msg = generate_mermaid_image(
+                mermaid_content, output_format="png"
+            )
+
+            if not success:
+                return False, None, error_msg or "Failed to generate ERD image"
+
+            # Create PDF
+            buffer = BytesIO()
+            doc = SimpleDocTemplate(
+                buffer,
+                pagesize=A4,
+                rightMargin=0.75 * inch,
+                leftMargin=0.75 * inch,
+                topMargin=1 * inch,
+                bottomMargin=0.75 * inch,
+            )
+
+            # Prepare content
+            styles = getSampleStyleSheet()
+            story = []
+
+            # Title
+            title = Paragraph(f"{db_name} - Entity Relationship Diagram", styles["Title"])
+            story.append(title)
+            story.append(Spacer(1, 0.3 * inch))
+
+            # Image - fit to page width while maintaining aspect ratio
+            try:
+                img = Image(image_path)
+                img._restrictSize(doc.width, doc.height - 2 * inch)  # Leave space for title
+                story.append(img)
+            except Exception as e:
+                logger.error(f"Error adding image to PDF: {e}")
+                return False, None, f"Error creating PDF: {str(e)}"
+
+            # Build PDF
+            doc.build(story)
+            pdf_content = buffer.getvalue()
+            write_artifact("erd", pdf_key, "pdf", pdf_content)
+
+            logger.info(f"Successfully generated ERD PDF for database: {db_name}")
 
         # Create HTTP response
-        buffer.seek(0)
-        response = HttpResponse(buffer.getvalue(), content_type="application/pdf")
+        response = HttpResponse(pdf_content, content_type="application/pdf")
         response["Content-Disposition"] = f'attachment; filename="{db_name}_ERD.pdf"'
-
-        logger.info(f"Successfully generated ERD PDF for database: {db_name}")
         return True, response, None
 
     except Exception as e:
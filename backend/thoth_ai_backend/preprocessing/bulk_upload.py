@@ -0,0 +1,174 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Batched, deduplicated upload of documents to the vector store.
+
+Documents get a deterministic id derived from a hash of their content, so an
+upload can be turned into a sync: documents already stored under the same id
+are skipped, new ones are embedded and upserted in batches through
+bulk_add_documents() with a bounded number of batches in flight, and stored
+documents that are no longer in the source are deleted at the end.
+Re-uploading an unchanged file therefore embeds nothing.
+"""
+
+import logging
+import os
+import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterable, Optional
+
+from thoth_qdrant import ThothType
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = int(os.getenv("THOTH_UPLOAD_BATCH_SIZE", "100"))
+DEFAULT_CONCURRENCY = int(os.getenv("THOTH_UPLOAD_CONCURRENCY", "4"))
+
+# Namespace for content-derived document ids (uuid5 keeps them valid Qdrant ids)
+_DOCUMENT_ID_NAMESPACE = uuid.UUID("6f1c2f7e-3b0e-4c55-9a43-7f0e9d2c8a11")
+
+
+def content_document_id(thoth_type: ThothType, *parts: str) -> str:
+    """Return a stable document id for the given type and content."""
+    normalized = "\x1f".join(" ".join((part or "").split()) for part in parts)
+    return str(uuid.uuid5(_DOCUMENT_ID_NAMESPACE, f"{thoth_type.value}\x1e{normalized}"))
+
+
+def _existing_document_ids(vector_db, thoth_type: ThothType) -> set:
+    """Collect the ids of the documents of one type already in the store."""
+    if hasattr(vector_db, "get_documents_by_type"):
+        documents = vector_db.get_documents_by_type(thoth_type)
+    elif thoth_type == ThothType.EVIDENCE:
+        documents = vector_db.get_all_evidence_documents()
+    elif thoth_type == ThothType.SQL:
+        documents = vector_db.get_all_sql_documents()
+    else:
+        documents = vector_db.get_all_column_documents()
+    return {doc.id for doc in documents}
+
+
+def _delete_stale(vector_db, thoth_type: ThothType, stale_ids: set, executor) -> None:
+    """Delete stored documents that are no longer part of the source."""
+    if not stale_ids:
+        return
+    if hasattr(vector_db, "delete_documents"):
+        vector_db.delete_documents(list(stale_ids))
+    else:
+        # One call per document; run them on the upload pool
+        list(executor.map(vector_db.delete_document, stale_ids))
+    logger.info(f"Deleted {len(stale_ids)} stale {thoth_type.value} documents")
+
+
+def sync_documents(
+    vector_db,
+    thoth_type: ThothType,
+    documents: Iterable,
+    on_progress: Optional[Callable[[int, int, int], None]] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> Dict[str, float]:
+    """
+    Make the documents of `thoth_type` in the store match `documents`.
+
+    Args:
+        vector_db: Vector store created by VectorStoreFactory.
+        thoth_type: Type of the documents being synced.
+        documents: Iterable of documents whose ids were built with
+            content_document_id(); consumed lazily.
+        on_progress: Called with (processed, successful, failed) as
+            documents are skipped or batches complete.
+        batch_size: Documents embedded and upserted per bulk_add_documents call.
+        concurrency: Maximum number of batches in flight.
+
+    Returns:
+        Dict with processed, uploaded, skipped, failed, deleted, seconds and
+        docs_per_sec.
+    """
+    started = time.perf_counter()
+    existing_ids = _existing_document_ids(vector_db, thoth_type)
+    seen_ids = set()
+
+    processed = successful = failed = uploaded = skipped = 0
+
+    def report():
+        if on_progress:
+            on_progress(processed, successful, failed)
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        in_flight = {}
+
+        def collect(done):
+            nonlocal processed, successful, failed, uploaded
+            for future in done:
+                batch_len = in_flight.pop(future)
+                processed += batch_len
+                try:
+                    future.result()
+                    successful += batch_len
+                    uploaded += batch_len
+                except Exception as e:
+                    failed += batch_len
+                    logger.error(
+                        f"Failed to upload batch of {batch_len} {thoth_type.value} documents: {e}"
+                    )
+            report()
+
+        def submit(batch):
+            # Bound the work in flight so memory stays flat on large sources
+            if len(in_flight) >= max(1, concurrency):
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                collect(done)
+            in_flight[executor.submit(vector_db.bulk_add_documents, batch)] = len(batch)
+
+        batch = []
+        for doc in documents:
+            if doc.id in seen_ids or doc.id in existing_ids:
+                seen_ids.add(doc.id)
+                skipped += 1
+                processed += 1
+                successful += 1
+                if skipped % batch_size == 0:
+                    report()
+                continue
+            seen_ids.add(doc.id)
+            batch.append(doc)
+            if len(batch) >= batch_size:
+                submit(batch)
+                batch = []
+        if batch:
+            submit(batch)
+
+        if in_flight:
+            collect(wait(in_flight).done)
+        report()
+
+        stale_ids = existing_ids - seen_ids
+        _delete_stale(vector_db, thoth_type, stale_ids, executor)
+
+    seconds = time.perf_counter() - started
+    stats = {
+        "processed": processed,
+        "uploaded": uploaded,
+        "skipped": skipped,
+        "failed": failed,
+        "deleted": len(stale_ids),
+        "seconds": round(seconds, 3),
+        "docs_per_sec": round(processed / seconds, 1) if seconds > 0 else 0.0,
+    }
+    logger.info(
+        f"Synced {thoth_type.value} documents: {uploaded} uploaded, {skipped} unchanged, "
+        f"{failed} failed, {len(stale_ids)} deleted in {stats['seconds']}s "
+        f"({stats['docs_per_sec']} docs/sec)"
+    )
+    return stats
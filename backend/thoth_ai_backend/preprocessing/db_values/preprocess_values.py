@@ -17,6 +17,7 @@ from typing import Dict, List, Tuple
 
 from datasketch import MinHash, MinHashLSH
 from tqdm import tqdm
+from thoth_ai_backend.preprocessing.db_values.trigram_index import build_trigram_index
 from thoth_ai_backend.utils.progress_tracker import ProgressTracker
 
 
@@ -154,7 +155,8 @@ def make_lsh(
 
 def make_db_lsh(db, db_directory_path, db_name, **kwargs) -> int:
     """
-    Creates a MinHash LSH for the database and saves the results.
+    Creates a MinHash LSH for the database and saves the results, together
+    with the trigram index that workspaces can select instead of the LSH.
 
     Args:
         db_directory_path (str): The path to the database directory.
@@ -186,6 +188,14 @@ def make_db_lsh(db, db_directory_path, db_name, **kwargs) -> int:
     with open(preprocessed_path / f"{db_name}_minhashes.pkl", "wb") as file:
         pickle.dump(minhashes, file)
 
+    try:
+        build_trigram_index(
+            unique_values, preprocessed_path / f"{db_name}_trigrams.sqlite3"
+        )
+    except Exception as e:
+        # The LSH is complete; workspaces using the trigram index fall back to it
+        logging.error(f"Error creating trigram index for {db_name}: {e}")
+
     # Return the number of processed items
     total_unique_values = sum(
         len(column_values)
@@ -0,0 +1,142 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Trigram inverted index of the database values.
+
+An alternative to the MinHash LSH for value lookup, built from the same
+`db.get_unique_values()` output. Every value is split into the lowercase
+character trigrams of " value " (padded, so values shorter than three
+characters still get grams). The index maps each trigram to the ids of the
+values containing it. Unlike MinHash, a lookup sees every value sharing a
+trigram with the keyword, so short values and multi-token entities are not
+lost to the signature.
+
+The index is one SQLite file, {db_name}_trigrams.sqlite3, next to the LSH
+pickles:
+- `value_index(id, table_name, column_name, value, grams)`: one row per value,
+  with its number of distinct trigrams.
+- `postings(gram, ids)`: the ids of a trigram as a little-endian uint32 blob.
+- `meta(key, value)`: format version and n-gram size.
+
+The SQL generator reads it in helpers/value_index.py, which splits keywords
+with the same `value_grams()` rules.
+"""
+
+import logging
+import os
+import sqlite3
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Set, Union
+
+import numpy as np
+
+FORMAT_VERSION = "1"
+
+
+def value_grams(value: str, n_gram: int = 3) -> Set[str]:
+    """
+    Distinct lowercase character n-grams of a value, padded with one space on each side.
+
+    Args:
+        value (str): The value to split.
+        n_gram (int, optional): The n-gram size. Defaults to 3.
+
+    Returns:
+        Set[str]: The n-grams, empty for a blank value.
+    """
+    text = " ".join(str(value).lower().split())
+    if not text:
+        return set()
+    padded = f" {text} "
+    return {padded[i : i + n_gram] for i in range(len(padded) - n_gram + 1)}
+
+
+def build_trigram_index(
+    unique_values: Dict[str, Dict[str, List[str]]],
+    index_path: Union[str, Path],
+    n_gram: int = 3,
+) -> int:
+    """
+    Builds the trigram index of the unique values and writes it to index_path.
+
+    The file is written under a temporary name and moved into place, so
+    readers never see a half-built index.
+
+    Args:
+        unique_values (Dict[str, Dict[str, List[str]]]): {table_name: {column_name: [values]}}.
+        index_path (Union[str, Path]): The SQLite file to write.
+        n_gram (int, optional): The n-gram size. Defaults to 3.
+
+    Returns:
+        int: The number of values indexed.
+    """
+    index_path = Path(index_path)
+    tmp_path = index_path.with_name(index_path.name + ".tmp")
+    if tmp_path.exists():
+        tmp_path.unlink()
+
+    rows = []
+    postings: Dict[str, List[int]] = defaultdict(list)
+    for table_name, table_values in unique_values.items():
+        for column_name, column_values in table_values.items():
+            for value in column_values:
+                grams = value_grams(value, n_gram)
+                if not grams:
+                    continue
+                value_id = len(rows)
+                rows.append((value_id, table_name, column_name, str(value), len(grams)))
+                for gram in grams:
+                    postings[gram].append(value_id)
+
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.executescript(
+            """
+            CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+            CREATE TABLE value_index (
+                id INTEGER PRIMARY KEY,
+                table_name TEXT NOT NULL,
+                column_name TEXT NOT NULL,
+                value TEXT NOT NULL,
+                grams INTEGER NOT NULL
+            );
+            CREATE TABLE postings (gram TEXT PRIMARY KEY, ids BLOB NOT NULL) WITHOUT ROWID;
+            """
+        )
+        with conn:
+            conn.executemany("INSERT INTO value_index VALUES (?, ?, ?, ?, ?)", rows)
+            # Ids were appended in increasing order, so every posting list is sorted
+            conn.executemany(
+                "INSERT INTO postings VALUES (?, ?)",
+                (
+                    (gram, np.asarray(ids, dtype="<u4").tobytes())
+                    for gram, ids in postings.items()
+                ),
+            )
+            conn.executemany(
+                "INSERT INTO meta VALUES (?, ?)",
+                [
+                    ("version", FORMAT_VERSION),
+                    ("n_gram", str(n_gram)),
+                    ("values", str(len(rows))),
+                ],
+            )
+    finally:
+        conn.close()
+    os.replace(tmp_path, index_path)
+
+    logging.info(
+        f"Trigram index {index_path.name}: {len(rows)} values, {len(postings)} trigrams"
+    )
+    return len(rows)
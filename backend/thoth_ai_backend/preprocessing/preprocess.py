@@ -57,6 +57,7 @@ def preprocess(
     setting: Dict,
     lsh_root_arg: str = None,
     workspace_id: int = None,
+    job=None,
 ) -> None:
     """
     Preprocesses a database by creating Locality-Sensitive Hashing (LSH) signatures and context vectors.
@@ -81,6 +82,8 @@ def preprocess(
         lsh_root_arg (str, optional): Root directory path for storing LSH data.
             If None, will use DB_ROOT_PATH environment variable. Defaults to None.
         workspace_id (int, optional): Workspace ID for progress tracking.
+        job (JobContext, optional): Job queue context. The LSH phase is
+            checkpointed, so a resumed job goes straight to the context vectors.
 
     Returns:
         None
@@ -143,20 +146,29 @@ def preprocess(
     else:
         total_items = 0
 
-    logging.info(f"Creating LSH for {db_name} in {db_directory_path}")
-    lsh_processed_items = make_db_lsh(
-        db,
-        db_directory_path,
-        db_name,
-        signature_size=signature_size,
-        n_gram=n_gram,
-        threshold=threshold,
-        verbose=verbose,
-        workspace_id=workspace_id,
-    )
-    logging.info(
-        f"LSH for {db_name} created. Processed {lsh_processed_items} unique values."
-    )
+    if job is not None and "lsh_processed_items" in job.checkpoint:
+        lsh_processed_items = job.checkpoint["lsh_processed_items"]
+        logging.info(
+            f"Resuming preprocessing of {db_name}: LSH already built ({lsh_processed_items} unique values)"
+        )
+    else:
+        logging.info(f"Creating LSH for {db_name} in {db_directory_path}")
+        lsh_processed_items = make_db_lsh(
+            db,
+            db_directory_path,
+            db_name,
+            signature_size=signature_size,
+            n_gram=n_gram,
+            threshold=threshold,
+            verbose=verbose,
+            workspace_id=workspace_id,
+        )
+        logging.info(
+            f"LSH for {db_name} created. Processed {lsh_processed_items} unique values."
+        )
+        if job is not None:
+            job.save_checkpoint(lsh_processed_items=lsh_processed_items)
+            job.raise_if_cancelled()
     logging.info(f"Creating context vectors for {db_name}")
 
     columns_processed = make_db_context_vec_db(
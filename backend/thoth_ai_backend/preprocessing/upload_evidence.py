@@ -34,29 +34,35 @@ django.setup()
 from thoth_core.models import Workspace
 
 from thoth_ai_backend.backend_utils.vectordb_config_utils import get_vectordb_config
+from thoth_ai_backend.preprocessing.bulk_upload import content_document_id, sync_documents
 from thoth_ai_backend.utils.progress_tracker import ProgressTracker
 
 
-def upload_evidence_to_vectordb(workspace_id=None) -> tuple:
+def upload_evidence_to_vectordb(workspace_id=None, job=None) -> tuple:
     """
     Uploads evidence from dev.json to the vector database and updates the workspace timestamp.
 
     This function processes evidence data from a development JSON file and uploads it to the
     appropriate vector database collection associated with the specified workspace. It first
-    establishes connections to the workspace's SQL database and vector database, then clears
-    any existing evidence documents before uploading new ones. Only evidence with matching db_id
-    (corresponding to the collection name) are processed.
+    establishes connections to the workspace's SQL database and vector database, then syncs
+    the stored evidence documents with the file: unchanged documents are kept, new ones are
+    embedded and uploaded in batches, and documents no longer in the file are removed.
+    Only evidence with matching db_id (corresponding to the collection name) are processed.
 
     The function workflow:
     1. Creates a QdrantVectorStore for the collection based on workspace's SQL DB
-    2. Deletes all existing EVIDENCE documents
-    3. Reads evidence from data/dev_databases/dev.json
-    4. Creates and uploads EvidenceDocuments for each evidence where db_id matches the workspace's collection
+    2. Reads evidence from data/dev_databases/dev.json
+    3. Builds EvidenceDocuments with content-derived ids for each evidence where db_id matches the workspace's collection
+    4. Uploads only the documents not already stored, in batches (see bulk_upload.sync_documents),
+       and deletes the stored EVIDENCE documents that are no longer in the file
     5. Updates the workspace's last_evidence_load timestamp
 
     Args:
         workspace_id (int, optional): The ID of the workspace to determine the collection name
             and database connections. Must be provided.
+        job (JobContext, optional): Job queue context; the upload stops between
+            batches when the job is cancelled. Documents already stored are
+            skipped when it runs again, so an interrupted upload resumes.
 
     Raises:
         ValueError: If workspace_id is not provided, if the workspace doesn't exist,
@@ -152,16 +158,6 @@ def upload_evidence_to_vectordb(workspace_id=None) -> tuple:
 
     vector_db = VectorStoreFactory.create(backend, **vector_params)
 
-    # Delete existing collection before uploading new evidence
-    try:
-        if hasattr(vector_db, "delete_collection"):
-            vector_db.delete_collection(thoth_type=ThothType.EVIDENCE)
-            logging.info(
-                f"Deleted existing EVIDENCE collection for {vector_db_config.get('collection_name')}"
-            )
-    except Exception as e:
-        logging.warning(f"Could not delete existing EVIDENCE collection: {e}")
-
     logging.info(
         f"Using vector database: {vector_db_config['vector_db_type']}, "
         f"collection: {vector_db_config.get('collection_name')}, "
@@ -181,14 +177,6 @@ def upload_evidence_to_vectordb(workspace_id=None) -> tuple:
         logging.error(error_msg)
         raise RuntimeError(error_msg)
 
-    # Delete all existing EVIDENCE documents
-    # Use the interface method instead of the implementation-specific method
-    existing_evidence = vector_db.get_all_evidence_documents()
-    if existing_evidence:
-        evidence_ids = [doc.id for doc in existing_evidence]
-        vector_db.delete_documents(evidence_ids)
-        logging.info(f"Deleted {len(evidence_ids)} existing evidence documents")
-
     # Read dev.json file
     project_root = Path(__file__).resolve().parents[2]
 
@@ -247,74 +235,42 @@ def upload_evidence_to_vectordb(workspace_id=None) -> tuple:
     logging.info(f"Found {total_items} evidence items to process for db_id: {db_id}")
 
     # Update progress tracking with the actual total (it was initialized with 0 in the view)
-    progress = ProgressTracker.get_progress(workspace_id, "evidence")
-    if progress:
-        # Update the total items count now that we know the actual number
-        ProgressTracker.update_progress(workspace_id, "evidence", 0, 0, 0)
-        # Now update with the correct total
-        progress = ProgressTracker.get_progress(workspace_id, "evidence")
-        if progress:
-            from django.core.cache import cache
-
-            progress["total_items"] = total_items
-            cache_key = ProgressTracker.get_cache_key(workspace_id, "evidence")
-            cache.set(cache_key, json.dumps(progress), timeout=3600)
-    else:
-        # Fallback: initialize if somehow it doesn't exist yet
-        ProgressTracker.init_progress(workspace_id, "evidence", total_items)
-
-    successful_uploads = 0
-    failed_uploads = 0
-    processed_items = 0
-
-    # Process each entry, filtering for the specified db_id
-    for entry in dev_data:
-        if entry.get("db_id") != db_id:
-            continue
-
-        evidence = entry.get("evidence")
-        if not evidence or not isinstance(evidence, str):
-            logging.warning(f"Skipping invalid evidence entry: {entry}")
-            continue
-
-        evidence_doc = EvidenceDocument(
-            evidence=evidence.strip(),
-            text=evidence.strip(),  # Use evidence as the text for searching
-        )
-
-        try:
-            vector_db.add_evidence(evidence_doc)
-            successful_uploads += 1
-            processed_items += 1
-            # Update progress tracker
-            ProgressTracker.update_progress(
-                workspace_id,
-                "evidence",
-                processed_items,
-                successful_uploads,
-                failed_uploads,
-            )
-            progress_percentage = (
-                int((processed_items / total_items) * 100) if total_items > 0 else 0
-            )
-            logging.info(
-                f"Successfully uploaded evidence ({processed_items}/{total_items} - {progress_percentage}%): {evidence[:100]}..."
-            )
-        except Exception as e:
-            failed_uploads += 1
-            processed_items += 1
-            # Update progress tracker
-            ProgressTracker.update_progress(
-                workspace_id,
-                "evidence",
-                processed_items,
-                successful_uploads,
-                failed_uploads,
-            )
-            logging.error(
-                f"Failed to upload evidence: {evidence[:100]}... Error: {str(e)}"
+    ProgressTracker.set_total(workspace_id, "evidence", total_items)
+
+    def evidence_documents():
+        # Built lazily; ids are derived from the content so unchanged
+        # evidence already in the store is recognised and skipped
+        for entry in dev_data:
+            if entry.get("db_id") != db_id:
+                continue
+
+            evidence = entry.get("evidence")
+            if not evidence or not isinstance(evidence, str):
+                logging.warning(f"Skipping invalid evidence entry: {entry}")
+                continue
+
+            yield EvidenceDocument(
+                id=content_document_id(ThothType.EVIDENCE, evidence),
+                evidence=evidence.strip(),
+                text=evidence.strip(),  # Use evidence as the text for searching
             )
 
+    def report_progress(processed, successful, failed):
+        ProgressTracker.update_progress(
+            workspace_id, "evidence", processed, successful, failed
+        )
+        if job is not None:
+            job.raise_if_cancelled()
+
+    stats = sync_documents(
+        vector_db,
+        ThothType.EVIDENCE,
+        evidence_documents(),
+        on_progress=report_progress,
+    )
+    successful_uploads = stats["processed"] - stats["failed"]
+    failed_uploads = stats["failed"]
+
     # Clear the cache to ensure fresh data on next retrieval
     # get_cached_training_data.clear(ThothType.EVIDENCE) - sostituire con equivalente streamlit free
 
@@ -34,29 +34,35 @@ django.setup()
 from thoth_core.models import Workspace
 
 from thoth_ai_backend.backend_utils.vectordb_config_utils import get_vectordb_config
+from thoth_ai_backend.preprocessing.bulk_upload import content_document_id, sync_documents
 from thoth_ai_backend.utils.progress_tracker import ProgressTracker
 
 
-def upload_questions_to_vectordb(workspace_id=None) -> tuple:
+def upload_questions_to_vectordb(workspace_id=None, job=None) -> tuple:
     """
     Uploads questions from dev.json to the vector database and updates the workspace timestamp.
 
     This function processes question data from a development JSON file and uploads it to the
     appropriate vector database collection associated with the specified workspace. It first
-    establishes connections to the workspace's SQL database and vector database, then clears
-    any existing question documents before uploading new ones. Only questions with matching db_id
-    (corresponding to the collection name) are processed.
+    establishes connections to the workspace's SQL database and vector database, then syncs
+    the stored question documents with the file: unchanged documents are kept, new ones are
+    embedded and uploaded in batches, and documents no longer in the file are removed.
+    Only questions with matching db_id (corresponding to the collection name) are processed.
 
     The function workflow:
     1. Creates a QdrantVectorStore for the collection based on workspace's SQL DB
-    2. Deletes all existing SQL documents
-    3. Reads questions from data/dev_databases/dev.json
-    4. Creates and uploads SqlDocuments for each evidence where db_id matches the workspace's collection
+    2. Reads questions from data/dev_databases/dev.json
+    3. Builds SqlDocuments with content-derived ids for each question where db_id matches the workspace's collection
+    4. Uploads only the documents not already stored, in batches (see bulk_upload.sync_documents),
+       and deletes the stored SQL documents that are no longer in the file
     5. Updates the workspace's last_sql_loaded timestamp
 
     Args:
         workspace_id (int, optional): The ID of the workspace to determine the collection name
             and database connections. Must be provided.
+        job (JobContext, optional): Job queue context; the upload stops between
+            batches when the job is cancelled. Documents already stored are
+            skipped when it runs again, so an interrupted upload resumes.
 
     Raises:
         ValueError: If workspace_id is not provided, if the workspace doesn't exist,
@@ -152,16 +158,6 @@ def upload_questions_to_vectordb(workspace_id=None) -> tuple:
 
     vector_db = VectorStoreFactory.create(backend, **vector_params)
 
-    # Delete existing collection before uploading new questions
-    try:
-        if hasattr(vector_db, "delete_collection"):
-            vector_db.delete_collection(thoth_type=ThothType.SQL)
-            logging.info(
-                f"Deleted existing SQL collection for {vector_db_config.get('collection_name')}"
-            )
-    except Exception as e:
-        logging.warning(f"Could not delete existing SQL collection: {e}")
-
     logging.info(
         f"Using vector database: {vector_db_config['vector_db_type']}, "
         f"collection: {vector_db_config.get('collection_name')}, "
@@ -177,14 +173,6 @@ def upload_questions_to_vectordb(workspace_id=None) -> tuple:
         logging.error(error_msg)
         return 0  # Return 0 to indicate failure
 
-    # Delete all existing SQL documents
-    # Use the interface method instead of the implementation-specific method
-    existing_questions = vector_db.get_all_sql_documents()
-    if existing_questions:
-        question_ids = [doc.id for doc in existing_questions]
-        vector_db.delete_documents(question_ids)
-        logging.info(f"Deleted {len(question_ids)} existing question documents")
-
     # Read dev.json file
     project_root = Path(__file__).resolve().parents[2]
 
@@ -245,84 +233,52 @@ def upload_questions_to_vectordb(workspace_id=None) -> tuple:
     logging.info(f"Found {total_items} question items to process for db_id: {db_id}")
 
     # Update progress tracking with the actual total (it was initialized with 0 in the view)
-    progress = ProgressTracker.get_progress(workspace_id, "questions")
-    if progress:
-        # Update the total items count now that we know the actual number
-        ProgressTracker.update_progress(workspace_id, "questions", 0, 0, 0)
-        # Now update with the correct total
-        progress = ProgressTracker.get_progress(workspace_id, "questions")
-        if progress:
-            from django.core.cache import cache
-
-            progress["total_items"] = total_items
-            cache_key = ProgressTracker.get_cache_key(workspace_id, "questions")
-            cache.set(cache_key, json.dumps(progress), timeout=3600)
-    else:
-        # Fallback: initialize if somehow it doesn't exist yet
-        ProgressTracker.init_progress(workspace_id, "questions", total_items)
-
-    successful_uploads = 0
-    failed_uploads = 0
-    processed_items = 0
-
-    # Process each entry, filtering for the specified db_id
-    for entry in dev_data:
-        if entry.get("db_id") != db_id:
-            continue
-
-        question = entry.get("question")
-        sql = entry.get("SQL")
-        evidence = entry.get("evidence", "")
-
-        if (
-            not question
-            or not isinstance(question, str)
-            or not sql
-            or not isinstance(sql, str)
-        ):
-            logging.warning(f"Skipping invalid question entry: {entry}")
-            continue
-
-        sql_doc = SqlDocument(
-            question=question.strip(),
-            sql=sql.strip(),
-            evidence=evidence.strip(),
-            text=question.strip(),  # Use question as the text for searching
-        )
-
-        try:
-            vector_db.add_sql(sql_doc)
-            successful_uploads += 1
-            processed_items += 1
-            # Update progress tracker
-            ProgressTracker.update_progress(
-                workspace_id,
-                "questions",
-                processed_items,
-                successful_uploads,
-                failed_uploads,
-            )
-            progress_percentage = (
-                int((processed_items / total_items) * 100) if total_items > 0 else 0
-            )
-            logging.info(
-                f"Successfully uploaded question ({processed_items}/{total_items} - {progress_percentage}%): {question[:100]}..."
-            )
-        except Exception as e:
-            failed_uploads += 1
-            processed_items += 1
-            # Update progress tracker
-            ProgressTracker.update_progress(
-                workspace_id,
-                "questions",
-                processed_items,
-                successful_uploads,
-                failed_uploads,
-            )
-            logging.error(
-                f"Failed to upload question: {question[:100]}... Error: {str(e)}"
+    ProgressTracker.set_total(workspace_id, "questions", total_items)
+
+    def question_documents():
+        # Built lazily; ids are derived from the content so unchanged
+        # questions already in the store are recognised and skipped
+        for entry in dev_data:
+            if entry.get("db_id") != db_id:
+                continue
+
+            question = entry.get("question")
+            sql = entry.get("SQL")
+            evidence = entry.get("evidence", "")
+
+            if (
+                not question
+                or not isinstance(question, str)
+                or not sql
+                or not isinstance(sql, str)
+            ):
+                logging.warning(f"Skipping invalid question entry: {entry}")
+                continue
+
+            yield SqlDocument(
+                id=content_document_id(ThothType.SQL, question, sql, evidence),
+                question=question.strip(),
+                sql=sql.strip(),
+                evidence=evidence.strip(),
+                text=question.strip(),  # Use question as the text for searching
             )
 
+    def report_progress(processed, successful, failed):
+        ProgressTracker.update_progress(
+            workspace_id, "questions", processed, successful, failed
+        )
+        if job is not None:
+            job.raise_if_cancelled()
+
+    stats = sync_documents(
+        vector_db,
+        ThothType.SQL,
+        question_documents(),
+        on_progress=report_progress,
+    )
+    successful_uploads = stats["processed"] - stats["failed"]
+    failed_uploads = stats["failed"]
+
     # Update the last_sql_loaded timestamp in the workspace
     workspace.last_sql_loaded = timezone.now()
     workspace.save()
@@ -22,6 +22,7 @@ from .views import (
     DbDocsView,
     ErdView,
     GdprReportView,
+    LatencyDashboardView,
 )
 from . import views_progress
 
@@ -143,6 +144,11 @@ urlpatterns = [
         views_progress.check_questions_progress,
         name="check_questions_progress",
     ),
+    path(
+        "workspace/<int:workspace_id>/progress/<str:operation_type>/stream/",
+        views_progress.progress_stream,
+        name="progress_stream",
+    ),
     # Keep original sync endpoints as fallback
     path(
         "workspace/<int:workspace_id>/upload-evidences-sync/",
@@ -167,6 +173,11 @@ urlpatterns = [
     path("erd/export-pdf/", views.erd_export_pdf, name="erd_export_pdf"),
     # GDPR compliance
     path("gdpr-report/", GdprReportView.as_view(), name="gdpr_report"),
+    path(
+        "latency-dashboard/",
+        LatencyDashboardView.as_view(),
+        name="latency_dashboard",
+    ),
     path("gdpr-report/export-pdf/", views.gdpr_export_pdf, name="gdpr_export_pdf"),
     path("gdpr-report/export-json/", views.gdpr_export_json, name="gdpr_export_json"),
     path("gdpr-report/export-csv/", views.gdpr_export_csv, name="gdpr_export_csv"),
@@ -0,0 +1,156 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Storage backends for ProgressTracker.
+
+- MemoryProgressBackend: a dict guarded by a lock. Only visible inside the
+  current process; meant for tests and single-process development servers.
+- SharedMemoryProgressBackend (default): one small JSON file per operation in
+  a tmpfs directory (/dev/shm when available). Visible to every process on
+  the host, so it works with multi-worker gunicorn, and never touches the
+  database. Separate containers share it through THOTH_PROGRESS_DIR on a
+  volume mounted by all of them (see docker-compose.yml).
+- RedisProgressBackend: for deployments spanning several hosts. Any client
+  exposing get/set/delete (redis-py, fakeredis, ...) can be injected, which
+  is how it is stubbed locally.
+
+The backend is selected with the THOTH_PROGRESS_BACKEND environment variable
+("memory", "shm" or "redis"); THOTH_PROGRESS_REDIS_URL configures Redis.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Progress entries expire after one hour, like the previous cache entries
+PROGRESS_TTL_SECONDS = 3600
+
+
+class MemoryProgressBackend:
+    """In-process progress storage."""
+
+    def __init__(self):
+        self._data: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            data = self._data.get(key)
+            return dict(data) if data is not None else None
+
+    def set(self, key: str, data: Dict[str, Any]) -> None:
+        with self._lock:
+            self._data[key] = dict(data)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+
+class SharedMemoryProgressBackend:
+    """
+    Host-wide progress storage on a tmpfs directory.
+
+    Writes go to a temporary file that is atomically renamed over the target,
+    so readers never observe a partially written entry.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        if directory is None:
+            base = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+            directory = os.path.join(base, "thoth_progress")
+        self.directory = directory
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._path(key)
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        if data.get("_expires_at", 0) < time.time():
+            self.delete(key)
+            return None
+        data.pop("_expires_at", None)
+        return data
+
+    def set(self, key: str, data: Dict[str, Any]) -> None:
+        payload = dict(data, _expires_at=time.time() + PROGRESS_TTL_SECONDS)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(payload, f)
+            os.replace(tmp_path, self._path(key))
+        except Exception:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def delete(self, key: str) -> None:
+        try:
+            os.unlink(self._path(key))
+        except FileNotFoundError:
+            pass
+
+
+class RedisProgressBackend:
+    """Progress storage on a Redis-compatible server."""
+
+    def __init__(self, client=None, url: Optional[str] = None):
+        if client is None:
+            try:
+                import redis
+            except ImportError as e:
+                raise ImportError(
+                    "The redis progress backend requires the 'redis' package"
+                ) from e
+            client = redis.Redis.from_url(url or "redis://localhost:6379/0")
+        self.client = client
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        raw = self.client.get(key)
+        if raw is None:
+            return None
+        if isinstance(raw, bytes):
+            raw = raw.decode("utf-8")
+        return json.loads(raw)
+
+    def set(self, key: str, data: Dict[str, Any]) -> None:
+        self.client.set(key, json.dumps(data), ex=PROGRESS_TTL_SECONDS)
+
+    def delete(self, key: str) -> None:
+        self.client.delete(key)
+
+
+def create_backend(name: Optional[str] = None):
+    """Instantiate the progress backend selected by name or environment."""
+    name = (name or os.getenv("THOTH_PROGRESS_BACKEND", "shm")).lower()
+    if name == "memory":
+        return MemoryProgressBackend()
+    if name == "redis":
+        return RedisProgressBackend(url=os.getenv("THOTH_PROGRESS_REDIS_URL"))
+    if name != "shm":
+        logger.warning(f"Unknown progress backend '{name}', using shared memory")
+    return SharedMemoryProgressBackend(os.getenv("THOTH_PROGRESS_DIR"))
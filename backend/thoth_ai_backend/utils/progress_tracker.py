@@ -10,28 +10,108 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from django.core.cache import cache
-import json
 import logging
+import os
+import threading
+import time
+
+from thoth_ai_backend.utils.progress_backends import create_backend
 
 logger = logging.getLogger(__name__)
 
+TERMINAL_STATUSES = ("completed", "failed")
+
 
 class ProgressTracker:
     """
-    A simple progress tracker using Django's cache to store progress information
-    for long-running operations like evidence and question uploads.
+    Progress tracker for long-running operations like evidence and question
+    uploads and preprocessing.
+
+    Progress is kept in a low-overhead backend (shared memory by default, see
+    progress_backends) instead of the database cache. Updates are coalesced
+    in the writing process: update_progress() only publishes to the backend
+    when THOTH_PROGRESS_FLUSH_INTERVAL seconds (default 0.5) have elapsed
+    since the last publish, or when the operation reaches a terminal state,
+    so callers can report progress after every item without extra cost.
+
+    The backend is the source of truth. A process only answers from its own
+    buffer while it holds an update that has not been published yet;
+    init_progress(), set_total() and mark_failed() always write through.
     """
 
+    FLUSH_INTERVAL = float(os.getenv("THOTH_PROGRESS_FLUSH_INTERVAL", "0.5"))
+
+    _backend = None
+    _backend_lock = threading.Lock()
+    # Latest progress, last publish time and unpublished keys, for the
+    # process running update_progress()
+    _local_state = {}
+    _last_flush = {}
+    _pending = set()
+    _state_lock = threading.Lock()
+
+    @classmethod
+    def get_backend(cls):
+        """Return the shared progress backend, creating it on first use."""
+        if cls._backend is None:
+            with cls._backend_lock:
+                if cls._backend is None:
+                    cls._backend = create_backend()
+        return cls._backend
+
+    @classmethod
+    def set_backend(cls, backend):
+        """Replace the progress backend (used by tests and custom deployments)."""
+        with cls._backend_lock:
+            cls._backend = backend
+        with cls._state_lock:
+            cls._local_state.clear()
+            cls._last_flush.clear()
+            cls._pending.clear()
+
     @staticmethod
     def get_cache_key(workspace_id, operation_type):
-        """Generate a unique cache key for the progress tracking."""
+        """Generate a unique key for the progress tracking."""
         return f"progress_{operation_type}_{workspace_id}"
 
-    @staticmethod
-    def init_progress(workspace_id, operation_type, total_items):
+    @classmethod
+    def _forget(cls, key):
+        """Drop the buffered progress of a key (caller holds _state_lock)."""
+        cls._local_state.pop(key, None)
+        cls._last_flush.pop(key, None)
+        cls._pending.discard(key)
+
+    @classmethod
+    def _publish(cls, key, progress_data, force=False):
+        """Write progress to the backend unless a recent write makes it redundant."""
+        now = time.monotonic()
+        with cls._state_lock:
+            if progress_data.get("status") in TERMINAL_STATUSES:
+                # Nothing will follow a terminal update; the backend becomes the
+                # only copy, so a clear_progress() from another worker is honoured
+                cls._forget(key)
+                force = True
+            else:
+                cls._local_state[key] = dict(progress_data)
+                last = cls._last_flush.get(key)
+                if not force and last is not None and now - last < cls.FLUSH_INTERVAL:
+                    cls._pending.add(key)
+                    return
+                cls._last_flush[key] = now
+                cls._pending.discard(key)
+        cls.get_backend().set(key, progress_data)
+
+    @classmethod
+    def _write_through(cls, key, progress_data):
+        """Write progress to the backend without keeping a local copy."""
+        with cls._state_lock:
+            cls._forget(key)
+        cls.get_backend().set(key, progress_data)
+
+    @classmethod
+    def init_progress(cls, workspace_id, operation_type, total_items):
         """Initialize progress tracking for an operation."""
-        cache_key = ProgressTracker.get_cache_key(workspace_id, operation_type)
+        cache_key = cls.get_cache_key(workspace_id, operation_type)
         progress_data = {
             "total_items": total_items,
             "processed_items": 0,
@@ -40,19 +120,36 @@ class ProgressTracker:
             "status": "processing",
             "percentage": 0,
         }
-        cache.set(cache_key, json.dumps(progress_data), timeout=3600)  # 1 hour timeout
+        cls._write_through(cache_key, progress_data)
         logger.info(
             f"Initialized progress tracking for {operation_type} in workspace {workspace_id}: {total_items} items"
         )
         return progress_data
 
-    @staticmethod
+    @classmethod
+    def set_total(cls, workspace_id, operation_type, total_items):
+        """Set the total number of items once it is known."""
+        progress_data = cls.get_progress(workspace_id, operation_type)
+        if not progress_data:
+            return cls.init_progress(workspace_id, operation_type, total_items)
+
+        progress_data["total_items"] = total_items
+        cls._write_through(
+            cls.get_cache_key(workspace_id, operation_type), progress_data
+        )
+        return progress_data
+
+    @classmethod
     def update_progress(
-        workspace_id, operation_type, processed_items, successful_items, failed_items
+        cls, workspace_id, operation_type, processed_items, successful_items, failed_items
     ):
         """Update progress for an operation."""
-        cache_key = ProgressTracker.get_cache_key(workspace_id, operation_type)
-        progress_data = ProgressTracker.get_progress(workspace_id, operation_type)
+        cache_key = cls.get_cache_key(workspace_id, operation_type)
+        with cls._state_lock:
+            progress_data = cls._local_state.get(cache_key)
+            progress_data = dict(progress_data) if progress_data else None
+        if progress_data is None:
+            progress_data = cls.get_backend().get(cache_key)
 
         if progress_data:
             progress_data["processed_items"] = processed_items
@@ -69,31 +166,66 @@ class ProgressTracker:
 
             # Check if completed
             # Only mark as completed if we have a real total (not 0) and all items are processed
-            if (
+            completed = (
                 progress_data["total_items"] > 0
                 and processed_items >= progress_data["total_items"]
-            ):
+            )
+            if completed:
                 progress_data["status"] = "completed"
 
-            cache.set(cache_key, json.dumps(progress_data), timeout=3600)
+            cls._publish(cache_key, progress_data, force=completed)
 
         return progress_data
 
-    @staticmethod
-    def get_progress(workspace_id, operation_type):
-        """Get current progress for an operation."""
-        cache_key = ProgressTracker.get_cache_key(workspace_id, operation_type)
-        progress_json = cache.get(cache_key)
+    @classmethod
+    def mark_failed(cls, workspace_id, operation_type, error):
+        """Mark an operation as failed, keeping the counters reached so far."""
+        progress_data = cls.get_progress(workspace_id, operation_type) or {
+            "total_items": 0,
+            "processed_items": 0,
+            "successful_items": 0,
+            "failed_items": 0,
+            "percentage": 0,
+        }
+        progress_data["status"] = "failed"
+        progress_data["error"] = str(error)
+        cls._publish(
+            cls.get_cache_key(workspace_id, operation_type), progress_data, force=True
+        )
+        return progress_data
 
-        if progress_json:
-            return json.loads(progress_json)
-        return None
+    @classmethod
+    def flush(cls, workspace_id, operation_type):
+        """Publish any coalesced update that has not reached the backend yet."""
+        cache_key = cls.get_cache_key(workspace_id, operation_type)
+        with cls._state_lock:
+            progress_data = (
+                cls._local_state.get(cache_key) if cache_key in cls._pending else None
+            )
+        if progress_data:
+            cls._publish(cache_key, progress_data, force=True)
 
-    @staticmethod
-    def clear_progress(workspace_id, operation_type):
+    @classmethod
+    def get_progress(cls, workspace_id, operation_type):
+        """Get current progress for an operation."""
+        cache_key = cls.get_cache_key(workspace_id, operation_type)
+        with cls._state_lock:
+            local = (
+                cls._local_state.get(cache_key) if cache_key in cls._pending else None
+            )
+        # The writing process sees its own unpublished update; everyone else,
+        # including this process once it has published, reads the backend
+        if local is not None:
+            return dict(local)
+        return cls.get_backend().get(cache_key)
+
+    @classmethod
+    def clear_progress(cls, workspace_id, operation_type):
         """Clear progress tracking for an operation."""
-        cache_key = ProgressTracker.get_cache_key(workspace_id, operation_type)
-        cache.delete(cache_key)
+        cache_key = cls.get_cache_key(workspace_id, operation_type)
+        with cls._state_lock:
+            cls._forget(cache_key)
+        cls.get_backend().delete(cache_key)
         logger.info(
             f"Cleared progress tracking for {operation_type} in workspace {workspace_id}"
         )
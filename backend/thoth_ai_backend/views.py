@@ -34,7 +34,7 @@ from .decorators import require_editor_group
 from .forms import EvidenceForm, SqlDocumentForm, ColumnForm  # Import the new forms
 
 # Import Http404 for error handling if evidence not found
-from django.http import Http404, HttpResponseRedirect, HttpResponse
+from django.http import Http404, HttpResponseRedirect, HttpResponse, StreamingHttpResponse
 from django.conf import settings
 
 # Import decorators for restricting HTTP methods
@@ -49,9 +49,7 @@ from django.contrib import messages
 # Import vector store utility
 from .backend_utils.vector_store_utils import (
     get_vector_store,
-    export_evidence_to_csv_file,
-    export_columns_to_csv_file,
-    export_questions_to_csv_file,
+    open_csv_export,
     import_evidence_from_csv_file,
     import_columns_from_csv_file,
     import_questions_from_csv_file,
@@ -68,13 +66,12 @@ from io import BytesIO
 # Vector store handled by thoth-qdrant library
 
 from thoth_core.models import Workspace
+from thoth_core.job_queue import enqueue
 from thoth_ai_backend.preprocessing.upload_evidence import upload_evidence_to_vectordb
 from thoth_ai_backend.preprocessing.upload_questions import upload_questions_to_vectordb
 from .preprocessing.update_database_columns_direct import (
     update_database_columns_description,
 )
-from .async_tasks import run_preprocessing_task
-import threading
 from django.http import JsonResponse
 from .mermaid_utils import get_erd_display_image, generate_erd_pdf
 from thoth_core.thoth_ai.thoth_workflow.gdpr_scanner import generate_gdpr_html
@@ -224,6 +221,55 @@ class GdprReportView(LoginRequiredMixin, TemplateView):
         return context
 
 
+class LatencyDashboardView(LoginRequiredMixin, TemplateView):
+    template_name = "latency_dashboard.html"
+
+    # p90 growth over the baseline (in percent) flagged as a regression
+    REGRESSION_THRESHOLD_PCT = 20
+
+    def get_context_data(self, **kwargs):
+        from thoth_core.latency_rollup import phase_trends
+        from thoth_core.models import RollupGranularity
+
+        context = super().get_context_data(**kwargs)
+        try:
+            granularity = self.request.GET.get("granularity", RollupGranularity.DAY)
+            if granularity not in RollupGranularity.values:
+                granularity = RollupGranularity.DAY
+
+            show_all = self.request.GET.get("scope") == "all"
+            workspace_name = ""
+            if not show_all:
+                try:
+                    workspace_name = get_current_workspace(self.request).name
+                except ValueError:
+                    # No workspace selected: fall back to the global rollup
+                    show_all = True
+
+            trends = phase_trends(
+                workspace=workspace_name,
+                agent_name=self.request.GET.get("agent", ""),
+                granularity=granularity,
+            )
+            for trend in trends:
+                change = trend["p90_change_pct"]
+                trend["regressed"] = (
+                    change is not None and change >= self.REGRESSION_THRESHOLD_PCT
+                )
+
+            context["trends"] = trends
+            context["granularity"] = granularity
+            context["scope_label"] = workspace_name or "All workspaces"
+            context["show_all"] = show_all
+            context["regression_threshold"] = self.REGRESSION_THRESHOLD_PCT
+        except Exception as e:
+            logger.error(f"Error in LatencyDashboardView: {e}", exc_info=True)
+            context["error"] = f"An error occurred: {str(e)}"
+            context["trends"] = []
+
+        return context
+
+
 class ErdView(LoginRequiredMixin, TemplateView):
     template_name = "erd.html"
 
@@ -251,7 +297,7 @@ class ErdView(LoginRequiredMixin, TemplateView):
                 )
                 return context
 
-            # Generate SVG image for display using original ERD format
+            # SVG image for display using original ERD format (cached by content)
             success, image_path, error_msg = get_erd_display_image(sql_db.erd)
 
             if success and image_path:
@@ -263,12 +309,6 @@ class ErdView(LoginRequiredMixin, TemplateView):
                     context["svg_content"] = svg_content
                     context["erd_image_path"] = image_path
 
-                    # Clean up temporary file
-                    try:
-                        os.unlink(image_path)
-                    except Exception:
-                        pass
-
                 except Exception as e:
                     logger.error(f"Error reading ERD SVG file: {e}")
                     context["error"] = f"Error reading generated ERD image: {str(e)}"
@@ -851,7 +891,7 @@ def delete_question_confirmed(request, question_id):
 @require_http_methods(["POST"])
 def run_preprocessing(request, workspace_id):
     """
-    Starts the preprocessing task in a background thread and returns a polling template.
+    Queues the preprocessing job and returns a polling template.
     """
     workspace = get_object_or_404(Workspace, id=workspace_id)
 
@@ -871,13 +911,12 @@ def run_preprocessing(request, workspace_id):
             },
         )
 
-    # Start the background task
-    task = threading.Thread(target=run_preprocessing_task, args=(workspace.id,))
-    task.start()
+    # Queue the preprocessing job
+    job = enqueue("preprocessing", {"workspace_id": workspace.id}, user=request.user)
 
     # Update workspace status
     workspace.preprocessing_status = Workspace.PreprocessingStatus.RUNNING
-    workspace.task_id = str(task.ident)  # Store thread identifier
+    workspace.task_id = job.task_id
     workspace.save()
 
     # Return the polling template to the user with improved UI
@@ -1127,18 +1166,18 @@ def export_evidence_csv(request):
     try:
         vector_store = get_vector_store(request)
 
-        # Call the utility function to handle file saving and get CSV content
+        # Stream the CSV page by page while the utility saves it on the server
         # Pass the request parameter for new path resolution
-        saved_filepath, csv_content = export_evidence_to_csv_file(vector_store, request)
+        saved_filepath, csv_chunks = open_csv_export(vector_store, "evidence", request)
 
         # Prepare HTTP response for download
-        response = HttpResponse(csv_content, content_type="text/csv")
+        response = StreamingHttpResponse(csv_chunks, content_type="text/csv")
         # Filename for download, no timestamp as per requirement
         response["Content-Disposition"] = 'attachment; filename="evidence_export.csv"'
 
         messages.success(
             request,
-            f"Evidence exported successfully. Saved on server at: {saved_filepath}. Download started.",
+            f"Evidence export started. Saving on server at: {saved_filepath}. Download started.",
         )
         return response
 
@@ -1154,14 +1193,14 @@ def export_columns_csv(request):
         vector_store = get_vector_store(request)
 
         # Pass the request parameter for new path resolution
-        saved_filepath, csv_content = export_columns_to_csv_file(vector_store, request)
+        saved_filepath, csv_chunks = open_csv_export(vector_store, "columns", request)
 
-        response = HttpResponse(csv_content, content_type="text/csv")
+        response = StreamingHttpResponse(csv_chunks, content_type="text/csv")
         response["Content-Disposition"] = 'attachment; filename="columns_export.csv"'
 
         messages.success(
             request,
-            f"Columns exported successfully. Saved on server at: {saved_filepath}. Download started.",
+            f"Columns export started. Saving on server at: {saved_filepath}. Download started.",
         )
         return response
 
@@ -1177,16 +1216,16 @@ def export_questions_csv(request):
         vector_store = get_vector_store(request)
 
         # Pass the request parameter for new path resolution
-        saved_filepath, csv_content = export_questions_to_csv_file(
-            vector_store, request
+        saved_filepath, csv_chunks = open_csv_export(
+            vector_store, "questions", request
         )
 
-        response = HttpResponse(csv_content, content_type="text/csv")
+        response = StreamingHttpResponse(csv_chunks, content_type="text/csv")
         response["Content-Disposition"] = 'attachment; filename="questions_export.csv"'
 
         messages.success(
             request,
-            f"Questions exported successfully. Saved on server at: {saved_filepath}. Download started.",
+            f"Questions export started. Saving on server at: {saved_filepath}. Download started.",
         )
         return response
 
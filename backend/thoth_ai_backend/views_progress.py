@@ -10,47 +10,35 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import threading
+import json
 import logging
+import time
+from django.http import StreamingHttpResponse
 from django.shortcuts import render, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.views.decorators.http import require_POST, require_http_methods
 from django.urls import reverse
 from thoth_core.models import Workspace
-from thoth_ai_backend.preprocessing.upload_evidence import upload_evidence_to_vectordb
-from thoth_ai_backend.preprocessing.upload_questions import upload_questions_to_vectordb
-from thoth_ai_backend.utils.progress_tracker import ProgressTracker
+from thoth_core.job_queue import enqueue
+from thoth_ai_backend.utils.progress_tracker import ProgressTracker, TERMINAL_STATUSES
 
 logger = logging.getLogger(__name__)
 
+# Server-sent events settings for progress_stream
+STREAM_POLL_INTERVAL = 0.25  # seconds between backend reads
+STREAM_KEEPALIVE_INTERVAL = 15  # seconds between keep-alive comments
+STREAM_MAX_DURATION = 60  # seconds; EventSource reconnects automatically
 
-def run_upload_in_background(func, workspace_id, operation_type):
+
+def run_upload_in_background(workspace_id, operation_type, user=None):
     """
-    Run upload function in a background thread.
+    Queue an evidence or questions upload on the job queue.
     """
-
-    def wrapper():
-        try:
-            func(workspace_id)
-        except Exception as e:
-            logger.error(f"Error in background upload for {operation_type}: {e}")
-            # Mark as failed in progress tracker
-            progress = ProgressTracker.get_progress(workspace_id, operation_type)
-            if progress:
-                progress["status"] = "failed"
-                progress["error"] = str(e)
-                ProgressTracker.update_progress(
-                    workspace_id,
-                    operation_type,
-                    progress.get("processed_items", 0),
-                    progress.get("successful_items", 0),
-                    progress.get("failed_items", 0),
-                )
-
-    thread = threading.Thread(target=wrapper)
-    thread.daemon = True
-    thread.start()
-    return thread
+    return enqueue(
+        f"{operation_type}_upload",
+        {"workspace_id": workspace_id, "operation_type": operation_type},
+        user=user,
+    )
 
 
 @login_required
@@ -61,14 +49,14 @@ def upload_evidences_async(request, workspace_id):
     """
     workspace = get_object_or_404(Workspace, id=workspace_id)
 
-    # Initialize progress BEFORE starting the background thread
+    # Initialize progress BEFORE queueing the job
     # This ensures the progress data exists when the first poll happens
     ProgressTracker.init_progress(
         workspace_id, "evidence", 0
     )  # Start with 0, will be updated
 
     # Start upload in background
-    run_upload_in_background(upload_evidence_to_vectordb, workspace_id, "evidence")
+    run_upload_in_background(workspace_id, "evidence", request.user)
 
     # Return immediately with progress bar
     context = {
@@ -76,6 +64,9 @@ def upload_evidences_async(request, workspace_id):
         "progress_url": reverse(
             "thoth_ai_backend:check_evidence_progress", args=[workspace.id]
         ),
+        "stream_url": reverse(
+            "thoth_ai_backend:progress_stream", args=[workspace.id, "evidence"]
+        ),
         "button_text": "Load Evidence",
         "show_progress": True,
         "total_items": 0,  # Will be updated by progress polling
@@ -97,14 +88,14 @@ def upload_questions_async(request, workspace_id):
     """
     workspace = get_object_or_404(Workspace, id=workspace_id)
 
-    # Initialize progress BEFORE starting the background thread
+    # Initialize progress BEFORE queueing the job
     # This ensures the progress data exists when the first poll happens
     ProgressTracker.init_progress(
         workspace_id, "questions", 0
     )  # Start with 0, will be updated
 
     # Start upload in background
-    run_upload_in_background(upload_questions_to_vectordb, workspace_id, "questions")
+    run_upload_in_background(workspace_id, "questions", request.user)
 
     # Return immediately with progress bar
     context = {
@@ -112,6 +103,9 @@ def upload_questions_async(request, workspace_id):
         "progress_url": reverse(
             "thoth_ai_backend:check_questions_progress", args=[workspace.id]
         ),
+        "stream_url": reverse(
+            "thoth_ai_backend:progress_stream", args=[workspace.id, "questions"]
+        ),
         "button_text": "Load Questions",
         "show_progress": True,
         "total_items": 0,  # Will be updated by progress polling
@@ -199,6 +193,9 @@ def check_evidence_progress(request, workspace_id):
             "progress_url": reverse(
                 "thoth_ai_backend:check_evidence_progress", args=[workspace.id]
             ),
+            "stream_url": reverse(
+                "thoth_ai_backend:progress_stream", args=[workspace.id, "evidence"]
+            ),
             "button_text": "Load Evidence",
             "show_progress": True,
             "total_items": total,
@@ -287,6 +284,9 @@ def check_questions_progress(request, workspace_id):
             "progress_url": reverse(
                 "thoth_ai_backend:check_questions_progress", args=[workspace.id]
             ),
+            "stream_url": reverse(
+                "thoth_ai_backend:progress_stream", args=[workspace.id, "questions"]
+            ),
             "button_text": "Load Questions",
             "show_progress": True,
             "total_items": total,
@@ -299,3 +299,58 @@ def check_questions_progress(request, workspace_id):
     return render(
         request, "partials/operation_status_button_with_progress.html", context
     )
+
+
+def _progress_events(workspace_id, operation_type):
+    """
+    Yield server-sent events for an operation until it reaches a terminal state.
+
+    An event is only sent when the progress changes, so an idle stream costs
+    one backend read per STREAM_POLL_INTERVAL and no network traffic beyond
+    the periodic keep-alive comment.
+    """
+    started = time.monotonic()
+    last_payload = None
+    last_sent = started
+
+    while time.monotonic() - started < STREAM_MAX_DURATION:
+        progress = ProgressTracker.get_progress(workspace_id, operation_type)
+        if progress is None:
+            yield 'event: progress\ndata: {"status": "missing"}\n\n'
+            return
+
+        payload = json.dumps(progress, sort_keys=True)
+        if payload != last_payload:
+            yield f"event: progress\ndata: {payload}\n\n"
+            last_payload = payload
+            last_sent = time.monotonic()
+            if progress.get("status") in TERMINAL_STATUSES:
+                return
+        elif time.monotonic() - last_sent >= STREAM_KEEPALIVE_INTERVAL:
+            yield ": keep-alive\n\n"
+            last_sent = time.monotonic()
+
+        time.sleep(STREAM_POLL_INTERVAL)
+
+
+@login_required
+@require_http_methods(["GET"])
+def progress_stream(request, workspace_id, operation_type):
+    """
+    Stream progress of an upload as server-sent events.
+
+    Replaces the 500ms HTMX polling of check_*_progress while an operation
+    runs: the browser keeps one connection open and receives a JSON event
+    per change. The check_*_progress views are still used to render the
+    final state once a terminal event arrives.
+    """
+    get_object_or_404(Workspace, id=workspace_id)
+
+    response = StreamingHttpResponse(
+        _progress_events(workspace_id, operation_type),
+        content_type="text/event-stream",
+    )
+    response["Cache-Control"] = "no-cache"
+    # Disable proxy buffering (nginx) so events are delivered immediately
+    response["X-Accel-Buffering"] = "no"
+    return response
@@ -22,6 +22,7 @@ from .admin_models.admin_setting import *
 from .admin_models.admin_agent import *
 from .admin_models.admin_groupprofile import *
 from .admin_models.admin_thothlog import *
+from .admin_models.admin_backgroundjob import *
 
 # Shared helper functions (e.g. validate_fk_fields) can remain here if used by multiple admins
 
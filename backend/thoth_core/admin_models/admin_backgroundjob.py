@@ -0,0 +1,51 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from django.contrib import admin, messages
+from thoth_core.job_queue import cancel_job
+from thoth_core.models import BackgroundJob
+
+
+@admin.register(BackgroundJob)
+class BackgroundJobAdmin(admin.ModelAdmin):
+    list_display = (
+        "id",
+        "job_type",
+        "status",
+        "attempts",
+        "worker_id",
+        "created_by",
+        "created_at",
+        "started_at",
+        "finished_at",
+    )
+    list_filter = ("status", "job_type")
+    search_fields = ("job_type", "worker_id", "error")
+    ordering = ("-created_at",)
+    actions = ("cancel_jobs",)
+    readonly_fields = [f.name for f in BackgroundJob._meta.fields]
+
+    def has_add_permission(self, request):
+        # Jobs are queued by the application, never by hand
+        return False
+
+    def cancel_jobs(self, request, queryset):
+        """
+        Cancel the selected jobs; running jobs stop at their next checkpoint.
+        """
+        cancelled = sum(1 for pk in queryset.values_list("pk", flat=True) if cancel_job(pk))
+        if cancelled:
+            messages.success(request, f"Cancellation requested for {cancelled} job(s).")
+        else:
+            messages.warning(request, "None of the selected jobs is queued or running.")
+
+    cancel_jobs.short_description = "Cancel selected jobs"
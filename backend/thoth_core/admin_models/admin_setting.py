@@ -38,6 +38,7 @@ class SettingAdmin(admin.ModelAdmin):
                     "n_grams",
                     "threshold",
                     "lsh_top_n",
+                    "value_index_backend",
                     "edit_distance_threshold",
                     "embedding_similarity_threshold",
                     "max_examples_per_column",
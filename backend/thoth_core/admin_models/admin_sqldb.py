@@ -44,8 +44,7 @@ from thoth_core.thoth_ai.thoth_workflow.generate_db_documentation import (
 )
 from thoth_core.thoth_ai.thoth_workflow.gdpr_scanner import scan_database_for_gdpr
 from thoth_core.thoth_ai.thoth_workflow.async_table_comments import (
-    start_async_column_comments,
-    start_async_table_comments,
+    start_async_sequential_comments,
 )
 from thoth_core.thoth_ai.thoth_workflow.generate_db_erd import generate_db_erd
 from thoth_core.thoth_ai.thoth_workflow.async_db_elements import (
@@ -1043,77 +1042,9 @@ class SqlDbAdmin(admin.ModelAdmin):
         table_ids = list(all_tables.values_list("id", flat=True))
 
         try:
-            # Start with column comment generation first
-            # The table comment generation will be triggered after columns complete
-            from threading import Thread
-            import time
-
-            def sequential_comment_generation():
-                """Execute comment generation sequentially: columns first, then tables"""
-                try:
-                    # Step 1: Generate column comments
-                    column_task_id = start_async_column_comments(
-                        sql_db.id, column_ids, request.user.id
-                    )
-
-                    # Wait for column comments to complete before starting table comments
-                    while True:
-                        sql_db.refresh_from_db()
-                        if sql_db.column_comment_status != "RUNNING":
-                            break
-                        time.sleep(5)  # Check every 5 seconds
-
-                    # Step 2: If columns completed successfully, start table comments
-                    if sql_db.column_comment_status == "COMPLETED":
-                        can_start_tables, status_message = check_sqldb_task_can_start(
-                            sql_db, "table_comment"
-                        )
-                        sql_db.refresh_from_db()
-
-                        if can_start_tables:
-                            table_task_id = start_async_table_comments(
-                                sql_db.id, table_ids, request.user.id
-                            )
-                        else:
-                            from django.utils import timezone
-
-                            table_status = sql_db.table_comment_status or "UNKNOWN"
-                            log_message = (
-                                f"Table comment generation skipped: {status_message}. "
-                                f"Current status: {table_status}."
-                            )
-                            sql_db.table_comment_status = "FAILED"
-                            sql_db.table_comment_log = log_message
-                            sql_db.table_comment_end_time = timezone.now()
-                            sql_db.save(
-                                update_fields=[
-                                    "table_comment_status",
-                                    "table_comment_log",
-                                    "table_comment_end_time",
-                                ]
-                            )
-                    else:
-                        # Log that table comments were skipped due to column comment failure
-                        sql_db.table_comment_log = "Table comment generation skipped due to column comment failure"
-                        sql_db.save(update_fields=["table_comment_log"])
-
-                except Exception as e:
-                    sql_db.refresh_from_db()
-                    sql_db.table_comment_log = (
-                        f"Sequential comment generation error: {str(e)}"
-                    )
-                    sql_db.save(update_fields=["table_comment_log"])
-
-            # Start the sequential process in a background thread
-            thread = Thread(target=sequential_comment_generation)
-            thread.daemon = True
-            thread.start()
-
             # Initialize column comment status (reset end time)
             sql_db.column_comment_status = "RUNNING"
-            sql_db.column_comment_task_id = (
-                f"sequential_comments_db_{sql_db.id}_{int(time.time())}"
-            )
+            sql_db.column_comment_task_id = None
             sql_db.column_comment_log = f"Starting sequential comment generation: {len(column_ids)} columns, then {len(table_ids)} tables"
             sql_db.column_comment_end_time = None
 
@@ -1133,6 +1064,12 @@ class SqlDbAdmin(admin.ModelAdmin):
                 "table_comment_end_time",
             ])
 
+            # Column comments run first; the same job then generates table comments
+            task_id = start_async_sequential_comments(
+                sql_db.id, column_ids, table_ids, request.user.id
+            )
+            SqlDb.objects.filter(pk=sql_db.pk).update(column_comment_task_id=task_id)
+
             messages.success(
                 request,
                 f"Started sequential comment generation for database '{sql_db.name}'. "
@@ -18,6 +18,7 @@ from django.utils import timezone
 import json
 import ast
 from thoth_core.models import ThothLog
+from thoth_core.log_archive import load_archived_detail
 from thoth_core.utilities.utils import export_csv
 from thoth_core.admin_utils import (
     parse_value,
@@ -86,6 +87,7 @@ class ThothLogAdmin(admin.ModelAdmin):
 
     # All fields are read-only as requested
     readonly_fields = (
+        "archive_status_display",
         "test_status_display",
         "username",
         "workspace",
@@ -159,6 +161,7 @@ class ThothLogAdmin(admin.ModelAdmin):
             "Main Information",
             {
                 "fields": (
+                    "archive_status_display",
                     "question",
                     "generated_sql_textarea",
                     "evaluation_case_display",
@@ -1556,6 +1559,36 @@ class ThothLogAdmin(admin.ModelAdmin):
 
     get_question_preview.short_description = "Question Preview"
 
+    def get_object(self, request, object_id, from_field=None):
+        """
+        Load the log and, when requested with ?archive=1, restore its archived
+        detail fields in memory so the read-only detail view shows them.
+        """
+        obj = super().get_object(request, object_id, from_field)
+        if obj is not None and obj.archived_at and request.GET.get("archive") == "1":
+            detail = load_archived_detail(obj)
+            if detail is not None:
+                for field_name, value in detail.items():
+                    setattr(obj, field_name, value)
+                obj._archive_loaded = True
+        return obj
+
+    def archive_status_display(self, obj):
+        """Show whether detail fields were archived and offer to load them"""
+        if not obj.archived_at:
+            return "Full detail stored in database"
+        archived_on = timezone.localtime(obj.archived_at).strftime("%Y-%m-%d %H:%M")
+        if getattr(obj, "_archive_loaded", False):
+            return format_html(
+                "Details archived on {} &mdash; showing archived details", archived_on
+            )
+        return format_html(
+            'Details archived on {} &mdash; <a href="?archive=1">load archived details</a>',
+            archived_on,
+        )
+
+    archive_status_display.short_description = "Detail Storage"
+
     def has_add_permission(self, request):
         """Disable manual creation since logs should be created programmatically"""
         return False
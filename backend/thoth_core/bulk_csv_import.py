@@ -0,0 +1,269 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Chunked bulk import of CSV exports into Django models.
+
+The import_* management commands used to resolve every row with a get()
+followed by create() or save(), i.e. two or three queries per row plus one
+per foreign key. bulk_import_csv() streams the file in chunks instead: for
+each chunk the referenced foreign keys are loaded into in-memory maps, the
+ids that already exist are fetched with a single in_bulk(), and all rows are
+written with one bulk_create(update_conflicts=True). Rows keep the ids found
+in the CSV, so restores stay idempotent.
+"""
+
+import csv
+import itertools
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from django.core.management.color import no_style
+from django.db import DatabaseError, connection, transaction
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = int(os.getenv("THOTH_IMPORT_CHUNK_SIZE", "1000"))
+
+
+class SkipRow(Exception):
+    """Raised by a row builder to skip a row with a warning."""
+
+
+@dataclass
+class ImportStats:
+    """Counters collected while importing one CSV file."""
+
+    rows: int = 0
+    created: int = 0
+    updated: int = 0
+    skipped: int = 0
+    errors: int = 0
+    seconds: float = 0.0
+    warnings: List[str] = field(default_factory=list)
+
+    @property
+    def rows_per_sec(self) -> float:
+        return round(self.rows / self.seconds, 1) if self.seconds > 0 else 0.0
+
+    def summary(self, label: str) -> str:
+        return (
+            f"{label}: created {self.created}, updated {self.updated}, "
+            f"skipped {self.skipped}, errors {self.errors} "
+            f"({self.rows} rows in {self.seconds:.2f}s, {self.rows_per_sec} rows/sec)"
+        )
+
+
+class ReferenceMap:
+    """
+    In-memory map from the values a CSV uses to reference `model` to its
+    primary keys.
+
+    References are normally ids; when `fallback_field` is given, values that
+    are not known ids are also looked up by that field (e.g. a table name).
+    Lookups are batched: load() resolves all unknown values of a chunk with
+    at most two queries and the results are kept for the following chunks.
+    """
+
+    def __init__(self, model, fallback_field: Optional[str] = None):
+        self.model = model
+        self.fallback_field = fallback_field
+        self._pks: Dict[str, Optional[int]] = {}
+
+    def add(self, value, pk) -> None:
+        """Register a reference resolved elsewhere (e.g. just imported)."""
+        self._pks[str(value)] = pk
+
+    def load(self, values: Iterable) -> None:
+        pending = {str(v).strip() for v in values if v and str(v).strip()}
+        pending -= self._pks.keys()
+        if not pending:
+            return
+
+        pk_name = self.model._meta.pk.name
+        numeric = [v for v in pending if v.isdigit()]
+        if numeric:
+            for pk in self.model.objects.filter(
+                **{f"{pk_name}__in": numeric}
+            ).values_list(pk_name, flat=True):
+                self._pks[str(pk)] = pk
+
+        unresolved = pending - self._pks.keys()
+        if unresolved and self.fallback_field:
+            for pk, value in self.model.objects.filter(
+                **{f"{self.fallback_field}__in": unresolved}
+            ).values_list(pk_name, self.fallback_field):
+                # Keep the first match, as filter(...).first() did
+                self._pks.setdefault(str(value), pk)
+
+        for value in pending - self._pks.keys():
+            self._pks[value] = None
+
+    def resolve(self, value, label: str):
+        """Return the primary key for `value` or raise SkipRow."""
+        value = (str(value).strip() if value is not None else "")
+        if not value:
+            raise SkipRow(f"Missing {label} reference")
+        pk = self._pks.get(value)
+        if pk is None:
+            raise SkipRow(f"{label} '{value}' not found")
+        return pk
+
+
+def iter_csv_chunks(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[List[dict]]:
+    """Yield the rows of a CSV file as lists of dicts of at most chunk_size."""
+    with open(path, "r", encoding="utf-8", newline="") as file:
+        reader = csv.DictReader(file)
+        while True:
+            chunk = list(itertools.islice(reader, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+
+def _upsert(model, objects: List, update_fields: Sequence[str]) -> None:
+    kwargs = {"update_conflicts": True, "update_fields": list(update_fields)}
+    # MySQL/MariaDB upsert on any unique key and reject an explicit target
+    if connection.features.supports_update_conflicts_with_target:
+        kwargs["unique_fields"] = [model._meta.pk.name]
+    model.objects.bulk_create(objects, **kwargs)
+
+
+def _existing_pks_by_natural_key(model, rows: List[dict], match_on: Sequence[str]) -> Dict[tuple, int]:
+    """Map natural keys of id-less rows to existing primary keys (one query)."""
+    first = match_on[0]
+    values = {row[first] for row in rows}
+    pk_name = model._meta.pk.name
+    existing = {}
+    for record in model.objects.filter(**{f"{first}__in": values}).values_list(
+        pk_name, *match_on
+    ):
+        existing.setdefault(tuple(record[1:]), record[0])
+    return existing
+
+
+def bulk_import_csv(
+    path: str,
+    model,
+    build_row: Callable[[dict], Optional[dict]],
+    update_fields: Sequence[str],
+    references: Optional[Dict[str, ReferenceMap]] = None,
+    match_on: Optional[Sequence[str]] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    label: Optional[str] = None,
+) -> ImportStats:
+    """
+    Import a CSV file into `model`, preserving the ids found in the file.
+
+    Args:
+        path: CSV file to read.
+        model: Django model to write.
+        build_row: Called with each CSV row; returns the model field values
+            (including "id" when the row has one). It may raise SkipRow to
+            skip the row with a warning. References listed in `references`
+            are already loaded when it runs.
+        update_fields: Fields overwritten when the id already exists.
+        references: CSV column -> ReferenceMap to preload for every chunk.
+        match_on: Natural key used for rows without an id; an existing
+            record with the same values is updated instead of duplicated.
+        chunk_size: Rows read, resolved and written together.
+        label: Name used in warnings and in the log summary.
+
+    Returns:
+        ImportStats with the counters, elapsed time and the warnings raised.
+    """
+    label = label or model._meta.verbose_name
+    references = references or {}
+    pk_name = model._meta.pk.name
+    stats = ImportStats()
+    started = time.perf_counter()
+
+    for chunk in iter_csv_chunks(path, chunk_size):
+        stats.rows += len(chunk)
+        for column, reference_map in references.items():
+            reference_map.load(row.get(column) for row in chunk)
+
+        values_list = []
+        for row in chunk:
+            try:
+                values = build_row(row)
+            except SkipRow as e:
+                stats.skipped += 1
+                stats.warnings.append(f"{label}: {e}, skipping row")
+                continue
+            except Exception as e:
+                stats.errors += 1
+                stats.warnings.append(f"Error processing {label} row {row}: {e}")
+                continue
+            if values is None:
+                stats.skipped += 1
+                continue
+            if not values.get(pk_name):
+                values.pop(pk_name, None)
+            values_list.append(values)
+
+        if not values_list:
+            continue
+
+        ids = [values[pk_name] for values in values_list if pk_name in values]
+        existing = set(model.objects.only(pk_name).in_bulk(ids)) if ids else set()
+        existing = {str(pk) for pk in existing}
+
+        if match_on:
+            keyless = [values for values in values_list if pk_name not in values]
+            if keyless:
+                natural_pks = _existing_pks_by_natural_key(model, keyless, match_on)
+                for values in keyless:
+                    pk = natural_pks.get(tuple(values[f] for f in match_on))
+                    if pk is not None:
+                        values[pk_name] = pk
+                        existing.add(str(pk))
+
+        objects = [model(**values) for values in values_list]
+        try:
+            with transaction.atomic():
+                _upsert(model, objects, update_fields)
+        except DatabaseError as e:
+            # Retry row by row so one bad row does not cost the whole chunk
+            logger.warning(f"Bulk write of {len(objects)} {label} rows failed ({e}), retrying per row")
+            for obj in objects:
+                try:
+                    with transaction.atomic():
+                        _upsert(model, [obj], update_fields)
+                except DatabaseError as row_error:
+                    stats.errors += 1
+                    stats.warnings.append(f"Error writing {label} {obj.pk}: {row_error}")
+                    continue
+                if obj.pk is not None and str(obj.pk) in existing:
+                    stats.updated += 1
+                else:
+                    stats.created += 1
+            continue
+
+        for obj in objects:
+            if obj.pk is not None and str(obj.pk) in existing:
+                stats.updated += 1
+            else:
+                stats.created += 1
+
+    if stats.created:
+        # Explicit ids bypass the sequence; move it past them (no-op on SQLite)
+        with connection.cursor() as cursor:
+            for sql in connection.ops.sequence_reset_sql(no_style(), [model]):
+                cursor.execute(sql)
+
+    stats.seconds = time.perf_counter() - started
+    logger.info(stats.summary(f"Imported {label} from {os.path.basename(path)}"))
+    return stats
@@ -12,9 +12,16 @@
 
 import logging
 import os
-from django.db import IntegrityError
 from django.contrib import messages
-from .models import SqlTable, SqlColumn, ColumnDataTypes, Relationship, SSHAuthMethod
+from .models import SqlColumn, ColumnDataTypes, SSHAuthMethod
+from .schema_reflection import (
+    ReflectedColumn,
+    ReflectedTable,
+    ReflectedCatalog,
+    apply_catalog,
+    reflect_catalog,
+    reflect_columns,
+)
 
 # New plugin-based imports
 from thoth_dbmanager import ThothDbFactory, get_available_databases
@@ -266,9 +273,11 @@ def map_data_type(data_type):
         return ColumnDataTypes.VARCHAR  # Default to VARCHAR for unknown types
 
 
-def get_column_names_and_comments(sqldb, table_name):
+def get_column_names_and_comments(sqldb, table_name, db_manager=None):
     try:
-        db_manager = get_db_manager(sqldb)
+        # Reuse the caller's manager when given, to avoid reconnecting per table
+        if db_manager is None:
+            db_manager = get_db_manager(sqldb)
 
         # Prefer adapter documents
         columns_info = None
@@ -316,37 +325,45 @@ def get_column_names_and_comments(sqldb, table_name):
 
 
 def create_sql_columns(sql_table, column_info):
+    catalog = ReflectedCatalog(
+        tables={
+            sql_table.name: ReflectedTable(
+                name=sql_table.name,
+                columns=[
+                    ReflectedColumn(
+                        name=column_data[0],
+                        data_type=column_data[1],
+                        comment=(column_data[2] if len(column_data) > 2 else None) or "",
+                        is_pk=column_data[3] if len(column_data) > 3 else False,
+                    )
+                    for column_data in column_info
+                ],
+            )
+        }
+    )
+    existing = set(
+        SqlColumn.objects.filter(sql_table=sql_table).values_list(
+            "original_column_name", flat=True
+        )
+    )
+    apply_catalog(
+        sql_table.sql_db,
+        catalog,
+        create_tables=False,
+        column_tables={sql_table.name},
+        create_relationships=False,
+    )
+
     created_columns = []
     skipped_columns = []
-
     for column_data in column_info:
-        column_name = column_data[0]
-        data_type = column_data[1]
+        column_name, data_type = column_data[0], column_data[1]
         comment = column_data[2] if len(column_data) > 2 else None
-        is_pk = column_data[3] if len(column_data) > 3 else False
-
-        # Check if the column already exists
-        if SqlColumn.objects.filter(
-            sql_table=sql_table, original_column_name=column_name
-        ).exists():
+        if column_name in existing:
             skipped_columns.append((column_name, data_type, comment))
-            continue
-
-        # Map the data type
-        mapped_data_type = map_data_type(data_type)
-
-        # Create the column
-        column = SqlColumn(
-            sql_table=sql_table,
-            original_column_name=column_name,
-            column_name=column_name,
-            data_format=mapped_data_type,
-            column_description=comment or "",
-            pk_field="PK" if is_pk else "",  # Set 'PK' if the column is a primary key
-        )
-        column.save()
-
-        created_columns.append((column_name, data_type, comment))
+        else:
+            existing.add(column_name)
+            created_columns.append((column_name, data_type, comment))
 
     return created_columns, skipped_columns
 
@@ -357,64 +374,60 @@ def create_columns(modeladmin, request, queryset):
     total_failed = 0
     failed_tables = []
 
-    for sql_table in queryset:
-        try:
-            logger.info(f"SqlTable: {sql_table.name}")
-            logger.info(f"SqlDb: {sql_table.sql_db.name}")
+    # Reflect each database once for all of its selected tables
+    tables_by_db = {}
+    for sql_table in queryset.select_related("sql_db"):
+        tables_by_db.setdefault(sql_table.sql_db_id, []).append(sql_table)
 
-            # Get column names and comments
-            column_info = get_column_names_and_comments(
-                sql_table.sql_db, sql_table.name
+    for sql_tables in tables_by_db.values():
+        sqldb = sql_tables[0].sql_db
+        table_names = {sql_table.name for sql_table in sql_tables}
+        try:
+            logger.info(f"SqlDb: {sqldb.name}")
+            catalog = reflect_catalog(
+                sqldb, include_foreign_keys=False, table_names=table_names
+            )
+            stats = apply_catalog(
+                sqldb,
+                catalog,
+                create_tables=False,
+                column_tables=table_names,
+                create_relationships=False,
             )
+        except Exception as e:
+            for sql_table in sql_tables:
+                error_msg = f"Failed to process table '{sql_table.name}' in database '{sqldb.name}': {str(e)}"
+                logger.error(error_msg)
+                messages.error(request, error_msg)
+                failed_tables.append((sql_table.name, sqldb.name, str(e)))
+                total_failed += 1
+            continue
 
-            if not column_info:
-                error_msg = f"No columns found or error occurred for table '{sql_table.name}' in database '{sql_table.sql_db.name}'"
+        for sql_table in sql_tables:
+            reflected = catalog.tables.get(sql_table.name)
+            if reflected is None or not reflected.columns:
+                error_msg = f"No columns found or error occurred for table '{sql_table.name}' in database '{sqldb.name}'"
                 messages.error(request, error_msg)
                 failed_tables.append(
                     (
                         sql_table.name,
-                        sql_table.sql_db.name,
+                        sqldb.name,
                         "No columns found or connection error",
                     )
                 )
                 total_failed += 1
                 continue
 
-            logger.info("Columns found:")
-            for column, data_type, comment, is_pk in column_info:
-                logger.info(
-                    f"- {column} ({data_type}) (Comment: {comment or 'None'}) (PK: {'Yes' if is_pk else 'No'})"
-                )
-
-            # Create SqlColumn records
-            created_columns, skipped_columns = create_sql_columns(
-                sql_table, column_info
+            created, skipped = stats["columns_by_table"].get(sql_table.name, (0, 0))
+            logger.info(
+                f"SqlTable: {sql_table.name}: {created} columns created, {skipped} columns skipped"
             )
-
-            logger.info("Columns created:")
-            for column, data_type, comment in created_columns:
-                logger.info(f"- {column} (Comment: {comment or 'None'})")
-
-            logger.info("Columns skipped (already existing):")
-            for column, data_type, comment in skipped_columns:
-                logger.info(f"- {column} (Comment: {comment or 'None'})")
-
-            logger.info("--------------------")
-
-            # Success message
             messages.success(
                 request,
-                f"Successfully processed table '{sql_table.name}' in database '{sql_table.sql_db.name}': {len(created_columns)} columns created, {len(skipped_columns)} columns skipped",
+                f"Successfully processed table '{sql_table.name}' in database '{sqldb.name}': {created} columns created, {skipped} columns skipped",
             )
             total_success += 1
 
-        except Exception as e:
-            error_msg = f"Failed to process table '{sql_table.name}' in database '{sql_table.sql_db.name}': {str(e)}"
-            logger.error(error_msg)
-            messages.error(request, error_msg)
-            failed_tables.append((sql_table.name, sql_table.sql_db.name, str(e)))
-            total_failed += 1
-
     # Summary message
     if total_failed > 0:
         messages.warning(
@@ -428,9 +441,10 @@ def create_columns(modeladmin, request, queryset):
 create_columns.short_description = "Create columns for selected tables"
 
 
-def get_table_names_and_comments(sqldb):
+def get_table_names_and_comments(sqldb, db_manager=None):
     try:
-        db_manager = get_db_manager(sqldb)
+        if db_manager is None:
+            db_manager = get_db_manager(sqldb)
 
         # Prefer adapter documents
         adapter = getattr(db_manager, "adapter", None)
@@ -457,28 +471,16 @@ def get_table_names_and_comments(sqldb):
 
 
 def create_sql_tables(sqldb, table_info):
-    created_tables = []
-    skipped_tables = []
-
-    for table_name, description in table_info:
-        try:
-            sql_table, created = SqlTable.objects.get_or_create(
-                name=table_name,
-                sql_db=sqldb,
-                defaults={"description": description or ""},
-            )
-            if created:
-                created_tables.append((table_name, description))
-            else:
-                # Update the comment if the table already exists
-                if sql_table.description != description:
-                    sql_table.description = description
-                    sql_table.save()
-                skipped_tables.append((table_name, description))
-        except IntegrityError:
-            skipped_tables.append((table_name, description))
-
-    return created_tables, skipped_tables
+    catalog = ReflectedCatalog(
+        tables={
+            table_name: ReflectedTable(name=table_name, comment=description or "")
+            for table_name, description in table_info
+        }
+    )
+    stats = apply_catalog(
+        sqldb, catalog, column_tables=set(), create_relationships=False
+    )
+    return stats["tables_created"], stats["tables_skipped"]
 
 
 def create_relationships(modeladmin, request, queryset):
@@ -496,23 +498,9 @@ def create_relationships(modeladmin, request, queryset):
     for sqldb in sqldb_list:
         try:
             db_manager = get_db_manager(sqldb)
-            # Prefer adapter docs to keep schema_name; fallback to manager API
-            adapter = getattr(db_manager, "adapter", None)
-            if adapter and hasattr(adapter, "get_foreign_keys_as_documents"):
-                fk_docs = adapter.get_foreign_keys_as_documents()
-                relationships_info = [
-                    {
-                        "source_table_name": d.source_table_name,
-                        "source_column_name": d.source_column_name,
-                        "target_table_name": d.target_table_name,
-                        "target_column_name": d.target_column_name,
-                    }
-                    for d in fk_docs
-                ]
-            else:
-                relationships_info = db_manager.get_foreign_keys()
+            catalog = reflect_catalog(sqldb, db_manager=db_manager, include_columns=False)
 
-            if not relationships_info:
+            if not catalog.foreign_keys:
                 messages.warning(
                     request,
                     f"No foreign key relationships found in database '{sqldb.name}'",
@@ -520,90 +508,15 @@ def create_relationships(modeladmin, request, queryset):
                 total_success += 1
                 continue
 
-            relationships_created = 0
-            relationships_failed = 0
-
-            # Limit to relationships whose tables exist in our catalog
-            existing_tables = set(
-                SqlTable.objects.filter(sql_db=sqldb).values_list("name", flat=True)
+            # Columns of the tables involved may be missing; read them in the same pass
+            fk_tables = {fk.source_table for fk in catalog.foreign_keys} | {
+                fk.target_table for fk in catalog.foreign_keys
+            }
+            reflect_columns(sqldb, catalog, fk_tables, db_manager=db_manager)
+            stats = apply_catalog(
+                sqldb, catalog, create_tables=False, column_tables=fk_tables
             )
-            relationships_info = [
-                r
-                for r in relationships_info
-                if r.get("source_table_name") in existing_tables
-                and r.get("target_table_name") in existing_tables
-            ]
-
-            for rel_data in relationships_info:
-                source_table_name = rel_data["source_table_name"]
-                source_column_name = rel_data["source_column_name"]
-                target_table_name = rel_data["target_table_name"]
-                target_column_name = rel_data["target_column_name"]
-
-                try:
-                    source_table = SqlTable.objects.get(
-                        name=source_table_name, sql_db=sqldb
-                    )
-                    target_table = SqlTable.objects.get(
-                        name=target_table_name, sql_db=sqldb
-                    )
-                    # Ensure source/target columns exist; create on-the-fly if missing
-                    try:
-                        source_column = SqlColumn.objects.get(
-                            original_column_name=source_column_name,
-                            sql_table=source_table,
-                        )
-                    except SqlColumn.DoesNotExist:
-                        try:
-                            col_info = get_column_names_and_comments(
-                                sqldb, source_table.name
-                            )
-                            create_sql_columns(source_table, col_info)
-                            source_column = SqlColumn.objects.get(
-                                original_column_name=source_column_name,
-                                sql_table=source_table,
-                            )
-                        except Exception:
-                            raise
-                    try:
-                        target_column = SqlColumn.objects.get(
-                            original_column_name=target_column_name,
-                            sql_table=target_table,
-                        )
-                    except SqlColumn.DoesNotExist:
-                        try:
-                            col_info = get_column_names_and_comments(
-                                sqldb, target_table.name
-                            )
-                            create_sql_columns(target_table, col_info)
-                            target_column = SqlColumn.objects.get(
-                                original_column_name=target_column_name,
-                                sql_table=target_table,
-                            )
-                        except Exception:
-                            raise
-
-                    relationship, created = Relationship.objects.get_or_create(
-                        source_table=source_table,
-                        target_table=target_table,
-                        source_column=source_column,
-                        target_column=target_column,
-                    )
-                    if created:
-                        relationships_created += 1
-                    logger.info(
-                        f"Created/Updated relationship: {source_table_name}.{source_column_name} -> {target_table_name}.{target_column_name}"
-                    )
-                except SqlTable.DoesNotExist:
-                    error_msg = f"Table not found in database '{sqldb.name}' - Source: {source_table_name} or Target: {target_table_name}"
-                    logger.error(error_msg)
-                    relationships_failed += 1
-                except Exception as e:
-                    error_msg = f"Error creating relationship in database '{sqldb.name}': {str(e)}"
-                    logger.error(error_msg)
-                    relationships_failed += 1
-
-            Relationship.update_pk_fk_fields()
+            relationships_created = stats["relationships_created"]
             logger.info("Relationships created and pk_field/fk_field updated.")
 
             # Success message
@@ -725,145 +638,31 @@ def create_db_elements(modeladmin, request, queryset):
         try:
             logger.info(f"Processing SqlDb: {sqldb.name}")
 
-            # Step 1: Create all tables
-            logger.info("Step 1: Creating tables")
-            table_info = get_table_names_and_comments(sqldb)
-            if not table_info:
+            # Tables, columns and foreign keys are read in one pass and
+            # written in one transaction
+            catalog = reflect_catalog(sqldb)
+            if not catalog.tables:
                 raise Exception("Failed to retrieve table information")
 
-            created_tables, skipped_tables = create_sql_tables(sqldb, table_info)
+            stats = apply_catalog(sqldb, catalog)
 
             logger.info("Tables created:")
-            for table, comment in created_tables:
+            for table, comment in stats["tables_created"]:
                 logger.info(f"  - {table} (Comment: {comment or 'None'})")
-            logger.info("Tables skipped (already existing):")
-            for table, comment in skipped_tables:
-                logger.info(f"  - {table} (Comment: {comment or 'None'})")
-
-            # Step 2: Create columns for each table
-            logger.info("\nStep 2: Creating columns for each table")
-            tables_processed = 0
-            tables_failed = 0
-
-            for sql_table in SqlTable.objects.filter(sql_db=sqldb):
-                try:
-                    logger.info(f"Processing table: {sql_table.name}")
-                    column_info = get_column_names_and_comments(sqldb, sql_table.name)
-                    if not column_info:
-                        logger.warning(f"No columns found for table {sql_table.name}")
-                        continue
-
-                    created_columns, skipped_columns = create_sql_columns(
-                        sql_table, column_info
-                    )
-                    tables_processed += 1
-                except Exception as e:
-                    logger.error(f"Error processing table {sql_table.name}: {str(e)}")
-                    tables_failed += 1
-
-            # Step 3: Create foreign key relationships
-            logger.info("\nStep 3: Creating foreign key relationships")
-            try:
-                db_manager = get_db_manager(sqldb)
-                adapter = getattr(db_manager, "adapter", None)
-                if adapter and hasattr(adapter, "get_foreign_keys_as_documents"):
-                    fk_docs = adapter.get_foreign_keys_as_documents()
-                    relationships_info = [
-                        {
-                            "source_table_name": d.source_table_name,
-                            "source_column_name": d.source_column_name,
-                            "target_table_name": d.target_table_name,
-                            "target_column_name": d.target_column_name,
-                        }
-                        for d in fk_docs
-                    ]
-                else:
-                    relationships_info = db_manager.get_foreign_keys()
-
-                # Limit to relationships whose tables exist in our catalog
-                existing_tables = set(
-                    SqlTable.objects.filter(sql_db=sqldb).values_list("name", flat=True)
-                )
-                relationships_info = [
-                    r
-                    for r in relationships_info
-                    if r.get("source_table_name") in existing_tables
-                    and r.get("target_table_name") in existing_tables
-                ]
-
-                relationships_created = 0
-                for rel_data in relationships_info:
-                    source_table_name = rel_data["source_table_name"]
-                    source_column_name = rel_data["source_column_name"]
-                    target_table_name = rel_data["target_table_name"]
-                    target_column_name = rel_data["target_column_name"]
-
-                    try:
-                        source_table = SqlTable.objects.get(
-                            name=source_table_name, sql_db=sqldb
-                        )
-                        target_table = SqlTable.objects.get(
-                            name=target_table_name, sql_db=sqldb
-                        )
-                        # Ensure columns exist; create on-the-fly if missing
-                        try:
-                            source_column = SqlColumn.objects.get(
-                                original_column_name=source_column_name,
-                                sql_table=source_table,
-                            )
-                        except SqlColumn.DoesNotExist:
-                            try:
-                                col_info = get_column_names_and_comments(
-                                    sqldb, source_table.name
-                                )
-                                create_sql_columns(source_table, col_info)
-                                source_column = SqlColumn.objects.get(
-                                    original_column_name=source_column_name,
-                                    sql_table=source_table,
-                                )
-                            except Exception:
-                                raise
-                        try:
-                            target_column = SqlColumn.objects.get(
-                                original_column_name=target_column_name,
-                                sql_table=target_table,
-                            )
-                        except SqlColumn.DoesNotExist:
-                            try:
-                                col_info = get_column_names_and_comments(
-                                    sqldb, target_table.name
-                                )
-                                create_sql_columns(target_table, col_info)
-                                target_column = SqlColumn.objects.get(
-                                    original_column_name=target_column_name,
-                                    sql_table=target_table,
-                                )
-                            except Exception:
-                                raise
-
-                        relationship, created = Relationship.objects.get_or_create(
-                            source_table=source_table,
-                            target_table=target_table,
-                            source_column=source_column,
-                            target_column=target_column,
-                        )
-                        if created:
-                            relationships_created += 1
-                    except Exception as e:
-                        logger.warning(f"Error creating relationship: {str(e)}")
-
-                Relationship.update_pk_fk_fields()
-                logger.info("Relationships created and pk_field/fk_field updated.")
-
-                # Success message
-                messages.success(
-                    request,
-                    f"Successfully processed database '{sqldb.name}': {len(created_tables)} tables, {tables_processed} tables with columns, {relationships_created} relationships",
-                )
-                total_success += 1
+            logger.info(
+                f"Tables skipped (already existing): {len(stats['tables_skipped'])}"
+            )
+            logger.info(
+                f"Columns created: {stats['columns_created']}, skipped: {stats['columns_skipped']}"
+            )
+            logger.info("Relationships created and pk_field/fk_field updated.")
 
-            except Exception as e:
-                raise Exception(f"Error creating relationships: {str(e)}")
+            # Success message
+            messages.success(
+                request,
+                f"Successfully processed database '{sqldb.name}': {len(stats['tables_created'])} tables, {len(stats['columns_by_table'])} tables with columns, {stats['relationships_created']} relationships",
+            )
+            total_success += 1
 
         except Exception as e:
             error_msg = f"Failed to process database '{sqldb.name}': {str(e)}"
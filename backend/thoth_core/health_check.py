@@ -13,18 +13,29 @@
 """
 Health check utilities for the Thoth backend service.
 Provides comprehensive health monitoring for databases, vector stores, and system resources.
+
+SQL and vector databases are probed in the background by HealthProber
+(THOTH_HEALTH_PROBE_INTERVAL, THOTH_HEALTH_PROBE_TIMEOUT and
+THOTH_HEALTH_PROBE_CONCURRENCY) and /health serves its cached results.
 """
 
+import math
 import os
+import socket
+import threading
 import time
 import logging
 import psutil
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Dict, Any
+from functools import partial
+from typing import Dict, Any, Callable, List, Optional, Tuple
+from urllib.parse import urlparse
 from django.conf import settings
-from django.db import connection
+from django.db import close_old_connections, connection
 
-from thoth_core.models import SqlDb, VectorDb
+from thoth_core.models import SqlDb, VectorDb, VectorDbChoices
 from thoth_core.dbmanagement import get_db_manager
 
 logger = logging.getLogger(__name__)
@@ -42,6 +53,292 @@ class HealthCheckStatus:
     UNKNOWN = "unknown"
 
 
+PROBE_INTERVAL = float(os.getenv("THOTH_HEALTH_PROBE_INTERVAL", "30"))
+PROBE_TIMEOUT = float(os.getenv("THOTH_HEALTH_PROBE_TIMEOUT", "5"))
+PROBE_CONCURRENCY = max(1, int(os.getenv("THOTH_HEALTH_PROBE_CONCURRENCY", "8")))
+
+# Ports used to reach vector databases configured without one
+VECTOR_DEFAULT_PORTS = {
+    VectorDbChoices.QDRANT: 6333,
+    VectorDbChoices.CHROMA: 8000,
+    VectorDbChoices.PGVECTOR: 5432,
+    VectorDbChoices.MILVUS: 19530,
+}
+
+
+@dataclass
+class ProbeTarget:
+    """One database to probe; `probe` returns (is_healthy, message)."""
+
+    key: str
+    name: str
+    type: str
+    host: str
+    probe: Callable[[], Tuple[bool, str]]
+
+
+def probe_sql_database(sql_db) -> Tuple[bool, str]:
+    """Open the database through its manager and run the adapter's health check."""
+    db_manager = get_db_manager(sql_db)
+    # Use the health_check method from the adapter interface
+    if hasattr(db_manager.adapter, "health_check"):
+        if not db_manager.adapter.health_check():
+            return False, "Health check failed"
+    else:
+        # Fallback to simple query test
+        db_manager.adapter.execute_query("SELECT 1", fetch="one")
+    return True, "Connection successful"
+
+
+def probe_vector_database(vector_db, timeout: float = PROBE_TIMEOUT) -> Tuple[bool, str]:
+    """
+    Validate the configuration and, for server-based stores, open a TCP
+    connection to the configured endpoint. The health check has no
+    workspace context, so no collection is opened.
+    """
+    if not vector_db.name or not vector_db.vect_type:
+        return False, "Invalid configuration"
+
+    host, port = vector_db.host, vector_db.port
+    if vector_db.url:
+        parsed = urlparse(vector_db.url)
+        host = parsed.hostname or host
+        port = parsed.port or (443 if parsed.scheme == "https" else 80)
+    if not host:
+        return True, "Configuration valid (local storage)"
+
+    port = port or VECTOR_DEFAULT_PORTS.get(vector_db.vect_type)
+    if not port:
+        return True, "Configuration valid"
+    with socket.create_connection((host, port), timeout=timeout):
+        pass
+    return True, f"Reachable at {host}:{port}"
+
+
+def summarize_probes(statuses: List[Dict[str, Any]], label: str) -> Dict[str, Any]:
+    """Aggregate per-database statuses into a health check section."""
+    total_count = len(statuses)
+    if not total_count:
+        return {
+            "status": HealthCheckStatus.HEALTHY,
+            "message": f"No {label} configured",
+            "count": 0,
+            "databases": [],
+        }
+    healthy_count = sum(1 for s in statuses if s["status"] == HealthCheckStatus.HEALTHY)
+
+    # Determine overall status
+    if healthy_count == total_count:
+        overall_status = HealthCheckStatus.HEALTHY
+        message = f"All {total_count} {label} are healthy"
+    elif healthy_count > 0:
+        overall_status = HealthCheckStatus.DEGRADED
+        message = f"{healthy_count}/{total_count} {label} are healthy"
+    else:
+        overall_status = HealthCheckStatus.UNHEALTHY
+        message = f"All {total_count} {label} are unhealthy"
+
+    return {
+        "status": overall_status,
+        "message": message,
+        "count": total_count,
+        "healthy_count": healthy_count,
+        "databases": statuses,
+    }
+
+
+class HealthProber:
+    """
+    Probes every SQL and vector database concurrently and caches the
+    results, so /health answers from memory instead of opening a
+    connection per database on every request.
+
+    A daemon thread refreshes the cache every `interval` seconds (0 means
+    probe on demand only). Each probe runs in a bounded thread pool and is
+    reported unhealthy if it does not answer within `timeout` seconds; a
+    hung probe is not started again until it returns, so an unreachable
+    host never occupies more than one worker.
+    """
+
+    SECTIONS = {"sql_databases": "SQL databases", "vector_databases": "vector databases"}
+
+    def __init__(
+        self,
+        interval: float = PROBE_INTERVAL,
+        timeout: float = PROBE_TIMEOUT,
+        concurrency: int = PROBE_CONCURRENCY,
+    ):
+        self.interval = interval
+        self.timeout = timeout
+        self.concurrency = concurrency
+        self._executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="health-probe")
+        self._inflight: Dict[str, Future] = {}
+        self._sections: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._ready = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        with self._lock:
+            if self.interval <= 0 or (self._thread and self._thread.is_alive()):
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="health-prober", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=self.timeout)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.error(f"Health probe round failed: {e}")
+            finally:
+                close_old_connections()
+            self._stop.wait(self.interval)
+
+    def load_targets(self) -> Dict[str, List[ProbeTarget]]:
+        """Targets of every section, read with one query per model."""
+        return {
+            "sql_databases": [
+                ProbeTarget(
+                    f"sql:{sql_db.pk}",
+                    sql_db.name,
+                    sql_db.db_type,
+                    sql_db.db_host,
+                    partial(probe_sql_database, sql_db),
+                )
+                for sql_db in SqlDb.objects.all()
+            ],
+            "vector_databases": [
+                ProbeTarget(
+                    f"vector:{vector_db.pk}",
+                    vector_db.name,
+                    vector_db.vect_type,
+                    vector_db.host or "N/A",
+                    partial(probe_vector_database, vector_db, self.timeout),
+                )
+                for vector_db in VectorDb.objects.all()
+            ],
+        }
+
+    @staticmethod
+    def _timed(probe: Callable[[], Tuple[bool, str]]) -> Tuple[bool, str, float]:
+        started = time.perf_counter()
+        try:
+            healthy, message = probe()
+        except Exception as e:
+            healthy, message = False, f"Connection failed: {str(e)}"
+        return healthy, message, (time.perf_counter() - started) * 1000
+
+    def refresh(self) -> Dict[str, Dict[str, Any]]:
+        """Probe every target now; concurrent callers share one round."""
+        if not self._refresh_lock.acquire(blocking=False):
+            with self._refresh_lock:
+                return dict(self._sections)
+        try:
+            return self._refresh()
+        finally:
+            self._refresh_lock.release()
+
+    def _refresh(self) -> Dict[str, Dict[str, Any]]:
+        targets = self.load_targets()
+        futures = {}
+        for section_targets in targets.values():
+            for target in section_targets:
+                future = self._inflight.get(target.key)
+                if future is None or future.done():
+                    future = self._executor.submit(self._timed, target.probe)
+                    self._inflight[target.key] = future
+                futures[target.key] = future
+        for key in set(self._inflight) - set(futures):
+            del self._inflight[key]
+
+        # Every probe gets `timeout` seconds once a worker picks it up
+        rounds = max(1, math.ceil(len(futures) / self.concurrency))
+        wait(futures.values(), timeout=self.timeout * rounds)
+
+        checked_at = datetime.now(timezone.utc).isoformat()
+        sections = {}
+        for section, section_targets in targets.items():
+            statuses = []
+            for target in section_targets:
+                future = futures[target.key]
+                if future.done():
+                    healthy, message, elapsed_ms = future.result()
+                else:
+                    healthy, message, elapsed_ms = False, f"No response within {self.timeout:g}s", None
+                if not healthy:
+                    logger.error(f"Health probe of {target.name} failed: {message}")
+                statuses.append(
+                    {
+                        "name": target.name,
+                        "type": target.type,
+                        "host": target.host,
+                        "status": HealthCheckStatus.HEALTHY if healthy else HealthCheckStatus.UNHEALTHY,
+                        "message": message,
+                        "response_time_ms": round(elapsed_ms, 2) if elapsed_ms is not None else None,
+                        "checked_at": checked_at,
+                    }
+                )
+            sections[section] = summarize_probes(statuses, self.SECTIONS[section])
+            sections[section]["checked_at"] = checked_at
+            sections[section]["_checked"] = time.monotonic()
+
+        with self._lock:
+            self._sections = sections
+        self._ready.set()
+        return dict(sections)
+
+    def get_section(self, name: str, refresh: bool = False) -> Dict[str, Any]:
+        """
+        Cached results of one section. The first call waits for the initial
+        probe round (bounded by the probe timeout when running in the
+        background); later calls return immediately.
+        """
+        if refresh or (self.interval <= 0 and not self._ready.is_set()):
+            self.refresh()
+        elif not self._ready.is_set():
+            self.start()
+            self._ready.wait(self.timeout + 1)
+
+        with self._lock:
+            section = self._sections.get(name)
+        if section is None:
+            return {
+                "status": HealthCheckStatus.UNKNOWN,
+                "message": "Health probe has not completed yet",
+                "count": 0,
+                "databases": [],
+            }
+        result = {k: v for k, v in section.items() if k != "_checked"}
+        age = time.monotonic() - section["_checked"]
+        result["age_seconds"] = round(age, 1)
+        if self.interval > 0:
+            result["stale"] = age > 3 * self.interval + self.timeout
+        return result
+
+
+_prober: Optional[HealthProber] = None
+_prober_lock = threading.Lock()
+
+
+def get_health_prober() -> HealthProber:
+    """Return the prober of this process, started on first use."""
+    global _prober
+    with _prober_lock:
+        if _prober is None:
+            _prober = HealthProber()
+    return _prober
+
+
 class HealthChecker:
     """Main health checker class for Thoth backend services."""
 
@@ -109,158 +406,13 @@ class HealthChecker:
                 "details": {"error": str(e)},
             }
 
-    def check_sql_databases(self) -> Dict[str, Any]:
-        """Check configured SQL databases connectivity."""
-        sql_dbs = SqlDb.objects.all()
-        if not sql_dbs.exists():
-            return {
-                "status": HealthCheckStatus.HEALTHY,
-                "message": "No SQL databases configured",
-                "count": 0,
-                "databases": [],
-            }
-
-        healthy_count = 0
-        total_count = sql_dbs.count()
-        database_statuses = []
-
-        for sql_db in sql_dbs:
-            try:
-                db_manager = get_db_manager(sql_db)
-                # Use the health_check method from the adapter interface
-                if hasattr(db_manager.adapter, "health_check"):
-                    is_healthy = db_manager.adapter.health_check()
-                else:
-                    # Fallback to simple query test
-                    db_manager.adapter.execute_query("SELECT 1", fetch="one")
-                    is_healthy = True
-
-                if is_healthy:
-                    healthy_count += 1
-                    status = HealthCheckStatus.HEALTHY
-                    message = "Connection successful"
-                else:
-                    status = HealthCheckStatus.UNHEALTHY
-                    message = "Health check failed"
-
-                database_statuses.append(
-                    {
-                        "name": sql_db.name,
-                        "type": sql_db.db_type,
-                        "host": sql_db.db_host,
-                        "status": status,
-                        "message": message,
-                    }
-                )
-
-            except Exception as e:
-                logger.error(f"SQL database {sql_db.name} health check failed: {e}")
-                database_statuses.append(
-                    {
-                        "name": sql_db.name,
-                        "type": sql_db.db_type,
-                        "host": sql_db.db_host,
-                        "status": HealthCheckStatus.UNHEALTHY,
-                        "message": f"Connection failed: {str(e)}",
-                    }
-                )
-
-        # Determine overall status
-        if healthy_count == total_count:
-            overall_status = HealthCheckStatus.HEALTHY
-            message = f"All {total_count} SQL databases are healthy"
-        elif healthy_count > 0:
-            overall_status = HealthCheckStatus.DEGRADED
-            message = f"{healthy_count}/{total_count} SQL databases are healthy"
-        else:
-            overall_status = HealthCheckStatus.UNHEALTHY
-            message = f"All {total_count} SQL databases are unhealthy"
-
-        return {
-            "status": overall_status,
-            "message": message,
-            "count": total_count,
-            "healthy_count": healthy_count,
-            "databases": database_statuses,
-        }
-
-    def check_vector_databases(self) -> Dict[str, Any]:
-        """Check configured vector databases connectivity."""
-        vector_dbs = VectorDb.objects.all()
-        if not vector_dbs.exists():
-            return {
-                "status": HealthCheckStatus.HEALTHY,
-                "message": "No vector databases configured",
-                "count": 0,
-                "databases": [],
-            }
-
-        healthy_count = 0
-        total_count = vector_dbs.count()
-        database_statuses = []
+    def check_sql_databases(self, refresh: bool = False) -> Dict[str, Any]:
+        """Latest probe results of the configured SQL databases."""
+        return get_health_prober().get_section("sql_databases", refresh=refresh)
 
-        for vector_db in vector_dbs:
-            try:
-                # For health check, we'll just verify the vector database configuration
-                # without requiring workspace context
-                status_msg = "Configuration valid"
-                is_healthy = True
-
-                # Basic validation of vector database configuration
-                if not vector_db.name or not vector_db.vect_type:
-                    is_healthy = False
-                    status_msg = "Invalid configuration"
-
-                if is_healthy:
-                    healthy_count += 1
-                    status = HealthCheckStatus.HEALTHY
-                    message = status_msg
-                else:
-                    status = HealthCheckStatus.UNHEALTHY
-                    message = status_msg
-
-                database_statuses.append(
-                    {
-                        "name": vector_db.name,
-                        "type": vector_db.vect_type,
-                        "host": vector_db.host or "N/A",
-                        "status": status,
-                        "message": message,
-                    }
-                )
-
-            except Exception as e:
-                logger.error(
-                    f"Vector database {vector_db.name} health check failed: {e}"
-                )
-                database_statuses.append(
-                    {
-                        "name": vector_db.name,
-                        "type": vector_db.vect_type,
-                        "host": vector_db.host or "N/A",
-                        "status": HealthCheckStatus.UNHEALTHY,
-                        "message": f"Configuration check failed: {str(e)}",
-                    }
-                )
-
-        # Determine overall status
-        if healthy_count == total_count:
-            overall_status = HealthCheckStatus.HEALTHY
-            message = f"All {total_count} vector databases have valid configurations"
-        elif healthy_count > 0:
-            overall_status = HealthCheckStatus.DEGRADED
-            message = f"{healthy_count}/{total_count} vector databases have valid configurations"
-        else:
-            overall_status = HealthCheckStatus.UNHEALTHY
-            message = f"All {total_count} vector databases have configuration issues"
-
-        return {
-            "status": overall_status,
-            "message": message,
-            "count": total_count,
-            "healthy_count": healthy_count,
-            "databases": database_statuses,
-        }
+    def check_vector_databases(self, refresh: bool = False) -> Dict[str, Any]:
+        """Latest probe results of the configured vector databases."""
+        return get_health_prober().get_section("vector_databases", refresh=refresh)
 
     def check_environment_variables(self) -> Dict[str, Any]:
         """Check required environment variables."""
@@ -341,13 +493,23 @@ class HealthChecker:
             logger.error(f"Failed to get system metrics: {e}")
             return {"error": f"Failed to get system metrics: {str(e)}"}
 
-    def perform_health_check(self, include_metrics: bool = False) -> Dict[str, Any]:
-        """Perform comprehensive health check."""
+    def perform_health_check(
+        self, include_metrics: bool = False, refresh: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Perform comprehensive health check.
+
+        SQL and vector databases are reported from the background prober's
+        cache; with refresh=True they are probed again before answering.
+        """
         start_time = time.time()
 
         # Basic service info
         result = self.get_service_info()
 
+        if refresh:
+            get_health_prober().refresh()
+
         # Perform all health checks
         checks = {
             "django_database": self.check_django_database(),
@@ -0,0 +1,486 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Database-backed queue for long-running backend tasks.
+
+Views and admin actions enqueue a BackgroundJob row instead of starting a
+thread. Jobs are executed by a WorkerPool, either the one started by the
+run_workers management command (THOTH_JOB_RUNNER=external, used in Docker so
+the web workers only serve requests) or a small pool embedded in the web
+process (THOTH_JOB_RUNNER=embedded, the default, so a development server
+needs no extra process).
+
+Handlers receive a JobContext. They persist progress with save_checkpoint()
+and call raise_if_cancelled() between units of work; a job whose worker
+stops heartbeating is put back in the queue and its handler resumes from
+the saved checkpoint. Concurrency is capped per job type across all
+workers (THOTH_JOB_CONCURRENCY, e.g. "preprocessing=1,evidence_upload=2").
+"""
+
+import logging
+import os
+import socket
+import threading
+from datetime import timedelta
+from importlib import import_module
+from typing import Dict, Iterable, List, Optional
+
+from django.db import close_old_connections, connections, transaction
+from django.db.models import Count, F, Q
+from django.utils import timezone
+
+from thoth_core.models import BackgroundJob, JobStatus
+
+logger = logging.getLogger(__name__)
+
+# job type -> (handler dotted path, default concurrency across all workers)
+JOB_TYPES = {
+    "preprocessing": ("thoth_ai_backend.async_tasks.run_preprocessing_job", 1),
+    "evidence_upload": ("thoth_ai_backend.async_tasks.run_upload_job", 2),
+    "questions_upload": ("thoth_ai_backend.async_tasks.run_upload_job", 2),
+    "table_comments": (
+        "thoth_core.thoth_ai.thoth_workflow.async_table_comments.run_table_comments_job",
+        1,
+    ),
+    "column_comments": (
+        "thoth_core.thoth_ai.thoth_workflow.async_table_comments.run_column_comments_job",
+        1,
+    ),
+    "sequential_comments": (
+        "thoth_core.thoth_ai.thoth_workflow.async_table_comments.run_sequential_comments_job",
+        1,
+    ),
+    "db_elements": (
+        "thoth_core.thoth_ai.thoth_workflow.async_db_elements.run_db_elements_job",
+        2,
+    ),
+}
+
+# job type -> dotted path of a function called with the job when it ends
+# without its handler reaching the end: cancelled while queued, or given up
+# after its worker stopped responding
+ABANDON_HOOKS = {
+    "evidence_upload": "thoth_ai_backend.async_tasks.abandon_upload_job",
+    "questions_upload": "thoth_ai_backend.async_tasks.abandon_upload_job",
+}
+
+ACTIVE_STATUSES = (JobStatus.QUEUED, JobStatus.RUNNING)
+
+RUNNER_MODE = os.getenv("THOTH_JOB_RUNNER", "embedded").lower()
+EMBEDDED_THREADS = int(os.getenv("THOTH_JOB_EMBEDDED_THREADS", "2"))
+POLL_INTERVAL = float(os.getenv("THOTH_JOB_POLL_INTERVAL", "2"))
+HEARTBEAT_INTERVAL = float(os.getenv("THOTH_JOB_HEARTBEAT_INTERVAL", "10"))
+# A running job without a heartbeat for this long is considered orphaned
+STALE_AFTER = float(os.getenv("THOTH_JOB_STALE_AFTER", "120"))
+
+
+class JobCancelled(Exception):
+    """Raised inside a handler when its job has been cancelled."""
+
+
+class JobInterrupted(Exception):
+    """Raised inside a handler when its worker is shutting down."""
+
+
+def _parse_concurrency(value: str) -> Dict[str, int]:
+    limits = {}
+    for item in (value or "").split(","):
+        if "=" not in item:
+            continue
+        job_type, limit = item.split("=", 1)
+        try:
+            limits[job_type.strip()] = max(1, int(limit))
+        except ValueError:
+            logger.warning(f"Ignoring invalid THOTH_JOB_CONCURRENCY entry: {item!r}")
+    return limits
+
+
+_CONCURRENCY_OVERRIDES = _parse_concurrency(os.getenv("THOTH_JOB_CONCURRENCY", ""))
+
+
+def concurrency_limit(job_type: str) -> int:
+    """Maximum number of jobs of this type running at once across all workers."""
+    if job_type in _CONCURRENCY_OVERRIDES:
+        return _CONCURRENCY_OVERRIDES[job_type]
+    return JOB_TYPES[job_type][1]
+
+
+_handlers = {}
+
+
+def get_handler(job_type: str):
+    """Import and return the handler of a job type."""
+    if job_type not in _handlers:
+        module_path, _, name = JOB_TYPES[job_type][0].rpartition(".")
+        _handlers[job_type] = getattr(import_module(module_path), name)
+    return _handlers[job_type]
+
+
+def _run_abandon_hook(job: BackgroundJob) -> None:
+    """Let the job type clean up after a job that ended outside its handler."""
+    if job.job_type not in ABANDON_HOOKS:
+        return
+    module_path, _, name = ABANDON_HOOKS[job.job_type].rpartition(".")
+    try:
+        getattr(import_module(module_path), name)(job)
+    except Exception as e:
+        logger.error(f"Cleanup of {job.job_type} job {job.pk} failed: {e}", exc_info=True)
+
+
+class JobContext:
+    """Handle given to a job handler for its payload, checkpoint and cancellation."""
+
+    def __init__(self, job: BackgroundJob, stop_event: Optional[threading.Event] = None):
+        self.job = job
+        self.payload = job.payload or {}
+        self.checkpoint = dict(job.checkpoint or {})
+        self._stop_event = stop_event
+        self._cancelled = threading.Event()
+        if job.cancel_requested:
+            self._cancelled.set()
+
+    @property
+    def task_id(self) -> str:
+        return self.job.task_id
+
+    @property
+    def resumed(self) -> bool:
+        """True when a previous attempt saved a checkpoint."""
+        return bool(self.checkpoint)
+
+    def save_checkpoint(self, **values) -> None:
+        """Persist progress so an interrupted job resumes from here."""
+        self.checkpoint.update(values)
+        BackgroundJob.objects.filter(pk=self.job.pk).update(
+            checkpoint=self.checkpoint, heartbeat_at=timezone.now()
+        )
+
+    def mark_cancelled(self) -> None:
+        self._cancelled.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        """Stop the handler if the job was cancelled or the worker is stopping."""
+        if self._cancelled.is_set():
+            raise JobCancelled(f"Job {self.job.pk} cancelled")
+        if self._stop_event is not None and self._stop_event.is_set():
+            raise JobInterrupted(f"Job {self.job.pk} interrupted by worker shutdown")
+
+
+def enqueue(job_type: str, payload: Optional[dict] = None, user=None, max_attempts: int = 3) -> BackgroundJob:
+    """
+    Queue a job and return it; the caller's transaction must commit for it to run.
+    `user` may be a User or a user id.
+    """
+    if job_type not in JOB_TYPES:
+        raise ValueError(f"Unknown job type: {job_type}")
+    job = BackgroundJob.objects.create(
+        job_type=job_type,
+        payload=payload or {},
+        created_by_id=getattr(user, "pk", user),
+        max_attempts=max_attempts,
+    )
+    logger.info(f"Queued {job_type} job {job.pk}")
+    if RUNNER_MODE == "embedded":
+        transaction.on_commit(lambda: get_embedded_pool().wake())
+    return job
+
+
+def cancel_job(job_id: int) -> bool:
+    """
+    Cancel a job. A queued job is cancelled immediately; a running job is
+    asked to stop at its next checkpoint. Returns False if it already ended.
+    """
+    now = timezone.now()
+    if BackgroundJob.objects.filter(pk=job_id, status=JobStatus.QUEUED).update(
+        status=JobStatus.CANCELLED, cancel_requested=True, finished_at=now
+    ):
+        logger.info(f"Cancelled queued job {job_id}")
+        _run_abandon_hook(BackgroundJob.objects.get(pk=job_id))
+        return True
+    if BackgroundJob.objects.filter(pk=job_id, status=JobStatus.RUNNING).update(
+        cancel_requested=True
+    ):
+        logger.info(f"Requested cancellation of running job {job_id}")
+        return True
+    return False
+
+
+def get_job_for_task_id(task_id: Optional[str]) -> Optional[BackgroundJob]:
+    """Return the job referenced by a *_task_id value written by a job handler."""
+    if not task_id or not str(task_id).startswith("job-"):
+        return None
+    try:
+        return BackgroundJob.objects.filter(pk=int(str(task_id)[4:])).first()
+    except ValueError:
+        return None
+
+
+def requeue_stale_jobs(stale_after: float = STALE_AFTER) -> int:
+    """
+    Put back in the queue the running jobs whose worker stopped heartbeating.
+    Jobs that already used all their attempts, or were being cancelled, end.
+    """
+    cutoff = timezone.now() - timedelta(seconds=stale_after)
+    stale = BackgroundJob.objects.filter(status=JobStatus.RUNNING, heartbeat_at__lt=cutoff)
+    ending = list(
+        stale.filter(Q(cancel_requested=True) | Q(attempts__gte=F("max_attempts")))
+        .filter(job_type__in=ABANDON_HOOKS)
+        .values_list("pk", flat=True)
+    )
+    now = timezone.now()
+    cancelled = stale.filter(cancel_requested=True).update(
+        status=JobStatus.CANCELLED, finished_at=now
+    )
+    failed = stale.filter(attempts__gte=F("max_attempts")).update(
+        status=JobStatus.FAILED,
+        error="Worker stopped responding and no attempts are left",
+        finished_at=now,
+    )
+    requeued = stale.update(status=JobStatus.QUEUED, worker_id="")
+    if cancelled or failed or requeued:
+        logger.warning(
+            f"Stale jobs: {requeued} requeued, {failed} failed, {cancelled} cancelled"
+        )
+    for job in BackgroundJob.objects.filter(
+        pk__in=ending, status__in=(JobStatus.CANCELLED, JobStatus.FAILED)
+    ):
+        _run_abandon_hook(job)
+    return requeued
+
+
+def claim_next_job(worker_id: str, job_types: Optional[Iterable[str]] = None) -> Optional[BackgroundJob]:
+    """
+    Claim the oldest queued job whose type is below its concurrency limit.
+
+    The claim is a conditional UPDATE, so concurrent workers never run the
+    same job; the limit is re-checked after the claim and the job released
+    again if another worker won the last slot.
+    """
+    job_types = list(job_types or JOB_TYPES)
+    running = dict(
+        BackgroundJob.objects.filter(status=JobStatus.RUNNING, job_type__in=job_types)
+        .order_by()
+        .values_list("job_type")
+        .annotate(n=Count("id"))
+    )
+    available = [t for t in job_types if running.get(t, 0) < concurrency_limit(t)]
+    if not available:
+        return None
+
+    candidates = (
+        BackgroundJob.objects.filter(status=JobStatus.QUEUED, job_type__in=available)
+        .order_by("created_at", "id")
+        .values_list("pk", "job_type")[:20]
+    )
+    for pk, job_type in candidates:
+        if running.get(job_type, 0) >= concurrency_limit(job_type):
+            continue
+        now = timezone.now()
+        claimed = BackgroundJob.objects.filter(pk=pk, status=JobStatus.QUEUED).update(
+            status=JobStatus.RUNNING,
+            worker_id=worker_id,
+            started_at=now,
+            heartbeat_at=now,
+            attempts=F("attempts") + 1,
+        )
+        if not claimed:
+            continue
+
+        # Jobs that were running before this claim, or claimed concurrently
+        # with a lower id, keep their slot
+        ahead = (
+            BackgroundJob.objects.filter(status=JobStatus.RUNNING, job_type=job_type)
+            .exclude(pk=pk)
+            .filter(Q(started_at__lt=now) | Q(pk__lt=pk))
+            .count()
+        )
+        if ahead >= concurrency_limit(job_type):
+            BackgroundJob.objects.filter(pk=pk, worker_id=worker_id).update(
+                status=JobStatus.QUEUED, worker_id="", attempts=F("attempts") - 1
+            )
+            running[job_type] = ahead
+            continue
+        return BackgroundJob.objects.get(pk=pk)
+    return None
+
+
+def execute_job(job: BackgroundJob, stop_event: Optional[threading.Event] = None, contexts=None) -> str:
+    """Run a claimed job to completion and record its outcome; returns the final status."""
+    context = JobContext(job, stop_event)
+    if contexts is not None:
+        contexts[job.pk] = context
+    logger.info(
+        f"Running {job.job_type} job {job.pk} (attempt {job.attempts}"
+        f"{', resuming from checkpoint' if context.resumed else ''})"
+    )
+    updates = {}
+    try:
+        if context.cancelled:
+            _run_abandon_hook(job)
+        context.raise_if_cancelled()
+        result = get_handler(job.job_type)(context)
+        updates = {"status": JobStatus.COMPLETED, "result": result if isinstance(result, (dict, list)) else None}
+    except JobCancelled:
+        updates = {"status": JobStatus.CANCELLED}
+    except JobInterrupted:
+        # Not the job's fault: give the attempt back and let another worker resume it
+        updates = {"status": JobStatus.QUEUED, "worker_id": "", "attempts": F("attempts") - 1}
+    except Exception as e:
+        logger.error(f"{job.job_type} job {job.pk} failed: {e}", exc_info=True)
+        updates = {"status": JobStatus.FAILED, "error": str(e)}
+    finally:
+        if contexts is not None:
+            contexts.pop(job.pk, None)
+        if updates.get("status") != JobStatus.QUEUED:
+            updates["finished_at"] = timezone.now()
+        if updates:
+            BackgroundJob.objects.filter(pk=job.pk).update(**updates)
+    logger.info(f"{job.job_type} job {job.pk} finished with status {updates['status']}")
+    return updates["status"]
+
+
+class WorkerPool:
+    """
+    Threads that claim and execute queued jobs, plus a heartbeat thread that
+    keeps their jobs alive, relays cancellation requests and requeues jobs
+    orphaned by dead workers.
+    """
+
+    def __init__(
+        self,
+        threads: int = 2,
+        job_types: Optional[Iterable[str]] = None,
+        poll_interval: float = POLL_INTERVAL,
+        name: Optional[str] = None,
+    ):
+        self.threads = max(1, threads)
+        self.job_types = list(job_types) if job_types else None
+        self.poll_interval = poll_interval
+        self.name = name or f"{socket.gethostname()}:{os.getpid()}"
+        self.stop_event = threading.Event()
+        self._wake = threading.Condition()
+        self._pending_wakes = 0
+        self._contexts: Dict[int, JobContext] = {}
+        self._threads: List[threading.Thread] = []
+        self._idle = set()
+
+    def start(self) -> "WorkerPool":
+        for index in range(self.threads):
+            thread = threading.Thread(
+                target=self._work, args=(f"{self.name}:{index}",), daemon=True,
+                name=f"job-worker-{index}",
+            )
+            thread.start()
+            self._threads.append(thread)
+        heartbeat = threading.Thread(target=self._heartbeat, daemon=True, name="job-heartbeat")
+        heartbeat.start()
+        self._threads.append(heartbeat)
+        logger.info(f"Job worker pool {self.name} started with {self.threads} thread(s)")
+        return self
+
+    def wake(self) -> None:
+        """Make idle worker threads poll the queue now."""
+        with self._wake:
+            self._pending_wakes += 1
+            self._wake.notify_all()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop claiming jobs and interrupt running ones at their next checkpoint."""
+        self.stop_event.set()
+        self.wake()
+        for thread in self._threads:
+            thread.join(timeout)
+
+    def release_running(self) -> int:
+        """Requeue the jobs still held by this pool, e.g. after stop() timed out."""
+        job_ids = list(self._contexts)
+        if not job_ids:
+            return 0
+        return BackgroundJob.objects.filter(pk__in=job_ids, status=JobStatus.RUNNING).update(
+            status=JobStatus.QUEUED, worker_id="", attempts=F("attempts") - 1
+        )
+
+    def is_idle(self) -> bool:
+        return len(self._idle) == self.threads and not self._contexts
+
+    def _sleep(self) -> None:
+        with self._wake:
+            if not self._pending_wakes:
+                self._wake.wait(self.poll_interval)
+            self._pending_wakes = max(0, self._pending_wakes - 1)
+
+    def _work(self, worker_id: str) -> None:
+        try:
+            while not self.stop_event.is_set():
+                close_old_connections()
+                try:
+                    job = claim_next_job(worker_id, self.job_types)
+                except Exception as e:
+                    logger.error(f"Could not claim a job: {e}")
+                    job = None
+                if job is None:
+                    self._idle.add(worker_id)
+                    self._sleep()
+                    continue
+                self._idle.discard(worker_id)
+                execute_job(job, self.stop_event, self._contexts)
+        finally:
+            connections.close_all()
+
+    def _heartbeat(self) -> None:
+        last_stale_check = 0.0
+        try:
+            while not self.stop_event.wait(HEARTBEAT_INTERVAL):
+                close_old_connections()
+                try:
+                    job_ids = list(self._contexts)
+                    if job_ids:
+                        BackgroundJob.objects.filter(
+                            pk__in=job_ids, status=JobStatus.RUNNING
+                        ).update(heartbeat_at=timezone.now())
+                        for pk in BackgroundJob.objects.filter(
+                            pk__in=job_ids, cancel_requested=True
+                        ).values_list("pk", flat=True):
+                            context = self._contexts.get(pk)
+                            if context:
+                                context.mark_cancelled()
+                    last_stale_check += HEARTBEAT_INTERVAL
+                    if last_stale_check >= STALE_AFTER / 2:
+                        last_stale_check = 0.0
+                        if requeue_stale_jobs():
+                            self.wake()
+                except Exception as e:
+                    logger.error(f"Job heartbeat failed: {e}")
+        finally:
+            connections.close_all()
+
+
+_embedded_pool = None
+_embedded_lock = threading.Lock()
+
+
+def get_embedded_pool() -> WorkerPool:
+    """Return the worker pool running inside this process, starting it on first use."""
+    global _embedded_pool
+    if _embedded_pool is None:
+        with _embedded_lock:
+            if _embedded_pool is None:
+                requeue_stale_jobs()
+                _embedded_pool = WorkerPool(
+                    threads=EMBEDDED_THREADS, name=f"{socket.gethostname()}:{os.getpid()}:web"
+                ).start()
+    return _embedded_pool
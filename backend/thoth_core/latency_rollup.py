@@ -0,0 +1,256 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Pipeline latency rollups for ThothLog.
+
+Maintains hourly and daily p50/p90/p99 latencies per pipeline phase in the
+PipelineLatencyRollup table. Each run only recomputes the time buckets that
+received new or updated logs since the previous run, so the job stays cheap
+regardless of how large the log table grows.
+"""
+
+import logging
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone as dt_timezone
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from thoth_core.models import PipelineLatencyRollup, RollupGranularity, ThothLog
+
+logger = logging.getLogger(__name__)
+
+# Pipeline phase name -> ThothLog duration field (milliseconds)
+PIPELINE_PHASES: Dict[str, str] = {
+    "validation": "validation_duration_ms",
+    "keyword_generation": "keyword_generation_duration_ms",
+    "schema_preparation": "schema_preparation_duration_ms",
+    "context_retrieval": "context_retrieval_duration_ms",
+    "test_generation": "test_generation_duration_ms",
+    "test_reduction": "test_reduction_duration_ms",
+    "sql_generation": "sql_generation_duration_ms",
+    "evaluation": "evaluation_duration_ms",
+    "sql_selection": "sql_selection_duration_ms",
+    "belt_and_suspenders": "belt_and_suspenders_duration_ms",
+}
+
+BUCKET_SIZES = {
+    RollupGranularity.HOUR: timedelta(hours=1),
+    RollupGranularity.DAY: timedelta(days=1),
+}
+
+# Dimension value used for "all workspaces" / "all agents" rows
+ALL = ""
+
+
+def bucket_start(value: datetime, granularity: str) -> datetime:
+    """Truncate a datetime to the start of its UTC hour or day bucket."""
+    value = value.astimezone(dt_timezone.utc)
+    if granularity == RollupGranularity.DAY:
+        return value.replace(hour=0, minute=0, second=0, microsecond=0)
+    return value.replace(minute=0, second=0, microsecond=0)
+
+
+def percentile(sorted_values: List[int], pct: float) -> int:
+    """
+    Linear-interpolated percentile of an already sorted list.
+
+    Matches numpy's default ("linear") method, without the dependency.
+    """
+    if not sorted_values:
+        return 0
+    if len(sorted_values) == 1:
+        return sorted_values[0]
+    rank = (len(sorted_values) - 1) * pct / 100.0
+    lower = int(rank)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    fraction = rank - lower
+    return int(
+        round(sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * fraction)
+    )
+
+
+def summarize(durations: Iterable[int]) -> Dict[str, int]:
+    """Return count, min, max, mean and p50/p90/p99 of the given durations."""
+    values = sorted(durations)
+    if not values:
+        return {
+            "sample_count": 0,
+            "p50_ms": 0,
+            "p90_ms": 0,
+            "p99_ms": 0,
+            "min_ms": 0,
+            "max_ms": 0,
+            "mean_ms": 0,
+        }
+    return {
+        "sample_count": len(values),
+        "p50_ms": percentile(values, 50),
+        "p90_ms": percentile(values, 90),
+        "p99_ms": percentile(values, 99),
+        "min_ms": values[0],
+        "max_ms": values[-1],
+        "mean_ms": int(round(sum(values) / len(values))),
+    }
+
+
+def _dirty_buckets(since: Optional[datetime]) -> Dict[str, Set[datetime]]:
+    """
+    Collect the hourly and daily buckets touched by logs updated after `since`.
+    """
+    queryset = ThothLog.objects.all()
+    if since is not None:
+        queryset = queryset.filter(updated_at__gt=since)
+
+    dirty: Dict[str, Set[datetime]] = {granularity: set() for granularity in BUCKET_SIZES}
+    for started_at in queryset.values_list("started_at", flat=True).iterator(chunk_size=2000):
+        for granularity in BUCKET_SIZES:
+            dirty[granularity].add(bucket_start(started_at, granularity))
+    return dirty
+
+
+def group_samples(rows: Iterable[tuple]) -> Dict[Tuple[str, str, str], List[int]]:
+    """
+    Group the durations of (workspace, sql_agent_name, *phase durations) rows
+    by (phase, workspace, agent), adding each to the "all" rows as well.
+    """
+    samples: Dict[Tuple[str, str, str], List[int]] = defaultdict(list)
+    for workspace, agent_name, *durations in rows:
+        agent_name = agent_name or ""
+        for phase, duration in zip(PIPELINE_PHASES, durations):
+            # A zero duration means the phase did not run for this request
+            if not duration:
+                continue
+            for ws_key in (workspace, ALL):
+                for agent_key in (agent_name, ALL) if agent_name else (ALL,):
+                    samples[(phase, ws_key, agent_key)].append(duration)
+    return samples
+
+
+def _compute_bucket_rows(
+    granularity: str, start: datetime, computed_at: datetime
+) -> List[PipelineLatencyRollup]:
+    """
+    Build rollup rows for one bucket from the raw ThothLog durations.
+
+    Only the timing columns are loaded; the large text fields of the log are
+    never read.
+    """
+    end = start + BUCKET_SIZES[granularity]
+    duration_fields = list(PIPELINE_PHASES.values())
+    rows = ThothLog.objects.filter(started_at__gte=start, started_at__lt=end).values_list(
+        "workspace", "sql_agent_name", *duration_fields
+    )
+
+    samples = group_samples(rows.iterator(chunk_size=2000))
+    return [
+        PipelineLatencyRollup(
+            granularity=granularity,
+            bucket_start=start,
+            phase=phase,
+            workspace=workspace,
+            agent_name=agent_name,
+            computed_at=computed_at,
+            **summarize(durations),
+        )
+        for (phase, workspace, agent_name), durations in samples.items()
+    ]
+
+
+def rollup_pipeline_latency(full: bool = False) -> Dict[str, int]:
+    """
+    Incrementally refresh the latency rollup table.
+
+    Args:
+        full: Recompute every bucket instead of only those touched by logs
+            updated since the previous run.
+
+    Returns:
+        Dict with the number of buckets recomputed and rollup rows written.
+    """
+    computed_at = timezone.now()
+    since = None
+    if not full:
+        since = PipelineLatencyRollup.objects.aggregate(last=Max("computed_at"))["last"]
+
+    dirty = _dirty_buckets(since)
+    buckets = 0
+    rows_written = 0
+
+    for granularity, starts in dirty.items():
+        for start in sorted(starts):
+            rows = _compute_bucket_rows(granularity, start, computed_at)
+            # Replace the bucket atomically so readers never see a partial rollup
+            with transaction.atomic():
+                PipelineLatencyRollup.objects.filter(
+                    granularity=granularity, bucket_start=start
+                ).delete()
+                PipelineLatencyRollup.objects.bulk_create(rows)
+            buckets += 1
+            rows_written += len(rows)
+
+    logger.info(
+        f"Latency rollup completed: {buckets} buckets recomputed, {rows_written} rows written"
+    )
+    return {"buckets": buckets, "rows": rows_written}
+
+
+def phase_trends(
+    workspace: str = ALL,
+    agent_name: str = ALL,
+    granularity: str = RollupGranularity.DAY,
+    buckets: int = 14,
+) -> List[Dict]:
+    """
+    Return per-phase latency trends for the dashboard.
+
+    For each phase, the rows of the last `buckets` buckets are returned
+    together with the change of p90 between the latest bucket and the
+    median p90 of the earlier ones, which is what flags a regression.
+    """
+    since = bucket_start(timezone.now(), granularity) - BUCKET_SIZES[granularity] * (
+        buckets - 1
+    )
+    rows = PipelineLatencyRollup.objects.filter(
+        granularity=granularity,
+        workspace=workspace,
+        agent_name=agent_name,
+        bucket_start__gte=since,
+    ).order_by("phase", "bucket_start")
+
+    by_phase: Dict[str, List[PipelineLatencyRollup]] = defaultdict(list)
+    for row in rows:
+        by_phase[row.phase].append(row)
+
+    trends = []
+    for phase in PIPELINE_PHASES:
+        history = by_phase.get(phase)
+        if not history:
+            continue
+        latest = history[-1]
+        baseline = percentile(sorted(row.p90_ms for row in history[:-1]), 50)
+        p90_change_pct = None
+        if len(history) > 1 and baseline:
+            p90_change_pct = round((latest.p90_ms - baseline) / baseline * 100, 1)
+        trends.append(
+            {
+                "phase": phase,
+                "latest": latest,
+                "baseline_p90_ms": baseline,
+                "p90_change_pct": p90_change_pct,
+                "history": history,
+            }
+        )
+    return trends
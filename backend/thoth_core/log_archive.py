@@ -0,0 +1,242 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Tiered retention for ThothLog.
+
+Tier 1: recent logs keep every field in the database.
+Tier 2: older logs keep only summary fields (question, selected SQL, status,
+        timings, flags); the large detail blobs are appended to gzip-compressed
+        JSONL files partitioned by the day the log started.
+Tier 3 (optional): summary rows older than a second threshold are deleted.
+
+Archived details can be loaded back on demand with load_archived_detail(),
+which is what the ThothLog admin detail view uses.
+"""
+
+import gzip
+import json
+import logging
+import os
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone as dt_timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.utils import timezone
+
+from thoth_core.models import ThothLog
+from thoth_core.utilities.shared_paths import get_log_archive_path
+
+logger = logging.getLogger(__name__)
+
+# Large per-request payloads moved out of the database once a log ages out
+# of the full-detail tier. Everything else stays queryable as summary data.
+ARCHIVED_DETAIL_FIELDS = (
+    "translated_question",
+    "keywords_list",
+    "evidences",
+    "similar_questions",
+    "reduced_schema",
+    "used_mschema",
+    "generated_tests",
+    "evaluation_results",
+    "pool_of_generated_sql",
+    "directives",
+    "similar_columns",
+    "schema_with_examples",
+    "schema_from_vector_db",
+    "selection_metrics",
+    "enhanced_evaluation_thinking",
+    "enhanced_evaluation_answers",
+    "evaluation_details",
+    "lsh_similar_columns",
+    "gold_sql_extracted",
+    "evaluation_judgments",
+    "reduced_tests",
+    "evidence_relevance_events",
+    "evidence_relevance_summary",
+    "model_retry_events",
+    "retry_history",
+)
+
+DEFAULT_BATCH_SIZE = 500
+
+
+def _stripped_values() -> Dict[str, Any]:
+    """Values written to the detail fields of an archived row."""
+    values = {}
+    for name in ARCHIVED_DETAIL_FIELDS:
+        field = ThothLog._meta.get_field(name)
+        values[name] = None if field.null else ""
+    return values
+
+
+def archive_file_path(started_at: datetime, archive_dir: Optional[str] = None) -> str:
+    """
+    Return the archive file holding the details of logs started on the same
+    UTC day as `started_at` (<archive_dir>/YYYY/MM/thoth_logs_YYYY-MM-DD.jsonl.gz).
+    """
+    day = started_at.astimezone(dt_timezone.utc).date()
+    return os.path.join(
+        archive_dir or get_log_archive_path(),
+        f"{day:%Y}",
+        f"{day:%m}",
+        f"thoth_logs_{day:%Y-%m-%d}.jsonl.gz",
+    )
+
+
+def _append_records(path: str, records: Iterable[Dict[str, Any]]) -> None:
+    """
+    Append records as a new gzip member of the daily archive file.
+
+    gzip readers transparently concatenate members, so appending never
+    rewrites existing data. The file is fsynced before returning so the
+    database rows are only stripped once their details are on disk.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "ab") as raw:
+        with gzip.GzipFile(fileobj=raw, mode="ab") as gz:
+            for record in records:
+                line = json.dumps(record, cls=DjangoJSONEncoder, ensure_ascii=False)
+                gz.write(line.encode("utf-8") + b"\n")
+        raw.flush()
+        os.fsync(raw.fileno())
+
+
+def load_archived_detail(
+    log: ThothLog, archive_dir: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Load the archived detail fields of a log.
+
+    Returns:
+        Dict of detail field values, or None if the log is not archived or
+        its record cannot be found.
+    """
+    if not log.archived_at:
+        return None
+
+    path = archive_file_path(log.started_at, archive_dir)
+    if not os.path.exists(path):
+        logger.warning(f"Archive file missing for ThothLog {log.id}: {path}")
+        return None
+
+    detail = None
+    with gzip.open(path, "rt", encoding="utf-8") as archive:
+        for line in archive:
+            # Cheap prefix check before parsing; records start with their id
+            if not line.startswith(f'{{"id": {log.id},'):
+                continue
+            # A retried batch may have appended the same log twice; the last
+            # record wins.
+            detail = json.loads(line)["detail"]
+    return detail
+
+
+def archive_old_logs(
+    detail_days: int,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_batches: Optional[int] = None,
+    pause_seconds: float = 0.0,
+    archive_dir: Optional[str] = None,
+    dry_run: bool = False,
+) -> Dict[str, int]:
+    """
+    Move the detail fields of logs older than `detail_days` to archive files.
+
+    Work is done in batches of `batch_size` rows. Each batch writes its
+    archive records first and then strips the rows with a single UPDATE in
+    a short transaction, so the table is never locked for long.
+
+    Returns:
+        Dict with the number of archived logs, batches and archive files touched.
+    """
+    cutoff = timezone.now() - timedelta(days=detail_days)
+    pending = ThothLog.objects.filter(archived_at__isnull=True, started_at__lt=cutoff)
+
+    if dry_run:
+        return {"archived": pending.count(), "batches": 0, "files": 0}
+
+    stripped = _stripped_values()
+    archived = 0
+    batches = 0
+    files = set()
+
+    while max_batches is None or batches < max_batches:
+        ids = list(pending.order_by("id").values_list("id", flat=True)[:batch_size])
+        if not ids:
+            break
+
+        archived_at = timezone.now()
+        rows = ThothLog.objects.filter(id__in=ids).values(
+            "id", "started_at", *ARCHIVED_DETAIL_FIELDS
+        )
+
+        by_file: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for row in rows:
+            path = archive_file_path(row["started_at"], archive_dir)
+            by_file[path].append(
+                {
+                    "id": row["id"],
+                    "started_at": row["started_at"],
+                    "archived_at": archived_at,
+                    "detail": {name: row[name] for name in ARCHIVED_DETAIL_FIELDS},
+                }
+            )
+
+        for path, records in by_file.items():
+            _append_records(path, records)
+            files.add(path)
+
+        with transaction.atomic():
+            ThothLog.objects.filter(id__in=ids, archived_at__isnull=True).update(
+                archived_at=archived_at, **stripped
+            )
+
+        archived += len(ids)
+        batches += 1
+        logger.info(f"Archived ThothLog batch {batches}: {len(ids)} logs")
+
+        if pause_seconds:
+            time.sleep(pause_seconds)
+
+    return {"archived": archived, "batches": batches, "files": len(files)}
+
+
+def purge_old_summaries(
+    summary_days: int,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    dry_run: bool = False,
+) -> int:
+    """
+    Delete archived log rows older than `summary_days`, in batches.
+
+    Only rows whose details were already archived are removed, so the
+    archive files remain the record of every deleted log.
+    """
+    cutoff = timezone.now() - timedelta(days=summary_days)
+    expired = ThothLog.objects.filter(archived_at__isnull=False, started_at__lt=cutoff)
+
+    if dry_run:
+        return expired.count()
+
+    deleted = 0
+    while True:
+        ids = list(expired.order_by("id").values_list("id", flat=True)[:batch_size])
+        if not ids:
+            break
+        count, _ = ThothLog.objects.filter(id__in=ids).delete()
+        deleted += count
+    return deleted
@@ -0,0 +1,113 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from thoth_core.log_archive import (
+    DEFAULT_BATCH_SIZE,
+    archive_old_logs,
+    purge_old_summaries,
+)
+from thoth_core.utilities.shared_paths import get_log_archive_path
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = (
+        "Apply ThothLog retention tiers: keep full detail for --detail-days, "
+        "move older detail fields to compressed archive files and optionally "
+        "delete archived rows older than --summary-days"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--detail-days",
+            type=int,
+            default=int(os.getenv("THOTH_LOG_DETAIL_RETENTION_DAYS", 30)),
+            help="Days of full detail kept in the database (default: 30)",
+        )
+        parser.add_argument(
+            "--summary-days",
+            type=int,
+            default=int(os.getenv("THOTH_LOG_SUMMARY_RETENTION_DAYS", 0)),
+            help="Delete archived rows older than this many days (default: 0, never)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help=f"Rows processed per batch (default: {DEFAULT_BATCH_SIZE})",
+        )
+        parser.add_argument(
+            "--max-batches",
+            type=int,
+            default=None,
+            help="Stop after this many batches (default: no limit)",
+        )
+        parser.add_argument(
+            "--pause",
+            type=float,
+            default=0.0,
+            help="Seconds to sleep between batches to reduce contention",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Show how many logs would be archived or deleted",
+        )
+
+    def handle(self, *args, **options):
+        detail_days = options["detail_days"]
+        summary_days = options["summary_days"]
+        dry_run = options["dry_run"]
+
+        if detail_days < 1:
+            raise CommandError("--detail-days must be at least 1")
+        if summary_days and summary_days <= detail_days:
+            raise CommandError("--summary-days must be greater than --detail-days")
+
+        self.stdout.write(
+            f"Archiving ThothLog details older than {detail_days} days "
+            f"to {get_log_archive_path()}..."
+        )
+        result = archive_old_logs(
+            detail_days,
+            batch_size=options["batch_size"],
+            max_batches=options["max_batches"],
+            pause_seconds=options["pause"],
+            dry_run=dry_run,
+        )
+
+        if dry_run:
+            self.stdout.write(f"Would archive {result['archived']} log(s).")
+        else:
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Archived {result['archived']} log(s) in {result['batches']} "
+                    f"batch(es) across {result['files']} archive file(s)."
+                )
+            )
+
+        if summary_days:
+            deleted = purge_old_summaries(
+                summary_days, batch_size=options["batch_size"], dry_run=dry_run
+            )
+            action = "Would delete" if dry_run else "Deleted"
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"{action} {deleted} archived log(s) older than {summary_days} days."
+                )
+            )
@@ -0,0 +1,145 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+import re
+import time
+
+from django.core.management.base import BaseCommand
+
+from thoth_core.thoth_ai.thoth_workflow.gdpr_engine import (
+    CONTENT_MIN_RATIO,
+    CONTENT_PATTERNS,
+    GDPRClassifier,
+    detect_content_types,
+)
+from thoth_core.thoth_ai.thoth_workflow.gdpr_scanner import GDPR_PATTERNS, ID_PATTERNS
+
+NAME_PARTS = [
+    "customer", "order", "amount", "status", "created", "updated", "first_name",
+    "email", "phone", "street", "iban", "balance", "score", "code", "note",
+    "total", "quantity", "price", "ip_address", "device", "diagnosis", "flag",
+    "description", "level", "rate", "count", "date", "type", "group", "value",
+]
+
+SAMPLE_VALUES = {
+    "email": lambda i: f"user{i}@example.com",
+    "iban": lambda i: f"IT60 X054 2811 1010 0000 0{i:05d}",
+    "phone": lambda i: f"+39 06 {i:04d} 5678",
+    "amount": lambda i: f"{i * 3.5:.2f}",
+    "status": lambda i: random.choice(["open", "closed", "pending"]),
+    "created": lambda i: f"2024-01-{1 + i % 28:02d}",
+}
+
+
+def legacy_identify(column_name):
+    """The original per-pattern re.search() loop, kept for comparison."""
+    for pattern in ID_PATTERNS:
+        if re.search(pattern, column_name, re.IGNORECASE):
+            return []
+    matches = []
+    for category_group, patterns_dict in GDPR_PATTERNS.items():
+        for pattern_type, pattern_info in patterns_dict.items():
+            for pattern in pattern_info["patterns"]:
+                if re.search(pattern, column_name):
+                    matches.append((pattern_type, category_group))
+                    break
+    return matches
+
+
+def legacy_detect(samples):
+    """Per-value content matching, kept for comparison."""
+    detected = {}
+    for column, values in samples.items():
+        values = [v.strip() for v in values if isinstance(v, str) and v.strip()]
+        if not values:
+            continue
+        for pattern_type, regex in CONTENT_PATTERNS.items():
+            hits = sum(
+                1
+                for v in values
+                if re.fullmatch(regex, re.sub(r"\s+", "", v).upper() if pattern_type == "banking" else v)
+            )
+            if hits / len(values) >= CONTENT_MIN_RATIO:
+                detected.setdefault(column, pattern_type)
+                break
+    return detected
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the GDPR classifier on a synthetic wide schema: legacy "
+        "per-pattern matching against the compiled classifier, and per-value "
+        "against vectorised content detection. Nothing is written."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--tables", type=int, default=200)
+        parser.add_argument("--columns", type=int, default=100, help="Columns per table")
+        parser.add_argument("--rows", type=int, default=50, help="Sampled rows per table")
+        parser.add_argument("--seed", type=int, default=42)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options["seed"])
+        random.seed(options["seed"])
+        schema = [
+            [
+                f"{rng.choice(NAME_PARTS)}_{rng.choice(NAME_PARTS)}" if c % 3 else rng.choice(NAME_PARTS)
+                for c in range(options["columns"])
+            ]
+            for _ in range(options["tables"])
+        ]
+        names = [name for table in schema for name in table]
+        self.stdout.write(f"Schema: {options['tables']} tables, {len(names)} columns")
+
+        started = time.perf_counter()
+        legacy = [legacy_identify(name) for name in names]
+        legacy_time = time.perf_counter() - started
+
+        started = time.perf_counter()
+        classifier = GDPRClassifier(GDPR_PATTERNS, ID_PATTERNS)
+        compiled = [classifier.identify(name) for name in names]
+        compiled_time = time.perf_counter() - started
+
+        same = legacy == [[(m["pattern_type"], m["category_group"]) for m in c] for c in compiled]
+        self.report("Name matching", legacy_time, compiled_time, same)
+
+        samples = [
+            {
+                f"{kind}_{t}": [generate(i) for i in range(options["rows"])]
+                for kind, generate in SAMPLE_VALUES.items()
+            }
+            for t in range(options["tables"])
+        ]
+        started = time.perf_counter()
+        legacy = [legacy_detect(table) for table in samples]
+        legacy_time = time.perf_counter() - started
+
+        started = time.perf_counter()
+        detected = detect_content_types(
+            {(t, column): values for t, table in enumerate(samples) for column, values in table.items()}
+        )
+        vectorised_time = time.perf_counter() - started
+        vectorised = [{} for _ in samples]
+        for (t, column), pattern_type in detected.items():
+            vectorised[t][column] = pattern_type
+        self.report("Content detection", legacy_time, vectorised_time, legacy == vectorised)
+
+    def report(self, label, legacy_time, new_time, same):
+        speedup = legacy_time / new_time if new_time else float("inf")
+        style = self.style.SUCCESS if same else self.style.ERROR
+        self.stdout.write(
+            style(
+                f"{label}: legacy {legacy_time * 1000:.1f} ms, new {new_time * 1000:.1f} ms "
+                f"({speedup:.1f}x), results {'identical' if same else 'DIFFER'}"
+            )
+        )
@@ -12,6 +12,7 @@
 
 from django.core.management.base import BaseCommand
 from django.conf import settings
+from thoth_core.bulk_csv_import import ReferenceMap, SkipRow, bulk_import_csv
 from thoth_core.models import SqlDb, SqlTable, SqlColumn, Relationship, VectorDb
 import os
 import csv
@@ -187,16 +188,29 @@ class Command(BaseCommand):
             )
         )
 
-    def import_tables(self, import_dir, db_name, sql_db, source="local"):
-        """Import tables for a specific database, preserving original IDs"""
-        tables_file = os.path.join(import_dir, f"{db_name}_tables.csv")
-        source_specific_file = os.path.join(import_dir, source, f"{db_name}_tables.csv")
+    def report_stats(self, stats, label, db_name):
+        """Print the warnings and the summary of a bulk CSV import"""
+        for warning in stats.warnings:
+            self.stdout.write(self.style.WARNING(warning))
+        self.stdout.write(
+            self.style.SUCCESS(stats.summary(f"{label} for database {db_name}"))
+        )
+
+    def resolve_csv_file(self, import_dir, source, filename):
+        """Prefer the source-specific copy of a CSV file when present"""
+        csv_file = os.path.join(import_dir, filename)
+        source_specific_file = os.path.join(import_dir, source, filename)
 
         if os.path.exists(source_specific_file):
-            tables_file = source_specific_file
-            self.stdout.write(f"Using source-specific file: {tables_file}")
+            csv_file = source_specific_file
+            self.stdout.write(f"Using source-specific file: {csv_file}")
         else:
-            self.stdout.write(f"Using default file: {tables_file}")
+            self.stdout.write(f"Using default file: {csv_file}")
+        return csv_file
+
+    def import_tables(self, import_dir, db_name, sql_db, source="local"):
+        """Import tables for a specific database, preserving original IDs"""
+        tables_file = self.resolve_csv_file(import_dir, source, f"{db_name}_tables.csv")
 
         if not os.path.exists(tables_file):
             self.stdout.write(
@@ -206,71 +220,30 @@ class Command(BaseCommand):
             )
             return 0
 
-        imported_count = 0
-        updated_count = 0
-
-        with open(tables_file, "r") as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                try:
-                    # Extract the ID from CSV
-                    model_id = row.get("id")
-
-                    if not model_id:
-                        self.stdout.write(
-                            self.style.WARNING(
-                                f"Missing ID for table {row.get('name', 'unknown')} in {db_name}, skipping"
-                            )
-                        )
-                        continue
-
-                    # Try to get existing table by ID or create new one with that ID
-                    try:
-                        table = SqlTable.objects.get(id=model_id)
-                        # Update fields
-                        table.name = row["name"]
-                        table.sql_db = sql_db
-                        table.description = row.get("description", "")
-                        table.generated_comment = row.get("generated_comment", "")
-                        table.save()
-                        updated_count += 1
-                    except SqlTable.DoesNotExist:
-                        # Create new table with specified ID
-                        table = SqlTable.objects.create(
-                            id=model_id,
-                            name=row["name"],
-                            sql_db=sql_db,
-                            description=row.get("description", ""),
-                            generated_comment=row.get("generated_comment", ""),
-                        )
-                        imported_count += 1
-
-                except Exception as e:
-                    self.stdout.write(
-                        self.style.ERROR(
-                            f"Error processing table {row.get('name', 'unknown')} in {db_name}: {str(e)}"
-                        )
-                    )
-
-        self.stdout.write(
-            self.style.SUCCESS(
-                f"Imported {imported_count} tables and updated {updated_count} tables for database: {db_name}"
-            )
+        def build_row(row):
+            if not row.get("id"):
+                raise SkipRow(f"Missing ID for table {row.get('name', 'unknown')}")
+            return {
+                "id": row["id"],
+                "name": row["name"],
+                "sql_db": sql_db,
+                "description": row.get("description", ""),
+                "generated_comment": row.get("generated_comment", ""),
+            }
+
+        stats = bulk_import_csv(
+            tables_file,
+            SqlTable,
+            build_row,
+            update_fields=["name", "sql_db", "description", "generated_comment"],
+            label="tables",
         )
-        return imported_count + updated_count
+        self.report_stats(stats, "Tables", db_name)
+        return stats.created + stats.updated
 
     def import_columns(self, import_dir, db_name, sql_db, source="local"):
         """Import columns for a specific database, preserving original IDs"""
-        columns_file = os.path.join(import_dir, f"{db_name}_columns.csv")
-        source_specific_file = os.path.join(
-            import_dir, source, f"{db_name}_columns.csv"
-        )
-
-        if os.path.exists(source_specific_file):
-            columns_file = source_specific_file
-            self.stdout.write(f"Using source-specific file: {columns_file}")
-        else:
-            self.stdout.write(f"Using default file: {columns_file}")
+        columns_file = self.resolve_csv_file(import_dir, source, f"{db_name}_columns.csv")
 
         if not os.path.exists(columns_file):
             self.stdout.write(
@@ -280,111 +253,54 @@ class Command(BaseCommand):
             )
             return 0
 
-        imported_count = 0
-        updated_count = 0
-
-        with open(columns_file, "r") as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                try:
-                    # Extract the ID from CSV
-                    model_id = row.get("id")
-
-                    if not model_id:
-                        self.stdout.write(
-                            self.style.WARNING(
-                                f"Missing ID for column {row.get('column_name', 'unknown')} in {db_name}, skipping"
-                            )
-                        )
-                        continue
-
-                    # Get the table for this column using only ID
-                    sql_table = None
-                    table_id = row.get("sql_table_id")
-                    if not table_id:
-                        self.stdout.write(
-                            self.style.WARNING(
-                                f"Missing table ID for column {row.get('column_name', 'unknown')} in {db_name}, skipping"
-                            )
-                        )
-                        continue
-
-                    try:
-                        sql_table = SqlTable.objects.get(id=table_id)
-                    except SqlTable.DoesNotExist:
-                        self.stdout.write(
-                            self.style.WARNING(
-                                f"Table with ID {table_id} not found for column {row.get('column_name', 'unknown')}"
-                            )
-                        )
-                        continue
-
-                    # Get string values directly from CSV
-                    pk_field = row.get("pk_field", "")
-                    fk_field = row.get("fk_field", "")
-
-                    # Try to get existing column by ID or create new one with that ID
-                    try:
-                        column = SqlColumn.objects.get(id=model_id)
-                        # Update fields
-                        column.column_name = row["column_name"]
-                        column.original_column_name = row.get(
-                            "original_column_name", row["column_name"]
-                        )
-                        column.sql_table = sql_table
-                        column.data_format = row.get("data_format", "")
-                        column.column_description = row.get("column_description", "")
-                        column.generated_comment = row.get("generated_comment", "")
-                        column.value_description = row.get("value_description", "")
-                        column.pk_field = pk_field
-                        column.fk_field = fk_field
-                        column.save()
-                        updated_count += 1
-                    except SqlColumn.DoesNotExist:
-                        # Create new column with specified ID
-                        column = SqlColumn.objects.create(
-                            id=model_id,
-                            column_name=row["column_name"],
-                            original_column_name=row.get(
-                                "original_column_name", row["column_name"]
-                            ),
-                            sql_table=sql_table,
-                            data_format=row.get("data_format", ""),
-                            column_description=row.get("column_description", ""),
-                            generated_comment=row.get("generated_comment", ""),
-                            value_description=row.get("value_description", ""),
-                            pk_field=pk_field,
-                            fk_field=fk_field,
-                        )
-                        imported_count += 1
-
-                except Exception as e:
-                    self.stdout.write(
-                        self.style.ERROR(
-                            f"Error processing column {row.get('column_name', 'unknown')} in {db_name}: {str(e)}"
-                        )
-                    )
-
-        self.stdout.write(
-            self.style.SUCCESS(
-                f"Imported {imported_count} columns and updated {updated_count} columns for database: {db_name}"
-            )
+        tables = ReferenceMap(SqlTable)
+
+        def build_row(row):
+            column_name = row.get("column_name", "unknown")
+            if not row.get("id"):
+                raise SkipRow(f"Missing ID for column {column_name}")
+            return {
+                "id": row["id"],
+                "column_name": row["column_name"],
+                "original_column_name": row.get("original_column_name", row["column_name"]),
+                "sql_table_id": tables.resolve(
+                    row.get("sql_table_id"), f"Table for column {column_name}"
+                ),
+                "data_format": row.get("data_format", ""),
+                "column_description": row.get("column_description", ""),
+                "generated_comment": row.get("generated_comment", ""),
+                "value_description": row.get("value_description", ""),
+                "pk_field": row.get("pk_field", ""),
+                "fk_field": row.get("fk_field", ""),
+            }
+
+        stats = bulk_import_csv(
+            columns_file,
+            SqlColumn,
+            build_row,
+            update_fields=[
+                "column_name",
+                "original_column_name",
+                "sql_table",
+                "data_format",
+                "column_description",
+                "generated_comment",
+                "value_description",
+                "pk_field",
+                "fk_field",
+            ],
+            references={"sql_table_id": tables},
+            label="columns",
         )
-        return imported_count + updated_count
+        self.report_stats(stats, "Columns", db_name)
+        return stats.created + stats.updated
 
     def import_relationships(self, import_dir, db_name, source="local"):
         """Import relationships for a specific database, preserving original IDs"""
-        relationships_file = os.path.join(import_dir, f"{db_name}_relationships.csv")
-        source_specific_file = os.path.join(
+        relationships_file = self.resolve_csv_file(
             import_dir, source, f"{db_name}_relationships.csv"
         )
 
-        if os.path.exists(source_specific_file):
-            relationships_file = source_specific_file
-            self.stdout.write(f"Using source-specific file: {relationships_file}")
-        else:
-            self.stdout.write(f"Using default file: {relationships_file}")
-
         if not os.path.exists(relationships_file):
             self.stdout.write(
                 self.style.WARNING(
@@ -393,141 +309,32 @@ class Command(BaseCommand):
             )
             return 0
 
-        imported_count = 0
-        updated_count = 0
-
-        with open(relationships_file, "r") as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                try:
-                    # Extract the ID from CSV
-                    model_id = row.get("id")
-
-                    if not model_id:
-                        self.stdout.write(
-                            self.style.WARNING(
-                                f"Missing ID for relationship in {db_name}, skipping"
-                            )
-                        )
-                        continue
-
-                    # Get the source and target tables and columns
-                    source_table = None
-                    target_table = None
-                    source_column = None
-                    target_column = None
-
-                    # Get source table using only ID
-                    source_table_id = row.get("source_table")
-                    if not source_table_id:
-                        self.stdout.write(
-                            self.style.WARNING(
-                                f"Missing source table ID for relationship in {db_name}, skipping"
-                            )
-                        )
-                        continue
-
-                    try:
-                        source_table = SqlTable.objects.get(id=source_table_id)
-                    except SqlTable.DoesNotExist:
-                        self.stdout.write(
-                            self.style.WARNING(
-                                f"Source table with ID {source_table_id} not found"
-                            )
-                        )
-                        continue
-
-                    # Get target table using only ID
-                    target_table_id = row.get("target_table")
-                    if not target_table_id:
-                        self.stdout.write(
-                            self.style.WARNING(
-                                f"Missing target table ID for relationship in {db_name}, skipping"
-                            )
-                        )
-                        continue
-
-                    try:
-                        target_table = SqlTable.objects.get(id=target_table_id)
-                    except SqlTable.DoesNotExist:
-                        self.stdout.write(
-                            self.style.WARNING(
-                                f"Target table with ID {target_table_id} not found"
-                            )
-                        )
-                        continue
-
-                    # Get source column using only ID
-                    source_column_id = row.get("source_column")
-                    if not source_column_id:
-                        self.stdout.write(
-                            self.style.WARNING(
-                                f"Missing source column ID for relationship in {db_name}, skipping"
-                            )
-                        )
-                        continue
-
-                    try:
-                        source_column = SqlColumn.objects.get(id=source_column_id)
-                    except SqlColumn.DoesNotExist:
-                        self.stdout.write(
-                            self.style.WARNING(
-                                f"Source column with ID {source_column_id} not found"
-                            )
-                        )
-                        continue
-
-                    # Get target column using only ID
-                    target_column_id = row.get("target_column")
-                    if not target_column_id:
-                        self.stdout.write(
-                            self.style.WARNING(
-                                f"Missing target column ID for relationship in {db_name}, skipping"
-                            )
-                        )
-                        continue
-
-                    try:
-                        target_column = SqlColumn.objects.get(id=target_column_id)
-                    except SqlColumn.DoesNotExist:
-                        self.stdout.write(
-                            self.style.WARNING(
-                                f"Target column with ID {target_column_id} not found"
-                            )
-                        )
-                        continue
-
-                    # Try to get existing relationship by ID or create new one with that ID
-                    try:
-                        relationship = Relationship.objects.get(id=model_id)
-                        # Update fields
-                        relationship.source_table = source_table
-                        relationship.source_column = source_column
-                        relationship.target_table = target_table
-                        relationship.target_column = target_column
-                        relationship.save()
-                        updated_count += 1
-                    except Relationship.DoesNotExist:
-                        # Create new relationship with specified ID
-                        relationship = Relationship.objects.create(
-                            id=model_id,
-                            source_table=source_table,
-                            source_column=source_column,
-                            target_table=target_table,
-                            target_column=target_column,
-                        )
-                        imported_count += 1
-
-                except Exception as e:
-                    self.stdout.write(
-                        self.style.ERROR(
-                            f"Error processing relationship in {db_name}: {str(e)}"
-                        )
-                    )
-
-        self.stdout.write(
-            self.style.SUCCESS(
-                f"Imported {imported_count} relationships and updated {updated_count} relationships for database: {db_name}"
-            )
+        tables = ReferenceMap(SqlTable)
+        columns = ReferenceMap(SqlColumn)
+
+        def build_row(row):
+            if not row.get("id"):
+                raise SkipRow("Missing ID for relationship")
+            return {
+                "id": row["id"],
+                "source_table_id": tables.resolve(row.get("source_table"), "Source table"),
+                "target_table_id": tables.resolve(row.get("target_table"), "Target table"),
+                "source_column_id": columns.resolve(row.get("source_column"), "Source column"),
+                "target_column_id": columns.resolve(row.get("target_column"), "Target column"),
+            }
+
+        stats = bulk_import_csv(
+            relationships_file,
+            Relationship,
+            build_row,
+            update_fields=["source_table", "target_table", "source_column", "target_column"],
+            references={
+                "source_table": tables,
+                "target_table": tables,
+                "source_column": columns,
+                "target_column": columns,
+            },
+            label="relationships",
         )
-        return imported_count + updated_count
+        self.report_stats(stats, "Relationships", db_name)
+        return stats.created + stats.updated
@@ -11,8 +11,8 @@
 # limitations under the License.
 
 from django.core.management.base import BaseCommand
-from thoth_core.models import Relationship, SqlTable
-import csv
+from thoth_core.bulk_csv_import import ReferenceMap, bulk_import_csv
+from thoth_core.models import Relationship, SqlColumn, SqlTable
 import os
 from django.conf import settings
 import logging
@@ -34,139 +34,40 @@ class Command(BaseCommand):
             )
             return
 
-        imported_count = 0
-        updated_count = 0
-        error_count = 0
+        tables = ReferenceMap(SqlTable, fallback_field="name")
+        columns = ReferenceMap(SqlColumn)
 
-        with open(csv_path, "r", encoding="utf-8") as file:
-            reader = csv.DictReader(file)
+        def build_row(row):
+            return {
+                "id": row.get("id"),
+                "source_table_id": tables.resolve(row.get("source_table"), "Source SqlTable"),
+                "target_table_id": tables.resolve(row.get("target_table"), "Target SqlTable"),
+                "source_column_id": columns.resolve(row.get("source_column"), "Source SqlColumn"),
+                "target_column_id": columns.resolve(row.get("target_column"), "Target SqlColumn"),
+            }
 
-            for row in reader:
-                try:
-                    # Estrai l'ID dal CSV
-                    model_id = row.get("id")
-
-                    # Ottieni le tabelle SQL associate
-                    parent_table = None
-                    child_table = None
-
-                    if row.get("parent_table"):
-                        try:
-                            parent_table = SqlTable.objects.get(id=row["parent_table"])
-                        except (SqlTable.DoesNotExist, ValueError):
-                            try:
-                                # Try to get by name
-                                parent_table = SqlTable.objects.filter(
-                                    name=row["parent_table"]
-                                ).first()
-                            except Exception:
-                                self.stdout.write(
-                                    self.style.WARNING(
-                                        f"Parent SqlTable '{row['parent_table']}' not found for Relationship"
-                                    )
-                                )
-                                continue  # Skip this row if we don't find the parent table
-                    else:
-                        self.stdout.write(
-                            self.style.WARNING(
-                                "Missing parent_table reference for Relationship"
-                            )
-                        )
-                        continue  # Skip this row if there's no reference to the parent table
-
-                    if row.get("child_table"):
-                        try:
-                            child_table = SqlTable.objects.get(id=row["child_table"])
-                        except (SqlTable.DoesNotExist, ValueError):
-                            try:
-                                # Try to get by name
-                                child_table = SqlTable.objects.filter(
-                                    name=row["child_table"]
-                                ).first()
-                            except Exception:
-                                self.stdout.write(
-                                    self.style.WARNING(
-                                        f"Child SqlTable '{row['child_table']}' not found for Relationship"
-                                    )
-                                )
-                                continue  # Skip this row if we don't find the child table
-                    else:
-                        self.stdout.write(
-                            self.style.WARNING(
-                                "Missing child_table reference for Relationship"
-                            )
-                        )
-                        continue  # Skip this row if there's no reference to the child table
-
-                    if not model_id:
-                        self.stdout.write(
-                            self.style.WARNING(
-                                "Missing ID in row, using parent and child tables as key"
-                            )
-                        )
-                        # If there's no ID, use parent and child tables as key
-                        obj, created = Relationship.objects.update_or_create(
-                            parent_table=parent_table,
-                            child_table=child_table,
-                            defaults={
-                                "parent_column": row.get("parent_column", ""),
-                                "child_column": row.get("child_column", ""),
-                                "relationship_type": row.get(
-                                    "relationship_type", "ONE_TO_MANY"
-                                ),
-                            },
-                        )
-                        if created:
-                            imported_count += 1
-                            self.stdout.write(
-                                f"Created Relationship: {parent_table.name} -> {child_table.name}"
-                            )
-                        else:
-                            updated_count += 1
-                            self.stdout.write(
-                                f"Updated Relationship: {parent_table.name} -> {child_table.name}"
-                            )
-                    else:
-                        # If there's an ID, try to update the existing object or create a new one with that ID
-                        try:
-                            obj = Relationship.objects.get(id=model_id)
-                            # Aggiorna i campi
-                            obj.parent_table = parent_table
-                            obj.child_table = child_table
-                            obj.parent_column = row.get("parent_column", "")
-                            obj.child_column = row.get("child_column", "")
-                            obj.relationship_type = row.get(
-                                "relationship_type", "ONE_TO_MANY"
-                            )
-                            obj.save()
-                            updated_count += 1
-                            self.stdout.write(
-                                f"Updated Relationship with ID {model_id}: {parent_table.name} -> {child_table.name}"
-                            )
-                        except Relationship.DoesNotExist:
-                            # Crea un nuovo oggetto con l'ID specificato
-                            obj = Relationship.objects.create(
-                                id=model_id,
-                                parent_table=parent_table,
-                                child_table=child_table,
-                                parent_column=row.get("parent_column", ""),
-                                child_column=row.get("child_column", ""),
-                                relationship_type=row.get(
-                                    "relationship_type", "ONE_TO_MANY"
-                                ),
-                            )
-                            imported_count += 1
-                            self.stdout.write(
-                                f"Created Relationship with ID {model_id}: {parent_table.name} -> {child_table.name}"
-                            )
-                except Exception as e:
-                    error_count += 1
-                    self.stdout.write(
-                        self.style.ERROR(f"Error processing row {row}: {str(e)}")
-                    )
+        stats = bulk_import_csv(
+            csv_path,
+            Relationship,
+            build_row,
+            update_fields=["source_table", "target_table", "source_column", "target_column"],
+            references={
+                "source_table": tables,
+                "target_table": tables,
+                "source_column": columns,
+                "target_column": columns,
+            },
+            # Rows without an id update the relationship between the same columns
+            match_on=("source_column_id", "target_column_id"),
+            label="Relationship",
+        )
+        Relationship.update_pk_fk_fields()
 
+        for warning in stats.warnings:
+            self.stdout.write(self.style.WARNING(warning))
         self.stdout.write(
             self.style.SUCCESS(
-                f"Import completed. Imported: {imported_count}, Updated: {updated_count}, Errors: {error_count}"
+                f"Import completed. Imported: {stats.created}, Updated: {stats.updated}, "
+                f"Skipped: {stats.skipped}, Errors: {stats.errors} ({stats.rows_per_sec} rows/sec)"
             )
         )
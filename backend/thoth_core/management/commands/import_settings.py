@@ -182,6 +182,8 @@ class Command(BaseCommand):
                 )
             except (ValueError, TypeError):
                 pass
+        if row.get("value_index_backend") in ("lsh", "trigram"):
+            defaults["value_index_backend"] = row["value_index_backend"]
 
         # Schema linking thresholds
         if (
@@ -0,0 +1,46 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import time
+
+from django.core.management.base import BaseCommand
+
+from thoth_core.latency_rollup import rollup_pipeline_latency
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = (
+        "Refresh hourly/daily per-phase latency percentiles from ThothLog "
+        "(incremental by default)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Recompute every bucket instead of only those with new logs",
+        )
+
+    def handle(self, *args, **options):
+        start = time.monotonic()
+        result = rollup_pipeline_latency(full=options["full"])
+        elapsed = time.monotonic() - start
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Recomputed {result['buckets']} bucket(s), wrote {result['rows']} "
+                f"rollup row(s) in {elapsed:.2f}s"
+            )
+        )
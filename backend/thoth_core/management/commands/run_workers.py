@@ -0,0 +1,186 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import multiprocessing
+import os
+import signal
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from thoth_core.job_queue import (
+    JOB_TYPES,
+    POLL_INTERVAL,
+    WorkerPool,
+    cancel_job,
+    concurrency_limit,
+    requeue_stale_jobs,
+)
+from thoth_core.models import BackgroundJob, JobStatus
+
+logger = logging.getLogger(__name__)
+
+
+def run_pool(threads, job_types, poll_interval, once, grace):
+    """Run one worker pool until it is signalled (or, with once, until idle)."""
+    pool = WorkerPool(threads=threads, job_types=job_types, poll_interval=poll_interval)
+
+    def shutdown(signum, frame):
+        logger.info(f"Worker pool {pool.name} stopping (signal {signum})")
+        pool.stop_event.set()
+        pool.wake()
+
+    signal.signal(signal.SIGTERM, shutdown)
+    signal.signal(signal.SIGINT, shutdown)
+
+    requeue_stale_jobs()
+    pool.start()
+    while not pool.stop_event.is_set():
+        time.sleep(0.5)
+        if once and pool.is_idle():
+            pool.stop_event.set()
+    # Running handlers stop at their next checkpoint and requeue their job
+    pool.stop(timeout=grace)
+    released = pool.release_running()
+    if released:
+        logger.warning(f"Requeued {released} job(s) still running at shutdown")
+
+
+class Command(BaseCommand):
+    help = (
+        "Run the background job workers (preprocessing, uploads, comment "
+        "generation, database element creation)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--threads",
+            type=int,
+            default=int(os.getenv("THOTH_JOB_THREADS", "2")),
+            help="Worker threads per process (default: THOTH_JOB_THREADS or 2)",
+        )
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=int(os.getenv("THOTH_JOB_PROCESSES", "1")),
+            help="Worker processes (default: THOTH_JOB_PROCESSES or 1)",
+        )
+        parser.add_argument(
+            "--types",
+            type=str,
+            default="",
+            help=f"Comma-separated job types to run (default: all of {', '.join(JOB_TYPES)})",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=POLL_INTERVAL,
+            help="Seconds between queue polls when idle",
+        )
+        parser.add_argument(
+            "--grace",
+            type=float,
+            default=30.0,
+            help="Seconds to wait for running jobs to reach a checkpoint on shutdown",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit once no more jobs can be claimed",
+        )
+        parser.add_argument(
+            "--cancel",
+            type=int,
+            metavar="JOB_ID",
+            help="Cancel a job and exit",
+        )
+        parser.add_argument(
+            "--status",
+            action="store_true",
+            help="Show queued and running jobs per type and exit",
+        )
+
+    def handle(self, *args, **options):
+        if options["cancel"]:
+            if cancel_job(options["cancel"]):
+                self.stdout.write(self.style.SUCCESS(f"Cancellation requested for job {options['cancel']}"))
+            else:
+                self.stdout.write(self.style.WARNING(f"Job {options['cancel']} is not queued or running"))
+            return
+
+        if options["status"]:
+            self.show_status()
+            return
+
+        job_types = [t.strip() for t in options["types"].split(",") if t.strip()] or None
+        unknown = set(job_types or []) - set(JOB_TYPES)
+        if unknown:
+            raise CommandError(f"Unknown job type(s): {', '.join(sorted(unknown))}")
+
+        processes = max(1, options["processes"])
+        pool_args = (
+            max(1, options["threads"]),
+            job_types,
+            options["poll_interval"],
+            options["once"],
+            options["grace"],
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Starting {processes} worker process(es) with {pool_args[0]} thread(s) each "
+                f"for {', '.join(job_types or JOB_TYPES)}"
+            )
+        )
+
+        if processes == 1:
+            run_pool(*pool_args)
+            return
+
+        # Connections must not be shared with the forked children
+        connections.close_all()
+        context = multiprocessing.get_context("fork")
+        children = [
+            context.Process(target=run_pool, args=pool_args, name=f"job-worker-{i}")
+            for i in range(processes)
+        ]
+        for child in children:
+            child.start()
+
+        def forward(signum, frame):
+            for child in children:
+                if child.is_alive():
+                    os.kill(child.pid, signal.SIGTERM)
+
+        signal.signal(signal.SIGTERM, forward)
+        signal.signal(signal.SIGINT, forward)
+        for child in children:
+            child.join()
+        self.stdout.write(self.style.SUCCESS("All worker processes stopped"))
+
+    def show_status(self):
+        rows = {}
+        for job_type, status in BackgroundJob.objects.filter(
+            status__in=[JobStatus.QUEUED, JobStatus.RUNNING]
+        ).values_list("job_type", "status"):
+            counts = rows.setdefault(job_type, {JobStatus.QUEUED: 0, JobStatus.RUNNING: 0})
+            counts[status] += 1
+        if not rows:
+            self.stdout.write("No queued or running jobs")
+            return
+        for job_type, counts in sorted(rows.items()):
+            limit = concurrency_limit(job_type) if job_type in JOB_TYPES else "-"
+            self.stdout.write(
+                f"{job_type}: {counts[JobStatus.QUEUED]} queued, "
+                f"{counts[JobStatus.RUNNING]} running (limit {limit})"
+            )
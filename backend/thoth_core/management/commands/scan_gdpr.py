@@ -28,11 +28,24 @@ class Command(BaseCommand):
             action='store_true',
             help='Scan all databases'
         )
+        parser.add_argument(
+            '--sample-values',
+            action='store_true',
+            help='Also sample column values to detect emails, IBANs and phone numbers by content'
+        )
+        parser.add_argument(
+            '--sample-rows',
+            type=int,
+            default=None,
+            help='Rows sampled per table with --sample-values (default: THOTH_GDPR_SAMPLE_ROWS)'
+        )
 
     def handle(self, *args, **options):
         workspace_id = options.get('workspace')
         database_name = options.get('database')
         scan_all = options.get('all')
+        sample_values = options.get('sample_values') or None
+        sample_rows = options.get('sample_rows')
 
         if not workspace_id:
             self.stdout.write(self.style.ERROR('Workspace ID is required'))
@@ -68,7 +81,9 @@ class Command(BaseCommand):
                 self.stdout.write(f'Scanning database "{db.name}"...')
                 
                 # Perform GDPR scan
-                report = scan_database_for_gdpr(db.id)
+                report = scan_database_for_gdpr(
+                    db.id, sample_values=sample_values, sample_rows=sample_rows
+                )
                 
                 if "error" in report:
                     self.stdout.write(
@@ -0,0 +1,17 @@
+# Generated by Django 5.2 on 2026-10-18 21:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('thoth_core', '0023_alter_agent_options_alter_aimodel_options_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='thothlog',
+            index=models.Index(fields=['-started_at', '-id'], name='thoth_core__started_59ac6a_idx'),
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 5.2 on 2026-10-18 21:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('thoth_core', '0024_thothlog_cursor_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PipelineLatencyRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('granularity', models.CharField(choices=[('hour', 'Hour'), ('day', 'Day')], max_length=8)),
+                ('bucket_start', models.DateTimeField()),
+                ('phase', models.CharField(max_length=64)),
+                ('workspace', models.CharField(blank=True, default='', max_length=255)),
+                ('agent_name', models.CharField(blank=True, default='', max_length=255)),
+                ('sample_count', models.IntegerField(default=0)),
+                ('p50_ms', models.IntegerField(default=0)),
+                ('p90_ms', models.IntegerField(default=0)),
+                ('p99_ms', models.IntegerField(default=0)),
+                ('min_ms', models.IntegerField(default=0)),
+                ('max_ms', models.IntegerField(default=0)),
+                ('mean_ms', models.IntegerField(default=0)),
+                ('computed_at', models.DateTimeField()),
+            ],
+            options={
+                'verbose_name': 'Pipeline Latency Rollup',
+                'verbose_name_plural': 'Pipeline Latency Rollups',
+                'ordering': ['-bucket_start', 'phase'],
+            },
+        ),
+        migrations.AddField(
+            model_name='thothlog',
+            name='successful_agent_name',
+            field=models.CharField(blank=True, default='', help_text='Name of the SQL generation agent that produced the selected SQL', max_length=255),
+        ),
+        migrations.AddIndex(
+            model_name='thothlog',
+            index=models.Index(fields=['updated_at'], name='thoth_core__updated_f2373f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pipelinelatencyrollup',
+            index=models.Index(fields=['granularity', '-bucket_start'], name='thoth_core__granula_f0c450_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pipelinelatencyrollup',
+            index=models.Index(fields=['computed_at'], name='thoth_core__compute_ced155_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='pipelinelatencyrollup',
+            constraint=models.UniqueConstraint(fields=('granularity', 'bucket_start', 'phase', 'workspace', 'agent_name'), name='unique_latency_rollup_bucket'),
+        ),
+    ]
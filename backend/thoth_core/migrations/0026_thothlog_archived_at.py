@@ -0,0 +1,22 @@
+# Generated by Django 5.2 on 2026-10-18 21:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('thoth_core', '0025_pipeline_latency_rollup'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='thothlog',
+            name='archived_at',
+            field=models.DateTimeField(blank=True, help_text='When the detail fields were moved to the compressed log archive', null=True),
+        ),
+        migrations.AddIndex(
+            model_name='thothlog',
+            index=models.Index(fields=['archived_at', 'started_at'], name='thoth_core__archive_ba14ef_idx'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2 on 2026-10-18 22:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('thoth_core', '0027_backgroundjob'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LLMOutputCache',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=64, unique=True)),
+                ('kind', models.CharField(max_length=32)),
+                ('model_name', models.CharField(max_length=255)),
+                ('content', models.TextField()),
+                ('hits', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('last_hit_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'LLM Output Cache',
+                'verbose_name_plural': 'LLM Output Cache',
+                'indexes': [models.Index(fields=['kind', 'created_at'], name='thoth_core__kind_39b462_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-18 23:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('thoth_core', '0028_llmoutputcache'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='setting',
+            name='value_index_backend',
+            field=models.CharField(choices=[('lsh', 'MinHash LSH'), ('trigram', 'Trigram index')], default='lsh', help_text='Index used to look up database values similar to the question keywords (query-time parameter)', max_length=16),
+        ),
+    ]
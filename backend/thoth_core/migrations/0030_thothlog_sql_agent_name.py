@@ -0,0 +1,30 @@
+# Generated by Django 5.2 on 2026-10-18 23:31
+
+from django.db import migrations, models
+
+
+def delete_per_agent_rollups(apps, schema_editor):
+    """Per-agent rollup rows were keyed by selection reasons, not by agents"""
+    PipelineLatencyRollup = apps.get_model('thoth_core', 'PipelineLatencyRollup')
+    PipelineLatencyRollup.objects.exclude(agent_name='').delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('thoth_core', '0029_setting_value_index_backend'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='thothlog',
+            name='sql_agent_name',
+            field=models.CharField(blank=True, default='', help_text='Identifier of the SQL generation agent that produced the selected SQL', max_length=128),
+        ),
+        migrations.AlterField(
+            model_name='thothlog',
+            name='successful_agent_name',
+            field=models.TextField(blank=True, default='', help_text='How the selected SQL was chosen: candidate count and selection reason'),
+        ),
+        migrations.RunPython(delete_per_agent_rollups, migrations.RunPython.noop),
+    ]
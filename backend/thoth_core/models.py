@@ -469,23 +469,23 @@ class Relationship(models.Model):
         # Dizionario per tenere traccia delle relazioni FK
         fk_relations = {}
 
-        # Raccogliamo tutte le relazioni
-        for rel in Relationship.objects.all():
-            source_col = rel.source_column
-            target_col = rel.target_column
-
-            # Aggiorniamo solo le relazioni FK
-            if source_col.id not in fk_relations:
-                fk_relations[source_col.id] = set()
-            fk_relations[source_col.id].add(
-                f"{target_col.sql_table.name}.{target_col.original_column_name}"
+        # Raccogliamo tutte le relazioni con una sola query
+        for source_col_id, target_table_name, target_col_name in (
+            Relationship.objects.values_list(
+                "source_column_id",
+                "target_column__sql_table__name",
+                "target_column__original_column_name",
+            )
+        ):
+            fk_relations.setdefault(source_col_id, set()).add(
+                f"{target_table_name}.{target_col_name}"
             )
 
-        # Aggiorniamo solo i campi fk_field
+        # Aggiorniamo solo i campi fk_field, in blocco
+        columns = SqlColumn.objects.in_bulk(list(fk_relations))
         for col_id, references in fk_relations.items():
-            col = SqlColumn.objects.get(id=col_id)
-            col.fk_field = f"{', '.join(references)}"
-            col.save()
+            columns[col_id].fk_field = f"{', '.join(references)}"
+        SqlColumn.objects.bulk_update(columns.values(), ["fk_field"], batch_size=500)
 
     class Meta:
         verbose_name = "Relationship"
@@ -681,6 +681,12 @@ class Setting(models.Model):
         default=10,
         help_text="Maximum number of example values to retain per column (query-time parameter)",
     )
+    value_index_backend = models.CharField(
+        max_length=16,
+        choices=[("lsh", "MinHash LSH"), ("trigram", "Trigram index")],
+        default="lsh",
+        help_text="Index used to look up database values similar to the question keywords (query-time parameter)",
+    )
 
     class Meta:
         verbose_name = "Setting"
@@ -1212,6 +1218,25 @@ class ThothLog(models.Model):
         help_text="Compact retry history strings for SQL generation attempts"
     )
 
+    successful_agent_name = models.TextField(
+        blank=True,
+        default="",
+        help_text="How the selected SQL was chosen: candidate count and selection reason"
+    )
+
+    sql_agent_name = models.CharField(
+        max_length=128,
+        blank=True,
+        default="",
+        help_text="Identifier of the SQL generation agent that produced the selected SQL"
+    )
+
+    archived_at = models.DateTimeField(
+        blank=True,
+        null=True,
+        help_text="When the detail fields were moved to the compressed log archive"
+    )
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -1221,8 +1246,11 @@ class ThothLog(models.Model):
         ordering = ["-started_at"]
         indexes = [
             models.Index(fields=["-started_at"]),
+            models.Index(fields=["-started_at", "-id"]),
             models.Index(fields=["username"]),
             models.Index(fields=["workspace"]),
+            models.Index(fields=["updated_at"]),
+            models.Index(fields=["archived_at", "started_at"]),
         ]
 
     def __str__(self):
@@ -1253,3 +1281,134 @@ class ThothLog(models.Model):
             if minutes > 0:
                 return f"{hours} hour{'s' if hours != 1 else ''} {minutes} minute{'s' if minutes != 1 else ''}"
             return f"{hours} hour{'s' if hours != 1 else ''}"
+
+
+class RollupGranularity(models.TextChoices):
+    HOUR = "hour", "Hour"
+    DAY = "day", "Day"
+
+
+class PipelineLatencyRollup(models.Model):
+    """
+    Materialized latency percentiles of a ThothLog pipeline phase.
+
+    One row summarizes every log of a time bucket for a (workspace, agent)
+    pair. Empty workspace or agent values mean "all workspaces" and
+    "all agents", so overall percentiles are available without merging
+    rows (percentiles are not additive).
+    """
+
+    granularity = models.CharField(max_length=8, choices=RollupGranularity.choices)
+    bucket_start = models.DateTimeField()
+    phase = models.CharField(max_length=64)
+    workspace = models.CharField(max_length=255, blank=True, default="")
+    agent_name = models.CharField(max_length=255, blank=True, default="")
+    sample_count = models.IntegerField(default=0)
+    p50_ms = models.IntegerField(default=0)
+    p90_ms = models.IntegerField(default=0)
+    p99_ms = models.IntegerField(default=0)
+    min_ms = models.IntegerField(default=0)
+    max_ms = models.IntegerField(default=0)
+    mean_ms = models.IntegerField(default=0)
+    computed_at = models.DateTimeField()
+
+    class Meta:
+        verbose_name = "Pipeline Latency Rollup"
+        verbose_name_plural = "Pipeline Latency Rollups"
+        ordering = ["-bucket_start", "phase"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["granularity", "bucket_start", "phase", "workspace", "agent_name"],
+                name="unique_latency_rollup_bucket",
+            )
+        ]
+        indexes = [
+            models.Index(fields=["granularity", "-bucket_start"]),
+            models.Index(fields=["computed_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.phase} {self.granularity} {self.bucket_start} ({self.workspace or 'all'})"
+
+
+class JobStatus(models.TextChoices):
+    QUEUED = "QUEUED", "Queued"
+    RUNNING = "RUNNING", "Running"
+    COMPLETED = "COMPLETED", "Completed"
+    FAILED = "FAILED", "Failed"
+    CANCELLED = "CANCELLED", "Cancelled"
+
+
+class BackgroundJob(models.Model):
+    """
+    A long-running task executed by the job queue (see thoth_core.job_queue).
+
+    Jobs are claimed by the run_workers pool, report liveness through
+    heartbeat_at and persist their progress in checkpoint, so a job whose
+    worker died is put back in the queue and resumes from its last
+    checkpoint. Setting cancel_requested asks the running handler to stop
+    at its next checkpoint.
+    """
+
+    job_type = models.CharField(max_length=64)
+    status = models.CharField(
+        max_length=16, choices=JobStatus.choices, default=JobStatus.QUEUED
+    )
+    payload = models.JSONField(default=dict, blank=True)
+    checkpoint = models.JSONField(default=dict, blank=True)
+    result = models.JSONField(null=True, blank=True)
+    error = models.TextField(blank=True)
+    cancel_requested = models.BooleanField(default=False)
+    attempts = models.IntegerField(default=0)
+    max_attempts = models.IntegerField(default=3)
+    worker_id = models.CharField(max_length=255, blank=True)
+    created_by = models.ForeignKey(
+        User, on_delete=models.SET_NULL, null=True, blank=True, related_name="+"
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    heartbeat_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = "Background Job"
+        verbose_name_plural = "Background Jobs"
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["status", "job_type", "created_at"]),
+            models.Index(fields=["status", "heartbeat_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.job_type} #{self.pk} ({self.status})"
+
+    @property
+    def task_id(self):
+        """Identifier stored in the *_task_id fields of the models a job updates."""
+        return f"job-{self.pk}"
+
+
+class LLMOutputCache(models.Model):
+    """
+    LLM output stored by content hash (see thoth_core.thoth_ai.llm_cache).
+
+    The key hashes the model configuration and the fully rendered prompt,
+    which already embeds the prompt template, the table/column metadata and
+    the sample data; any change to one of them produces a new key.
+    """
+
+    key = models.CharField(max_length=64, unique=True)
+    kind = models.CharField(max_length=32)
+    model_name = models.CharField(max_length=255)
+    content = models.TextField()
+    hits = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    last_hit_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = "LLM Output Cache"
+        verbose_name_plural = "LLM Output Cache"
+        indexes = [models.Index(fields=["kind", "created_at"])]
+
+    def __str__(self):
+        return f"{self.kind} {self.key[:12]}"
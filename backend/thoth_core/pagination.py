@@ -0,0 +1,29 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from rest_framework.pagination import CursorPagination
+
+
+class ThothLogCursorPagination(CursorPagination):
+    """
+    Keyset pagination for ThothLog entries.
+
+    Pages are addressed by an opaque cursor on (started_at, id) instead of
+    an offset, so fetching a deep page costs the same as fetching the first
+    one. The id tiebreaker keeps the ordering stable when several logs share
+    the same started_at timestamp.
+    """
+
+    ordering = ("-started_at", "-id")
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 500
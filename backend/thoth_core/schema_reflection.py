@@ -0,0 +1,407 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Single-pass schema reflection for SqlDb catalogs.
+
+reflect_catalog() reads tables, columns (with primary keys and comments) and
+foreign keys of a database through one database manager. On PostgreSQL,
+MariaDB and SQL Server all columns come from a single catalog query; other
+backends fall back to per-table column reads over the same connection.
+
+apply_catalog() diffs the reflected catalog against the existing SqlTable,
+SqlColumn and Relationship rows in memory and writes the differences with
+bulk_create/bulk_update inside one transaction.
+"""
+
+import logging
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from django.db import transaction
+
+from .models import Relationship, SqlColumn, SqlTable
+
+logger = logging.getLogger(__name__)
+
+BULK_BATCH_SIZE = 500
+
+# One query returning the columns of every table in the schema
+POSTGRESQL_COLUMNS_QUERY = """
+SELECT
+    c.relname AS table_name,
+    a.attname AS column_name,
+    format_type(a.atttypid, a.atttypmod) AS data_type,
+    COALESCE(pgd.description, '') AS comment,
+    EXISTS (
+        SELECT 1
+        FROM pg_index i
+        WHERE i.indrelid = c.oid AND i.indisprimary AND a.attnum = ANY(i.indkey)
+    ) AS is_pk
+FROM pg_class c
+JOIN pg_namespace n ON n.oid = c.relnamespace
+JOIN pg_attribute a ON a.attrelid = c.oid
+LEFT JOIN pg_description pgd ON pgd.objoid = c.oid AND pgd.objsubid = a.attnum
+WHERE c.relkind IN ('r','p')
+  AND n.nspname = :schema
+  AND a.attnum > 0
+  AND NOT a.attisdropped
+ORDER BY c.relname, a.attnum
+"""
+
+MARIADB_COLUMNS_QUERY = """
+SELECT
+    TABLE_NAME AS table_name,
+    COLUMN_NAME AS column_name,
+    DATA_TYPE AS data_type,
+    COLUMN_COMMENT AS comment,
+    (COLUMN_KEY = 'PRI') AS is_pk
+FROM information_schema.COLUMNS
+WHERE TABLE_SCHEMA = DATABASE()
+ORDER BY TABLE_NAME, ORDINAL_POSITION
+"""
+
+
+@dataclass
+class ReflectedColumn:
+    name: str
+    data_type: str
+    comment: str = ""
+    is_pk: bool = False
+
+
+@dataclass
+class ReflectedTable:
+    name: str
+    comment: str = ""
+    columns: List[ReflectedColumn] = field(default_factory=list)
+
+
+@dataclass
+class ReflectedForeignKey:
+    source_table: str
+    source_column: str
+    target_table: str
+    target_column: str
+
+
+@dataclass
+class ReflectedCatalog:
+    tables: Dict[str, ReflectedTable] = field(default_factory=dict)
+    foreign_keys: List[ReflectedForeignKey] = field(default_factory=list)
+
+
+def _row_value(row, key):
+    """Read a column from a SQLAlchemy row, a mapping or a document."""
+    if isinstance(row, dict):
+        return row.get(key)
+    return getattr(row, key, None)
+
+
+def _bulk_columns(sqldb, db_manager) -> Optional[Dict[str, List[ReflectedColumn]]]:
+    """
+    Read every column of the database with a single catalog query.
+
+    Returns None when the backend has no bulk query, so the caller falls back
+    to per-table reads.
+    """
+    adapter = getattr(db_manager, "adapter", None)
+    if adapter is None:
+        return None
+
+    if sqldb.db_type == "PostgreSQL":
+        schema = getattr(adapter, "schema", None) or sqldb.schema or "public"
+        rows = adapter.execute_query(POSTGRESQL_COLUMNS_QUERY, {"schema": schema})
+    elif sqldb.db_type == "MariaDB":
+        rows = adapter.execute_query(MARIADB_COLUMNS_QUERY)
+    elif sqldb.db_type == "SQLServer" and hasattr(adapter, "get_columns_as_documents"):
+        # Without a table name the SQL Server adapter returns all columns
+        rows = adapter.get_columns_as_documents(None)
+    else:
+        return None
+
+    columns: Dict[str, List[ReflectedColumn]] = defaultdict(list)
+    for row in rows:
+        columns[_row_value(row, "table_name")].append(
+            ReflectedColumn(
+                name=_row_value(row, "column_name"),
+                data_type=_row_value(row, "data_type") or "",
+                comment=_row_value(row, "comment") or "",
+                is_pk=bool(_row_value(row, "is_pk")),
+            )
+        )
+    return columns
+
+
+def _table_columns(sqldb, db_manager, table_name) -> List[ReflectedColumn]:
+    """Read the columns of one table, preferring adapter documents."""
+    from .dbmanagement import get_column_names_and_comments
+
+    return [
+        ReflectedColumn(name=name, data_type=data_type, comment=comment or "", is_pk=is_pk)
+        for name, data_type, comment, is_pk in get_column_names_and_comments(
+            sqldb, table_name, db_manager=db_manager
+        )
+    ]
+
+
+def _foreign_keys(db_manager) -> List[ReflectedForeignKey]:
+    adapter = getattr(db_manager, "adapter", None)
+    if adapter and hasattr(adapter, "get_foreign_keys_as_documents"):
+        rows = adapter.get_foreign_keys_as_documents()
+    else:
+        rows = db_manager.get_foreign_keys()
+    return [
+        ReflectedForeignKey(
+            source_table=_row_value(row, "source_table_name"),
+            source_column=_row_value(row, "source_column_name"),
+            target_table=_row_value(row, "target_table_name"),
+            target_column=_row_value(row, "target_column_name"),
+        )
+        for row in rows
+    ]
+
+
+def reflect_columns(
+    sqldb,
+    catalog: ReflectedCatalog,
+    table_names: Optional[Iterable[str]] = None,
+    db_manager=None,
+) -> None:
+    """
+    Fill in the columns of the catalog tables (all tables if `table_names` is None).
+    """
+    from .dbmanagement import get_db_manager
+
+    if db_manager is None:
+        db_manager = get_db_manager(sqldb)
+
+    wanted = set(table_names) if table_names is not None else set(catalog.tables)
+    try:
+        bulk = _bulk_columns(sqldb, db_manager)
+    except Exception as e:
+        logger.warning(
+            f"Bulk column reflection failed for '{sqldb.name}', reading tables one by one: {e}"
+        )
+        bulk = None
+
+    for name in wanted:
+        table = catalog.tables.get(name)
+        if table is None:
+            continue
+        if bulk is not None:
+            table.columns = bulk.get(name, [])
+        else:
+            try:
+                table.columns = _table_columns(sqldb, db_manager, name)
+            except Exception as e:
+                logger.error(f"Error reflecting columns of table {name}: {e}")
+
+
+def reflect_catalog(
+    sqldb,
+    db_manager=None,
+    include_columns: bool = True,
+    include_foreign_keys: bool = True,
+    table_names: Optional[Iterable[str]] = None,
+) -> ReflectedCatalog:
+    """
+    Read the catalog of `sqldb` through a single database manager.
+
+    Args:
+        sqldb: SqlDb to reflect.
+        db_manager: Manager to reuse; created with get_db_manager() if omitted.
+        include_columns: Read the columns of the tables.
+        include_foreign_keys: Read the foreign keys.
+        table_names: Limit column reads to these tables (all tables if None).
+    """
+    from .dbmanagement import get_db_manager, get_table_names_and_comments
+
+    started = time.perf_counter()
+    if db_manager is None:
+        db_manager = get_db_manager(sqldb)
+
+    catalog = ReflectedCatalog()
+    for name, comment in get_table_names_and_comments(sqldb, db_manager=db_manager):
+        catalog.tables[name] = ReflectedTable(name=name, comment=comment or "")
+
+    if include_columns:
+        reflect_columns(sqldb, catalog, table_names, db_manager=db_manager)
+
+    if include_foreign_keys:
+        catalog.foreign_keys = _foreign_keys(db_manager)
+
+    logger.info(
+        f"Reflected catalog of '{sqldb.name}' in {time.perf_counter() - started:.2f}s: "
+        f"{len(catalog.tables)} tables, "
+        f"{sum(len(t.columns) for t in catalog.tables.values())} columns, "
+        f"{len(catalog.foreign_keys)} foreign keys"
+    )
+    return catalog
+
+
+def apply_catalog(
+    sqldb,
+    catalog: ReflectedCatalog,
+    create_tables: bool = True,
+    column_tables: Optional[Set[str]] = None,
+    create_relationships: bool = True,
+) -> Dict:
+    """
+    Bring SqlTable, SqlColumn and Relationship rows in line with `catalog`.
+
+    New tables, columns and relationships are bulk created. Table
+    descriptions that differ from the database comment are bulk updated.
+    Existing columns are never modified, so descriptions edited in ThothAI
+    are preserved.
+
+    Args:
+        sqldb: SqlDb the catalog was reflected from.
+        catalog: Result of reflect_catalog().
+        create_tables: Create and update SqlTable rows.
+        column_tables: Only create columns for these tables (all if None).
+        create_relationships: Create Relationship rows for the foreign keys.
+
+    Returns:
+        Dict with created/updated/skipped counts, per-table column counts
+        and the elapsed seconds.
+    """
+    from .dbmanagement import map_data_type
+
+    started = time.perf_counter()
+    stats = {
+        "tables_created": [],
+        "tables_skipped": [],
+        "columns_by_table": {},
+        "columns_created": 0,
+        "columns_skipped": 0,
+        "relationships_created": 0,
+        "relationships_skipped": 0,
+        "relationships_failed": 0,
+    }
+
+    with transaction.atomic():
+        tables = {t.name: t for t in SqlTable.objects.filter(sql_db=sqldb)}
+
+        if create_tables:
+            new_tables = []
+            changed_tables = []
+            for name, reflected in catalog.tables.items():
+                existing = tables.get(name)
+                if existing is None:
+                    new_tables.append(
+                        SqlTable(name=name, sql_db=sqldb, description=reflected.comment)
+                    )
+                    stats["tables_created"].append((name, reflected.comment))
+                else:
+                    if existing.description != reflected.comment:
+                        existing.description = reflected.comment
+                        changed_tables.append(existing)
+                    stats["tables_skipped"].append((name, reflected.comment))
+            SqlTable.objects.bulk_create(new_tables, batch_size=BULK_BATCH_SIZE)
+            SqlTable.objects.bulk_update(
+                changed_tables, ["description"], batch_size=BULK_BATCH_SIZE
+            )
+            if new_tables:
+                # Not every backend returns primary keys from bulk_create
+                tables = {t.name: t for t in SqlTable.objects.filter(sql_db=sqldb)}
+
+        existing_columns = set(
+            SqlColumn.objects.filter(sql_table__sql_db=sqldb).values_list(
+                "sql_table_id", "original_column_name"
+            )
+        )
+        new_columns = []
+        for name, reflected in catalog.tables.items():
+            table = tables.get(name)
+            if table is None or not reflected.columns:
+                continue
+            if column_tables is not None and name not in column_tables:
+                continue
+            created = skipped = 0
+            for column in reflected.columns:
+                if (table.id, column.name) in existing_columns:
+                    skipped += 1
+                    continue
+                existing_columns.add((table.id, column.name))
+                new_columns.append(
+                    SqlColumn(
+                        sql_table=table,
+                        original_column_name=column.name,
+                        column_name=column.name,
+                        data_format=map_data_type(column.data_type),
+                        column_description=column.comment,
+                        pk_field="PK" if column.is_pk else "",
+                    )
+                )
+                created += 1
+            stats["columns_by_table"][name] = (created, skipped)
+            stats["columns_created"] += created
+            stats["columns_skipped"] += skipped
+        SqlColumn.objects.bulk_create(new_columns, batch_size=BULK_BATCH_SIZE)
+
+        if create_relationships and catalog.foreign_keys:
+            column_ids: Dict[Tuple[int, str], int] = {
+                (table_id, name): column_id
+                for column_id, table_id, name in SqlColumn.objects.filter(
+                    sql_table__sql_db=sqldb
+                ).values_list("id", "sql_table_id", "original_column_name")
+            }
+            existing_relationships = set(
+                Relationship.objects.filter(source_table__sql_db=sqldb).values_list(
+                    "source_table_id", "target_table_id", "source_column_id", "target_column_id"
+                )
+            )
+            new_relationships = []
+            for fk in catalog.foreign_keys:
+                source_table = tables.get(fk.source_table)
+                target_table = tables.get(fk.target_table)
+                # Limit to relationships whose tables exist in our catalog
+                if source_table is None or target_table is None:
+                    continue
+                source_column_id = column_ids.get((source_table.id, fk.source_column))
+                target_column_id = column_ids.get((target_table.id, fk.target_column))
+                if source_column_id is None or target_column_id is None:
+                    logger.warning(
+                        f"Column not found for relationship "
+                        f"{fk.source_table}.{fk.source_column} -> {fk.target_table}.{fk.target_column}"
+                    )
+                    stats["relationships_failed"] += 1
+                    continue
+                key = (source_table.id, target_table.id, source_column_id, target_column_id)
+                if key in existing_relationships:
+                    stats["relationships_skipped"] += 1
+                    continue
+                existing_relationships.add(key)
+                new_relationships.append(
+                    Relationship(
+                        source_table_id=key[0],
+                        target_table_id=key[1],
+                        source_column_id=key[2],
+                        target_column_id=key[3],
+                    )
+                )
+            Relationship.objects.bulk_create(new_relationships, batch_size=BULK_BATCH_SIZE)
+            stats["relationships_created"] = len(new_relationships)
+
+            Relationship.update_pk_fk_fields()
+
+    stats["seconds"] = round(time.perf_counter() - started, 3)
+    logger.info(
+        f"Applied catalog of '{sqldb.name}' in {stats['seconds']}s: "
+        f"{len(stats['tables_created'])} tables created, "
+        f"{stats['columns_created']} columns created, "
+        f"{stats['relationships_created']} relationships created"
+    )
+    return stats
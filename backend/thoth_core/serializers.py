@@ -23,6 +23,7 @@ from .models import (
     Agent,
     GroupProfile,
     ThothLog,
+    PipelineLatencyRollup,
 )
 from rest_framework import serializers
 from thoth_core.models import GroupProfile
@@ -287,7 +288,28 @@ class GroupProfileSerializer(serializers.ModelSerializer):
 
 
 class ThothLogSerializer(serializers.ModelSerializer):
+    """
+    Serializer for ThothLog entries.
+
+    Accepts an optional ``fields`` keyword argument restricting the output
+    to a subset of the model fields (used by the list API projection).
+    """
+
     class Meta:
         model = ThothLog
         fields = "__all__"
         # read_only_fields removed - we need to allow creating logs via API
+
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop("fields", None)
+        super().__init__(*args, **kwargs)
+
+        if fields:
+            for field_name in set(self.fields) - set(fields):
+                self.fields.pop(field_name)
+
+
+class PipelineLatencyRollupSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = PipelineLatencyRollup
+        exclude = ["id"]
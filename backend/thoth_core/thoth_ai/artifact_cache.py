@@ -0,0 +1,201 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+On-disk cache of rendered schema artifacts.
+
+ERD images, ERD PDFs and the database documentation HTML are pure
+functions of their inputs: the Mermaid source, or the schema metadata
+(tables, columns, comments, relationships) plus the documentation
+language. Each artifact is stored under a SHA-256 fingerprint of those
+inputs, so an unchanged schema is served from disk without calling the
+Mermaid service or rebuilding the page, while any edit produces a new
+key. Documentation sections are cached per table, so editing one table
+only re-renders that table's section.
+
+Files live in THOTH_ARTIFACT_CACHE_DIR (default: exports/artifact_cache
+under BASE_DIR). Set THOTH_ARTIFACT_CACHE=false to bypass the cache, or
+bump CACHE_VERSION to invalidate every entry at once.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from django.conf import settings
+from django.db.models import Q
+
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION = 1
+ENABLED = os.getenv("THOTH_ARTIFACT_CACHE", "true").lower() in ("1", "true", "yes", "on")
+
+_section_lock = threading.Lock()
+
+
+def get_cache_dir() -> str:
+    return os.getenv("THOTH_ARTIFACT_CACHE_DIR") or os.path.join(
+        settings.BASE_DIR, "exports", "artifact_cache"
+    )
+
+
+def fingerprint(*parts) -> str:
+    """Return the content hash of the given JSON-serializable inputs."""
+    encoded = json.dumps([CACHE_VERSION, *parts], sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def artifact_path(kind: str, key: str, extension: str) -> str:
+    return os.path.join(get_cache_dir(), kind, f"{key}.{extension}")
+
+
+def read_artifact(kind: str, key: str, extension: str) -> Optional[bytes]:
+    if not ENABLED:
+        return None
+    try:
+        with open(artifact_path(kind, key, extension), "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        logger.warning(f"Could not read cached {kind} artifact {key}: {e}")
+        return None
+
+
+def write_artifact(kind: str, key: str, extension: str, data: bytes) -> str:
+    """Store an artifact atomically and return its path."""
+    path = artifact_path(kind, key, extension)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # Unique temporary name, so concurrent renders of one key never interleave
+    partial = f"{path}.{os.getpid()}.{threading.get_ident()}.part"
+    with open(partial, "wb") as f:
+        f.write(data)
+    os.replace(partial, path)
+    return path
+
+
+def cached_artifact(kind: str, key: str, extension: str, render: Callable[[], bytes]) -> str:
+    """
+    Return the path of the cached artifact, calling `render` only on a
+    miss. Exceptions raised by `render` propagate and nothing is stored.
+    """
+    path = artifact_path(kind, key, extension)
+    if ENABLED and os.path.exists(path):
+        return path
+    return write_artifact(kind, key, extension, render())
+
+
+def cached_sections(
+    kind: str,
+    scope: str,
+    sections: Sequence[Tuple[str, object]],
+    render: Callable[[object], str],
+) -> List[str]:
+    """
+    Render a list of (fingerprint, item) sections, re-using the HTML of
+    every section whose fingerprint is unchanged. The sections of one
+    `scope` (e.g. a database and language) share a JSON manifest that only
+    keeps the current fingerprints, so removed sections are dropped.
+    """
+    manifest_path = artifact_path(kind, scope, "json")
+    with _section_lock:
+        stored = {}
+        if ENABLED:
+            try:
+                with open(manifest_path, encoding="utf-8") as f:
+                    stored = json.load(f)
+            except (OSError, ValueError):
+                stored = {}
+
+        rendered = []
+        current = {}
+        for key, item in sections:
+            html = stored.get(key)
+            if html is None:
+                html = render(item)
+            current[key] = html
+            rendered.append(html)
+
+        if ENABLED and current != stored:
+            try:
+                write_artifact(kind, scope, "json", json.dumps(current, ensure_ascii=False).encode("utf-8"))
+            except OSError as e:
+                logger.warning(f"Could not store {kind} sections for {scope}: {e}")
+    return rendered
+
+
+@dataclass
+class SchemaSnapshot:
+    """Tables, columns and relationships of one SqlDb, loaded with three queries."""
+
+    db_id: int
+    tables: List[Dict] = field(default_factory=list)
+    relationships: List[Dict] = field(default_factory=list)
+
+    def table_fingerprint(self, table: Dict, *extra) -> str:
+        return fingerprint("table", table, *extra)
+
+    def relationships_fingerprint(self, *extra) -> str:
+        return fingerprint("relationships", self.relationships, *extra)
+
+    def fingerprint(self, *extra) -> str:
+        return fingerprint("schema", self.tables, self.relationships, *extra)
+
+
+TABLE_FIELDS = ("id", "name", "description", "generated_comment")
+COLUMN_FIELDS = (
+    "sql_table_id",
+    "original_column_name",
+    "column_name",
+    "data_format",
+    "column_description",
+    "generated_comment",
+    "value_description",
+    "pk_field",
+    "fk_field",
+)
+RELATIONSHIP_FIELDS = (
+    "source_table__sql_db_id",
+    "source_table__name",
+    "source_column__original_column_name",
+    "target_table__name",
+    "target_column__original_column_name",
+)
+
+
+def load_schema_snapshot(db_id: int) -> SchemaSnapshot:
+    """Load the documented metadata of a database, in primary key order."""
+    from thoth_core.models import Relationship, SqlColumn, SqlTable
+
+    tables = list(SqlTable.objects.filter(sql_db_id=db_id).order_by("id").values(*TABLE_FIELDS))
+    columns_by_table = {table["id"]: [] for table in tables}
+    for column in (
+        SqlColumn.objects.filter(sql_table__sql_db_id=db_id)
+        .order_by("id")
+        .values(*COLUMN_FIELDS)
+    ):
+        columns_by_table[column.pop("sql_table_id")].append(column)
+    for table in tables:
+        table["columns"] = columns_by_table[table.pop("id")]
+
+    relationships = list(
+        Relationship.objects.filter(
+            Q(source_table__sql_db_id=db_id) | Q(target_table__sql_db_id=db_id)
+        )
+        .order_by("id")
+        .values(*RELATIONSHIP_FIELDS)
+    )
+    return SchemaSnapshot(db_id=db_id, tables=tables, relationships=relationships)
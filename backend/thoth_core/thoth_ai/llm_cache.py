@@ -0,0 +1,145 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Persistent content-hash cache of LLM outputs.
+
+Comment, scope and documentation generation render a prompt that embeds
+the prompt template, the table/column metadata and a sample of the data.
+The cache key is a SHA-256 of that rendered prompt together with the model
+configuration (provider, model, temperature, max tokens) and CACHE_VERSION,
+so re-running generation on unchanged tables returns the stored output
+without calling the provider, while any change to the template, metadata,
+sample data or model produces a miss.
+
+Entries are stored in LLMOutputCache. Set THOTH_LLM_CACHE=false to bypass
+the cache, or bump CACHE_VERSION to invalidate every entry at once.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from typing import Callable, Dict, Iterable, List, Optional
+
+from django.db import IntegrityError
+from django.db.models import F
+from django.utils import timezone
+
+from thoth_core.models import LLMOutputCache
+from thoth_core.thoth_ai.llm_client import LLMResponse
+
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION = 1
+ENABLED = os.getenv("THOTH_LLM_CACHE", "true").lower() in ("1", "true", "yes", "on")
+
+
+class LLMCacheStats:
+    """Thread-safe hit/miss counters for one generation run."""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def record(self, hit: bool, count: int = 1) -> None:
+        with self._lock:
+            if hit:
+                self.hits += count
+            else:
+                self.misses += count
+
+    def summary(self) -> str:
+        total = self.hits + self.misses
+        rate = f"{100 * self.hits / total:.0f}%" if total else "n/a"
+        return f"LLM cache: {self.hits} hits, {self.misses} misses (hit rate {rate})"
+
+
+def cache_key(kind: str, llm_client, messages: List[Dict[str, str]], max_tokens: Optional[int] = None) -> str:
+    """Return the content hash identifying this request."""
+    material = {
+        "version": CACHE_VERSION,
+        "kind": kind,
+        "provider": str(getattr(llm_client, "provider", "")),
+        "model": getattr(llm_client, "model_name", ""),
+        "temperature": getattr(llm_client, "temperature", None),
+        "max_tokens": max_tokens,
+        "messages": messages,
+    }
+    encoded = json.dumps(material, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def get_cached(keys: Iterable[str], stats: Optional[LLMCacheStats] = None) -> Dict[str, LLMResponse]:
+    """Return the cached responses of `keys` (one query) and count their hits."""
+    keys = list(keys)
+    if not ENABLED or not keys:
+        return {}
+    found = {
+        entry.key: LLMResponse(content=entry.content, model=entry.model_name)
+        for entry in LLMOutputCache.objects.filter(key__in=keys).only("key", "content", "model_name")
+    }
+    if found:
+        LLMOutputCache.objects.filter(key__in=list(found)).update(
+            hits=F("hits") + 1, last_hit_at=timezone.now()
+        )
+    if stats is not None:
+        stats.record(True, len(found))
+        stats.record(False, len(keys) - len(found))
+    return found
+
+
+def store(kind: str, llm_client, entries: Dict[str, LLMResponse]) -> None:
+    """Store responses by key; existing keys are left untouched."""
+    if not ENABLED:
+        return
+    model_name = getattr(llm_client, "model_name", "")
+    objects = [
+        LLMOutputCache(key=key, kind=kind, model_name=model_name, content=response.content)
+        for key, response in entries.items()
+        if response is not None and getattr(response, "content", None)
+    ]
+    if not objects:
+        return
+    try:
+        LLMOutputCache.objects.bulk_create(objects, ignore_conflicts=True)
+    except IntegrityError as e:
+        logger.warning(f"Could not store {len(objects)} LLM cache entries: {e}")
+
+
+def cached_generate(
+    kind: str,
+    llm_client,
+    messages: List[Dict[str, str]],
+    max_tokens: Optional[int] = None,
+    stats: Optional[LLMCacheStats] = None,
+    validate: Optional[Callable[[LLMResponse], bool]] = None,
+    key_messages: Optional[List[Dict[str, str]]] = None,
+    **kwargs,
+) -> LLMResponse:
+    """
+    llm_client.generate() through the cache. Responses are stored only if
+    `validate` (when given) accepts them, so an unusable answer is retried
+    on the next run instead of being replayed. `key_messages` lets callers
+    hash a prompt rendered without previously generated text, so feeding
+    an earlier output back into the prompt does not defeat the cache.
+    """
+    key = cache_key(kind, llm_client, key_messages or messages, max_tokens)
+    cached = get_cached([key], stats)
+    if key in cached:
+        return cached[key]
+    response = llm_client.generate(messages, max_tokens=max_tokens, **kwargs)
+    if validate is None or validate(response):
+        store(kind, llm_client, {key: response})
+    return response
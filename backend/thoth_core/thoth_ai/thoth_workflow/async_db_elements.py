@@ -14,21 +14,18 @@
 Async task functions for creating database elements (tables, columns, relationships).
 This module provides background processing capabilities to prevent timeouts
 when processing large databases, using simple logging to console and file.
+
+Databases are processed on the job queue (see thoth_core.job_queue); each
+completed database is checkpointed, so a resumed job skips it.
 """
 
 import logging
-import threading
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from django.utils import timezone
 
-from thoth_core.models import SqlDb, SqlTable, SqlColumn, Relationship
-from thoth_core.dbmanagement import (
-    get_table_names_and_comments,
-    create_sql_tables,
-    get_column_names_and_comments,
-    create_sql_columns,
-    get_db_manager,
-)
+from thoth_core.job_queue import JobCancelled, JobInterrupted, enqueue
+from thoth_core.models import SqlDb
+from thoth_core.schema_reflection import apply_catalog, reflect_catalog
 from thoth_core.thoth_ai.thoth_workflow.simple_logger import get_db_elements_logger
 
 logger = logging.getLogger(__name__)
@@ -39,25 +36,36 @@ class AsyncDbElementsTask:
 
     @staticmethod
     def process_db_elements(
-        workspace_id: int, sqldb_ids: List[int], user_id: int = None
+        workspace_id: int, sqldb_ids: List[int], user_id: int = None, job=None
     ) -> Dict[str, Any]:
         """
         Async task to create tables, columns, and relationships for specified databases.
-        Uses simple logging to console and file only.
+        Uses simple logging to console and file only. When run as a job, the
+        ids of the databases already processed are kept in its checkpoint.
         """
+        checkpoint = job.checkpoint if job is not None else {}
         try:
             total_databases = len(sqldb_ids)
-            total_success = 0
-            total_failed = 0
-            failed_databases = []
+            total_success = checkpoint.get("success", 0)
+            total_failed = checkpoint.get("failed", 0)
+            failed_databases = [tuple(item) for item in checkpoint.get("failed_databases", [])]
+            done_ids = set(checkpoint.get("done_ids", []))
 
             for sqldb_id in sqldb_ids:
+                if sqldb_id in done_ids:
+                    continue
+                if job is not None:
+                    job.raise_if_cancelled()
                 try:
                     sql_db = SqlDb.objects.get(id=sqldb_id)
                     
                     # Initialize DB-scoped status (no log field)
                     sql_db.db_elements_status = "RUNNING"
-                    sql_db.db_elements_task_id = f"db_elements_db_{sql_db.id}_{timezone.now().timestamp()}"
+                    sql_db.db_elements_task_id = (
+                        job.task_id
+                        if job is not None
+                        else f"db_elements_db_{sql_db.id}_{timezone.now().timestamp()}"
+                    )
                     sql_db.db_elements_start_time = timezone.now()
                     sql_db.db_elements_end_time = None
                     sql_db.save(update_fields=[
@@ -71,166 +79,48 @@ class AsyncDbElementsTask:
                     task_logger.info(f"Starting database elements creation for DB '{sql_db.name}' (ID: {sql_db.id})")
                     task_logger.info(f"Workspace ID: {workspace_id}, User ID: {user_id}")
 
-                    # Step 1: Create tables
-                    task_logger.info("Step 1: Creating tables")
+                    # Read tables, columns and foreign keys in one pass
+                    task_logger.info("Step 1: Reflecting database catalog")
                     try:
-                        table_info = get_table_names_and_comments(sql_db)
-                        if not table_info:
+                        catalog = reflect_catalog(sql_db)
+                        if not catalog.tables:
                             raise Exception("Failed to retrieve table information")
-
-                        created_tables, skipped_tables = create_sql_tables(sql_db, table_info)
-                        
-                        task_logger.info(f"Tables created: {len(created_tables)}")
-                        task_logger.info(f"Tables skipped: {len(skipped_tables)}")
-                        
-                        for table, comment in created_tables:
-                            task_logger.info(f"  - Created table: {table} (Comment: {comment or 'None'})")
-                            
                     except Exception as e:
-                        task_logger.error(f"Error creating tables: {str(e)}")
+                        task_logger.error(f"Error reflecting catalog: {str(e)}")
                         raise Exception(f"Error creating tables: {str(e)}")
 
-                    # Step 2: Create columns for each table
-                    task_logger.info("Step 2: Creating columns for each table")
-                    tables_processed = 0
-                    tables_failed = 0
-                    
-                    all_tables = list(SqlTable.objects.filter(sql_db=sql_db))
-                    total_tables = len(all_tables)
-                    
-                    for i, sql_table in enumerate(all_tables):
-                        try:
-                            task_logger.info(f"Processing table {i+1}/{total_tables}: {sql_table.name}")
-                            column_info = get_column_names_and_comments(sql_db, sql_table.name)
-                            if not column_info:
-                                task_logger.warning(f"No columns found for table {sql_table.name}")
-                                continue
-
-                            created_columns, skipped_columns = create_sql_columns(
-                                sql_table, column_info
-                            )
-                            tables_processed += 1
-                            
-                            task_logger.info(
-                                f"  Columns created: {len(created_columns)}, "
-                                f"skipped: {len(skipped_columns)}"
-                            )
-                            
-                            # Log some sample columns
-                            for j, (col, dtype, comment) in enumerate(created_columns[:3]):
-                                task_logger.info(f"    - Column {j+1}: {col} ({dtype})")
-                            if len(created_columns) > 3:
-                                task_logger.info(f"    ... and {len(created_columns) - 3} more columns")
-                                
-                        except Exception as e:
-                            task_logger.error(f"Error processing table {sql_table.name}: {str(e)}")
-                            tables_failed += 1
-
-                    task_logger.info(f"Tables processing completed: {tables_processed} successful, {tables_failed} failed")
+                    task_logger.info(
+                        f"Found {len(catalog.tables)} tables, "
+                        f"{sum(len(t.columns) for t in catalog.tables.values())} columns, "
+                        f"{len(catalog.foreign_keys)} foreign keys"
+                    )
 
-                    # Step 3: Create foreign key relationships
-                    task_logger.info("Step 3: Creating foreign key relationships")
+                    # Write tables, columns and relationships in one transaction
+                    task_logger.info("Step 2: Creating tables, columns and relationships")
                     try:
-                        db_manager = get_db_manager(sql_db)
-                        adapter = getattr(db_manager, "adapter", None)
-                        if adapter and hasattr(adapter, "get_foreign_keys_as_documents"):
-                            fk_docs = adapter.get_foreign_keys_as_documents()
-                            relationships_info = [
-                                {
-                                    "source_table_name": d.source_table_name,
-                                    "source_column_name": d.source_column_name,
-                                    "target_table_name": d.target_table_name,
-                                    "target_column_name": d.target_column_name,
-                                }
-                                for d in fk_docs
-                            ]
-                        else:
-                            relationships_info = db_manager.get_foreign_keys()
-
-                        # Limit to relationships whose tables exist in our catalog
-                        existing_tables = set(
-                            SqlTable.objects.filter(sql_db=sql_db).values_list("name", flat=True)
-                        )
-                        relationships_info = [
-                            r
-                            for r in relationships_info
-                            if r.get("source_table_name") in existing_tables
-                            and r.get("target_table_name") in existing_tables
-                        ]
-
-                        relationships_created = 0
-                        for rel_data in relationships_info:
-                            source_table_name = rel_data["source_table_name"]
-                            source_column_name = rel_data["source_column_name"]
-                            target_table_name = rel_data["target_table_name"]
-                            target_column_name = rel_data["target_column_name"]
-
-                            try:
-                                source_table = SqlTable.objects.get(
-                                    name=source_table_name, sql_db=sql_db
-                                )
-                                target_table = SqlTable.objects.get(
-                                    name=target_table_name, sql_db=sql_db
-                                )
-                                
-                                # Ensure columns exist; create on-the-fly if missing
-                                try:
-                                    source_column = SqlColumn.objects.get(
-                                        original_column_name=source_column_name,
-                                        sql_table=source_table,
-                                    )
-                                except SqlColumn.DoesNotExist:
-                                    try:
-                                        col_info = get_column_names_and_comments(
-                                            sql_db, source_table.name
-                                        )
-                                        create_sql_columns(source_table, col_info)
-                                        source_column = SqlColumn.objects.get(
-                                            original_column_name=source_column_name,
-                                            sql_table=source_table,
-                                        )
-                                    except Exception:
-                                        raise
-                                try:
-                                    target_column = SqlColumn.objects.get(
-                                        original_column_name=target_column_name,
-                                        sql_table=target_table,
-                                    )
-                                except SqlColumn.DoesNotExist:
-                                    try:
-                                        col_info = get_column_names_and_comments(
-                                            sql_db, target_table.name
-                                        )
-                                        create_sql_columns(target_table, col_info)
-                                        target_column = SqlColumn.objects.get(
-                                            original_column_name=target_column_name,
-                                            sql_table=target_table,
-                                        )
-                                    except Exception:
-                                        raise
+                        stats = apply_catalog(sql_db, catalog)
+                    except Exception as e:
+                        task_logger.error(f"Error creating database elements: {str(e)}")
+                        raise
 
-                                relationship, created = Relationship.objects.get_or_create(
-                                    source_table=source_table,
-                                    target_table=target_table,
-                                    source_column=source_column,
-                                    target_column=target_column,
-                                )
-                                if created:
-                                    relationships_created += 1
-                                    task_logger.info(
-                                        f"  Created relationship: "
-                                        f"{source_table_name}.{source_column_name} -> "
-                                        f"{target_table_name}.{target_column_name}"
-                                    )
-                            except Exception as e:
-                                task_logger.warning(f"Error creating relationship: {str(e)}")
+                    created_tables = stats["tables_created"]
+                    tables_processed = len(stats["columns_by_table"])
+                    relationships_created = stats["relationships_created"]
 
-                        Relationship.update_pk_fk_fields()
-                        task_logger.info(f"Relationships created: {relationships_created}")
-                        
-                    except Exception as e:
-                        task_logger.error(f"Error creating relationships: {str(e)}")
-                        raise Exception(f"Error creating relationships: {str(e)}")
+                    task_logger.info(f"Tables created: {len(created_tables)}")
+                    task_logger.info(f"Tables skipped: {len(stats['tables_skipped'])}")
+                    for table, comment in created_tables:
+                        task_logger.info(f"  - Created table: {table} (Comment: {comment or 'None'})")
+                    task_logger.info(
+                        f"Columns created: {stats['columns_created']}, "
+                        f"skipped: {stats['columns_skipped']}"
+                    )
+                    task_logger.info(f"Relationships created: {relationships_created}")
+                    if stats["relationships_failed"]:
+                        task_logger.warning(
+                            f"Relationships skipped for missing columns: {stats['relationships_failed']}"
+                        )
+                    task_logger.info(f"Database elements written in {stats['seconds']}s")
 
                     # Finalize task
                     sql_db.db_elements_end_time = timezone.now()
@@ -261,6 +151,15 @@ class AsyncDbElementsTask:
                     failed_databases.append((sql_db.name, str(e)))
                     total_failed += 1
 
+                done_ids.add(sqldb_id)
+                if job is not None:
+                    job.save_checkpoint(
+                        done_ids=sorted(done_ids),
+                        success=total_success,
+                        failed=total_failed,
+                        failed_databases=failed_databases,
+                    )
+
             logger.info(
                 f"Database elements creation completed: {total_success} successes, "
                 f"{total_failed} failures out of {total_databases} databases"
@@ -274,6 +173,8 @@ class AsyncDbElementsTask:
                 "failed_databases": failed_databases,
             }
             
+        except (JobCancelled, JobInterrupted):
+            raise
         except Exception as e:
             logger.error(f"Critical error in async database elements creation: {str(e)}")
             return {
@@ -284,11 +185,21 @@ class AsyncDbElementsTask:
             }
 
 
+def run_db_elements_job(job):
+    """Job queue handler for database elements creation."""
+    return AsyncDbElementsTask.process_db_elements(
+        job.payload.get("workspace_id"),
+        job.payload["sqldb_ids"],
+        job.payload.get("user_id"),
+        job=job,
+    )
+
+
 def start_async_db_elements_creation(
-    workspace_id: int, sqldb_ids: List[int], user_id: int = None
+    workspace_id: int, sqldb_ids: List[int], user_id: Optional[int] = None
 ) -> str:
     """
-    Start async database elements creation in a separate thread.
+    Queue database elements creation on the job queue.
 
     Args:
         workspace_id: ID of the workspace
@@ -298,12 +209,9 @@ def start_async_db_elements_creation(
     Returns:
         Task ID for tracking
     """
-
-    def run_task():
-        AsyncDbElementsTask.process_db_elements(workspace_id, sqldb_ids, user_id)
-
-    thread = threading.Thread(target=run_task)
-    thread.daemon = True
-    thread.start()
-
-    return f"db_elements_{workspace_id}_{timezone.now().timestamp()}"
\ No newline at end of file
+    job = enqueue(
+        "db_elements",
+        {"workspace_id": workspace_id, "sqldb_ids": list(sqldb_ids), "user_id": user_id},
+        user=user_id,
+    )
+    return job.task_id
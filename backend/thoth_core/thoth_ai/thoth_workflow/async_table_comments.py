@@ -14,14 +14,20 @@
 Async task functions for generating AI comments for tables.
 This module provides background processing capabilities to prevent timeouts
 when generating comments for large datasets.
+
+The work runs on the job queue (see thoth_core.job_queue). Tables and columns
+are processed in chunks and the ids already handled are checkpointed after
+each chunk, so an interrupted job resumes with the remaining ones and a
+cancelled job stops at the next chunk boundary.
 """
 
 import logging
-import threading
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from django.utils import timezone
 
-from thoth_core.models import SqlTable, SqlDb
+from thoth_core.job_queue import JobCancelled, JobInterrupted, enqueue
+from thoth_core.models import SqlColumn, SqlTable, SqlDb
+from thoth_core.thoth_ai.thoth_workflow.comment_engine import LLM_CONCURRENCY
 from thoth_core.thoth_ai.thoth_workflow.create_table_comments import (
     create_table_comments_async,
 )
@@ -32,16 +38,35 @@ from thoth_core.thoth_ai.thoth_workflow.log_handler import (
     create_db_comment_logger,
     update_sqldb_log,
 )
+from thoth_core.utilities.task_validation import check_sqldb_task_can_start
 
 logger = logging.getLogger(__name__)
 
+# Chunks are commented concurrently, so keep them large enough to fill the
+# LLM concurrency while still checkpointing regularly
+TABLE_CHUNK_SIZE = max(10, 2 * LLM_CONCURRENCY)
+# Columns are sent to the LLM grouped by table; this many tables per chunk
+COLUMN_TABLES_PER_CHUNK = max(5, LLM_CONCURRENCY)
+
+
+def _load_checkpoint(job) -> tuple:
+    """Return (done ids, per-DB [processed, failed] counts) saved by a previous attempt."""
+    if job is None:
+        return set(), {}
+    return set(job.checkpoint.get("done_ids", [])), dict(job.checkpoint.get("db_counts", {}))
+
+
+def _save_checkpoint(job, done_ids: set, db_counts: dict) -> None:
+    if job is not None:
+        job.save_checkpoint(done_ids=sorted(done_ids), db_counts=db_counts)
+
 
 class AsyncTableCommentTask:
     """Handles async processing of table comments generation."""
 
     @staticmethod
     def process_table_comments(
-        workspace_id: int, table_ids: List[int], user_id: int = None
+        workspace_id: int, table_ids: List[int], user_id: int = None, job=None
     ) -> Dict[str, Any]:
         """
         Async task to generate comments for specified tables.
@@ -50,10 +75,13 @@ class AsyncTableCommentTask:
             workspace_id: ID of the workspace
             table_ids: List of table IDs to process
             user_id: ID of the user who initiated the task
+            job: Job queue context used for checkpoints and cancellation
 
         Returns:
             Dict with task results and status
         """
+        done_ids, db_counts = _load_checkpoint(job)
+
         # Group incoming table IDs by SqlDb
         try:
             tables = SqlTable.objects.filter(id__in=table_ids).select_related("sql_db")
@@ -73,7 +101,11 @@ class AsyncTableCommentTask:
 
                 # Initialize DB-scoped status and log
                 sql_db.table_comment_status = "RUNNING"
-                sql_db.table_comment_task_id = f"table_comments_db_{sql_db.id}_{timezone.now().timestamp()}"
+                sql_db.table_comment_task_id = (
+                    job.task_id
+                    if job is not None
+                    else f"table_comments_db_{sql_db.id}_{timezone.now().timestamp()}"
+                )
                 sql_db.table_comment_start_time = timezone.now()
                 # Reset end time at task start
                 sql_db.table_comment_end_time = None
@@ -92,50 +124,72 @@ class AsyncTableCommentTask:
                     f"Starting async table comment generation for DB '{sql_db.name}' with {len(db_table_ids)} table(s)"
                 )
 
-                # Process tables in chunks
-                chunk_size = 10
-                processed_count = 0
-                failed_count = 0
-                for i in range(0, len(db_table_ids), chunk_size):
-                    chunk = db_table_ids[i : i + chunk_size]
-                    chunk_start = i + 1
-                    chunk_end = min(i + chunk_size, len(db_table_ids))
-
+                # Process tables in chunks, resuming after the ones already done
+                processed_count, failed_count = db_counts.get(str(db_id), [0, 0])
+                already_done = sum(1 for table_id in db_table_ids if table_id in done_ids)
+                if already_done:
                     custom_logger.info(
-                        f"Processing chunk {chunk_start}-{chunk_end} of {len(db_table_ids)} tables"
+                        f"Resuming: {already_done} of {len(db_table_ids)} tables already processed"
                     )
+                interrupted = False
+                try:
+                    for i in range(0, len(db_table_ids), TABLE_CHUNK_SIZE):
+                        chunk = [t for t in db_table_ids[i : i + TABLE_CHUNK_SIZE] if t not in done_ids]
+                        if not chunk:
+                            continue
+                        if job is not None:
+                            job.raise_if_cancelled()
+                        chunk_start = i + 1
+                        chunk_end = min(i + TABLE_CHUNK_SIZE, len(db_table_ids))
 
-                    try:
-                        # Use env-based async function; ignore workspace_id
-                        results = create_table_comments_async(chunk, None, custom_logger)
-                        processed_count += results.get("processed", 0)
-                        failed_count += results.get("failed", 0)
+                        custom_logger.info(
+                            f"Processing chunk {chunk_start}-{chunk_end} of {len(db_table_ids)} tables"
+                        )
 
-                        for error in results.get("errors", []):
-                            custom_logger.error(f"Error in chunk {chunk_start}-{chunk_end}: {error}")
+                        try:
+                            # Use env-based async function; ignore workspace_id
+                            results = create_table_comments_async(chunk, None, custom_logger)
+                            processed_count += results.get("processed", 0)
+                            failed_count += results.get("failed", 0)
 
-                        update_sqldb_log(sql_db, memory_handler, "table_comment_log")
+                            for error in results.get("errors", []):
+                                custom_logger.error(f"Error in chunk {chunk_start}-{chunk_end}: {error}")
 
-                        custom_logger.info(
-                            f"Chunk {chunk_start}-{chunk_end} completed: {results.get('processed',0)} processed, {results.get('failed',0)} failed"
-                        )
-                    except Exception as e:
-                        custom_logger.error(
-                            f"Error processing table chunk {chunk_start}-{chunk_end}: {str(e)}"
-                        )
-                        failed_count += len(chunk)
-                        update_sqldb_log(sql_db, memory_handler, "table_comment_log")
+                            update_sqldb_log(sql_db, memory_handler, "table_comment_log")
 
-                # Add summary and finalize per-DB
-                memory_handler.add_summary(processed_count, failed_count, len(db_table_ids))
-                sql_db.table_comment_end_time = timezone.now()
-                sql_db.table_comment_status = "COMPLETED" if failed_count == 0 else "FAILED"
-                update_sqldb_log(sql_db, memory_handler, "table_comment_log")
-                sql_db.save(update_fields=[
-                    "table_comment_status",
-                    "table_comment_end_time",
-                    "table_comment_log",
-                ])
+                            custom_logger.info(
+                                f"Chunk {chunk_start}-{chunk_end} completed: {results.get('processed',0)} processed, {results.get('failed',0)} failed"
+                            )
+                        except Exception as e:
+                            custom_logger.error(
+                                f"Error processing table chunk {chunk_start}-{chunk_end}: {str(e)}"
+                            )
+                            failed_count += len(chunk)
+                            update_sqldb_log(sql_db, memory_handler, "table_comment_log")
+
+                        done_ids.update(chunk)
+                        db_counts[str(db_id)] = [processed_count, failed_count]
+                        _save_checkpoint(job, done_ids, db_counts)
+                except JobInterrupted:
+                    # Left RUNNING: the job is requeued and resumes from the checkpoint
+                    interrupted = True
+                    raise
+                except JobCancelled:
+                    custom_logger.warning("Table comment generation cancelled")
+                    failed_count += len([t for t in db_table_ids if t not in done_ids])
+                    raise
+                finally:
+                    if not interrupted:
+                        # Add summary and finalize per-DB
+                        memory_handler.add_summary(processed_count, failed_count, len(db_table_ids))
+                        sql_db.table_comment_end_time = timezone.now()
+                        sql_db.table_comment_status = "COMPLETED" if failed_count == 0 else "FAILED"
+                        update_sqldb_log(sql_db, memory_handler, "table_comment_log")
+                        sql_db.save(update_fields=[
+                            "table_comment_status",
+                            "table_comment_end_time",
+                            "table_comment_log",
+                        ])
 
                 total_processed += processed_count
                 total_failed += failed_count
@@ -150,6 +204,8 @@ class AsyncTableCommentTask:
                 "failed": total_failed,
                 "total": len(table_ids),
             }
+        except (JobCancelled, JobInterrupted):
+            raise
         except Exception as e:
             logger.error(f"Critical error in async table comments: {str(e)}")
             return {"status": "error", "error": str(e), "processed": 0, "failed": len(table_ids) if table_ids else 0}
@@ -160,7 +216,7 @@ class AsyncColumnCommentTask:
 
     @staticmethod
     def process_column_comments(
-        workspace_id: int, column_ids: List[int], user_id: int = None
+        workspace_id: int, column_ids: List[int], user_id: int = None, job=None
     ) -> Dict[str, Any]:
         """
         Async task to generate comments for specified columns.
@@ -169,20 +225,19 @@ class AsyncColumnCommentTask:
             workspace_id: ID of the workspace
             column_ids: List of column IDs to process
             user_id: ID of the user who initiated the task
+            job: Job queue context used for checkpoints and cancellation
 
         Returns:
             Dict with task results and status
         """
-        # Group incoming column IDs by SqlDb (via their tables)
-        try:
-            columns = (
-                SqlTable.objects.none()  # placeholder to keep type hints happy
-            )
-            # Fetch columns with their tables and dbs
-            from thoth_core.models import SqlColumn as _SqlColumn
+        done_ids, db_counts = _load_checkpoint(job)
 
-            col_qs = _SqlColumn.objects.filter(id__in=column_ids).select_related(
-                "sql_table", "sql_table__sql_db"
+        # Group incoming column IDs by SqlDb and table
+        try:
+            col_qs = (
+                SqlColumn.objects.filter(id__in=column_ids)
+                .select_related("sql_table", "sql_table__sql_db")
+                .order_by("sql_table_id", "id")
             )
             by_db: Dict[int, Dict[str, Any]] = {}
             for c in col_qs:
@@ -191,8 +246,9 @@ class AsyncColumnCommentTask:
                     continue
                 db_id = table.sql_db.id
                 if db_id not in by_db:
-                    by_db[db_id] = {"db": table.sql_db, "column_ids": []}
+                    by_db[db_id] = {"db": table.sql_db, "column_ids": [], "by_table": {}}
                 by_db[db_id]["column_ids"].append(c.id)
+                by_db[db_id]["by_table"].setdefault(table.id, []).append(c.id)
 
             total_processed = 0
             total_failed = 0
@@ -200,10 +256,15 @@ class AsyncColumnCommentTask:
             for db_id, payload in by_db.items():
                 sql_db: SqlDb = payload["db"]
                 db_column_ids: List[int] = payload["column_ids"]
+                table_groups: List[List[int]] = list(payload["by_table"].values())
 
                 # Initialize DB-scoped status and log
                 sql_db.column_comment_status = "RUNNING"
-                sql_db.column_comment_task_id = f"column_comments_db_{sql_db.id}_{timezone.now().timestamp()}"
+                sql_db.column_comment_task_id = (
+                    job.task_id
+                    if job is not None
+                    else f"column_comments_db_{sql_db.id}_{timezone.now().timestamp()}"
+                )
                 sql_db.column_comment_start_time = timezone.now()
                 # Reset end time at task start
                 sql_db.column_comment_end_time = None
@@ -224,46 +285,79 @@ class AsyncColumnCommentTask:
                     f"Starting async column comment generation for DB '{sql_db.name}' with {len(db_column_ids)} column(s)"
                 )
 
-                try:
-                    results = create_selected_column_comments_async(
-                        db_column_ids, None, custom_logger
+                processed_count, failed_count = db_counts.get(str(db_id), [0, 0])
+                already_done = sum(1 for column_id in db_column_ids if column_id in done_ids)
+                if already_done:
+                    custom_logger.info(
+                        f"Resuming: {already_done} of {len(db_column_ids)} columns already processed"
                     )
-                    processed_count = results.get("processed", 0)
-                    failed_count = results.get("failed", 0)
 
-                    for detail in results.get("details", []):
-                        if detail.get("status") == "success":
-                            custom_logger.info(
-                                f"✓ Successfully processed column: {detail.get('column')}"
-                            )
-                        else:
-                            custom_logger.error(
-                                f"✗ Failed to process column: {detail.get('column')} - {detail.get('message')}"
+                interrupted = False
+                try:
+                    for i in range(0, len(table_groups), COLUMN_TABLES_PER_CHUNK):
+                        chunk = [
+                            column_id
+                            for group in table_groups[i : i + COLUMN_TABLES_PER_CHUNK]
+                            for column_id in group
+                            if column_id not in done_ids
+                        ]
+                        if not chunk:
+                            continue
+                        if job is not None:
+                            job.raise_if_cancelled()
+
+                        try:
+                            results = create_selected_column_comments_async(
+                                chunk, None, custom_logger
                             )
+                            processed_count += results.get("processed", 0)
+                            failed_count += results.get("failed", 0)
 
-                    for error in results.get("errors", []):
-                        custom_logger.error(f"Error during processing: {error}")
+                            for detail in results.get("details", []):
+                                if detail.get("status") == "success":
+                                    custom_logger.info(
+                                        f"✓ Successfully processed column: {detail.get('column')}"
+                                    )
+                                else:
+                                    custom_logger.error(
+                                        f"✗ Failed to process column: {detail.get('column')} - {detail.get('message')}"
+                                    )
 
-                    update_sqldb_log(sql_db, memory_handler, "column_comment_log")
+                            for error in results.get("errors", []):
+                                custom_logger.error(f"Error during processing: {error}")
 
-                except Exception as e:
-                    custom_logger.error(
-                        f"Error during column comment generation: {str(e)}"
-                    )
-                    processed_count = 0
-                    failed_count = len(db_column_ids)
-                    update_sqldb_log(sql_db, memory_handler, "column_comment_log")
-
-                # Add summary and finalize per-DB
-                memory_handler.add_summary(processed_count, failed_count, len(db_column_ids))
-                sql_db.column_comment_end_time = timezone.now()
-                sql_db.column_comment_status = "COMPLETED" if failed_count == 0 else "FAILED"
-                update_sqldb_log(sql_db, memory_handler, "column_comment_log")
-                sql_db.save(update_fields=[
-                    "column_comment_status",
-                    "column_comment_end_time",
-                    "column_comment_log",
-                ])
+                            update_sqldb_log(sql_db, memory_handler, "column_comment_log")
+
+                        except Exception as e:
+                            custom_logger.error(
+                                f"Error during column comment generation: {str(e)}"
+                            )
+                            failed_count += len(chunk)
+                            update_sqldb_log(sql_db, memory_handler, "column_comment_log")
+
+                        done_ids.update(chunk)
+                        db_counts[str(db_id)] = [processed_count, failed_count]
+                        _save_checkpoint(job, done_ids, db_counts)
+                except JobInterrupted:
+                    # Left RUNNING: the job is requeued and resumes from the checkpoint
+                    interrupted = True
+                    raise
+                except JobCancelled:
+                    custom_logger.warning("Column comment generation cancelled")
+                    failed_count += len([c for c in db_column_ids if c not in done_ids])
+                    raise
+                finally:
+                    if not interrupted:
+                        # Add summary and finalize per-DB
+                        memory_handler.add_summary(processed_count, failed_count, len(db_column_ids))
+                        sql_db.column_comment_end_time = timezone.now()
+                        sql_db.column_comment_status = "COMPLETED" if failed_count == 0 else "FAILED"
+                        update_sqldb_log(sql_db, memory_handler, "column_comment_log")
+                        sql_db.save(update_fields=[
+                            "column_comment_status",
+                            "column_comment_end_time",
+                            "column_comment_log",
+                        ])
 
                 total_processed += processed_count
                 total_failed += failed_count
@@ -278,16 +372,88 @@ class AsyncColumnCommentTask:
                 "failed": total_failed,
                 "total": len(column_ids),
             }
+        except (JobCancelled, JobInterrupted):
+            raise
         except Exception as e:
             logger.error(f"Critical error in async column comments: {str(e)}")
             return {"status": "error", "error": str(e), "processed": 0, "failed": len(column_ids) if column_ids else 0}
 
 
+def run_table_comments_job(job):
+    """Job queue handler for table comment generation."""
+    return AsyncTableCommentTask.process_table_comments(
+        job.payload.get("workspace_id"),
+        job.payload["table_ids"],
+        job.payload.get("user_id"),
+        job=job,
+    )
+
+
+def run_column_comments_job(job):
+    """Job queue handler for column comment generation."""
+    return AsyncColumnCommentTask.process_column_comments(
+        job.payload.get("workspace_id"),
+        job.payload["column_ids"],
+        job.payload.get("user_id"),
+        job=job,
+    )
+
+
+def run_sequential_comments_job(job):
+    """
+    Job queue handler generating column comments first, then table comments,
+    so table comments can use the fresh column descriptions.
+    """
+    sql_db = SqlDb.objects.get(id=job.payload["sql_db_id"])
+    column_ids = job.payload["column_ids"]
+    table_ids = job.payload["table_ids"]
+    user_id = job.payload.get("user_id")
+
+    if job.checkpoint.get("phase") != "tables":
+        # Column progress and table progress use separate checkpoints
+        column_results = AsyncColumnCommentTask.process_column_comments(
+            sql_db.id, column_ids, user_id, job=job
+        )
+        job.save_checkpoint(phase="tables", done_ids=[], db_counts={}, columns=column_results)
+
+    sql_db.refresh_from_db()
+    if sql_db.column_comment_status != "COMPLETED":
+        # Log that table comments were skipped due to column comment failure
+        sql_db.table_comment_log = "Table comment generation skipped due to column comment failure"
+        sql_db.save(update_fields=["table_comment_log"])
+        return {"columns": job.checkpoint.get("columns"), "tables": None}
+
+    can_start_tables, status_message = check_sqldb_task_can_start(sql_db, "table_comment")
+    sql_db.refresh_from_db()
+    # A resumed job finds its own RUNNING table task
+    if not can_start_tables and sql_db.table_comment_task_id != job.task_id:
+        table_status = sql_db.table_comment_status or "UNKNOWN"
+        sql_db.table_comment_status = "FAILED"
+        sql_db.table_comment_log = (
+            f"Table comment generation skipped: {status_message}. "
+            f"Current status: {table_status}."
+        )
+        sql_db.table_comment_end_time = timezone.now()
+        sql_db.save(
+            update_fields=[
+                "table_comment_status",
+                "table_comment_log",
+                "table_comment_end_time",
+            ]
+        )
+        return {"columns": job.checkpoint.get("columns"), "tables": None}
+
+    table_results = AsyncTableCommentTask.process_table_comments(
+        sql_db.id, table_ids, user_id, job=job
+    )
+    return {"columns": job.checkpoint.get("columns"), "tables": table_results}
+
+
 def start_async_table_comments(
-    workspace_id: int, table_ids: List[int], user_id: int = None
+    workspace_id: int, table_ids: List[int], user_id: Optional[int] = None
 ) -> str:
     """
-    Start async table comments generation in a separate thread.
+    Queue table comments generation on the job queue.
 
     Args:
         workspace_id: ID of the workspace
@@ -297,22 +463,19 @@ def start_async_table_comments(
     Returns:
         Task ID for tracking
     """
-
-    def run_task():
-        AsyncTableCommentTask.process_table_comments(workspace_id, table_ids, user_id)
-
-    thread = threading.Thread(target=run_task)
-    thread.daemon = True
-    thread.start()
-
-    return f"table_comments_{workspace_id}_{timezone.now().timestamp()}"
+    job = enqueue(
+        "table_comments",
+        {"workspace_id": workspace_id, "table_ids": list(table_ids), "user_id": user_id},
+        user=user_id,
+    )
+    return job.task_id
 
 
 def start_async_column_comments(
-    workspace_id: int, column_ids: List[int], user_id: int = None
+    workspace_id: int, column_ids: List[int], user_id: Optional[int] = None
 ) -> str:
     """
-    Start async column comments generation in a separate thread.
+    Queue column comments generation on the job queue.
 
     Args:
         workspace_id: ID of the workspace
@@ -322,14 +485,31 @@ def start_async_column_comments(
     Returns:
         Task ID for tracking
     """
+    job = enqueue(
+        "column_comments",
+        {"workspace_id": workspace_id, "column_ids": list(column_ids), "user_id": user_id},
+        user=user_id,
+    )
+    return job.task_id
 
-    def run_task():
-        AsyncColumnCommentTask.process_column_comments(
-            workspace_id, column_ids, user_id
-        )
 
-    thread = threading.Thread(target=run_task)
-    thread.daemon = True
-    thread.start()
+def start_async_sequential_comments(
+    sql_db_id: int, column_ids: List[int], table_ids: List[int], user_id: Optional[int] = None
+) -> str:
+    """
+    Queue column then table comments generation for one database.
 
-    return f"column_comments_{workspace_id}_{timezone.now().timestamp()}"
+    Returns:
+        Task ID for tracking
+    """
+    job = enqueue(
+        "sequential_comments",
+        {
+            "sql_db_id": sql_db_id,
+            "column_ids": list(column_ids),
+            "table_ids": list(table_ids),
+            "user_id": user_id,
+        },
+        user=user_id,
+    )
+    return job.task_id
@@ -0,0 +1,192 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Concurrent engine for table and column comment generation.
+
+Comment generation used to walk the tables one by one: open a database
+manager, read the example rows, then wait for a single LLM call. The engine
+splits the work in two bounded phases:
+
+- prefetch_tables() opens one manager per database and reads the schema and
+  example rows of many tables in parallel, with at most DB_CONNECTIONS
+  concurrent reads;
+- run_llm_calls() issues the LLM calls from LLM_CONCURRENCY threads, paced
+  by a process-wide requests-per-minute budget and guarded by the caller's
+  CircuitBreaker.
+
+Callers build prompts and save results on their own thread, so no Django
+ORM access happens in the worker threads and results can be written back
+with a single bulk_update.
+"""
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from thoth_core.thoth_ai.thoth_workflow.comment_generation_utils import (
+    get_table_schema_safe,
+    setup_sql_db,
+)
+
+logger = logging.getLogger(__name__)
+
+LLM_CONCURRENCY = max(1, int(os.getenv("THOTH_COMMENT_LLM_CONCURRENCY", "8")))
+# Requests per minute across all comment jobs of this process (0 = unlimited)
+LLM_REQUESTS_PER_MINUTE = float(os.getenv("THOTH_COMMENT_LLM_RPM", "60"))
+DB_CONNECTIONS = max(1, int(os.getenv("THOTH_COMMENT_DB_CONNECTIONS", "4")))
+
+CIRCUIT_OPEN_MESSAGE = "Circuit breaker is OPEN - too many failures"
+
+
+class RateLimiter:
+    """Token bucket spacing calls to at most `per_minute` per minute."""
+
+    def __init__(self, per_minute: float, burst: Optional[int] = None):
+        self.per_minute = per_minute
+        # Allow a short burst so the first calls of a run start together
+        self.capacity = float(burst or max(1, min(int(per_minute), LLM_CONCURRENCY)))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Block until a call may start; returns the seconds waited."""
+        if self.per_minute <= 0:
+            return 0.0
+        rate = self.per_minute / 60.0
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / rate
+            time.sleep(delay)
+            waited += delay
+
+
+_rate_limiter = RateLimiter(LLM_REQUESTS_PER_MINUTE)
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Return the limiter shared by every comment job of this process."""
+    return _rate_limiter
+
+
+@dataclass
+class TablePrefetch:
+    """Schema and example rows read for one table."""
+
+    table_id: int
+    schema: str = ""
+    example_data: Dict[str, list] = field(default_factory=dict)
+    error: Optional[str] = None
+    example_error: Optional[str] = None
+
+
+def prefetch_tables(
+    tables: Iterable,
+    example_rows: int = 5,
+    max_connections: int = DB_CONNECTIONS,
+    include_schema: bool = True,
+) -> Dict[int, TablePrefetch]:
+    """
+    Read the schema and example rows of `tables` (SqlTable instances with
+    sql_db loaded) in parallel. One database manager is opened per database
+    and shared by the reads on it.
+    """
+    tables = list(tables)
+    managers: Dict[int, Any] = {}
+    results: Dict[int, TablePrefetch] = {}
+    for table in tables:
+        if table.sql_db_id in managers:
+            continue
+        try:
+            managers[table.sql_db_id] = setup_sql_db(table.sql_db)
+        except Exception as e:
+            managers[table.sql_db_id] = None
+            logger.error(f"Database setup error for {table.sql_db.name}: {e}")
+            for other in tables:
+                if other.sql_db_id == table.sql_db_id:
+                    results[other.id] = TablePrefetch(other.id, error=f"Database setup error: {e}")
+
+    def fetch(table) -> TablePrefetch:
+        db = managers[table.sql_db_id]
+        prefetch = TablePrefetch(
+            table.id,
+            schema=get_table_schema_safe(db, table.name) if include_schema else "",
+        )
+        try:
+            prefetch.example_data = db.get_example_data(table.name, example_rows) or {}
+        except Exception as e:
+            prefetch.example_error = str(e)
+        return prefetch
+
+    pending = [t for t in tables if managers.get(t.sql_db_id) is not None]
+    if pending:
+        with ThreadPoolExecutor(max_workers=min(max_connections, len(pending)), thread_name_prefix="comment-db") as executor:
+            for table, prefetch in zip(pending, executor.map(fetch, pending)):
+                results[table.id] = prefetch
+    return results
+
+
+@dataclass
+class LLMCallResult:
+    key: Any
+    output: Any = None
+    error: Optional[str] = None
+    circuit_open: bool = False
+
+
+def run_llm_calls(
+    requests: Dict[Any, Any],
+    call: Callable[[Any], Any],
+    circuit_breaker,
+    concurrency: int = LLM_CONCURRENCY,
+    rate_limiter: Optional[RateLimiter] = None,
+) -> Dict[Any, LLMCallResult]:
+    """
+    Run call(request) for every entry of `requests` from a bounded thread
+    pool. Each call waits for the rate limiter and goes through
+    circuit_breaker; once the breaker opens, the calls not yet started fail
+    fast with circuit_open set.
+    """
+    rate_limiter = rate_limiter or get_rate_limiter()
+
+    def run(key) -> LLMCallResult:
+        if circuit_breaker.state == "OPEN" and time.time() - circuit_breaker.last_failure_time <= circuit_breaker.recovery_timeout:
+            return LLMCallResult(key, error=CIRCUIT_OPEN_MESSAGE, circuit_open=True)
+        rate_limiter.acquire()
+        try:
+            return LLMCallResult(key, output=circuit_breaker.call(call, requests[key]))
+        except Exception as e:
+            return LLMCallResult(key, error=str(e), circuit_open=CIRCUIT_OPEN_MESSAGE in str(e))
+
+    keys = list(requests)
+    if not keys:
+        return {}
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(keys)), thread_name_prefix="comment-llm") as executor:
+        results = {result.key: result for result in executor.map(run, keys)}
+    logger.info(
+        f"{len(keys)} LLM calls finished in {time.perf_counter() - started:.1f}s "
+        f"({min(concurrency, len(keys))} concurrent)"
+    )
+    return results
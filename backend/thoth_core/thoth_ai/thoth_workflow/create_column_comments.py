@@ -33,10 +33,19 @@ from thoth_core.thoth_ai.thoth_workflow.create_db_scope import get_language_desc
 from thoth_core.models import LLMChoices
 from thoth_core.thoth_ai.prompts.columns_comment_prompt import get_columns_prompt
 from thoth_core.utilities.task_validation import check_sqldb_task_can_start
+from thoth_core.thoth_ai.llm_cache import (
+    LLMCacheStats,
+    cache_key,
+    cached_generate,
+    get_cached,
+    store,
+)
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+COLUMN_COMMENT_CACHE_KIND = "column_comment"
+
 
 class PipelineTimeoutError(Exception):
     """Exception raised when pipeline operations timeout"""
@@ -141,18 +150,8 @@ def create_fresh_llm_client(logger: Optional[logging.Logger] = None):
     return llm_client
 
 
-def generate_column_comments_with_llm(llm_client, variables: Dict[str, Any]):
-    """
-    Generate column comments using the LLM client.
-
-    Args:
-        llm_client: ThothLLMClient instance
-        setting: Workspace settings
-        variables: Dictionary containing prompt variables
-
-    Returns:
-        LLM response content
-    """
+def build_column_comment_messages(llm_client, variables: Dict[str, Any]):
+    """Render the column comment prompt into chat messages for the LLM client."""
     from thoth_core.thoth_ai.thoth_workflow.comment_generation_utils import (
         preprocess_template,
     )
@@ -176,10 +175,51 @@ def generate_column_comments_with_llm(llm_client, variables: Dict[str, Any]):
             }
         )
     messages.append({"role": "user", "content": formatted_prompt})
+    return messages
+
 
-    # Generate response
-    response = llm_client.generate(messages, max_tokens=2000)
-    return response
+def generate_column_comments_with_llm(
+    llm_client,
+    variables: Dict[str, Any],
+    timeout: Optional[float] = None,
+    cache_stats: Optional[LLMCacheStats] = None,
+    cache_variables: Optional[Dict[str, Any]] = None,
+):
+    """
+    Generate column comments using the LLM client.
+
+    The output is served from the LLM output cache when the same prompt
+    (same template, metadata and sample data) was already answered by the
+    same model.
+
+    Args:
+        llm_client: ThothLLMClient instance
+        variables: Dictionary containing prompt variables
+        timeout: Optional request timeout in seconds, enforced by the provider client
+        cache_stats: Optional LLMCacheStats collecting cache hits and misses
+        cache_variables: Prompt variables used for the cache key instead of
+            `variables` (e.g. without previously generated comments)
+
+    Returns:
+        LLM response content
+    """
+    messages = build_column_comment_messages(llm_client, variables)
+    key_messages = (
+        build_column_comment_messages(llm_client, cache_variables)
+        if cache_variables
+        else None
+    )
+    extra = {"timeout": timeout} if timeout else {}
+    return cached_generate(
+        COLUMN_COMMENT_CACHE_KIND,
+        llm_client,
+        messages,
+        max_tokens=2000,
+        stats=cache_stats,
+        validate=lambda response: bool(parse_column_comments(output_to_json(response))),
+        key_messages=key_messages,
+        **extra,
+    )
 
 
 def create_selected_column_comments(modeladmin, request, queryset):
@@ -393,7 +433,16 @@ def process_column_chunk(
         }
 
         # Generate column comments using the LLM
-        output = generate_column_comments_with_llm(llm, prompt_variables)
+        cache_variables = dict(
+            prompt_variables,
+            table_comment=table.description or "",
+            column_comments=create_filtered_column_comments_dataframe(
+                table, selected_column_names, include_generated=False
+            ),
+        )
+        output = generate_column_comments_with_llm(
+            llm, prompt_variables, cache_variables=cache_variables
+        )
         try:
             table_comment_json = output_to_json(output)
             if table_comment_json is None:
@@ -466,41 +515,45 @@ def update_column_comments(table, column_comments):
         return f"Error updating column comments: {str(e)}"
 
 
+def parse_column_comments(columns_comment_json):
+    """Return (column name, description) pairs found in the LLM JSON output."""
+    column_comments = []
+    if not columns_comment_json or not isinstance(columns_comment_json, list):
+        return column_comments
+    for item in columns_comment_json:
+        if isinstance(item, dict):
+            # Handle both possible key names
+            column_name = item.get("column_name", item.get("name", ""))
+            description = item.get("description", item.get("comment", ""))
+
+            if column_name and description:
+                column_comments.append((column_name, description))
+            else:
+                logger.warning(f"Skipping item with missing data: {item}")
+    return column_comments
+
+
 def update_column_comments_on_backend(columns_comment_json, table):
     if columns_comment_json and isinstance(columns_comment_json, list):
         try:
-            column_comments = []
-            for item in columns_comment_json:
-                if isinstance(item, dict):
-                    # Handle both possible key names
-                    column_name = item.get("column_name", item.get("name", ""))
-                    description = item.get("description", item.get("comment", ""))
-
-                    if column_name and description:
-                        column_comments.append(
-                            {"name": column_name, "generated_comment": description}
-                        )
-                    else:
-                        import logging
-
-                        logger = logging.getLogger(__name__)
-                        logger.warning(f"Skipping item with missing data: {item}")
-
+            column_comments = [
+                {"name": name, "generated_comment": description}
+                for name, description in parse_column_comments(columns_comment_json)
+            ]
             if column_comments:
                 return update_column_comments(table, column_comments)
             else:
                 return "No valid column comments found in JSON"
 
         except (KeyError, TypeError) as e:
-            import logging
-
-            logger = logging.getLogger(__name__)
             logger.error(f"Error processing column comments JSON: {e}")
             return f"Error processing JSON: {str(e)}"
     return "Invalid JSON format"
 
 
-def create_filtered_column_comments_dataframe(table, selected_names: list):
+def create_filtered_column_comments_dataframe(
+    table, selected_names: list, include_generated: bool = True
+):
     # Create a DataFrame with column information
     column_comments = pd.DataFrame(
         list(
@@ -516,7 +569,7 @@ def create_filtered_column_comments_dataframe(table, selected_names: list):
 
     # Replace original_comment with generated_comment where original_comment is empty
     column_comments["description"] = column_comments.apply(
-        lambda row: row["generated_comment"]
+        lambda row: (row["generated_comment"] if include_generated else "")
         if pd.isna(row["column_description"]) or row["column_description"] == ""
         else row["column_description"],
         axis=1,
@@ -555,6 +608,42 @@ def create_filtered_column_comments_dataframe(table, selected_names: list):
     return column_comments
 
 
+def format_column_example_data(all_example_data, selected_column_names):
+    """
+    Tabulate the example values of the selected columns, truncating large
+    text values. Returns the table text and the names of truncated columns.
+    """
+    selected_columns_present_in_data = [
+        col for col in selected_column_names if col in (all_example_data or {})
+    ]
+    if not selected_columns_present_in_data:
+        return "No example data available for the selected columns.", []
+
+    filtered_example_data = {}
+    truncated_columns = []
+    for col in selected_columns_present_in_data:
+        # Truncate large text content to prevent LLM timeouts
+        truncated_data = []
+        has_truncation = False
+        for item in all_example_data[col]:
+            if item is not None and isinstance(item, str) and len(str(item)) > 500:
+                # For XML and other large text, truncate and add indicator
+                truncated_data.append(
+                    str(item)[:500] + "... [TRUNCATED - Large content detected]"
+                )
+                has_truncation = True
+            else:
+                truncated_data.append(item)
+        filtered_example_data[col] = truncated_data
+        if has_truncation:
+            truncated_columns.append(col)
+
+    example_data = tabulate(
+        filtered_example_data, headers="keys", tablefmt="pipe", showindex=False
+    )
+    return example_data, truncated_columns
+
+
 def create_selected_column_comments_async(
     column_ids: List[int],
     workspace_id: int = None,
@@ -564,8 +653,10 @@ def create_selected_column_comments_async(
     Async-compatible function to generate comments for specified columns.
 
     This function is designed to be called from async contexts without requiring
-    Django admin parameters. It processes a list of column IDs and generates
-    comments for each column with detailed logging.
+    Django admin parameters. Columns are grouped by table and sent to the LLM
+    in chunks of 10; the schemas and example rows of all tables are prefetched
+    in parallel, the chunks are commented concurrently under the comment rate
+    limit and circuit breaker, and the results are saved with one bulk update.
 
     Args:
         column_ids: List of SqlColumn IDs to process
@@ -576,29 +667,40 @@ def create_selected_column_comments_async(
         Dict with processing results including success/failure counts and detailed logs
     """
     from thoth_core.models import SqlColumn
-    from django.db import transaction
-    import logging
+    from thoth_core.thoth_ai.thoth_workflow.comment_engine import (
+        LLMCallResult,
+        prefetch_tables,
+        run_llm_calls,
+    )
 
     # Use custom logger if provided, otherwise use default logger
     logger = custom_logger if custom_logger else logging.getLogger(__name__)
 
     results = {"processed": 0, "failed": 0, "errors": [], "details": []}
 
-    try:
-        if custom_logger:
-            logger.info(
-                f"Starting column comment generation for {len(column_ids)} columns"
-            )
-        else:
-            logger.info(
-                f"Starting async column comments generation for {len(column_ids)} columns"
+    def fail(table, columns, error_msg, message):
+        logger.error(error_msg)
+        results["errors"].append(error_msg)
+        for column in columns:
+            results["failed"] += 1
+            results["details"].append(
+                {
+                    "column": f"{table.name}.{column.original_column_name}",
+                    "status": "failed",
+                    "message": message,
+                }
             )
 
+    try:
+        logger.info(f"Starting column comment generation for {len(column_ids)} columns")
+
         # Get the columns to process
-        columns = SqlColumn.objects.filter(id__in=column_ids).select_related(
-            "sql_table", "sql_table__sql_db"
+        columns = list(
+            SqlColumn.objects.filter(id__in=column_ids).select_related(
+                "sql_table", "sql_table__sql_db"
+            )
         )
-        total_columns = columns.count()
+        total_columns = len(columns)
 
         if total_columns == 0:
             logger.error("No columns found with the provided IDs")
@@ -607,8 +709,6 @@ def create_selected_column_comments_async(
 
         logger.info(f"Found {total_columns} columns to process")
 
-        # Workspace/settings no longer required; proceed with env-based configuration
-
         # Group columns by table for efficient processing
         columns_by_table = {}
         for column in columns:
@@ -619,390 +719,208 @@ def create_selected_column_comments_async(
 
         logger.info(f"Processing columns from {len(columns_by_table)} tables")
 
-        # Process each table's columns with thread-safe pipeline and circuit breaker
-        pipeline = None  # Create pipeline once per thread
+        llm_client = create_fresh_llm_client(logger)
+        if llm_client is None:
+            for table_data in columns_by_table.values():
+                fail(
+                    table_data["table"],
+                    table_data["columns"],
+                    "Failed to create LLM client from environment",
+                    "Pipeline creation failed",
+                )
+            return results
+
+        # Read schemas and example rows of all tables in parallel
+        prefetched = prefetch_tables(
+            [table_data["table"] for table_data in columns_by_table.values()],
+            example_rows=5,
+        )
 
+        # Build one prompt per chunk of columns on this thread (ORM access)
+        chunk_size = 10
+        chunks = {}
+        prompts = {}
+        cache_variables = {}
         for table_id, table_data in columns_by_table.items():
             table = table_data["table"]
             table_columns = table_data["columns"]
+            prefetch = prefetched[table_id]
+            if prefetch.error:
+                fail(
+                    table,
+                    table_columns,
+                    f"Database setup error for table {table.name}: {prefetch.error}",
+                    "Database setup error",
+                )
+                continue
+            if prefetch.example_error:
+                logger.warning(f"Could not retrieve example data for table {table.name}")
+            all_example_data = (
+                prefetch.example_data
+                if any(lst for lst in prefetch.example_data.values() if lst)
+                else {}
+            )
 
-            try:
-                with transaction.atomic():
-                    if custom_logger:
-                        logger.info(
-                            f"Processing {len(table_columns)} columns from table: {table.name}"
-                        )
-                    else:
-                        logger.info(
-                            f"Starting processing columns from table: {table.name} (ID: {table.id})"
-                        )
-
-                    # Create fresh LLM client if not exists or if previous attempt failed
-                    if pipeline is None:
-                        pipeline = create_fresh_llm_client(logger)
-                        if pipeline is None:
-                            error_msg = "Failed to create LLM client from environment"
-                            logger.error(error_msg)
-                            results["errors"].append(error_msg)
-                            # Mark all columns in this table as failed
-                            for column in table_columns:
-                                results["failed"] += 1
-                                results["details"].append(
-                                    {
-                                        "column": f"{table.name}.{column.original_column_name}",
-                                        "status": "failed",
-                                        "message": "Pipeline creation failed",
-                                    }
-                                )
-                            continue
-
-                    # Setup database
-                    try:
-                        db = setup_sql_db(table.sql_db)
-                        if custom_logger:
-                            logger.info(
-                                f"Setting up database connection for table {table.name}"
-                            )
-                        else:
-                            logger.info(
-                                f"Successfully set up database for table {table.name}"
-                            )
-                    except Exception as e:
-                        error_msg = (
-                            f"Database setup error for table {table.name}: {str(e)}"
-                        )
-                        logger.error(error_msg)
-                        results["errors"].append(error_msg)
-                        # Mark all columns in this table as failed
-                        for column in table_columns:
-                            results["failed"] += 1
-                            results["details"].append(
-                                {
-                                    "column": f"{table.name}.{column.original_column_name}",
-                                    "status": "failed",
-                                    "message": "Database setup error",
-                                }
-                            )
-                        continue
-
-                    # Get table schema and data using the safe wrapper
-                    table_schema = get_table_schema_safe(db, table.name)
-                    if custom_logger:
-                        logger.info(f"Retrieved table structure for {table.name}")
-                    else:
-                        logger.info(f"Retrieved schema for table {table.name}")
+            table_comment = (
+                table.description
+                if table.description and table.description.strip()
+                else table.generated_comment
+            )
+            language = get_language_description(table.sql_db.language or "en")
 
-                    # Get table comment
-                    table_comment = (
-                        table.description
-                        if table.description and table.description.strip()
-                        else table.generated_comment
+            for start in range(0, len(table_columns), chunk_size):
+                column_chunk = table_columns[start : start + chunk_size]
+                selected_column_names = [col.original_column_name for col in column_chunk]
+                example_data, truncated_columns = format_column_example_data(
+                    all_example_data, selected_column_names
+                )
+                if truncated_columns:
+                    logger.info(
+                        f"Truncated large content in columns: {', '.join(truncated_columns)}"
                     )
+                key = (table_id, start)
+                chunks[key] = column_chunk
+                prompts[key] = {
+                    "table_schema": prefetch.schema,
+                    "table_comment": table_comment,
+                    "column_list": tabulate(
+                        [selected_column_names],
+                        headers=["Selected Columns"],
+                        tablefmt="pipe",
+                    ),
+                    "column_comments": create_filtered_column_comments_dataframe(
+                        table, selected_column_names
+                    ),
+                    "example_data": example_data,
+                    "table": table.name,  # Pass table name as string, not the model instance
+                    "language": language,
+                    "max_examples": 10,  # Maximum number of enum values to show in description
+                }
+                # The cache is keyed on the metadata entered by users, not on
+                # comments generated by earlier runs that the prompt includes
+                cache_variables[key] = dict(
+                    prompts[key],
+                    table_comment=table.description or "",
+                    column_comments=create_filtered_column_comments_dataframe(
+                        table, selected_column_names, include_generated=False
+                    ),
+                )
 
-                    # Get example data
-                    try:
-                        all_example_data = db.get_example_data(
-                            table.name, 5
-                        )
-                        if all_example_data and any(
-                            lst for lst in all_example_data.values() if lst
-                        ):
-                            available_columns_in_data = set(all_example_data.keys())
-                        else:
-                            all_example_data = {}
-                            available_columns_in_data = set()
-                    except Exception as e:
-                        if custom_logger:
-                            logger.warning(
-                                f"Could not retrieve example data for table {table.name}"
-                            )
-                        else:
-                            logger.warning(
-                                f"Could not retrieve example data for table {table.name}: {str(e)}"
-                            )
-                        all_example_data = {}
-                        available_columns_in_data = set()
-
-                    # Process columns in chunks to prevent memory issues
-                    chunk_size = 10
-                    column_chunks = [
-                        table_columns[i : i + chunk_size]
-                        for i in range(0, len(table_columns), chunk_size)
-                    ]
-
-                    for chunk_idx, column_chunk in enumerate(column_chunks):
-                        try:
-                            if custom_logger:
-                                logger.info(
-                                    f"Processing chunk {chunk_idx + 1}/{len(column_chunks)} for table {table.name}"
-                                )
-
-                            # Prepare data for this chunk
-                            selected_column_names = [
-                                col.original_column_name for col in column_chunk
-                            ]
-                            tabulated_selected_columns = tabulate(
-                                [selected_column_names],
-                                headers=["Selected Columns"],
-                                tablefmt="pipe",
-                            )
-
-                            # Get column comments for context
-                            selected_column_comments = (
-                                create_filtered_column_comments_dataframe(
-                                    table, selected_column_names
-                                )
-                            )
-
-                            # Prepare example data for available columns with truncation for large content
-                            selected_columns_present_in_data = [
-                                col
-                                for col in selected_column_names
-                                if col in available_columns_in_data
-                            ]
-
-                            if selected_columns_present_in_data:
-                                filtered_example_data = {}
-                                truncated_columns = []
-
-                                for col in selected_columns_present_in_data:
-                                    col_data = all_example_data[col]
-                                    # Truncate large text content to prevent LLM timeouts
-                                    truncated_data = []
-                                    has_truncation = False
-
-                                    for item in col_data:
-                                        if (
-                                            item is not None
-                                            and isinstance(item, str)
-                                            and len(str(item)) > 500
-                                        ):
-                                            # For XML and other large text, truncate and add indicator
-                                            truncated_item = (
-                                                str(item)[:500]
-                                                + "... [TRUNCATED - Large content detected]"
-                                            )
-                                            truncated_data.append(truncated_item)
-                                            has_truncation = True
-                                        else:
-                                            truncated_data.append(item)
-
-                                    filtered_example_data[col] = truncated_data
-                                    if has_truncation:
-                                        truncated_columns.append(col)
-
-                                # Log truncation information
-                                if truncated_columns and custom_logger:
-                                    logger.info(
-                                        f"Truncated large content in columns: {', '.join(truncated_columns)}"
-                                    )
-
-                                example_data = tabulate(
-                                    filtered_example_data,
-                                    headers="keys",
-                                    tablefmt="pipe",
-                                    showindex=False,
-                                )
-                            else:
-                                example_data = "No example data available for the selected columns."
-
-                            # Generate comments with timeout and circuit breaker
-                            language_code = table.sql_db.language or "en"
-                            language = get_language_description(language_code)
-
-                            def run_llm_generation():
-                                with pipeline_timeout(
-                                    90
-                                ) as timeout_wrapper:  # 90 seconds timeout
-                                    prompt_variables = {
-                                        "table_schema": table_schema,
-                                        "table_comment": table_comment,
-                                        "column_list": tabulated_selected_columns,
-                                        "column_comments": selected_column_comments,
-                                        "example_data": example_data,
-                                        "table": table.name,  # Pass table name as string, not the model instance
-                                        "language": language,
-                                        "max_examples": 10,  # Maximum number of enum values to show in description
-                                    }
-                                    return timeout_wrapper(
-                                        generate_column_comments_with_llm,
-                                        pipeline,
-                                        prompt_variables,
-                                    )
-
-                            try:
-                                if custom_logger:
-                                    logger.info(
-                                        f"Calling LLM for {len(column_chunk)} columns in table: {table.name}"
-                                    )
-                                else:
-                                    logger.info(
-                                        f"Generating comments for {len(column_chunk)} columns in table {table.name}"
-                                    )
-
-                                # Use circuit breaker for LLM call
-                                output = llm_circuit_breaker.call(run_llm_generation)
-
-                                if custom_logger:
-                                    logger.info(
-                                        f"LLM response received for columns in table: {table.name}"
-                                    )
-
-                                columns_comment_json = output_to_json(output)
-                                if columns_comment_json:
-                                    return_code = update_column_comments_on_backend(
-                                        columns_comment_json, table
-                                    )
-                                    if return_code == "OK":
-                                        # Mark all columns in this chunk as successful
-                                        for column in column_chunk:
-                                            if custom_logger:
-                                                logger.info(
-                                                    f"✓ Successfully processed column: {table.name}.{column.original_column_name}"
-                                                )
-                                            else:
-                                                logger.info(
-                                                    f"Successfully processed column {table.name}.{column.original_column_name}"
-                                                )
-                                            results["processed"] += 1
-                                            results["details"].append(
-                                                {
-                                                    "column": f"{table.name}.{column.original_column_name}",
-                                                    "status": "success",
-                                                    "message": "Comment generated successfully",
-                                                }
-                                            )
-                                    else:
-                                        error_msg = f"Failed to update comments for columns in {table.name}: {return_code}"
-                                        logger.error(error_msg)
-                                        results["errors"].append(error_msg)
-                                        # Mark all columns in this chunk as failed
-                                        for column in column_chunk:
-                                            results["failed"] += 1
-                                            results["details"].append(
-                                                {
-                                                    "column": f"{table.name}.{column.original_column_name}",
-                                                    "status": "failed",
-                                                    "message": "Failed to save comments",
-                                                }
-                                            )
-                                else:
-                                    error_msg = f"Failed to generate comments for columns in {table.name}"
-                                    logger.error(error_msg)
-                                    results["errors"].append(error_msg)
-                                    # Mark all columns in this chunk as failed
-                                    for column in column_chunk:
-                                        results["failed"] += 1
-                                        results["details"].append(
-                                            {
-                                                "column": f"{table.name}.{column.original_column_name}",
-                                                "status": "failed",
-                                                "message": "AI comment generation failed",
-                                            }
-                                        )
-
-                            except PipelineTimeoutError as e:
-                                error_msg = f"Timeout processing columns in {table.name}: {str(e)}"
-                                logger.error(error_msg)
-                                results["errors"].append(error_msg)
-                                # Mark all columns in this chunk as failed
-                                for column in column_chunk:
-                                    results["failed"] += 1
-                                    results["details"].append(
-                                        {
-                                            "column": f"{table.name}.{column.original_column_name}",
-                                            "status": "failed",
-                                            "message": "Pipeline timeout",
-                                        }
-                                    )
-                                # Recreate pipeline for next attempt
-                                pipeline = None
-                                continue
-
-                            except Exception as e:
-                                if "Circuit breaker is OPEN" in str(e):
-                                    error_msg = "Circuit breaker activated - stopping processing due to repeated failures"
-                                    logger.error(error_msg)
-                                    results["errors"].append(error_msg)
-                                    # Stop processing all remaining columns
-                                    remaining_columns = []
-                                    for (
-                                        remaining_table_id,
-                                        remaining_table_data,
-                                    ) in list(columns_by_table.items())[
-                                        list(columns_by_table.keys()).index(table_id) :
-                                    ]:
-                                        if remaining_table_id == table_id:
-                                            # Add remaining chunks from current table
-                                            for remaining_chunk in column_chunks[
-                                                chunk_idx:
-                                            ]:
-                                                remaining_columns.extend(
-                                                    remaining_chunk
-                                                )
-                                        else:
-                                            # Add all columns from remaining tables
-                                            remaining_columns.extend(
-                                                remaining_table_data["columns"]
-                                            )
-
-                                    for remaining_column in remaining_columns:
-                                        results["failed"] += 1
-                                        results["details"].append(
-                                            {
-                                                "column": f"{remaining_column.sql_table.name}.{remaining_column.original_column_name}",
-                                                "status": "failed",
-                                                "message": "Circuit breaker activated",
-                                            }
-                                        )
-                                    return results
-                                else:
-                                    error_msg = f"Error processing columns in {table.name}: {str(e)}"
-                                    logger.error(error_msg)
-                                    results["errors"].append(error_msg)
-                                    # Mark all columns in this chunk as failed
-                                    for column in column_chunk:
-                                        results["failed"] += 1
-                                        results["details"].append(
-                                            {
-                                                "column": f"{table.name}.{column.original_column_name}",
-                                                "status": "failed",
-                                                "message": "Processing error",
-                                            }
-                                        )
-                                    # Recreate pipeline for next attempt
-                                    pipeline = None
-                                    continue
-
-                        except Exception as e:
-                            error_msg = f"Error processing column chunk in {table.name}: {str(e)}"
-                            logger.error(error_msg)
-                            results["errors"].append(error_msg)
-                            # Mark all columns in this chunk as failed
-                            for column in column_chunk:
-                                results["failed"] += 1
-                                results["details"].append(
-                                    {
-                                        "column": f"{table.name}.{column.original_column_name}",
-                                        "status": "failed",
-                                        "message": "Processing error",
-                                    }
-                                )
-
-            except Exception as e:
-                error_msg = f"Error processing table {table.name}: {str(e)}"
-                logger.error(error_msg)
-                results["errors"].append(error_msg)
-                # Mark all columns in this table as failed
-                for column in table_columns:
-                    results["failed"] += 1
-                    results["details"].append(
-                        {
-                            "column": f"{table.name}.{column.original_column_name}",
-                            "status": "failed",
-                            "message": "Table processing error",
-                        }
-                    )
+        # Answers to unchanged prompts come from the LLM output cache
+        cache_stats = LLMCacheStats()
+        messages_by_chunk = {
+            key: build_column_comment_messages(llm_client, variables)
+            for key, variables in prompts.items()
+        }
+        cache_keys = {
+            key: cache_key(
+                COLUMN_COMMENT_CACHE_KIND,
+                llm_client,
+                build_column_comment_messages(llm_client, variables),
+                2000,
+            )
+            for key, variables in cache_variables.items()
+        }
+        cached = get_cached(cache_keys.values(), cache_stats)
+        outputs = {
+            key: LLMCallResult(key, output=cached[cache_keys[key]])
+            for key in cache_keys
+            if cache_keys[key] in cached
+        }
+
+        logger.info(f"Calling LLM for {len(prompts) - len(outputs)} column chunks")
+        # 90 seconds timeout per chunk
+        outputs.update(
+            run_llm_calls(
+                {k: m for k, m in messages_by_chunk.items() if k not in outputs},
+                lambda messages: llm_client.generate(messages, max_tokens=2000, timeout=90),
+                llm_circuit_breaker,
+            )
+        )
+        logger.info(cache_stats.summary())
+
+        # The LLM may describe any column of the table, not only the selected ones
+        table_columns_by_name = {
+            (column.sql_table_id, column.original_column_name): column
+            for column in SqlColumn.objects.filter(sql_table_id__in=list(columns_by_table))
+        }
+        updated_columns = {}
+        succeeded = []
+        new_entries = {}
+        circuit_open = False
+        for key, outcome in outputs.items():
+            table_id, _ = key
+            table = columns_by_table[table_id]["table"]
+            column_chunk = chunks[key]
+            if outcome.circuit_open:
+                circuit_open = True
+                fail(
+                    table,
+                    column_chunk,
+                    f"Circuit breaker activated - columns in {table.name} not processed",
+                    "Circuit breaker activated",
+                )
+                continue
+            if outcome.error:
+                fail(
+                    table,
+                    column_chunk,
+                    f"Error processing columns in {table.name}: {outcome.error}",
+                    "Processing error",
+                )
+                continue
+
+            comments = parse_column_comments(output_to_json(outcome.output))
+            if not comments:
+                fail(
+                    table,
+                    column_chunk,
+                    f"Failed to generate comments for columns in {table.name}",
+                    "AI comment generation failed",
+                )
+                continue
+
+            missing = []
+            for name, description in comments:
+                column = table_columns_by_name.get((table_id, name))
+                if column is None:
+                    missing.append(name)
+                    continue
+                column.generated_comment = description
+                updated_columns[column.pk] = column
+            if missing:
+                fail(
+                    table,
+                    column_chunk,
+                    f"Failed to update comments for columns in {table.name}: "
+                    f"Column '{missing[0]}' not found in table '{table.name}'",
+                    "Failed to save comments",
+                )
+                continue
+            succeeded.append((table, column_chunk))
+            if cache_keys[key] not in cached:
+                new_entries[cache_keys[key]] = outcome.output
+
+        if circuit_open:
+            logger.error("Circuit breaker activated - stopping processing due to repeated failures")
+
+        with transaction.atomic():
+            SqlColumn.objects.bulk_update(list(updated_columns.values()), ["generated_comment"])
+        store(COLUMN_COMMENT_CACHE_KIND, llm_client, new_entries)
+
+        for table, column_chunk in succeeded:
+            for column in column_chunk:
+                logger.info(
+                    f"✓ Successfully processed column: {table.name}.{column.original_column_name}"
+                )
+                results["processed"] += 1
+                results["details"].append(
+                    {
+                        "column": f"{table.name}.{column.original_column_name}",
+                        "status": "success",
+                        "message": "Comment generated successfully",
+                    }
+                )
 
         logger.info(
             f"Completed processing all columns. Processed: {results['processed']}, Failed: {results['failed']}"
@@ -17,6 +17,7 @@ from django.contrib import messages
 
 # Removed Haystack imports - using LiteLLM instead
 from thoth_core.models import SqlTable, SqlColumn, LLMChoices, LanguageCode
+from thoth_core.thoth_ai.llm_cache import cached_generate
 from thoth_core.thoth_ai.thoth_workflow.comment_generation_utils import (
     setup_llm_from_env,
 )
@@ -40,7 +41,7 @@ def _clean_content(generated_content):
 
 
 def _generate_scope_with_llm(llm_client, prompt_variables):
-    """Generate scope using the LLM client."""
+    """Generate scope using the LLM client, reusing the cached output of an identical prompt."""
     template_path = os.path.join(
         settings.BASE_DIR,
         "thoth_core",
@@ -77,7 +78,13 @@ def _generate_scope_with_llm(llm_client, prompt_variables):
     messages.append({"role": "user", "content": formatted_prompt})
 
     # Generate response
-    response = llm_client.generate(messages, max_tokens=2000)
+    response = cached_generate(
+        "db_scope",
+        llm_client,
+        messages,
+        max_tokens=2000,
+        validate=lambda output: bool(getattr(output, "content", None)),
+    )
     return response
 
 
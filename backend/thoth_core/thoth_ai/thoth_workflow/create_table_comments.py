@@ -32,6 +32,15 @@ from thoth_core.thoth_ai.thoth_workflow.create_db_scope import get_language_desc
 from thoth_core.models import LLMChoices  # Added LLMChoices
 from django.db import transaction  # Added transaction
 from thoth_core.utilities.task_validation import check_sqldb_task_can_start
+from thoth_core.thoth_ai.llm_cache import (
+    LLMCacheStats,
+    cache_key,
+    cached_generate,
+    get_cached,
+    store,
+)
+
+TABLE_COMMENT_CACHE_KIND = "table_comment"
 
 
 class LLMTimeoutError(Exception):
@@ -137,18 +146,8 @@ def create_fresh_llm_client(logger: Optional[logging.Logger] = None):
     return llm_client
 
 
-def generate_table_comments_with_llm(llm_client, prompt_variables: Dict[str, Any]):
-    """
-    Generate table comments using the LLM client.
-
-    Args:
-        llm_client: ThothLLMClient instance
-        setting: Workspace settings
-        prompt_variables: Dictionary containing prompt variables
-
-    Returns:
-        LLM response
-    """
+def build_table_comment_messages(llm_client, prompt_variables: Dict[str, Any]):
+    """Render the table comment prompt into chat messages for the LLM client."""
     # Get the prompt template
     from thoth_core.thoth_ai.thoth_workflow.comment_generation_utils import (
         preprocess_template,
@@ -172,10 +171,42 @@ def generate_table_comments_with_llm(llm_client, prompt_variables: Dict[str, Any
             }
         )
     messages.append({"role": "user", "content": formatted_prompt})
+    return messages
 
-    # Generate response
-    response = llm_client.generate(messages, max_tokens=2000)
-    return response
+
+def generate_table_comments_with_llm(
+    llm_client,
+    prompt_variables: Dict[str, Any],
+    timeout: Optional[float] = None,
+    cache_stats: Optional[LLMCacheStats] = None,
+):
+    """
+    Generate table comments using the LLM client.
+
+    The output is served from the LLM output cache when the same prompt
+    (same template, metadata and sample data) was already answered by the
+    same model.
+
+    Args:
+        llm_client: ThothLLMClient instance
+        prompt_variables: Dictionary containing prompt variables
+        timeout: Optional request timeout in seconds, enforced by the provider client
+        cache_stats: Optional LLMCacheStats collecting cache hits and misses
+
+    Returns:
+        LLM response
+    """
+    messages = build_table_comment_messages(llm_client, prompt_variables)
+    extra = {"timeout": timeout} if timeout else {}
+    return cached_generate(
+        TABLE_COMMENT_CACHE_KIND,
+        llm_client,
+        messages,
+        max_tokens=2000,
+        stats=cache_stats,
+        validate=lambda response: output_to_json(response) is not None,
+        **extra,
+    )
 
 
 def create_table_comments(modeladmin, request, queryset):  # Renamed function
@@ -529,6 +560,46 @@ def create_column_comments_dataframe(table):
     return column_comments
 
 
+def format_example_data(examples_data_result, example_rows: int = 5) -> str:
+    """
+    Tabulate example rows for the table prompt, truncating long cells and
+    dropping rows until the text fits the character budget.
+    """
+    MAX_CELL_CHARS = 1000
+    BUDGET_CHARS = 200_000
+
+    def truncate_cell(val):
+        if val is None:
+            return val
+        try:
+            s = str(val)
+        except Exception:
+            s = repr(val)
+        if len(s) > MAX_CELL_CHARS:
+            return s[:MAX_CELL_CHARS] + "... [TRUNCATED - Large content detected]"
+        return s
+
+    def build_example_str(data_dict, rows):
+        if not data_dict or rows <= 0:
+            return ""
+        sliced = {k: (v[:rows] if isinstance(v, list) else v) for k, v in data_dict.items()}
+        truncated = {k: [truncate_cell(x) for x in (v or [])] for k, v in sliced.items()}
+        return tabulate(truncated, headers="keys", tablefmt="pipe", showindex=False)
+
+    if not examples_data_result or not any(
+        lst for lst in examples_data_result.values() if lst
+    ):
+        return ""
+    n_rows = example_rows
+    example_data_str = build_example_str(examples_data_result, n_rows)
+    while len(example_data_str) > BUDGET_CHARS and n_rows > 0:
+        n_rows = max(1, n_rows // 2) if n_rows > 1 else 0
+        example_data_str = build_example_str(examples_data_result, n_rows)
+    if len(example_data_str) > BUDGET_CHARS:
+        example_data_str = ""
+    return example_data_str
+
+
 def create_table_comments_async(
     table_ids: List[int], workspace_id: int = None, custom_logger: logging.Logger = None
 ) -> Dict[str, Any]:
@@ -536,8 +607,9 @@ def create_table_comments_async(
     Async-compatible function to generate comments for specified tables.
 
     This function is designed to be called from async contexts without requiring
-    Django admin parameters. It processes a list of table IDs and generates
-    comments for each table with detailed logging.
+    Django admin parameters. Schemas and example rows are prefetched in
+    parallel, the LLM calls run concurrently under the comment rate limit and
+    circuit breaker, and the generated comments are saved with one bulk update.
 
     Args:
         table_ids: List of SqlTable IDs to process
@@ -546,28 +618,32 @@ def create_table_comments_async(
     Returns:
         Dict with processing results including success/failure counts and detailed logs
     """
-    from thoth_core.models import SqlTable, Workspace
-    from django.db import transaction
-    import logging
+    from thoth_core.models import SqlTable
+    from thoth_core.thoth_ai.thoth_workflow.comment_engine import (
+        LLMCallResult,
+        prefetch_tables,
+        run_llm_calls,
+    )
 
     # Use custom logger if provided, otherwise use default logger
     logger = custom_logger if custom_logger else logging.getLogger(__name__)
 
     results = {"processed": 0, "failed": 0, "errors": [], "details": []}
 
+    def fail(table, error_msg, message):
+        logger.error(error_msg)
+        results["errors"].append(error_msg)
+        results["failed"] += 1
+        results["details"].append(
+            {"table": table.name, "status": "failed", "message": message}
+        )
+
     try:
-        if custom_logger:
-            logger.info(
-                f"Starting table comment generation for {len(table_ids)} tables"
-            )
-        else:
-            logger.info(
-                f"Starting async table comments generation for {len(table_ids)} tables"
-            )
+        logger.info(f"Starting table comment generation for {len(table_ids)} tables")
 
         # Get the tables to process
-        tables = SqlTable.objects.filter(id__in=table_ids).select_related("sql_db")
-        total_tables = tables.count()
+        tables = list(SqlTable.objects.filter(id__in=table_ids).select_related("sql_db"))
+        total_tables = len(tables)
 
         if total_tables == 0:
             logger.error("No tables found with the provided IDs")
@@ -576,284 +652,115 @@ def create_table_comments_async(
 
         logger.info(f"Found {total_tables} tables to process")
 
-        # Workspace/settings no longer required; proceed with env-based configuration
+        llm_client = create_fresh_llm_client(logger)
+        if llm_client is None:
+            for table in tables:
+                fail(table, "Failed to create LLM client from environment", "Pipeline creation failed")
+            return results
 
-        # Process each table with thread-safe pipeline and circuit breaker
-        table_count = 0
-        pipeline = None  # Create pipeline once per thread
+        # Read schemas and example rows in parallel
+        prefetched = prefetch_tables(tables, example_rows=5)
+        logger.info(f"Retrieved table structure and example data for {len(prefetched)} tables")
 
+        # Build the prompts on this thread (ORM access)
+        tables_by_id = {}
+        prompts = {}
         for table in tables:
-            table_count += 1
-            try:
-                with transaction.atomic():
-                    if custom_logger:
-                        logger.info(
-                            f"Processing table {table_count}/{total_tables}: {table.name}"
-                        )
-                    else:
-                        logger.info(
-                            f"Starting processing table: {table.name} (ID: {table.id})"
-                        )
-
-                    # Create fresh LLM client if not exists or if previous attempt failed
-                    if pipeline is None:
-                        pipeline = create_fresh_llm_client(logger)
-                        if pipeline is None:
-                            error_msg = "Failed to create LLM client from environment"
-                            logger.error(error_msg)
-                            results["errors"].append(error_msg)
-                            results["failed"] += 1
-                            results["details"].append(
-                                {
-                                    "table": table.name,
-                                    "status": "failed",
-                                    "message": "Pipeline creation failed",
-                                }
-                            )
-                            continue
-
-                    # Setup database
-                    try:
-                        db = setup_sql_db(table.sql_db)
-                        if custom_logger:
-                            logger.info(
-                                f"Setting up database connection for {table.name}"
-                            )
-                        else:
-                            logger.info(
-                                f"Successfully set up database for table {table.name}"
-                            )
-                    except Exception as e:
-                        error_msg = f"Database setup error for {table.name}: {str(e)}"
-                        logger.error(error_msg)
-                        results["errors"].append(error_msg)
-                        results["failed"] += 1
-                        results["details"].append(
-                            {
-                                "table": table.name,
-                                "status": "failed",
-                                "message": "Database setup error",
-                            }
-                        )
-                        continue
-
-                    # Get table schema/structure and data (without logging sensitive details)
-                    table_schema = get_table_schema_safe(db, table.name)
-                    if custom_logger:
-                        logger.info(f"Retrieved table structure for {table.name}")
-                    else:
-                        logger.info(f"Retrieved schema for table {table.name}")
-
-                    # Get current comment
-                    table_current_comment_str = (
-                        table.description
-                        if table.description and table.description.strip()
-                        else ""
-                    )
+            prefetch = prefetched[table.id]
+            if prefetch.error:
+                fail(table, f"Database setup error for {table.name}: {prefetch.error}", "Database setup error")
+                continue
+            if prefetch.example_error:
+                logger.warning(f"Could not retrieve example data for {table.name}")
+
+            column_comments_df = create_column_comments_dataframe(table)
+            tables_by_id[table.id] = table
+            prompts[table.id] = {
+                "database_schema": prefetch.schema,
+                "table_comment": table.description
+                if table.description and table.description.strip()
+                else "",
+                "column_comments": column_comments_df.to_markdown(index=False)
+                if not column_comments_df.empty
+                else "",
+                "example_data": format_example_data(prefetch.example_data, 5),
+                "table": table.name,  # Pass table name as string, not the model instance
+                "language": get_language_description(table.sql_db.language or "en"),
+            }
 
-                    # Get column comments
-                    column_comments_df = create_column_comments_dataframe(table)
-                    column_comments_str = (
-                        column_comments_df.to_markdown(index=False)
-                        if not column_comments_df.empty
-                        else ""
-                    )
+        # Answers to unchanged prompts come from the LLM output cache
+        cache_stats = LLMCacheStats()
+        messages_by_table = {
+            table_id: build_table_comment_messages(llm_client, variables)
+            for table_id, variables in prompts.items()
+        }
+        keys = {
+            table_id: cache_key(TABLE_COMMENT_CACHE_KIND, llm_client, messages, 2000)
+            for table_id, messages in messages_by_table.items()
+        }
+        cached = get_cached(keys.values(), cache_stats)
+        outputs = {
+            table_id: LLMCallResult(table_id, output=cached[key])
+            for table_id, key in keys.items()
+            if key in cached
+        }
 
-                    # Get example data with truncation and budgeted size
-                    try:
-                        examples_data_result = db.get_example_data(
-                            table.name, 5
-                        )
-
-                        MAX_CELL_CHARS = 1000
-
-                        def truncate_cell(val):
-                            if val is None:
-                                return val
-                            try:
-                                s = str(val)
-                            except Exception:
-                                s = repr(val)
-                            if len(s) > MAX_CELL_CHARS:
-                                return s[:MAX_CELL_CHARS] + "... [TRUNCATED - Large content detected]"
-                            return s
-
-                        BUDGET_CHARS = 200_000
-
-                        def build_example_str(data_dict, rows):
-                            if not data_dict or rows <= 0:
-                                return ""
-                            sliced = {k: (v[:rows] if isinstance(v, list) else v) for k, v in data_dict.items()}
-                            truncated = {k: [truncate_cell(x) for x in (v or [])] for k, v in sliced.items()}
-                            return tabulate(truncated, headers="keys", tablefmt="pipe", showindex=False)
-
-                        if examples_data_result and any(
-                            lst for lst in examples_data_result.values() if lst
-                        ):
-                            n_rows = 5
-                            example_data_str = build_example_str(examples_data_result, n_rows)
-                            while len(example_data_str) > BUDGET_CHARS and n_rows > 0:
-                                n_rows = max(1, n_rows // 2) if n_rows > 1 else 0
-                                example_data_str = build_example_str(examples_data_result, n_rows)
-                            if len(example_data_str) > BUDGET_CHARS:
-                                example_data_str = ""
-                        else:
-                            example_data_str = ""
-                    except Exception as e:
-                        if custom_logger:
-                            logger.warning(
-                                f"Could not retrieve example data for {table.name}"
-                            )
-                        else:
-                            logger.warning(
-                                f"Could not retrieve example data for {table.name}: {str(e)}"
-                            )
-                        example_data_str = ""
-
-                    # Generate comment with timeout and circuit breaker
-                    language_code = table.sql_db.language or "en"
-                    language = get_language_description(language_code)
-
-                    def run_llm_generation():
-                        with (
-                            llm_timeout(30) as timeout_wrapper
-                        ):  # 30 seconds timeout - if LLM doesn't respond, something is wrong
-                            prompt_variables = {
-                                "database_schema": table_schema,
-                                "table_comment": table_current_comment_str,
-                                "column_comments": column_comments_str,
-                                "example_data": example_data_str,
-                                "table": table.name,  # Pass table name as string, not the model instance
-                                "language": language,
-                            }
-                            return timeout_wrapper(
-                                generate_table_comments_with_llm,
-                                pipeline,
-                                prompt_variables,
-                            )
-
-                    try:
-                        if custom_logger:
-                            logger.info(f"Calling LLM for table: {table.name}")
-                        else:
-                            logger.info(f"Generating comment for table {table.name}")
-
-                        # Use circuit breaker for LLM call
-                        output = llm_circuit_breaker.call(run_llm_generation)
-
-                        if custom_logger:
-                            logger.info(
-                                f"LLM response received for table: {table.name}"
-                            )
-
-                        table_comment_json = output_to_json(output)
-                        if table_comment_json:
-                            return_code = update_table_comments_on_backend(
-                                table_comment_json, table
-                            )
-                            if return_code == "OK":
-                                if custom_logger:
-                                    logger.info(
-                                        f"✓ Successfully processed table: {table.name}"
-                                    )
-                                else:
-                                    logger.info(
-                                        f"Successfully processed table {table.name}"
-                                    )
-                                results["processed"] += 1
-                                results["details"].append(
-                                    {
-                                        "table": table.name,
-                                        "status": "success",
-                                        "message": "Comment generated successfully",
-                                    }
-                                )
-                            else:
-                                error_msg = f"Failed to update comment for {table.name}: {return_code}"
-                                logger.error(error_msg)
-                                results["errors"].append(error_msg)
-                                results["failed"] += 1
-                                results["details"].append(
-                                    {
-                                        "table": table.name,
-                                        "status": "failed",
-                                        "message": "Failed to save comment",
-                                    }
-                                )
-                        else:
-                            error_msg = f"Failed to generate comment for {table.name}"
-                            logger.error(error_msg)
-                            results["errors"].append(error_msg)
-                            results["failed"] += 1
-                            results["details"].append(
-                                {
-                                    "table": table.name,
-                                    "status": "failed",
-                                    "message": "AI comment generation failed",
-                                }
-                            )
-
-                    except LLMTimeoutError as e:
-                        error_msg = f"Timeout processing {table.name}: {str(e)}"
-                        logger.error(error_msg)
-                        results["errors"].append(error_msg)
-                        results["failed"] += 1
-                        results["details"].append(
-                            {
-                                "table": table.name,
-                                "status": "failed",
-                                "message": "Pipeline timeout",
-                            }
-                        )
-                        # Recreate pipeline for next attempt
-                        pipeline = None
-                        continue
-
-                    except Exception as e:
-                        if "Circuit breaker is OPEN" in str(e):
-                            error_msg = "Circuit breaker activated - stopping processing due to repeated failures"
-                            logger.error(error_msg)
-                            results["errors"].append(error_msg)
-                            # Stop processing all remaining tables
-                            remaining_tables = total_tables - table_count
-                            results["failed"] += remaining_tables
-                            for remaining_table in tables[table_count:]:
-                                results["details"].append(
-                                    {
-                                        "table": remaining_table.name,
-                                        "status": "failed",
-                                        "message": "Circuit breaker activated",
-                                    }
-                                )
-                            break
-                        else:
-                            error_msg = f"Error processing {table.name}: {str(e)}"
-                            logger.error(error_msg)
-                            results["errors"].append(error_msg)
-                            results["failed"] += 1
-                            results["details"].append(
-                                {
-                                    "table": table.name,
-                                    "status": "failed",
-                                    "message": "Processing error",
-                                }
-                            )
-                            # Recreate pipeline for next attempt
-                            pipeline = None
-                            continue
-
-            except Exception as e:
-                error_msg = f"Error processing {table.name}: {str(e)}"
-                logger.error(error_msg)
-                results["errors"].append(error_msg)
-                results["failed"] += 1
-                results["details"].append(
-                    {
-                        "table": table.name,
-                        "status": "failed",
-                        "message": "Processing error",
-                    }
-                )
+        # 30 seconds timeout - if LLM doesn't respond, something is wrong
+        outputs.update(
+            run_llm_calls(
+                {t: m for t, m in messages_by_table.items() if t not in outputs},
+                lambda messages: llm_client.generate(messages, max_tokens=2000, timeout=30),
+                llm_circuit_breaker,
+            )
+        )
+        logger.info(cache_stats.summary())
+
+        updated_tables = []
+        new_entries = {}
+        circuit_open = False
+        for table_id, outcome in outputs.items():
+            table = tables_by_id[table_id]
+            if outcome.circuit_open:
+                circuit_open = True
+                fail(table, f"Circuit breaker activated - {table.name} not processed", "Circuit breaker activated")
+                continue
+            if outcome.error:
+                fail(table, f"Error processing {table.name}: {outcome.error}", "Processing error")
+                continue
+
+            table_comment_json = output_to_json(outcome.output)
+            comment = (
+                table_comment_json[0].get("description")
+                if table_comment_json
+                and isinstance(table_comment_json, list)
+                and isinstance(table_comment_json[0], dict)
+                else None
+            )
+            if not comment:
+                fail(table, f"Failed to generate comment for {table.name}", "AI comment generation failed")
+                continue
+            table.generated_comment = comment
+            updated_tables.append(table)
+            if keys[table_id] not in cached:
+                new_entries[keys[table_id]] = outcome.output
+
+        if circuit_open:
+            logger.error("Circuit breaker activated - stopping processing due to repeated failures")
+
+        with transaction.atomic():
+            SqlTable.objects.bulk_update(updated_tables, ["generated_comment"])
+        store(TABLE_COMMENT_CACHE_KIND, llm_client, new_entries)
+
+        for table in updated_tables:
+            logger.info(f"✓ Successfully processed table: {table.name}")
+            results["processed"] += 1
+            results["details"].append(
+                {
+                    "table": table.name,
+                    "status": "success",
+                    "message": "Comment generated successfully",
+                }
+            )
 
         logger.info(
             f"Completed processing all tables. Processed: {results['processed']}, Failed: {results['failed']}"
@@ -0,0 +1,163 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compiled matchers for the GDPR scanner.
+
+The scanner used to run every pattern of GDPR_PATTERNS through re.search()
+for every column, recompiling nothing but still walking ~60 patterns per
+name. GDPRClassifier compiles them once:
+
+- every pattern type becomes a single alternation;
+- all types together form one combined regex, used as an exact prefilter:
+  names it does not match (most of a wide schema) are rejected in a single
+  pass, and only the remaining names are checked type by type, because
+  Python's re cannot report every overlapping type in one match;
+- results are memoised per column name, since wide schemas repeat names
+  like created_at or description across tables.
+
+detect_content_types() complements the name-based rules by looking at
+sampled values: email addresses, IBANs and phone numbers are recognised
+with one regex scan per detector over all sampled values of a batch.
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Dict, Hashable, Iterable, List, Optional
+
+import numpy as np
+
+SENSITIVITY_SCORES = {"LOW": 1, "MEDIUM": 2, "HIGH": 3, "CRITICAL": 4}
+
+# Share of non-empty sampled values that must match for a column to be flagged
+CONTENT_MIN_RATIO = 0.5
+
+# Content detectors: pattern type (as in GDPR_PATTERNS) -> full-match regex
+CONTENT_PATTERNS = {
+    "email": r"[A-Za-z0-9._%+\-]+@[A-Za-z0-9.\-]+\.[A-Za-z]{2,}",
+    # Compared after removing whitespace and upper-casing
+    "banking": r"[A-Z]{2}\d{2}[A-Z0-9]{11,30}",
+    # 8-15 digits: international (+39 ...), or grouped national numbers that
+    # are not dates (2024-01-05, 01.02.2023) or decimals (12345678.90)
+    "phone": (
+        r"(?=\+?(?:[^\d\n]*\d){8,15}[^\d\n]*$)"
+        r"(?:\+\d{1,3}[ .\-]?(?:\(\d{1,4}\)[ .\-]?)?\d{1,4}(?:[ .\-]?\d{1,4}){1,5}"
+        r"|(?!\d{1,4}[./\-]\d{1,2}[./\-]\d{1,4}$)(?!\d+\.\d+$)(?:\(\d{1,4}\)[ .\-]?)?\d{2,4}(?:[ .\-]\d{2,4}){1,4})"
+    ),
+}
+
+
+_CONTENT_REGEXES = {
+    pattern_type: re.compile(f"^(?:{regex})$", re.MULTILINE) for pattern_type, regex in CONTENT_PATTERNS.items()
+}
+_INLINE_WHITESPACE = re.compile(r"[^\S\n]+")
+
+
+def _scoped(pattern: str) -> str:
+    """Wrap a pattern in a group, turning a leading (?i) into a scoped flag."""
+    if pattern.startswith("(?i)"):
+        return f"(?i:{pattern[4:]})"
+    return f"(?:{pattern})"
+
+
+class GDPRClassifier:
+    """Name-based classifier over precompiled GDPR_PATTERNS."""
+
+    def __init__(self, patterns: Dict[str, Dict[str, Dict[str, Any]]], id_patterns: Iterable[str]):
+        self._types = []
+        for category_group, patterns_dict in patterns.items():
+            for pattern_type, pattern_info in patterns_dict.items():
+                self._types.append(
+                    (
+                        re.compile("|".join(_scoped(p) for p in pattern_info["patterns"])),
+                        {
+                            "pattern_type": pattern_type,
+                            "category_group": category_group,
+                            "sensitivity": pattern_info["sensitivity"],
+                            "category": pattern_info["category"],
+                            "score": SENSITIVITY_SCORES.get(pattern_info["sensitivity"], 0),
+                        },
+                    )
+                )
+        self._any = re.compile(
+            "|".join(_scoped(p) for info in patterns.values() for t in info.values() for p in t["patterns"])
+        )
+        self._id = re.compile("|".join(f"(?:{p})" for p in id_patterns), re.IGNORECASE)
+        self.group_of = {match["pattern_type"]: match["category_group"] for _, match in self._types}
+        self.classify = lru_cache(maxsize=8192)(self._classify)
+
+    def _classify(self, column_name: str) -> tuple:
+        if self._id.search(column_name) or not self._any.search(column_name):
+            return ()
+        return tuple(match for regex, match in self._types if regex.search(column_name))
+
+    def identify(self, column_name: str) -> List[Dict[str, Any]]:
+        """Matches of `column_name`, one per pattern type, in GDPR_PATTERNS order."""
+        return [dict(match) for match in self.classify(column_name)]
+
+    def match_for_type(self, pattern_type: str) -> Optional[Dict[str, Any]]:
+        for _, match in self._types:
+            if match["pattern_type"] == pattern_type:
+                return dict(match)
+        return None
+
+
+def _line_starts(buffer: str) -> np.ndarray:
+    """Offsets of the lines of a newline-separated buffer."""
+    chars = np.frombuffer(buffer.encode("utf-32-le"), dtype=np.uint32)
+    return np.concatenate(([0], np.flatnonzero(chars == 10) + 1))
+
+
+def _line_matches(regex: re.Pattern, buffer: str) -> np.ndarray:
+    """Indexes of the lines of `buffer` fully matched by `regex`, in one scan."""
+    offsets = [m.start() for m in regex.finditer(buffer)]
+    return np.searchsorted(_line_starts(buffer), offsets, side="right") - 1
+
+
+def detect_content_types(
+    samples: Dict[Hashable, list],
+    min_ratio: float = CONTENT_MIN_RATIO,
+) -> Dict[Hashable, str]:
+    """
+    Detect personal data in sampled values. `samples` maps column keys (a
+    column name, or a (table, column) pair to classify many tables in one
+    pass) to lists of values as returned by get_example_data; returns
+    key -> pattern type for the columns whose values mostly match a detector.
+
+    Values are joined into one newline-separated buffer and each detector
+    scans it once as a multi-line regex; hits are counted per column with
+    numpy instead of matching value by value.
+    """
+    keys = list(samples)
+    codes = []
+    values = []
+    for code, key in enumerate(keys):
+        for value in samples[key] or []:
+            if isinstance(value, str):
+                value = value.strip().replace("\n", " ")
+                if value:
+                    codes.append(code)
+                    values.append(value)
+    if not values:
+        return {}
+    codes = np.asarray(codes)
+    totals = np.bincount(codes, minlength=len(keys))
+    buffer = "\n".join(values)
+    compact = _INLINE_WHITESPACE.sub("", buffer).upper()
+
+    detected: Dict[Hashable, str] = {}
+    for pattern_type, regex in _CONTENT_REGEXES.items():
+        lines = _line_matches(regex, compact if pattern_type == "banking" else buffer)
+        hits = np.bincount(codes[lines], minlength=len(keys))
+        for code in np.flatnonzero((totals > 0) & (hits >= min_ratio * totals)):
+            detected.setdefault(keys[code], pattern_type)
+    return detected
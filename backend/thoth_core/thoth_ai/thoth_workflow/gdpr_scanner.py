@@ -10,11 +10,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import re
+import logging
+import os
+from collections import defaultdict
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from django.utils import timezone
-from thoth_core.models import SqlDb, SqlTable
+from thoth_core.models import SqlColumn, SqlDb, SqlTable
+from thoth_core.thoth_ai.thoth_workflow.comment_engine import prefetch_tables
+from thoth_core.thoth_ai.thoth_workflow.gdpr_engine import GDPRClassifier, detect_content_types
+
+logger = logging.getLogger(__name__)
 
 # GDPR sensitive data patterns
 GDPR_PATTERNS = {
@@ -199,58 +205,88 @@ def calculate_sensitivity_score(sensitivity_level: str) -> int:
     return scores.get(sensitivity_level, 0)
 
 
+# Column names treated as keys and never reported (case-insensitive)
+ID_PATTERNS = [
+    r"^id$",  # Exact match for 'id'
+    r"_id$",  # Ends with '_id'
+    r"id$",  # Ends with 'id' (covers cases like 'userid', 'orderid')
+    r"^pk_",  # Starts with 'pk_' (primary key)
+    r"^fk_",  # Starts with 'fk_' (foreign key)
+]
+
+_classifier = GDPRClassifier(GDPR_PATTERNS, ID_PATTERNS)
+
+# Sampling of column values to detect emails, IBANs and phone numbers by content
+SAMPLE_VALUES = os.getenv("THOTH_GDPR_SAMPLE_VALUES", "false").lower() in ("1", "true", "yes", "on")
+SAMPLE_ROWS = int(os.getenv("THOTH_GDPR_SAMPLE_ROWS", "50"))
+SAMPLE_CONNECTIONS = max(1, int(os.getenv("THOTH_GDPR_SAMPLE_CONNECTIONS", "4")))
+
+
 def identify_sensitive_column(column_name: str) -> List[Dict[str, Any]]:
     """
     Identify if a column contains sensitive data based on its name.
     Returns a list of matches with their sensitivity levels and categories.
+    ID fields (primary and foreign keys) never match.
     """
-    # Skip ID fields (primary keys and foreign keys)
-    id_patterns = [
-        r"^id$",  # Exact match for 'id'
-        r"_id$",  # Ends with '_id'
-        r"id$",  # Ends with 'id' (covers cases like 'userid', 'orderid')
-        r"^pk_",  # Starts with 'pk_' (primary key)
-        r"^fk_",  # Starts with 'fk_' (foreign key)
-    ]
-
-    # Check if column matches any ID pattern (case-insensitive)
-    for pattern in id_patterns:
-        if re.search(pattern, column_name, re.IGNORECASE):
-            return []  # Return empty list for ID fields
-
-    matches = []
-
-    for category_group, patterns_dict in GDPR_PATTERNS.items():
-        for pattern_type, pattern_info in patterns_dict.items():
-            for pattern in pattern_info["patterns"]:
-                if re.search(pattern, column_name):
-                    matches.append(
-                        {
-                            "pattern_type": pattern_type,
-                            "category_group": category_group,
-                            "sensitivity": pattern_info["sensitivity"],
-                            "category": pattern_info["category"],
-                            "score": calculate_sensitivity_score(
-                                pattern_info["sensitivity"]
-                            ),
-                        }
-                    )
-                    break  # Only one match per pattern type
+    return _classifier.identify(column_name)
 
+
+def sample_table_contents(
+    tables: List[SqlTable],
+    sample_rows: int = SAMPLE_ROWS,
+    max_connections: int = SAMPLE_CONNECTIONS,
+) -> Dict[int, Dict[str, str]]:
+    """
+    Read up to `sample_rows` rows of each table (at most `max_connections`
+    reads at a time) and return, per table id, the columns whose values look
+    like emails, IBANs or phone numbers.
+    """
+    samples = {}
+    prefetched = prefetch_tables(
+        tables, example_rows=sample_rows, max_connections=max_connections, include_schema=False
+    )
+    for table_id, prefetch in prefetched.items():
+        error = prefetch.error or prefetch.example_error
+        if error:
+            logger.warning(f"GDPR value sampling skipped for table {table_id}: {error}")
+            continue
+        for column_name, values in prefetch.example_data.items():
+            samples[(table_id, column_name)] = values
+
+    # One detection pass over the samples of every table
+    matches = defaultdict(dict)
+    for (table_id, column_name), pattern_type in detect_content_types(samples).items():
+        matches[table_id][column_name] = pattern_type
     return matches
 
 
-def scan_table_for_gdpr(table: SqlTable) -> Dict[str, Any]:
+def scan_table_for_gdpr(
+    table: SqlTable,
+    columns: Optional[List[SqlColumn]] = None,
+    content_matches: Optional[Dict[str, str]] = None,
+) -> Dict[str, Any]:
     """
     Scan a table for GDPR-sensitive columns.
     Returns a dictionary with the table analysis.
+
+    `columns` may be passed when already loaded; `content_matches` maps
+    column names to a pattern type detected from sampled values, used for
+    columns whose name does not reveal their content.
     """
+    if columns is None:
+        columns = list(table.columns.all())
+    content_matches = content_matches or {}
     sensitive_columns = []
     max_sensitivity = "NONE"
     max_score = 0
 
-    for column in table.columns.all():
+    for column in columns:
         column_matches = identify_sensitive_column(column.original_column_name)
+        detected_by = "name"
+        if not column_matches and column.original_column_name in content_matches:
+            match = _classifier.match_for_type(content_matches[column.original_column_name])
+            column_matches = [match] if match else []
+            detected_by = "content"
 
         if column_matches:
             # Take the highest sensitivity match for this column
@@ -262,7 +298,9 @@ def scan_table_for_gdpr(table: SqlTable) -> Dict[str, Any]:
                     "data_type": column.data_format,
                     "sensitivity": highest_match["sensitivity"],
                     "category": highest_match["category"],
+                    "category_group": highest_match["category_group"],
                     "pattern_type": highest_match["pattern_type"],
+                    "detected_by": detected_by,
                     "description": column.column_description
                     or column.generated_comment
                     or "",
@@ -278,28 +316,50 @@ def scan_table_for_gdpr(table: SqlTable) -> Dict[str, Any]:
         "table_name": table.name,
         "description": table.description or table.generated_comment or "",
         "sensitive_columns": sensitive_columns,
-        "column_count": table.columns.count(),
+        "column_count": len(columns),
         "sensitive_column_count": len(sensitive_columns),
         "max_sensitivity": max_sensitivity,
         "has_sensitive_data": len(sensitive_columns) > 0,
     }
 
 
-def scan_database_for_gdpr(db_id: int) -> Dict[str, Any]:
+def scan_database_for_gdpr(
+    db_id: int,
+    sample_values: Optional[bool] = None,
+    sample_rows: Optional[int] = None,
+    max_connections: Optional[int] = None,
+) -> Dict[str, Any]:
     """
     Perform a complete GDPR scan on a database.
     Returns a comprehensive report with all findings.
+
+    Tables and columns are loaded with one query each. With `sample_values`
+    (default THOTH_GDPR_SAMPLE_VALUES) up to `sample_rows` rows per table are
+    read from the database to detect personal data by content as well.
     """
     try:
         db = SqlDb.objects.get(id=db_id)
-        tables = SqlTable.objects.filter(sql_db=db).prefetch_related("columns")
+        tables = list(SqlTable.objects.filter(sql_db=db).select_related("sql_db"))
+        columns_by_table = defaultdict(list)
+        for column in SqlColumn.objects.filter(sql_table__sql_db=db).order_by("id"):
+            columns_by_table[column.sql_table_id].append(column)
+
+        if sample_values is None:
+            sample_values = SAMPLE_VALUES
+        content_matches = {}
+        if sample_values and tables:
+            content_matches = sample_table_contents(
+                tables,
+                sample_rows=sample_rows or SAMPLE_ROWS,
+                max_connections=max_connections or SAMPLE_CONNECTIONS,
+            )
 
         # Initialize report structure
         report = {
             "database_name": db.name,
             "scan_date": timezone.now().isoformat(),
             "summary": {
-                "total_tables": tables.count(),
+                "total_tables": len(tables),
                 "tables_with_sensitive_data": 0,
                 "total_columns": 0,
                 "sensitive_columns": 0,
@@ -311,6 +371,7 @@ def scan_database_for_gdpr(db_id: int) -> Dict[str, Any]:
             "categories": {},
             "tables": [],
             "recommendations": [],
+            "content_sampling": bool(sample_values),
         }
 
         # Initialize category counters
@@ -319,7 +380,9 @@ def scan_database_for_gdpr(db_id: int) -> Dict[str, Any]:
 
         # Scan each table
         for table in tables:
-            table_analysis = scan_table_for_gdpr(table)
+            table_analysis = scan_table_for_gdpr(
+                table, columns_by_table[table.id], content_matches.get(table.id)
+            )
             report["tables"].append(table_analysis)
 
             # Update summary statistics
@@ -344,18 +407,15 @@ def scan_database_for_gdpr(db_id: int) -> Dict[str, Any]:
                         report["summary"]["low_findings"] += 1
 
                     # Update category statistics
-                    for category_group, patterns_dict in GDPR_PATTERNS.items():
-                        for pattern_type, pattern_info in patterns_dict.items():
-                            if column["pattern_type"] == pattern_type:
-                                report["categories"][category_group]["count"] += 1
-                                report["categories"][category_group]["columns"].append(
-                                    {
-                                        "table": table.name,
-                                        "column": column["column_name"],
-                                        "sensitivity": column["sensitivity"],
-                                    }
-                                )
-                                break
+                    category_group = _classifier.group_of[column["pattern_type"]]
+                    report["categories"][category_group]["count"] += 1
+                    report["categories"][category_group]["columns"].append(
+                        {
+                            "table": table.name,
+                            "column": column["column_name"],
+                            "sensitivity": column["sensitivity"],
+                        }
+                    )
 
         # Generate recommendations based on findings
         report["recommendations"] = generate_recommendations(report)
@@ -18,7 +18,16 @@ from django.conf import settings
 from django.contrib import messages
 
 # Removed Haystack imports - using LiteLLM instead
-from thoth_core.models import SqlTable, SqlColumn, Relationship, LLMChoices
+from thoth_ai_backend.mermaid_utils import prerender_erd
+from thoth_core.models import LLMChoices
+from thoth_core.thoth_ai.artifact_cache import (
+    cached_sections,
+    fingerprint,
+    load_schema_snapshot,
+    read_artifact,
+    write_artifact,
+)
+from thoth_core.thoth_ai.llm_cache import cached_generate
 from thoth_core.thoth_ai.thoth_workflow.comment_generation_utils import (
     setup_llm_from_env,
 )
@@ -59,22 +68,9 @@ def generate_scope_html(scope_json_str):
         return f"<p>{scope_json_str}</p>"
 
 
-def generate_relationships_html(db_id, language="en"):
-    """Generate HTML for database relationships"""
+def _render_relationships_section(relationships, language):
     html_parts = []
-
-    # Get relationships
-    from thoth_core.models import Relationship
-
-    relationships = (
-        Relationship.objects.filter(source_table__sql_db__id=db_id)
-        .select_related(
-            "source_table", "source_column", "target_table", "target_column"
-        )
-        .order_by("source_table__name", "source_column__original_column_name")
-    )
-
-    if relationships.exists():
+    if relationships:
         html_parts.append(f"<h3>{get_translation(language, 'foreign_key_relationships')}</h3>")
 
         # Create relationships table
@@ -92,11 +88,11 @@ def generate_relationships_html(db_id, language="en"):
 
         for rel in relationships:
             html_parts.append("<tr>")
-            html_parts.append(f"<td><strong>{rel.source_table.name}</strong></td>")
-            html_parts.append(f"<td>{rel.source_column.original_column_name}</td>")
+            html_parts.append(f"<td><strong>{rel['source_table__name']}</strong></td>")
+            html_parts.append(f"<td>{rel['source_column__original_column_name']}</td>")
             html_parts.append('<td style="text-align: center;">→</td>')
-            html_parts.append(f"<td><strong>{rel.target_table.name}</strong></td>")
-            html_parts.append(f"<td>{rel.target_column.original_column_name}</td>")
+            html_parts.append(f"<td><strong>{rel['target_table__name']}</strong></td>")
+            html_parts.append(f"<td>{rel['target_column__original_column_name']}</td>")
             html_parts.append("</tr>")
 
         html_parts.append("</tbody>")
@@ -109,118 +105,141 @@ def generate_relationships_html(db_id, language="en"):
     return "\n".join(html_parts)
 
 
-def generate_tables_html(db_id, language="en"):
-    """Generate HTML for tables and columns documentation"""
-    html_parts = []
-    tables = SqlTable.objects.filter(sql_db__id=db_id).order_by("name")
-
-    for table in tables:
-        # Table header
-        html_parts.append('<div class="table-section">')
-        html_parts.append(f"<h3>{table.name}</h3>")
+def generate_relationships_html(db_id, language="en", snapshot=None):
+    """Generate HTML for database relationships"""
+    snapshot = snapshot or load_schema_snapshot(db_id)
+
+    # Only relationships starting from this database, by source table and column
+    relationships = sorted(
+        (
+            rel
+            for rel in snapshot.relationships
+            if rel["source_table__sql_db_id"] == snapshot.db_id
+        ),
+        key=lambda rel: (rel["source_table__name"], rel["source_column__original_column_name"]),
+    )
+    return cached_sections(
+        "doc_relationships",
+        f"{snapshot.db_id}_{language}",
+        [(fingerprint("relationships", relationships, language), relationships)],
+        lambda rels: _render_relationships_section(rels, language),
+    )[0]
 
-        # Table description
-        if table.description or table.generated_comment:
-            desc = table.description or table.generated_comment
-            html_parts.append(f'<p class="table-description">{desc}</p>')
 
-        # Columns table
-        html_parts.append('<table class="data-table">')
-        html_parts.append("<thead>")
-        html_parts.append("<tr>")
-        html_parts.append(f"<th>{get_translation(language, 'column_name')}</th>")
-        html_parts.append(f"<th>{get_translation(language, 'data_type')}</th>")
-        html_parts.append(f"<th>{get_translation(language, 'description')}</th>")
-        html_parts.append(f"<th>{get_translation(language, 'value_description')}</th>")
-        html_parts.append(f"<th>{get_translation(language, 'fk')}</th>")
-        html_parts.append("</tr>")
-        html_parts.append("</thead>")
-        html_parts.append("<tbody>")
+def _render_table_section(table, language):
+    html_parts = []
 
-        # Get columns and sort: PK first, then others alphabetically
-        columns = SqlColumn.objects.filter(sql_table=table)
-        pk_columns = []
-        other_columns = []
+    # Table header
+    html_parts.append('<div class="table-section">')
+    html_parts.append(f"<h3>{table['name']}</h3>")
 
-        for column in columns:
-            if column.pk_field:
-                pk_columns.append(column)
-            else:
-                other_columns.append(column)
+    # Table description
+    if table["description"] or table["generated_comment"]:
+        desc = table["description"] or table["generated_comment"]
+        html_parts.append(f'<p class="table-description">{desc}</p>')
 
-        # Sort each group
-        pk_columns.sort(key=lambda x: x.original_column_name)
-        other_columns.sort(key=lambda x: x.original_column_name)
+    # Columns table
+    html_parts.append('<table class="data-table">')
+    html_parts.append("<thead>")
+    html_parts.append("<tr>")
+    html_parts.append(f"<th>{get_translation(language, 'column_name')}</th>")
+    html_parts.append(f"<th>{get_translation(language, 'data_type')}</th>")
+    html_parts.append(f"<th>{get_translation(language, 'description')}</th>")
+    html_parts.append(f"<th>{get_translation(language, 'value_description')}</th>")
+    html_parts.append(f"<th>{get_translation(language, 'fk')}</th>")
+    html_parts.append("</tr>")
+    html_parts.append("</thead>")
+    html_parts.append("<tbody>")
 
-        # Combine: PK first, then others
-        sorted_columns = pk_columns + other_columns
+    # Sort columns: PK first, then others alphabetically
+    sorted_columns = sorted(
+        table["columns"],
+        key=lambda column: (not column["pk_field"], column["original_column_name"]),
+    )
 
-        for column in sorted_columns:
-            html_parts.append("<tr>")
+    for column in sorted_columns:
+        html_parts.append("<tr>")
 
-            # Column name with PK indicator
-            col_name = column.original_column_name
-            if column.pk_field:
-                col_name = f"🔑 {col_name}"
-            html_parts.append(f"<td>{col_name}</td>")
+        # Column name with PK indicator
+        col_name = column["original_column_name"]
+        if column["pk_field"]:
+            col_name = f"🔑 {col_name}"
+        html_parts.append(f"<td>{col_name}</td>")
 
-            # Data type
-            html_parts.append(f"<td><code>{column.data_format or 'TEXT'}</code></td>")
+        # Data type
+        html_parts.append(f"<td><code>{column['data_format'] or 'TEXT'}</code></td>")
 
-            # Description
-            desc = column.column_description or column.generated_comment or ""
-            html_parts.append(f"<td>{desc}</td>")
+        # Description
+        desc = column["column_description"] or column["generated_comment"] or ""
+        html_parts.append(f"<td>{desc}</td>")
 
-            # Value description
-            val_desc = column.value_description or ""
-            html_parts.append(f"<td>{val_desc}</td>")
+        # Value description
+        val_desc = column["value_description"] or ""
+        html_parts.append(f"<td>{val_desc}</td>")
 
-            # FK column with symbol
-            fk_symbol = "🔗" if column.fk_field else ""
-            html_parts.append(f'<td style="text-align: center;">{fk_symbol}</td>')
+        # FK column with symbol
+        fk_symbol = "🔗" if column["fk_field"] else ""
+        html_parts.append(f'<td style="text-align: center;">{fk_symbol}</td>')
 
-            html_parts.append("</tr>")
+        html_parts.append("</tr>")
 
-        html_parts.append("</tbody>")
-        html_parts.append("</table>")
-        html_parts.append("</div>")
+    html_parts.append("</tbody>")
+    html_parts.append("</table>")
+    html_parts.append("</div>")
 
     return "\n".join(html_parts)
 
 
-def generate_schema_string_from_models(db_id):
+def generate_tables_html(db_id, language="en", snapshot=None):
+    """Generate HTML for tables and columns documentation"""
+    snapshot = snapshot or load_schema_snapshot(db_id)
+    tables = sorted(snapshot.tables, key=lambda table: table["name"])
+
+    # Only tables whose metadata changed since the last run are rendered again
+    sections = cached_sections(
+        "doc_tables",
+        f"{snapshot.db_id}_{language}",
+        [(snapshot.table_fingerprint(table, language), table) for table in tables],
+        lambda table: _render_table_section(table, language),
+    )
+    return "\n".join(sections)
+
+
+def generate_schema_string_from_models(db_id, snapshot=None):
     """Generate schema string from Django models as fallback"""
     schema_strings = []
-    tables = SqlTable.objects.filter(sql_db__id=db_id)
+    snapshot = snapshot or load_schema_snapshot(db_id)
 
-    for table in tables:
+    for table in snapshot.tables:
         table_lines = []
-        table_lines.append(f"CREATE TABLE {table.name} (")
+        table_lines.append(f"CREATE TABLE {table['name']} (")
 
-        columns = SqlColumn.objects.filter(sql_table=table)
         col_lines = []
         pk_cols = []
         fk_defs = []
 
-        for column in columns:
+        for column in table["columns"]:
+            column_name = column["original_column_name"]
+
             # Add column description as comment
-            if column.column_description or column.generated_comment:
-                desc = column.column_description or column.generated_comment
+            if column["column_description"] or column["generated_comment"]:
+                desc = column["column_description"] or column["generated_comment"]
                 col_lines.append(f"    -- {desc}")
 
-            data_type = column.data_format or "TEXT"
-            col_lines.append(f"    {column.original_column_name} {data_type},")
+            data_type = column["data_format"] or "TEXT"
+            col_lines.append(f"    {column_name} {data_type},")
 
             # Collect PKs
-            if column.pk_field:
-                pk_cols.append(column.original_column_name)
+            if column["pk_field"]:
+                pk_cols.append(column_name)
 
             # Collect FKs
-            if column.fk_field:
-                if isinstance(column.fk_field, str) and "." in column.fk_field:
-                    ref_table, ref_column = column.fk_field.split(".", 1)
+            fk_field = column["fk_field"]
+            if fk_field:
+                if isinstance(fk_field, str) and "." in fk_field:
+                    ref_table, ref_column = fk_field.split(".", 1)
                     fk_defs.append(
-                        f"FOREIGN KEY ({column.original_column_name}) REFERENCES {ref_table}({ref_column})"
+                        f"FOREIGN KEY ({column_name}) REFERENCES {ref_table}({ref_column})"
                     )
 
         # Remove trailing comma from last column
@@ -242,6 +261,50 @@ def generate_schema_string_from_models(db_id):
     return "\n\n".join(schema_strings).rstrip("-" * 80).rstrip("\n")
 
 
+def collect_erd_prompt_data(snapshot):
+    """Return the (tables, relationships) variables of the ERD prompt."""
+    tables_data = []
+    for table in snapshot.tables:
+        columns_data = []
+        for col in table["columns"]:
+            columns_data.append(
+                {
+                    "name": col["original_column_name"],
+                    "expanded_name": col["column_name"] or col["original_column_name"],
+                    "data_type": col["data_format"],
+                    "description": col["column_description"]
+                    or col["generated_comment"]
+                    or "",
+                    "value_description": col["value_description"] or "",
+                    "is_pk": bool(col["pk_field"]),
+                    "is_fk": bool(col["fk_field"]),
+                    "fk_reference": col["fk_field"] if col["fk_field"] else "",
+                }
+            )
+
+        tables_data.append(
+            {
+                "name": table["name"],
+                "description": table["description"] or table["generated_comment"] or "",
+                "columns": columns_data,
+            }
+        )
+
+    relationships_data = []
+    for rel in snapshot.relationships:
+        relationships_data.append(
+            {
+                "source_table": rel["source_table__name"],
+                "source_column": rel["source_column__original_column_name"],
+                "target_table": rel["target_table__name"],
+                "target_column": rel["target_column__original_column_name"],
+                "name": f"{rel['source_table__name']}_{rel['target_table__name']}_fk",
+            }
+        )
+
+    return tables_data, relationships_data
+
+
 def extract_mermaid_diagram(markdown_content):
     """Extract Mermaid diagram from markdown content."""
     mermaid_pattern = r"```mermaid\s*(.*?)\s*```"
@@ -824,53 +887,10 @@ def generate_db_documentation(modeladmin, request, queryset):
 
         # Collect database information
 
-        # Generate schema string from Django models
-        schema_string = generate_schema_string_from_models(db.id)
-
-        # Collect table information with descriptions
-        tables_data = []
-        for table in SqlTable.objects.filter(sql_db=db):
-            columns_data = []
-            for col in SqlColumn.objects.filter(sql_table=table):
-                columns_data.append(
-                    {
-                        "name": col.original_column_name,
-                        "expanded_name": col.column_name or col.original_column_name,
-                        "data_type": col.data_format,
-                        "description": col.column_description
-                        or col.generated_comment
-                        or "",
-                        "value_description": col.value_description or "",
-                        "is_pk": bool(col.pk_field),
-                        "is_fk": bool(col.fk_field),
-                        "fk_reference": col.fk_field if col.fk_field else "",
-                    }
-                )
-
-            tables_data.append(
-                {
-                    "name": table.name,
-                    "description": table.description or table.generated_comment or "",
-                    "columns": columns_data,
-                }
-            )
-
-        # Collect relationships
-        relationships = Relationship.objects.filter(
-            source_table__sql_db=db
-        ) | Relationship.objects.filter(target_table__sql_db=db)
-
-        relationships_data = []
-        for rel in relationships:
-            relationships_data.append(
-                {
-                    "source_table": rel.source_table.name,
-                    "source_column": rel.source_column.original_column_name,
-                    "target_table": rel.target_table.name,
-                    "target_column": rel.target_column.original_column_name,
-                    "name": f"{rel.source_table.name}_{rel.target_table.name}_fk",
-                }
-            )
+        # Load tables, columns and relationships once for every section
+        snapshot = load_schema_snapshot(db.id)
+        schema_string = generate_schema_string_from_models(db.id, snapshot)
+        tables_data, relationships_data = collect_erd_prompt_data(snapshot)
 
         # Generate Mermaid diagram using LLM
         try:
@@ -897,8 +917,14 @@ def generate_db_documentation(modeladmin, request, queryset):
                 formatted_prompt = formatted_prompt.format(**prompt_variables)
             llm_messages.append({"role": "user", "content": formatted_prompt})
 
-            # Generate using LLM
-            output = llm.generate(llm_messages, max_tokens=3000)
+            # Generate using LLM (unchanged schemas reuse the cached diagram)
+            output = cached_generate(
+                "db_documentation_erd",
+                llm,
+                llm_messages,
+                max_tokens=3000,
+                validate=lambda response: bool(getattr(response, "content", None)),
+            )
 
             # Extract Mermaid diagram from LLM output
             mermaid_diagram = ""
@@ -910,10 +936,8 @@ def generate_db_documentation(modeladmin, request, queryset):
                 db.erd = mermaid_diagram
                 db.save(update_fields=["erd"])
 
-            # Generate HTML components using Python functions
-            scope_html = generate_scope_html(db.scope_json)
-            tables_html = generate_tables_html(db.id, language)
-            relationships_html = generate_relationships_html(db.id, language)
+                # Render the ERD images served by the ERD page and PDF export
+                prerender_erd(mermaid_diagram)
 
             # Save to file
             io_dir, error_message = ensure_exports_directory()
@@ -943,14 +967,25 @@ def generate_db_documentation(modeladmin, request, queryset):
             html_filepath = os.path.join(db_dir, html_filename)
 
             try:
-                # Generate complete HTML documentation (no ERD visualization)
-                html_content = generate_complete_html(
-                    db_name=db.name,
-                    scope_html=scope_html,
-                    tables_html=tables_html,
-                    relationships_html=relationships_html,
-                    language=language
-                )
+                # Unchanged schema, scope and language re-use the stored page
+                doc_key = snapshot.fingerprint(db.name, db.scope_json, language)
+                cached_html = read_artifact("documentation", doc_key, "html")
+                if cached_html is not None:
+                    html_content = cached_html.decode("utf-8")
+                else:
+                    # Generate complete HTML documentation (no ERD visualization)
+                    html_content = generate_complete_html(
+                        db_name=db.name,
+                        scope_html=generate_scope_html(db.scope_json),
+                        tables_html=generate_tables_html(db.id, language, snapshot),
+                        relationships_html=generate_relationships_html(
+                            db.id, language, snapshot
+                        ),
+                        language=language
+                    )
+                    write_artifact(
+                        "documentation", doc_key, "html", html_content.encode("utf-8")
+                    )
 
                 with open(html_filepath, "w", encoding="utf-8") as f:
                     f.write(html_content)
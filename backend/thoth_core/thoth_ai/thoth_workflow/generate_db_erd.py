@@ -4,12 +4,16 @@ import re
 from django.conf import settings
 from django.contrib import messages
 
-from thoth_core.models import LLMChoices, Relationship, SqlColumn, SqlTable
+from thoth_ai_backend.mermaid_utils import prerender_erd
+from thoth_core.models import LLMChoices
+from thoth_core.thoth_ai.artifact_cache import load_schema_snapshot
+from thoth_core.thoth_ai.llm_cache import cached_generate
 from thoth_core.thoth_ai.thoth_workflow.comment_generation_utils import (
     preprocess_template,
     setup_llm_from_env,
 )
 from thoth_core.thoth_ai.thoth_workflow.generate_db_documentation import (
+    collect_erd_prompt_data,
     extract_mermaid_diagram,
     generate_schema_string_from_models,
 )
@@ -59,50 +63,9 @@ def generate_db_erd(modeladmin, request, queryset):
             prompt_template_text = file.read()
 
         # Collect DB info: schema string, tables + columns, relationships
-        schema_string = generate_schema_string_from_models(db.id)
-
-        tables_data = []
-        for table in SqlTable.objects.filter(sql_db=db):
-            columns_data = []
-            for col in SqlColumn.objects.filter(sql_table=table):
-                columns_data.append(
-                    {
-                        "name": col.original_column_name,
-                        "expanded_name": col.column_name or col.original_column_name,
-                        "data_type": col.data_format,
-                        "description": col.column_description
-                        or col.generated_comment
-                        or "",
-                        "value_description": col.value_description or "",
-                        "is_pk": bool(col.pk_field),
-                        "is_fk": bool(col.fk_field),
-                        "fk_reference": col.fk_field if col.fk_field else "",
-                    }
-                )
-
-            tables_data.append(
-                {
-                    "name": table.name,
-                    "description": table.description or table.generated_comment or "",
-                    "columns": columns_data,
-                }
-            )
-
-        relationships = Relationship.objects.filter(
-            source_table__sql_db=db
-        ) | Relationship.objects.filter(target_table__sql_db=db)
-
-        relationships_data = []
-        for rel in relationships:
-            relationships_data.append(
-                {
-                    "source_table": rel.source_table.name,
-                    "source_column": rel.source_column.original_column_name,
-                    "target_table": rel.target_table.name,
-                    "target_column": rel.target_column.original_column_name,
-                    "name": f"{rel.source_table.name}_{rel.target_table.name}_fk",
-                }
-            )
+        snapshot = load_schema_snapshot(db.id)
+        schema_string = generate_schema_string_from_models(db.id, snapshot)
+        tables_data, relationships_data = collect_erd_prompt_data(snapshot)
 
         # Build LLM messages
         llm_messages = []
@@ -127,8 +90,14 @@ def generate_db_erd(modeladmin, request, queryset):
 
         llm_messages.append({"role": "user", "content": formatted_prompt})
 
-        # Call LLM
-        output = llm.generate(llm_messages, max_tokens=3000)
+        # Call LLM (same prompt as the documentation, so both share cached diagrams)
+        output = cached_generate(
+            "db_documentation_erd",
+            llm,
+            llm_messages,
+            max_tokens=3000,
+            validate=lambda response: bool(getattr(response, "content", None)),
+        )
 
         mermaid_diagram = ""
         if output and hasattr(output, "content"):
@@ -147,6 +116,9 @@ def generate_db_erd(modeladmin, request, queryset):
         db.erd = mermaid_diagram.strip()
         db.save(update_fields=["erd"])
 
+        # Render the ERD page and PDF images concurrently while we are here
+        prerender_erd(db.erd)
+
         modeladmin.message_user(
             request,
             f"ERD diagram generated and saved for database '{db.name}'.",
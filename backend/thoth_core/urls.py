@@ -83,6 +83,11 @@ urlpatterns = [
     path(
         "api/thoth-logs/summary/", views.get_thoth_logs_summary, name="thothlog-summary"
     ),
+    path(
+        "api/thoth-logs/latency/",
+        views.get_pipeline_latency,
+        name="thothlog-latency",
+    ),
     # Frontend authentication
     path(
         "api/generate-frontend-token/",
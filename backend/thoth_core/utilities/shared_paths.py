@@ -92,4 +92,18 @@ def get_import_path(filename=None):
     base_path = get_data_exchange_path()
     if filename:
         return os.path.join(base_path, filename)
-    return base_path
\ No newline at end of file
+    return base_path
+
+def get_log_archive_path():
+    """
+    Get path to the directory holding archived ThothLog detail files.
+
+    Can be overridden with the THOTH_LOG_ARCHIVE_DIR environment variable.
+
+    Returns:
+        str: Absolute path to the log archive directory
+    """
+    override = os.getenv("THOTH_LOG_ARCHIVE_DIR")
+    if override:
+        return override
+    return os.path.join(get_shared_data_path(), "thoth_log_archive")
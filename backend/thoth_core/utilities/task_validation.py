@@ -14,7 +14,8 @@ import threading
 import logging
 from django.utils import timezone
 from datetime import timedelta
-from thoth_core.models import Workspace, SqlDb, TaskStatus
+from thoth_core.job_queue import ACTIVE_STATUSES, get_job_for_task_id
+from thoth_core.models import JobStatus, Workspace, SqlDb, TaskStatus
 
 logger = logging.getLogger(__name__)
 
@@ -71,7 +72,15 @@ def validate_and_cleanup_running_task(workspace, task_type="table_comment"):
         should_reset = True
         reset_reason = "No task ID found for RUNNING status"
 
-    # Check 2: Validate if thread is still active
+    # Check 2: Validate that the queued job, or the legacy thread, is still active
+    elif str(task_id).startswith("job-"):
+        job = get_job_for_task_id(task_id)
+        if job is None or job.status not in ACTIVE_STATUSES:
+            should_reset = True
+            reset_reason = f"Job for task {task_id} is no longer active"
+        elif job.status == JobStatus.RUNNING:
+            # Running jobs heartbeat; the job queue requeues them if their worker dies
+            return True
     elif task_id:
         try:
             # Get all active thread identifiers
@@ -246,7 +255,7 @@ def validate_and_cleanup_running_sqldb_task(
 ) -> bool:
     """
     Validates if an SqlDb-scoped task marked as RUNNING is still legitimate.
-    Since SqlDb task IDs are not thread identifiers, we only perform a timeout check.
+    Tasks run by the job queue follow their job; others get a timeout check.
 
     Args:
         sql_db: SqlDb instance
@@ -274,23 +283,32 @@ def validate_and_cleanup_running_sqldb_task(
     if current_status != TaskStatus.RUNNING:
         return False
 
-    start_time = getattr(sql_db, start_time_field)
-    if start_time:
+    # Tasks run by the job queue are as alive as their job
+    job = get_job_for_task_id(getattr(sql_db, f"{task_type}_task_id"))
+    reset_reason = None
+    if job is not None:
+        if job.status in ACTIVE_STATUSES:
+            return True
+        reset_reason = f"Task auto-reset: its job ended with status {job.status}."
+    else:
+        start_time = getattr(sql_db, start_time_field)
         cutoff_time = timezone.now() - timedelta(hours=timeout_hours)
-        if start_time < cutoff_time:
-            setattr(sql_db, status_field, TaskStatus.FAILED)
-            setattr(sql_db, end_time_field, timezone.now())
-            old_log = getattr(sql_db, log_field) or ""
-            setattr(
-                sql_db,
-                log_field,
-                (old_log + "\n" if old_log else "")
-                + f"Task auto-reset after exceeding {timeout_hours}h runtime.",
-            )
-            sql_db.save(
-                update_fields=[status_field, end_time_field, log_field]
-            )
-            return False
+        if start_time and start_time < cutoff_time:
+            reset_reason = f"Task auto-reset after exceeding {timeout_hours}h runtime."
+
+    if reset_reason:
+        setattr(sql_db, status_field, TaskStatus.FAILED)
+        setattr(sql_db, end_time_field, timezone.now())
+        old_log = getattr(sql_db, log_field) or ""
+        setattr(
+            sql_db,
+            log_field,
+            (old_log + "\n" if old_log else "") + reset_reason,
+        )
+        sql_db.save(
+            update_fields=[status_field, end_time_field, log_field]
+        )
+        return False
 
     return True
 
@@ -10,13 +10,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
 import logging
 import os
 from datetime import datetime, timezone
 
 from django.contrib.auth.models import User
 from django.shortcuts import get_object_or_404, render
-from django.http import HttpResponse, HttpResponseBadRequest, HttpResponseForbidden
+from django.http import (
+    HttpResponse,
+    HttpResponseBadRequest,
+    HttpResponseForbidden,
+    StreamingHttpResponse,
+)
 from django.views.decorators.http import require_POST
 from django.contrib.auth.decorators import login_required
 from rest_framework.authentication import SessionAuthentication, TokenAuthentication
@@ -30,12 +36,25 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework import generics, status
+from rest_framework.exceptions import ValidationError
+from rest_framework.utils.encoders import JSONEncoder
 
 from thoth_core.authentication import ApiKeyAuthentication
 from thoth_core.permissions import HasValidApiKey, IsAuthenticatedOrHasApiKey
 from thoth_core.health_check import HealthChecker, HealthCheckStatus
-
-from .models import SqlColumn, SqlDb, SqlTable, Workspace, ThothLog, Agent, AgentChoices
+from thoth_core.pagination import ThothLogCursorPagination
+
+from .models import (
+    SqlColumn,
+    SqlDb,
+    SqlTable,
+    Workspace,
+    ThothLog,
+    Agent,
+    AgentChoices,
+    PipelineLatencyRollup,
+    RollupGranularity,
+)
 from .serializers import (
     SqlColumnSerializer,
     SqlTableSerializer,
@@ -43,6 +62,7 @@ from .serializers import (
     WorkspaceSerializer,
     WorkspaceListSerializer,
     ThothLogSerializer,
+    PipelineLatencyRollupSerializer,
 )
 
 logger = logging.getLogger(__name__)
@@ -1082,6 +1102,8 @@ def health_check(request):
     Query parameters:
     - metrics: Include system metrics (memory, CPU, disk) if set to 'true'
     - deep: Perform deep health checks if set to 'true' (same as metrics for now)
+    - refresh: Probe SQL and vector databases now instead of serving the
+      results cached by the background prober, if set to '1' or 'true'
 
     Returns:
     - 200 OK: Service is healthy
@@ -1091,6 +1113,7 @@ def health_check(request):
         # Parse query parameters
         include_metrics = request.GET.get("metrics", "false").lower() == "true"
         deep_check = request.GET.get("deep", "false").lower() == "true"
+        refresh = request.GET.get("refresh", "false").lower() in ("1", "true")
 
         # Include metrics for deep checks
         if deep_check:
@@ -1099,7 +1122,7 @@ def health_check(request):
         # Perform health check
         health_checker = HealthChecker()
         health_data = health_checker.perform_health_check(
-            include_metrics=include_metrics
+            include_metrics=include_metrics, refresh=refresh
         )
 
         # Log health check request
@@ -1135,11 +1158,20 @@ def health_check(request):
 class ThothLogListCreateView(generics.ListCreateAPIView):
     """
     API view for listing and creating ThothLog entries.
-    GET: List all logs (with pagination and filtering)
+    GET: List all logs (with cursor pagination and filtering)
     POST: Create a new log entry
+
+    Query parameters for GET:
+    - fields: comma-separated list of fields to return (loaded with .only())
+    - exclude: comma-separated list of fields to omit (deferred with .defer())
+    - page_size: number of logs per page (max 500)
+    - cursor: opaque cursor returned in the next/previous links
+    - export=ndjson: stream every matching log as newline-delimited JSON
+      instead of returning a page
     """
 
     serializer_class = ThothLogSerializer
+    pagination_class = ThothLogCursorPagination
     authentication_classes = [
         TokenAuthentication,
         ApiKeyAuthentication,
@@ -1147,6 +1179,90 @@ class ThothLogListCreateView(generics.ListCreateAPIView):
     ]
     permission_classes = [IsAuthenticatedOrHasApiKey]
 
+    # Fields always loaded so that cursor pagination and row identity work
+    # even when the client projects a narrow set of fields.
+    REQUIRED_FIELDS = ("id", "started_at")
+    EXPORT_CHUNK_SIZE = 500
+
+    def _parse_field_list(self, param):
+        """
+        Parse a comma-separated field list from the query string and validate
+        it against the concrete ThothLog fields.
+        """
+        raw_value = self.request.query_params.get(param)
+        if not raw_value:
+            return []
+
+        requested = [name.strip() for name in raw_value.split(",") if name.strip()]
+        valid_fields = {field.name for field in ThothLog._meta.concrete_fields}
+        unknown = sorted(set(requested) - valid_fields)
+        if unknown:
+            raise ValidationError(
+                {param: f"Unknown ThothLog fields: {', '.join(unknown)}"}
+            )
+        return requested
+
+    def get_projection(self):
+        """
+        Return the list of serialized fields requested by the client, or None
+        when the full representation should be returned.
+        """
+        if not hasattr(self, "_projection"):
+            fields = self._parse_field_list("fields")
+            excluded = self._parse_field_list("exclude")
+            if fields:
+                projection = [
+                    name
+                    for name in dict.fromkeys([*self.REQUIRED_FIELDS, *fields])
+                    if name not in excluded or name in self.REQUIRED_FIELDS
+                ]
+            elif excluded:
+                projection = [
+                    field.name
+                    for field in ThothLog._meta.concrete_fields
+                    if field.name not in excluded
+                    or field.name in self.REQUIRED_FIELDS
+                ]
+            else:
+                projection = None
+            self._projection = projection
+        return self._projection
+
+    def get_serializer(self, *args, **kwargs):
+        if self.request.method == "GET":
+            projection = self.get_projection()
+            if projection:
+                kwargs.setdefault("fields", projection)
+        return super().get_serializer(*args, **kwargs)
+
+    def list(self, request, *args, **kwargs):
+        if request.query_params.get("export") == "ndjson":
+            return self.export_ndjson()
+        return super().list(request, *args, **kwargs)
+
+    def export_ndjson(self):
+        """
+        Stream all matching logs as newline-delimited JSON.
+
+        Rows are fetched with a server-side iterator in fixed-size chunks so
+        memory use stays flat regardless of how many logs match.
+        """
+        queryset = self.filter_queryset(self.get_queryset()).order_by(
+            *ThothLogCursorPagination.ordering
+        )
+        projection = self.get_projection()
+
+        def generate_rows():
+            for log in queryset.iterator(chunk_size=self.EXPORT_CHUNK_SIZE):
+                data = ThothLogSerializer(log, fields=projection).data
+                yield json.dumps(data, cls=JSONEncoder) + "\n"
+
+        response = StreamingHttpResponse(
+            generate_rows(), content_type="application/x-ndjson"
+        )
+        response["Content-Disposition"] = 'attachment; filename="thoth_logs.ndjson"'
+        return response
+
     def get_queryset(self):
         """
         Filter logs based on user permissions.
@@ -1178,7 +1294,12 @@ class ThothLogListCreateView(generics.ListCreateAPIView):
         if started_to:
             queryset = queryset.filter(started_at__lte=started_to)
 
-        return queryset.order_by("-started_at")
+        if self.request.method == "GET":
+            projection = self.get_projection()
+            if projection:
+                queryset = queryset.only(*projection)
+
+        return queryset.order_by("-started_at", "-id")
 
     def perform_create(self, serializer):
         """
@@ -1330,6 +1451,73 @@ def get_thoth_logs_summary(request):
         )
 
 
+@api_view(["GET"])
+@authentication_classes(
+    [TokenAuthentication, ApiKeyAuthentication, SessionAuthentication]
+)
+@permission_classes([IsAuthenticatedOrHasApiKey])
+def get_pipeline_latency(request):
+    """
+    Return materialized per-phase latency percentiles (p50/p90/p99).
+
+    Query parameters:
+    - granularity: "hour" (default) or "day"
+    - phase: restrict to one pipeline phase
+    - workspace: workspace name (omit for the all-workspaces rollup)
+    - agent: agent name (omit for the all-agents rollup)
+    - since: ISO datetime (UTC when it has no offset), only buckets starting
+      at or after it
+    - limit: maximum number of rows (default 500)
+    """
+    granularity = request.query_params.get("granularity", RollupGranularity.HOUR)
+    if granularity not in RollupGranularity.values:
+        return Response(
+            {"error": f"Invalid granularity '{granularity}'"},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    try:
+        limit = min(max(int(request.query_params.get("limit", 500)), 1), 5000)
+    except ValueError:
+        return Response(
+            {"error": "limit must be an integer"}, status=status.HTTP_400_BAD_REQUEST
+        )
+
+    since = request.query_params.get("since")
+    if since:
+        from django.utils.dateparse import parse_datetime
+
+        try:
+            since = parse_datetime(since)
+        except ValueError:
+            since = None
+        if since is None:
+            return Response(
+                {"error": "since must be an ISO datetime"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+
+    queryset = PipelineLatencyRollup.objects.filter(
+        granularity=granularity,
+        workspace=request.query_params.get("workspace", ""),
+        agent_name=request.query_params.get("agent", ""),
+    )
+
+    phase = request.query_params.get("phase")
+    if phase:
+        queryset = queryset.filter(phase=phase)
+    if since:
+        queryset = queryset.filter(bucket_start__gte=since)
+
+    rollups = queryset.order_by("-bucket_start", "phase")[:limit]
+    return Response(
+        PipelineLatencyRollupSerializer(rollups, many=True).data,
+        status=status.HTTP_200_OK,
+    )
+
+
 @api_view(["GET"])
 @authentication_classes([SessionAuthentication, TokenAuthentication])
 @permission_classes([IsAuthenticated])
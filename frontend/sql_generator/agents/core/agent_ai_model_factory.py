@@ -36,6 +36,8 @@ from pydantic_ai.models.fallback import FallbackModel
 from pathlib import Path
 import logging
 
+from helpers.http_clients import get_http_clients
+
 logger = logging.getLogger(__name__)
 
 # Load environment variables from the correct .env file
@@ -51,6 +53,11 @@ if env_path.exists():
     load_dotenv(env_path)
 
 
+def _http_client(provider: str, base_url: str = None):
+    """Shared keep-alive client of the provider, None to let pydantic-ai create one."""
+    return get_http_clients().llm_client(provider, base_url)
+
+
 def get_agent_llm_model(agent_config: Dict[str, Any]):
     """
     Creates a new model instance based on configuration.
@@ -77,17 +84,17 @@ def get_agent_llm_model(agent_config: dict):
             raise ValueError("Deepseek API key not found in config or environment variables.")
         return OpenAIModel(
             ai_model['specific_model'],
-            provider=OpenAIProvider(api_key=api_key, base_url=base_url)
+            provider=OpenAIProvider(
+                api_key=api_key, base_url=base_url, http_client=_http_client(provider, base_url)
+            )
         )
     elif provider in ['MISTRAL', 'CODESTRAL']:
         api_key = ai_model.get('api_key') or os.getenv("MISTRAL_API_KEY")
         if not api_key:
             raise ValueError("Mistral API key not found in config or environment variables.")
-        # Set MISTRAL_API_KEY environment variable for the 'mistral' provider string
-        os.environ['MISTRAL_API_KEY'] = api_key
         return MistralModel(
             ai_model['specific_model'],
-            provider='mistral'
+            provider=MistralProvider(api_key=api_key, http_client=_http_client('MISTRAL'))
         )
     elif provider == 'OLLAMA':
         # Ollama typically doesn't use API keys, relies on base_url
@@ -100,7 +107,9 @@ def get_agent_llm_model(agent_config: dict):
         # Assuming Ollama uses OpenAI compatible API structure but without API key
         return OpenAIModel(
             ai_model['specific_model'],
-            provider=OpenAIProvider(api_key="ollama", base_url=base_url) # Use dummy api_key for OpenAIProvider
+            provider=OpenAIProvider(  # Use dummy api_key for OpenAIProvider
+                api_key="ollama", base_url=base_url, http_client=_http_client(provider, base_url)
+            )
         )
     elif provider == 'OPENAI':
         api_key = ai_model.get('api_key') or os.getenv("OPENAI_API_KEY")     
@@ -108,7 +117,7 @@ def get_agent_llm_model(agent_config: dict):
             raise ValueError("OpenAI API key not found in config or environment variables.")
         return OpenAIModel(
             ai_model['specific_model'],
-            provider=OpenAIProvider(api_key=api_key)
+            provider=OpenAIProvider(api_key=api_key, http_client=_http_client(provider))
         )
     elif provider == 'OPENROUTER':
         # Assuming OpenRouter uses OpenAI compatible API structure
@@ -120,7 +129,9 @@ def get_agent_llm_model(agent_config: dict):
         logger.debug(f"Creating OpenRouter model with specific_model='{specific_model}'")
         return OpenAIModel(
             specific_model,
-            provider=OpenAIProvider(api_key=api_key, base_url=base_url)
+            provider=OpenAIProvider(
+                api_key=api_key, base_url=base_url, http_client=_http_client(provider, base_url)
+            )
         )
     elif provider == 'GEMINI':
         api_key = ai_model.get('api_key') or os.getenv("GEMINI_API_KEY")
@@ -129,7 +140,7 @@ def get_agent_llm_model(agent_config: dict):
         # GeminiModel uses 'model_name' keyword, not 'ai_model'
         return GeminiModel(
             ai_model.get('specific_model', 'gemini-2.5-flash'), # Default if not specified
-            provider=GoogleGLAProvider(api_key=api_key)
+            provider=GoogleGLAProvider(api_key=api_key, http_client=_http_client(provider))
         )
     elif provider == 'ANTHROPIC':
         api_key = ai_model.get('api_key') or os.getenv("ANTHROPIC_API_KEY")
@@ -137,7 +148,7 @@ def get_agent_llm_model(agent_config: dict):
             raise ValueError("Anthropic API key not found in config or environment variables.")
         return AnthropicModel(
             ai_model['specific_model'],
-            provider=AnthropicProvider(api_key=api_key)
+            provider=AnthropicProvider(api_key=api_key, http_client=_http_client(provider))
         )
     elif provider == 'LMSTUDIO':
         # LMStudio uses OpenAI compatible API - configure exactly as in test
@@ -146,7 +157,9 @@ def get_agent_llm_model(agent_config: dict):
             base_url = base_url.rstrip('/') + '/v1'
         return OpenAIModel(
             ai_model['specific_model'],
-            provider=OpenAIProvider(api_key="lm-studio", base_url=base_url)
+            provider=OpenAIProvider(
+                api_key="lm-studio", base_url=base_url, http_client=_http_client(provider, base_url)
+            )
         )
     else:
         raise ValueError(f"Unsupported model provider: {provider}")
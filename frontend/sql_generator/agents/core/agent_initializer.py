@@ -14,10 +14,11 @@
 Agent initialization utilities and factory methods.
 """
 
-from typing import Optional, Dict, Any
+from typing import Callable, Optional, Dict, Any
 from pydantic_ai import Agent
 
 from .agent_ai_model_factory import create_fallback_model
+from .agent_registry import get_agent_registry
 from helpers.template_preparation import TemplateLoader, clean_template_for_llm
 from .agent_result_models import (
     CheckQuestionResult,
@@ -45,7 +46,76 @@ from model.agent_dependencies import (
 class AgentInitializer:
     """
     Factory class for creating and initializing different types of agents.
+
+    Agents are built once per (role, model configuration, system prompt)
+    through the agent registry and shared by every workspace setup and
+    request; per-run state is passed to them through deps.
     """
+
+    @staticmethod
+    def _registry_config(agent_config, default_model_config, agent_name, retries, **extra) -> Dict[str, Any]:
+        return {
+            "agent_config": agent_config,
+            "default_model": default_model_config,
+            "name": agent_name,
+            "retries": retries,
+            **extra,
+        }
+
+    @staticmethod
+    def _shared_agent(
+        role: str,
+        agent_config: Optional[Dict[str, Any]],
+        default_model_config: Optional[Dict[str, Any]],
+        agent_name: str,
+        system_prompt: str,
+        output_type,
+        deps_type,
+        retries: int,
+        output_validator: Optional[Callable[[], Any]] = None,
+        attributes: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Agent]:
+        """
+        Return the registered agent for this configuration, building it on
+        first use. `output_validator` is a factory, called only when the agent
+        is built, so a shared agent never gets the same validator twice.
+        """
+        def build():
+            # Create model with fallback
+            model = create_fallback_model(agent_config, default_model_config)
+            if not model:
+                return None
+
+            agent = Agent(
+                model=model,
+                name=agent_name,
+                system_prompt=clean_template_for_llm(system_prompt),
+                output_type=output_type,
+                deps_type=deps_type,
+                retries=retries
+            )
+            if output_validator:
+                validator = output_validator()
+                if validator:
+                    agent.output_validator(validator)
+            # Store agent type metadata from config, if provided
+            agent_type = agent_config.get("agent_type") if agent_config else None
+            if agent_type:
+                setattr(agent, "agent_type", agent_type)
+            for name, value in (attributes or {}).items():
+                setattr(agent, name, value)
+            return agent
+
+        config = AgentInitializer._registry_config(
+            agent_config,
+            default_model_config,
+            agent_name,
+            retries,
+            output_type=getattr(output_type, "__name__", str(output_type)),
+            validated=output_validator is not None,
+            attributes=attributes or {},
+        )
+        return get_agent_registry().get_or_build(role, config, system_prompt, build)
     
     @staticmethod
     def create_keyword_extraction_agent(agent_config: Dict[str, Any], default_model_config: Dict[str, Any] = None, retries: int = 3, force_default_prompt: bool = False) -> Optional[Agent]:
@@ -68,11 +138,6 @@ class AgentInitializer:
         Returns:
             Configured Agent instance ready for keyword extraction tasks, or None if no valid configuration
         """
-        # Create model with fallback
-        model = create_fallback_model(agent_config, default_model_config)
-        if not model:
-            return None
-        
         # Determina nome agent
         if agent_config:
             agent_name = agent_config['name']
@@ -87,22 +152,19 @@ class AgentInitializer:
         else:
             system_prompt = agent_config.get('system_prompt')
             
-        agent = Agent(
-            model=model,
-            name=agent_name,
-            system_prompt=clean_template_for_llm(system_prompt),
+        return AgentInitializer._shared_agent(
+            "keyword_extraction",
+            agent_config,
+            default_model_config,
+            agent_name,
+            system_prompt,
             output_type=ExtractKeywordsResult,
             deps_type=KeywordExtractionDeps,  # Use lightweight deps instead of SystemState
             retries=retries
         )
-        # Store agent type metadata from config, if provided
-        agent_type = agent_config.get("agent_type") if agent_config else None
-        if agent_type:
-            setattr(agent, "agent_type", agent_type)
-        return agent
     
     @staticmethod
-    def create_sql_generation_agent(agent_config: Dict[str, Any], default_model_config: Dict[str, Any] = None, retries: int = 3, force_default_prompt: bool = False, template_type: str = "query_plan") -> Optional[Agent]:
+    def create_sql_generation_agent(agent_config: Dict[str, Any], default_model_config: Dict[str, Any] = None, retries: int = 3, force_default_prompt: bool = False, template_type: str = "query_plan", with_sql_validator: bool = False) -> Optional[Agent]:
         """
         Create a SQL generation agent that converts natural language queries into SQL statements.
         
@@ -121,15 +183,12 @@ class AgentInitializer:
                                   Default is False.
             template_type: Type of SQL generation template to use: "query_plan", "divide_and_conquer", 
                           or "step_by_step". Default is "query_plan".
+            with_sql_validator: If True, attach the SQL output validator, which reads the
+                                dbmanager and evaluator agent of each run from its deps.
             
         Returns:
             Configured Agent instance ready for SQL generation tasks, or None if no valid configuration.
         """
-        # Create model with fallback
-        model = create_fallback_model(agent_config, default_model_config)
-        if not model:
-            return None
-        
         # Determina nome agent
         if agent_config:
             agent_name = agent_config['name']
@@ -146,21 +205,23 @@ class AgentInitializer:
         else:
             system_prompt = agent_config.get('system_prompt')
         
+        def sql_validator():
+            from agents.validators.sql_validators import SqlValidators
+            return SqlValidators().create_sql_validator()
+
         # Create agent without tools - SQL execution happens in validators
-        agent = Agent(
-            model=model,
-            name=agent_name,
-            system_prompt=clean_template_for_llm(system_prompt),
+        return AgentInitializer._shared_agent(
+            "sql_generation",
+            agent_config,
+            default_model_config,
+            agent_name,
+            system_prompt,
             output_type=SqlResponse,
             deps_type=SqlGenerationDeps,  # Use lightweight deps instead of SystemState
-            retries=retries
+            retries=retries,
+            output_validator=sql_validator if with_sql_validator else None,
+            attributes={"template_type": template_type}  # Store template type as metadata
         )
-        agent_type = agent_config.get("agent_type") if agent_config else None
-        if agent_type:
-            setattr(agent, "agent_type", agent_type)
-        # Store template type as metadata
-        setattr(agent, "template_type", template_type)
-        return agent
     
     @staticmethod
     def create_test_generation_agent(agent_config: Dict[str, Any], default_model_config: Dict[str, Any] = None, retries: int = 3, force_default_prompt: bool = False) -> Optional[Agent]:
@@ -185,11 +246,6 @@ class AgentInitializer:
         Returns:
             Configured Agent instance ready for test generation tasks, or None if no valid configuration.
         """
-        # Create model with fallback
-        model = create_fallback_model(agent_config, default_model_config)
-        if not model:
-            return None
-        
         # Determina nome agent
         if agent_config:
             agent_name = agent_config['name']
@@ -204,18 +260,16 @@ class AgentInitializer:
         else:
             system_prompt = agent_config.get('system_prompt')
         
-        agent = Agent(
-            model=model,
-            name=agent_name,
-            system_prompt=clean_template_for_llm(system_prompt),
+        return AgentInitializer._shared_agent(
+            "test_generation",
+            agent_config,
+            default_model_config,
+            agent_name,
+            system_prompt,
             output_type=TestUnitGeneratorResult,
             deps_type=TestGenerationDeps,  # Use lightweight deps for test generation
             retries=retries
         )
-        agent_type = agent_config.get("agent_type") if agent_config else None
-        if agent_type:
-            setattr(agent, "agent_type", agent_type)
-        return agent
     
     # Test execution agent removed - no longer used in the workflow
     
@@ -242,11 +296,6 @@ class AgentInitializer:
         Returns:
             Configured Agent instance ready for SQL evaluation tasks, or None if no valid configuration.
         """
-        # Create model with fallback
-        model = create_fallback_model(agent_config, default_model_config)
-        if not model:
-            return None
-        
         # Determine agent name
         if agent_config:
             agent_name = f"Evaluator - {agent_config['name']}"
@@ -259,26 +308,21 @@ class AgentInitializer:
         system_prompt = TemplateLoader.load('system_templates/system_template_evaluate.txt')
         
         # Create validator for evaluator
-        from agents.validators.test_validators import TestValidators
-        test_validators = TestValidators()
-        evaluator_validator = test_validators.create_evaluator_validator()
-        
-        agent = Agent(
-            model=model,
-            name=agent_name,
-            system_prompt=clean_template_for_llm(system_prompt),
+        def evaluator_validator():
+            from agents.validators.test_validators import TestValidators
+            return TestValidators().create_evaluator_validator()
+        
+        return AgentInitializer._shared_agent(
+            "evaluator",
+            agent_config,
+            default_model_config,
+            agent_name,
+            system_prompt,
             output_type=EvaluationResult,
             deps_type=EvaluatorDeps,  # Use lightweight deps
-            retries=retries
+            retries=retries,
+            output_validator=evaluator_validator
         )
-        
-        # Add the validator using decorator pattern
-        if evaluator_validator:
-            agent.output_validator(evaluator_validator)
-        agent_type = agent_config.get("agent_type") if agent_config else None
-        if agent_type:
-            setattr(agent, "agent_type", agent_type)
-        return agent
     
     @staticmethod
     def create_question_validator_agent(agent_config: Dict[str, Any], default_model_config: Dict[str, Any] = None, retries: int = 3, force_default_prompt: bool = False) -> Optional[Agent]:
@@ -304,11 +348,6 @@ class AgentInitializer:
         Returns:
             Configured Agent instance ready for question validation tasks, or None if no valid configuration.
         """
-        # Create model with fallback
-        model = create_fallback_model(agent_config, default_model_config)
-        if not model:
-            return None
-        
         # Determina nome agent
         if agent_config:
             agent_name = agent_config['name']
@@ -323,18 +362,16 @@ class AgentInitializer:
         else:
             system_prompt = agent_config.get('system_prompt')
         
-        agent = Agent(
-            model=model,
-            name=agent_name,
-            system_prompt=clean_template_for_llm(system_prompt),
+        return AgentInitializer._shared_agent(
+            "question_validator",
+            agent_config,
+            default_model_config,
+            agent_name,
+            system_prompt,
             output_type=CheckQuestionResult,
             deps_type=ValidationDeps,  # Use lightweight deps instead of SystemState
             retries=retries
         )
-        agent_type = agent_config.get("agent_type") if agent_config else None
-        if agent_type:
-            setattr(agent, "agent_type", agent_type)
-        return agent
     
     @staticmethod
     def create_question_translator_agent(agent_config: Dict[str, Any], default_model_config: Dict[str, Any] = None, retries: int = 3, force_default_prompt: bool = False) -> Optional[Agent]:
@@ -358,11 +395,6 @@ class AgentInitializer:
         Returns:
             Configured Agent instance ready for translation tasks, or None if no valid configuration.
         """
-        # Create model with fallback
-        model = create_fallback_model(agent_config, default_model_config)
-        if not model:
-            return None
-        
         # Determina nome agent
         if agent_config:
             agent_name = agent_config['name']
@@ -377,18 +409,16 @@ class AgentInitializer:
         else:
             system_prompt = agent_config.get('system_prompt')
         
-        agent = Agent(
-            model=model,
-            name=agent_name,
-            system_prompt=clean_template_for_llm(system_prompt),
+        return AgentInitializer._shared_agent(
+            "question_translator",
+            agent_config,
+            default_model_config,
+            agent_name,
+            system_prompt,
             output_type=TranslationResult,
             deps_type=TranslationDeps,  # Use lightweight deps instead of SystemState
             retries=retries
         )
-        agent_type = agent_config.get("agent_type") if agent_config else None
-        if agent_type:
-            setattr(agent, "agent_type", agent_type)
-        return agent
     
     @staticmethod
     def create_sql_explanation_agent(agent_config: Dict[str, Any], default_model_config: Dict[str, Any] = None, retries: int = 3, force_default_prompt: bool = False) -> Optional[Agent]:
@@ -413,11 +443,6 @@ class AgentInitializer:
         Returns:
             Configured Agent instance ready for SQL explanation tasks, or None if no valid configuration.
         """
-        # Create model with fallback
-        model = create_fallback_model(agent_config, default_model_config)
-        if not model:
-            return None
-        
         # Determina nome agent
         if agent_config:
             agent_name = agent_config['name']
@@ -433,6 +458,24 @@ class AgentInitializer:
             system_prompt = agent_config.get('system_prompt')
         
         # Create agent that expects simple string output as per template requirements
+        def build():
+            model = create_fallback_model(agent_config, default_model_config)
+            if not model:
+                return None
+            return AgentInitializer._build_sql_explanation_agent(
+                model, agent_config, agent_name, system_prompt, retries
+            )
+
+        return get_agent_registry().get_or_build(
+            "sql_explanation",
+            AgentInitializer._registry_config(agent_config, default_model_config, agent_name, retries),
+            system_prompt,
+            build,
+        )
+
+    @staticmethod
+    def _build_sql_explanation_agent(model, agent_config, agent_name, system_prompt, retries) -> Optional[Agent]:
+        """Build the explanation agent, without strict output typing if the model rejects it."""
         try:
             agent = Agent(
                 model=model,
@@ -489,11 +532,6 @@ class AgentInitializer:
         Returns:
             Configured TestReducer Agent instance, or None if creation fails
         """
-        # Create model with fallback
-        model = create_fallback_model(agent_config, default_model_config)
-        if not model:
-            return None
-        
         # Determine agent name
         if agent_config:
             agent_name = f"TestReducer - {agent_config['name']}"
@@ -505,19 +543,16 @@ class AgentInitializer:
         # Always use the TestReducer system template
         system_prompt = TemplateLoader.load('system_templates/system_template_test_reducer.txt')
         
-        agent = Agent(
-            model=model,
-            name=agent_name,
-            system_prompt=clean_template_for_llm(system_prompt),
+        return AgentInitializer._shared_agent(
+            "test_reducer",
+            agent_config,
+            default_model_config,
+            agent_name,
+            system_prompt,
             output_type=TestReducerResult,
             deps_type=EvaluatorDeps,  # Use same deps as Evaluator
             retries=retries
         )
-        
-        agent_type = agent_config.get("agent_type") if agent_config else None
-        if agent_type:
-            setattr(agent, "agent_type", agent_type)
-        return agent
 
     @staticmethod
     def create_sql_evaluator_agent(agent_config: Dict[str, Any], default_model_config: Dict[str, Any] = None, retries: int = 3) -> Optional[Agent]:
@@ -540,11 +575,6 @@ class AgentInitializer:
         Returns:
             Configured SqlEvaluator Agent instance, or None if creation fails
         """
-        # Create model with fallback
-        model = create_fallback_model(agent_config, default_model_config)
-        if not model:
-            return None
-        
         # Determine agent name
         if agent_config:
             agent_name = f"SqlEvaluator - {agent_config['name']}"
@@ -556,16 +586,13 @@ class AgentInitializer:
         # Use the existing sql_selector templates
         system_prompt = TemplateLoader.load('system_templates/system_template_sql_selector.txt')
         
-        agent = Agent(
-            model=model,
-            name=agent_name,
-            system_prompt=clean_template_for_llm(system_prompt),
+        return AgentInitializer._shared_agent(
+            "sql_evaluator",
+            agent_config,
+            default_model_config,
+            agent_name,
+            system_prompt,
             output_type=SqlSelectorResult,
             deps_type=EvaluatorDeps,  # Use same deps as Evaluator for simplicity
             retries=retries
         )
-        
-        agent_type = agent_config.get("agent_type") if agent_config else None
-        if agent_type:
-            setattr(agent, "agent_type", agent_type)
-        return agent
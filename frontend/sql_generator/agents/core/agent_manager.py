@@ -70,8 +70,9 @@ class ThothAgentManager(BaseAgentManager):
         self._create_sql_generation_agents()
         self._create_sql_explainer_agent()
         
-        # Only initialize validators we need
-        self.sql_validators = SqlValidators(self.evaluator_agent, self.dbmanager)  # Enable SQL validators with evaluator for gating
+        # Only initialize validators we need. SQL agents carry their validator;
+        # this instance is kept for callers validating outside an agent run.
+        self.sql_validators = SqlValidators(self.evaluator_agent, self.dbmanager)
         
         self._populate_agent_pools()
         self._configure_tools_and_validators()  # Enable tools and validators
@@ -150,7 +151,8 @@ class ThothAgentManager(BaseAgentManager):
             default_model_config,
             self.get_retries(sql_basic_config),
             force_default_prompt=use_default_basic,
-            template_type="simplified"  # Use new simplified template
+            template_type="simplified",  # Use new simplified template
+            with_sql_validator=True
         )
         
         self.sql_advanced_agent = AgentInitializer.create_sql_generation_agent(
@@ -158,7 +160,8 @@ class ThothAgentManager(BaseAgentManager):
             default_model_config,
             self.get_retries(sql_advanced_config),
             force_default_prompt=use_default_advanced,
-            template_type="simplified"  # Use new simplified template
+            template_type="simplified",  # Use new simplified template
+            with_sql_validator=True
         )
         
         self.sql_expert_agent = AgentInitializer.create_sql_generation_agent(
@@ -166,7 +169,8 @@ class ThothAgentManager(BaseAgentManager):
             default_model_config,
             self.get_retries(sql_expert_config),
             force_default_prompt=use_default_expert,
-            template_type="simplified"  # Use new simplified template
+            template_type="simplified",  # Use new simplified template
+            with_sql_validator=True
         )
         
         logger.info(f"Created 3 SQL generation agents (BASIC, ADVANCED, EXPERT) with simplified prompts")
@@ -435,19 +439,11 @@ class ThothAgentManager(BaseAgentManager):
     
     def _configure_sql_validators(self):
         """Configure validators for SQL generation agents."""
-        if self.sql_validators:
-            sql_validator = self.sql_validators.create_sql_validator()
-            
-            # Apply validators to all SQL agents
-            if self.sql_basic_agent:
-                logger.debug(f"Attaching validator to sql_basic_agent, dbmanager={self.dbmanager is not None}")
-                self.sql_basic_agent.output_validator(sql_validator)
-            if self.sql_advanced_agent:
-                logger.debug(f"Attaching validator to sql_advanced_agent, dbmanager={self.dbmanager is not None}")
-                self.sql_advanced_agent.output_validator(sql_validator)
-            if self.sql_expert_agent:
-                logger.debug(f"Attaching validator to sql_expert_agent, dbmanager={self.dbmanager is not None}")
-                self.sql_expert_agent.output_validator(sql_validator)
+        # The SQL validator is attached when the shared agents are built (see
+        # AgentInitializer.create_sql_generation_agent) and reads dbmanager and
+        # evaluator_agent from the run's SqlGenerationDeps, so nothing is added
+        # here: attaching it again would stack validators on shared agents.
+        pass
     
     def _configure_test_validators(self):
         """Configure validators for test generation and execution agents."""
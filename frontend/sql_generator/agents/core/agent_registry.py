@@ -0,0 +1,115 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Process-wide registry of constructed pydantic-ai agents.
+
+Building an agent loads and cleans its system template, creates the model
+(and its fallback) and attaches validators. None of this depends on the
+request: an Agent holds no per-run state, and request data reaches tools
+and validators through the deps passed to `agent.run()`. The registry
+therefore builds each agent once per (role, model configuration, system
+prompt) and hands the same instance to every workspace setup and request.
+
+The system prompt text is part of the key, so editing a template (or a
+custom prompt in the agent configuration) builds a new agent. The registry
+keeps at most THOTH_AGENT_REGISTRY_SIZE agents (default: 256), evicting the
+least recently used.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import Counter, OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+from helpers.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+REGISTRY_SIZE = max(1, int(os.getenv("THOTH_AGENT_REGISTRY_SIZE", "256")))
+
+
+def _fingerprint(value: Any) -> str:
+    encoded = json.dumps(value, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class AgentRegistry:
+    """Builds agents once per key and shares them across requests."""
+
+    def __init__(self, max_size: int = REGISTRY_SIZE):
+        self.max_size = max_size
+        self._agents: "OrderedDict[tuple, Any]" = OrderedDict()
+        self._lock = threading.RLock()
+        self.constructions: Counter = Counter()
+        self.reuses: Counter = Counter()
+
+    @staticmethod
+    def make_key(role: str, config: Dict[str, Any], system_prompt: Optional[str]) -> tuple:
+        """(role, model configuration hash, template version)."""
+        template_version = hashlib.sha256((system_prompt or "").encode("utf-8")).hexdigest()[:16]
+        return role, _fingerprint(config), template_version
+
+    def get_or_build(
+        self,
+        role: str,
+        config: Dict[str, Any],
+        system_prompt: Optional[str],
+        build: Callable[[], Any],
+    ) -> Any:
+        """
+        Return the agent registered under the key, calling `build` on a miss.
+        A None result (no usable model) is not cached, so a configuration
+        fixed later is picked up.
+        """
+        key = self.make_key(role, config, system_prompt)
+        with self._lock:
+            agent = self._agents.get(key)
+            if agent is not None:
+                self._agents.move_to_end(key)
+                self.reuses[role] += 1
+                return agent
+
+            agent = build()
+            if agent is None:
+                return None
+            self.constructions[role] += 1
+            self._agents[key] = agent
+            if len(self._agents) > self.max_size:
+                self._agents.popitem(last=False)
+            logger.debug(f"Built {role} agent '{getattr(agent, 'name', '')}' ({self.constructions[role]} built for this role)")
+            return agent
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "cached_agents": len(self._agents),
+                "max_size": self.max_size,
+                "constructions": dict(self.constructions),
+                "reuses": dict(self.reuses),
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._agents.clear()
+            self.constructions.clear()
+            self.reuses.clear()
+
+
+_registry = AgentRegistry()
+
+
+def get_agent_registry() -> AgentRegistry:
+    """Return the process-wide agent registry."""
+    return _registry
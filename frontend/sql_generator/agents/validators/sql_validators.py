@@ -79,7 +79,8 @@ class SqlValidators:
     """
     
     def __init__(self, evaluator_agent=None, dbmanager=None):
-        # evaluator_agent is used for evidence-critical gating
+        # evaluator_agent is used for evidence-critical gating. Both are defaults:
+        # validators of shared agents read them from SqlGenerationDeps per run
         self.dbmanager = dbmanager
         self.evaluator_agent = evaluator_agent
 
@@ -177,7 +178,10 @@ class SqlValidators:
             Async validator function
         """
         async def validate_sql_creation(ctx: RunContext[SqlGenerationDeps], response: SqlResponse):
-            logger.debug(f"SQL validator started for agent response, dbmanager={self.dbmanager is not None}")
+            # Resources of the requesting workspace come with the run's deps
+            dbmanager = getattr(ctx.deps, 'dbmanager', None) or self.dbmanager
+            evaluator_agent = getattr(ctx.deps, 'evaluator_agent', None) or self.evaluator_agent
+            logger.debug(f"SQL validator started for agent response, dbmanager={dbmanager is not None}")
             
             if isinstance(response, InvalidRequest):
                 logger.debug(f"Invalid request received: {response.error_message} - triggering retry")
@@ -248,12 +252,12 @@ class SqlValidators:
                     logger.debug(f"Testing SQL executability using: {test_query[:100]}...")
                     
                     # Execute EXPLAIN query using dbmanager if available
-                    if self.dbmanager:
-                        logger.debug(f"Executing EXPLAIN query to validate SQL syntax, dbmanager type: {type(self.dbmanager)}")
+                    if dbmanager:
+                        logger.debug(f"Executing EXPLAIN query to validate SQL syntax, dbmanager type: {type(dbmanager)}")
                         try:
                             # Execute the EXPLAIN query to validate syntax
                             logger.debug(f"Executing: {test_query[:100]}...")
-                            self.dbmanager.execute_sql(sql=test_query, params={})
+                            dbmanager.execute_sql(sql=test_query, params={})
                             logger.debug(f"SQL executability test successful - syntax is valid")
                         except Exception as explain_error:
                             logger.debug(f"EXPLAIN failed: {explain_error}")
@@ -301,7 +305,7 @@ class SqlValidators:
                 try:
                     evidence_tests = getattr(ctx.deps, 'evidence_critical_tests', None)
                     if evidence_tests and isinstance(evidence_tests, list) and len(evidence_tests) > 0:
-                        if not self.evaluator_agent:
+                        if not evaluator_agent:
                             logger.warning("Evidence-critical tests present but evaluator_agent is not available - skipping gating")
                             try:
                                 cfg = load_config_from_env()
@@ -416,7 +420,7 @@ class SqlValidators:
                                 # Run evaluator with a strict timeout and low temperature
                                 try:
                                     result = await asyncio.wait_for(
-                                        self.evaluator_agent.run(
+                                        evaluator_agent.run(
                                             template,
                                             model_settings=ModelSettings(temperature=0.2),
                                             deps=EvaluatorDeps()
@@ -531,11 +535,11 @@ class SqlValidators:
                     pass
 
                 # Step 5: Check for empty results if configured and dbmanager is available
-                if ctx.deps.treat_empty_result_as_error and self.dbmanager:
+                if ctx.deps.treat_empty_result_as_error and dbmanager:
                     logger.debug(f"Step 4: treat_empty_result_as_error=True, checking for empty results")
                     try:
                         # Execute the actual SQL to check for empty results
-                        result = self.dbmanager.execute_sql(sql=sql, params={})
+                        result = dbmanager.execute_sql(sql=sql, params={})
                         empty_result_error = self._is_empty_result(result)
                     except Exception as e:
                         logger.error(f"Error checking for empty results: {e}")
@@ -564,7 +568,7 @@ class SqlValidators:
                             error_message="The query executed successfully but returned no rows.",
                             available_tables=available_tables,
                         )
-                elif ctx.deps.treat_empty_result_as_error and not self.dbmanager:
+                elif ctx.deps.treat_empty_result_as_error and not dbmanager:
                     logger.warning("treat_empty_result_as_error=True but dbmanager not available - cannot check")
                 else:
                     logger.debug(f"Step 5: treat_empty_result_as_error=False: Skipping empty result check")
@@ -0,0 +1,161 @@
+#!/usr/bin/env python
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark of the LSH edit-distance and column-name filters.
+
+Compares the pairwise implementations the filters used to have (copied
+below as reference_*) with the batched ones in
+helpers/main_helpers/main_schema_extraction_from_lsh.py. The data is
+synthetic: LSH candidates are perturbed variants of the keywords spread
+over many columns, and the schema has many columns. The script checks
+that both implementations select exactly the same entities and columns.
+Inputs are copied outside the timed region.
+
+Usage (from frontend/sql_generator):
+    python dev/benchmark_lsh_filters.py [candidates] [columns] [repeats]
+"""
+
+import copy
+import difflib
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from helpers.main_helpers import main_schema_extraction_from_lsh as lsh  # noqa: E402
+
+KEYWORDS = ["new york city", "los angeles", "customer orders", "shipped status", "san francisco", "premium account"]
+
+
+def perturb(text: str, rng: random.Random) -> str:
+    chars = list(text)
+    for _ in range(rng.randint(0, 4)):
+        operation = rng.random()
+        position = rng.randrange(len(chars) + 1)
+        if operation < 0.4:
+            chars.insert(position, rng.choice("abcdefghijklmnopqrstuvwxyz "))
+        elif operation < 0.8 and chars:
+            del chars[min(position, len(chars) - 1)]
+        elif chars:
+            chars[min(position, len(chars) - 1)] = rng.choice("abcdefghijklmnopqrstuvwxyz")
+    suffix = rng.choice(["", "", " inc", " north", " 2024", " west side"])
+    return "".join(chars) + suffix
+
+
+def synthetic_candidates(count: int, rng: random.Random) -> list:
+    packets = lsh._get_to_search_values_lsh(KEYWORDS)
+    columns = [(f"table_{t}", f"column_{c}") for t in range(8) for c in range(6)]
+    candidates = []
+    per_packet = max(1, count // len(packets))
+    for packet in packets:
+        for _ in range(per_packet):
+            table, column = rng.choice(columns)
+            candidates.append({
+                **packet, "table_name": table, "column_name": column,
+                "similar_value": perturb(rng.choice([packet["substring"], packet["keyword"]]), rng),
+            })
+    return candidates[:count]
+
+
+def synthetic_schema(columns: int, rng: random.Random) -> dict:
+    words = ["customer", "order", "status", "city", "account", "amount", "date", "name", "type", "code",
+             "region", "premium", "shipped", "price", "quantity", "country", "state", "zip"]
+    schema = {}
+    for i in range(columns):
+        name = "_".join(rng.sample(words, rng.randint(1, 3)))
+        schema.setdefault(f"table_{i % 40}", []).append(f"{name}_{i // 40}" if rng.random() < 0.7 else name)
+    return schema
+
+
+# Reference implementations: the pairwise versions these filters replaced
+
+def reference_edit_distance(similar_entities_via_LSH, edit_distance_threshold):
+    similar_entities_via_edit_distance_similarity = []
+    for entity_packet in similar_entities_via_LSH:
+        edit_distance_similarity = difflib.SequenceMatcher(
+            None,
+            entity_packet["substring"].lower(),
+            entity_packet["similar_value"].lower(),
+        ).ratio()
+        if edit_distance_similarity >= edit_distance_threshold:
+            entity_packet["edit_distance_similarity"] = edit_distance_similarity
+            similar_entities_via_edit_distance_similarity.append(entity_packet)
+    return similar_entities_via_edit_distance_similarity
+
+
+def reference_column_matches(potential_column_names, schema):
+    matched = []
+    for table, columns in schema.items():
+        for column in columns:
+            for candidate in potential_column_names:
+                if lsh._does_keyword_match_column_lsh(candidate, column):
+                    matched.append((table, column))
+                    break
+    return matched
+
+
+def timed(function, repeats: int, inputs=None):
+    """Best time of `repeats` runs; a fresh deep copy of `inputs`, made outside the timing, is passed to each."""
+    best = float("inf")
+    for _ in range(repeats):
+        args = () if inputs is None else (copy.deepcopy(inputs),)
+        started = time.perf_counter()
+        result = function(*args)
+        best = min(best, time.perf_counter() - started)
+    return result, best * 1000
+
+
+def key(entities):
+    return [(e["keyword"], e["substring"], e["table_name"], e["column_name"], e["similar_value"]) for e in entities]
+
+
+def main():
+    candidates_count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    columns_count = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    repeats = int(sys.argv[3]) if len(sys.argv) > 3 else 5
+    rng = random.Random(42)
+    candidates = synthetic_candidates(candidates_count, rng)
+
+    print(f"{len(candidates)} LSH candidates, {columns_count} columns, best of {repeats}\n")
+    print(f"{'filter':34} {'pairwise ms':>12} {'batched ms':>11} {'speedup':>8} {'kept':>6}  identical")
+
+    def report(name, old, new, kept, identical):
+        print(f"{name:34} {old:12.2f} {new:11.2f} {old / new:7.1f}x {kept:6d}  {identical}")
+        assert identical, f"{name}: selections differ"
+
+    old_edit, old_ms = timed(lambda c: reference_edit_distance(c, 0.2), repeats, candidates)
+    new_edit, new_ms = timed(lambda c: lsh._get_similar_entities_via_edit_distance_lsh(c, 0.2), repeats, candidates)
+    report("edit distance (threshold 0.2)", old_ms, new_ms, len(new_edit), key(old_edit) == key(new_edit)
+           and [e["edit_distance_similarity"] for e in old_edit] == [e["edit_distance_similarity"] for e in new_edit])
+
+    old_strict, old_ms = timed(lambda c: reference_edit_distance(c, 0.6), repeats, candidates)
+    new_strict, new_ms = timed(lambda c: lsh._get_similar_entities_via_edit_distance_lsh(c, 0.6), repeats, candidates)
+    report("edit distance (threshold 0.6)", old_ms, new_ms, len(new_strict), key(old_strict) == key(new_strict))
+
+    schema = synthetic_schema(columns_count, rng)
+    names = [name for keyword in KEYWORDS for name in [keyword, *keyword.split()]] + ["order_status", "cities"]
+    pairs = [(table, column) for table, columns in schema.items() for column in columns]
+    old_cols, old_ms = timed(lambda: reference_column_matches(names, schema), repeats)
+    new_mask, new_ms = timed(
+        lambda: lsh._keyword_column_matches_lsh(names, [column for _, column in pairs]), repeats
+    )
+    new_cols = [pair for pair, matched in zip(pairs, new_mask) if matched]
+    report(f"column names ({len(names)} x {len(pairs)})", old_ms, new_ms, len(new_cols), old_cols == new_cols)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Startup benchmark for the SQL Generator.
+
+Starts the service with uvicorn several times and measures the time from
+process start to the first successful GET /health, plus the resident
+memory of the worker at that moment. The target is a sub-second
+time-to-first-health-check; the exit status is 1 when the median misses it.
+
+Usage (from frontend/sql_generator):
+    python dev/benchmark_startup.py [--runs N] [--target SECONDS]
+"""
+
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+import httpx
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def rss_mb(pid: int) -> float:
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return float("nan")
+
+
+def time_to_health(timeout: float) -> tuple:
+    port = free_port()
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port),
+         "--log-level", "warning"],
+        cwd=PROJECT_ROOT,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        with httpx.Client(timeout=0.5) as client:
+            while time.perf_counter() - started < timeout:
+                if process.poll() is not None:
+                    raise SystemExit(f"Service exited with status {process.returncode} before /health answered")
+                try:
+                    if client.get(f"http://127.0.0.1:{port}/health").status_code == 200:
+                        return time.perf_counter() - started, rss_mb(process.pid)
+                except httpx.TransportError:
+                    pass
+                time.sleep(0.01)
+        raise SystemExit(f"/health did not answer within {timeout:.0f} s")
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--target", type=float, default=1.0, help="seconds (default: 1.0)")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    args = parser.parse_args()
+
+    times, memory = [], []
+    for run in range(1, args.runs + 1):
+        elapsed, rss = time_to_health(args.timeout)
+        times.append(elapsed)
+        memory.append(rss)
+        print(f"run {run}: first /health after {elapsed:.3f} s, worker RSS {rss:.0f} MB")
+
+    median = statistics.median(times)
+    print(f"\nmedian {median:.3f} s (min {min(times):.3f} s, max {max(times):.3f} s), "
+          f"median RSS {statistics.median(memory):.0f} MB, target {args.target:.1f} s")
+    sys.exit(0 if median <= args.target else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Micro-benchmark of prompt rendering on the templates in templates/.
+
+For every user template it compares the previous rendering (read the file,
+then str.format, or escape/replace/format for the "safe" templates) with
+the compiled template, filling each placeholder with a value of realistic
+size (the schema placeholder gets a large synthetic mschema), and checks
+that both produce the same prompt.
+
+Usage (from frontend/sql_generator):
+    python dev/benchmark_templates.py [iterations] [schema_kb]
+"""
+
+import os
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from helpers.agents_utils import get_project_root  # noqa: E402
+from helpers.template_loader import TemplateLoader  # noqa: E402
+
+# Templates rendered with safe=True, and the variables their callers pass
+SAFE_TEMPLATES = {
+    "template_evaluate_single.txt": {"SQL_QUERY", "UNIT_TESTS"},
+    "template_test_reducer.txt": {"ORIGINAL_TESTS"},
+    "template_generate_unit_tests.txt": {
+        "directives", "used_mschema", "question", "evidence_for_template", "sql_candidate_list",
+    },
+}
+
+
+def synthetic_schema(size_kb: int) -> str:
+    table = (
+        "# Table: orders_{n}\n[\n"
+        "(order_id:INTEGER, Primary Key, Examples: [1, 2, 3]),\n"
+        "(customer_id:INTEGER, Examples: [10, 11]),\n"
+        "(status:TEXT, Examples: ['open', 'shipped', 'closed']),\n"
+        "(amount:REAL, Examples: [10.5, 99.0])\n]\n"
+    )
+    parts, size, n = [], 0, 0
+    while size < size_kb * 1024:
+        chunk = table.format(n=n)
+        parts.append(chunk)
+        size += len(chunk)
+        n += 1
+    return "".join(parts)
+
+
+def values_for(names, schema: str) -> dict:
+    values = {}
+    for name in names:
+        if "SCHEMA" in name.upper() or name == "used_mschema":
+            values[name] = schema
+        else:
+            values[name] = f"<{name.lower()}> " * 40
+    return values
+
+
+def old_format(path: str, values: dict) -> str:
+    with open(path, "r") as f:
+        return f.read().format(**values)
+
+
+def old_format_safe(path: str, values: dict) -> str:
+    with open(path, "r") as f:
+        escaped = f.read().replace("{", "{{").replace("}", "}}")
+    for name in values:
+        escaped = escaped.replace("{{" + name + "}}", "{" + name + "}")
+    return escaped.format(**values)
+
+
+def measure(render, iterations: int) -> float:
+    render()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        render()
+    return (time.perf_counter() - started) / iterations * 1e6
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    schema_kb = int(sys.argv[2]) if len(sys.argv) > 2 else 64
+    schema = synthetic_schema(schema_kb)
+    templates_dir = os.path.join(get_project_root(), "templates")
+
+    print(f"{iterations} renders per template, schema {schema_kb} KB\n")
+    print(f"{'template':48} {'mode':6} {'old µs':>10} {'compiled µs':>12} {'speedup':>8}")
+    total_old = total_new = 0.0
+    for name in sorted(os.listdir(templates_dir)):
+        path = os.path.join(templates_dir, name)
+        if not name.endswith(".txt") or not os.path.isfile(path):
+            continue
+        with open(path, "r") as f:
+            source = f.read()
+
+        if name in SAFE_TEMPLATES:
+            names, mode, old = SAFE_TEMPLATES[name], "safe", old_format_safe
+        else:
+            try:
+                names = {field for _, field, _, _ in string.Formatter().parse(source) if field}
+            except ValueError:
+                continue
+            mode, old = "format", old_format
+        if not names:
+            continue
+
+        values = values_for(names, schema)
+        compiled_names = names if mode == "safe" else None
+        expected = old(path, values)
+        rendered = TemplateLoader.compiled(name, names=compiled_names, variables=names).render(**values)
+        assert rendered == expected, f"{name}: compiled output differs"
+
+        old_us = measure(lambda: old(path, values), iterations)
+        new_us = measure(
+            lambda: TemplateLoader.compiled(name, names=compiled_names).render(**values), iterations
+        )
+        total_old += old_us
+        total_new += new_us
+        print(f"{name:48} {mode:6} {old_us:10.1f} {new_us:12.1f} {old_us / new_us:7.1f}x")
+
+    print(f"\n{'total':55} {total_old:10.1f} {total_new:12.1f} {total_old / total_new:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Recall and latency of the MinHash LSH and the trigram index for value lookup.
+
+Both indexes are built from the same {db}_unique_values.pkl that
+preprocessing writes. The LSH is built with thoth_dbmanager's
+create_lsh_index and the trigram index with the backend builder. Queries are
+values sampled from the database in four shapes:
+- exact: the value itself;
+- typo: the value with one character changed;
+- short: values of at most 5 characters;
+- partial: the first two words of values with at least three.
+A query is a hit when the sampled (table, column, value) is among the top_n
+results, as in the LSH filters.
+
+Usage (from frontend/sql_generator):
+    python dev/benchmark_value_index.py [unique_values.pkl] [queries per shape] [top_n]
+"""
+
+import os
+import pickle
+import random
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+REPO = os.path.dirname(os.path.dirname(os.path.dirname(HERE)))
+sys.path.insert(0, os.path.dirname(HERE))
+sys.path.insert(0, os.path.join(REPO, "backend"))
+
+from thoth_dbmanager.lsh.core import create_lsh_index, query_lsh_index  # noqa: E402
+from thoth_ai_backend.preprocessing.db_values.trigram_index import build_trigram_index  # noqa: E402
+from helpers.value_index import TrigramValueIndex  # noqa: E402
+
+DEFAULT_VALUES = os.path.join(
+    REPO, "data", "dev_databases", "california_schools", "preprocessed", "california_schools_unique_values.pkl"
+)
+
+
+def typo(value: str, rng: random.Random) -> str:
+    position = rng.randrange(len(value))
+    return value[:position] + rng.choice("abcdefghijklmnopqrstuvwxyz") + value[position + 1:]
+
+
+def sample_queries(unique_values, per_shape: int, rng: random.Random):
+    entries = [
+        (table, column, value)
+        for table, columns in unique_values.items()
+        for column, values in columns.items()
+        for value in values
+        if isinstance(value, str) and value.strip()
+    ]
+    textual = [e for e in entries if any(c.isalpha() for c in e[2])]
+    shapes = {
+        "exact": [(e, e[2]) for e in rng.sample(textual, per_shape)],
+        "typo": [(e, typo(e[2], rng)) for e in rng.sample([e for e in textual if len(e[2]) > 5], per_shape)],
+    }
+    short = [e for e in entries if len(e[2]) <= 5]
+    shapes["short"] = [(e, e[2]) for e in rng.sample(short, min(per_shape, len(short)))]
+    multi = [e for e in textual if len(e[2].split()) >= 3]
+    shapes["partial"] = [(e, " ".join(e[2].split()[:2])) for e in rng.sample(multi, min(per_shape, len(multi)))]
+    return shapes
+
+
+def hit(result, entry) -> bool:
+    table, column, value = entry
+    return value in result.get(table, {}).get(column, [])
+
+
+def run(name, query, shapes, top_n):
+    row = [name]
+    latencies = []
+    for queries in shapes.values():
+        hits = 0
+        for entry, keyword in queries:
+            started = time.perf_counter()
+            result = query(keyword, top_n)
+            latencies.append(time.perf_counter() - started)
+            hits += hit(result, entry)
+        row.append(f"{hits / len(queries):.1%}")
+    latencies = np.array(latencies) * 1000
+    row += [f"{np.mean(latencies):.2f}", f"{np.percentile(latencies, 95):.2f}"]
+    return row
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_VALUES
+    per_shape = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+    top_n = int(sys.argv[3]) if len(sys.argv) > 3 else 25
+    with open(path, "rb") as file:
+        unique_values = pickle.load(file)
+    total = sum(len(values) for columns in unique_values.values() for values in columns.values())
+    shapes = sample_queries(unique_values, per_shape, random.Random(7))
+    print(f"{os.path.basename(path)}: {total} values, top_n={top_n}, "
+          + ", ".join(f"{len(q)} {shape}" for shape, q in shapes.items()) + " queries\n")
+
+    rows = []
+    for signature_size in (30, 50):
+        started = time.perf_counter()
+        lsh, minhashes = create_lsh_index(unique_values, signature_size, 3, 0.01, verbose=False)
+        build = time.perf_counter() - started
+        rows.append(run(
+            f"MinHash LSH ({signature_size})",
+            lambda keyword, n: query_lsh_index(lsh, minhashes, keyword, signature_size, 3, n),
+            shapes, top_n,
+        ) + [f"{build:.1f}", f"{len(pickle.dumps((lsh, minhashes))) / 2**20:.1f}"])
+
+    with tempfile.TemporaryDirectory() as directory:
+        index_path = os.path.join(directory, "trigrams.sqlite3")
+        started = time.perf_counter()
+        build_trigram_index(unique_values, index_path)
+        build = time.perf_counter() - started
+        index = TrigramValueIndex(index_path)
+        rows.append(run("Trigram index", lambda keyword, n: index.query_lsh(keyword, top_n=n), shapes, top_n)
+                    + [f"{build:.1f}", f"{os.path.getsize(index_path) / 2**20:.1f}"])
+
+    header = ["index", *(f"recall {shape}" for shape in shapes), "mean ms", "p95 ms", "build s", "size MB"]
+    print("| " + " | ".join(header) + " |")
+    print("|" + "|".join("---" for _ in header) + "|")
+    for row in rows:
+        print("| " + " | ".join(row) + " |")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+#!/usr/bin/env python
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Memory-per-worker benchmark for the multi-worker mode (helpers/prefork.py).
+
+Two measurements, both reading /proc/<pid>/smaps_rollup (Linux only):
+
+- service: starts run_server.py with THOTH_WORKERS=N for each N, waits for
+  /health and reports RSS, PSS (shared pages divided among the processes
+  sharing them) and private memory per worker. Artifacts are only
+  preloaded when the Django backend is reachable.
+- artifacts: forks N workers that each hold a synthetic workspace artifact
+  set (a dict of value lists like an LSH index, plus a float32 embedding
+  matrix) of the given size, loaded three ways: privately in each worker,
+  once before the fork, and before the fork with the matrix mmap-shared
+  through workspace_artifacts.
+
+The last column, the total PSS of the workers and their parent, is the host
+RAM the deployment actually uses.
+
+Usage (from frontend/sql_generator):
+    python dev/benchmark_workers.py [--workers 1,2,4] [--artifact-mb 200] [--skip-service]
+"""
+
+import argparse
+import gc
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Optional
+
+import httpx
+import numpy as np
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+
+def memory_mb(pid: int) -> dict:
+    """Rss, Pss and Private (clean + dirty) of `pid` in MB."""
+    values = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) >= 2 and parts[1].isdigit():
+                values[parts[0].rstrip(":")] = int(parts[1]) / 1024
+    return {
+        "rss": values.get("Rss", 0.0),
+        "pss": values.get("Pss", 0.0),
+        "private": values.get("Private_Clean", 0.0) + values.get("Private_Dirty", 0.0),
+    }
+
+
+def children_of(pid: int) -> list:
+    with open(f"/proc/{pid}/task/{pid}/children") as f:
+        return [int(child) for child in f.read().split()]
+
+
+def print_row(label: str, parent: Optional[dict], per_worker: list) -> None:
+    """Averages per worker, and the total PSS of the workers and their parent."""
+    workers = len(per_worker)
+    total_pss = sum(m["pss"] for m in per_worker) + (parent["pss"] if parent else 0.0)
+    print(f"{label:28} {workers:7d} {sum(m['rss'] for m in per_worker) / workers:10.1f} "
+          f"{sum(m['pss'] for m in per_worker) / workers:10.1f} "
+          f"{sum(m['private'] for m in per_worker) / workers:10.1f} {total_pss:10.1f}")
+
+
+def header(title: str) -> None:
+    print(f"\n{title}")
+    print(f"{'':28} {'workers':>7} {'RSS/w MB':>10} {'PSS/w MB':>10} {'priv/w MB':>10} {'PSS tot MB':>10}")
+
+
+def benchmark_service(workers: int, timeout: float = 60.0) -> None:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    env = dict(os.environ, THOTH_WORKERS=str(workers))
+    process = subprocess.Popen(
+        [sys.executable, "run_server.py", str(port)],
+        cwd=PROJECT_ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        started = time.monotonic()
+        while time.monotonic() - started < timeout:
+            try:
+                if httpx.get(f"http://127.0.0.1:{port}/health", timeout=0.5).status_code == 200:
+                    break
+            except httpx.TransportError:
+                pass
+            time.sleep(0.1)
+        else:
+            raise SystemExit(f"/health did not answer within {timeout:.0f} s")
+        # Let every worker finish its startup and serve a few requests
+        time.sleep(1.0)
+        for _ in range(workers * 5):
+            httpx.get(f"http://127.0.0.1:{port}/health", timeout=2.0)
+        if workers > 1:
+            print_row("service", memory_mb(process.pid), [memory_mb(pid) for pid in children_of(process.pid)])
+        else:
+            print_row("service", None, [memory_mb(process.pid)])
+    finally:
+        process.send_signal(signal.SIGTERM)
+        process.wait(timeout=30)
+
+
+def synthetic_index(size_mb: float) -> dict:
+    """LSH-like index: many small Python strings in lists, about size_mb of heap."""
+    index, per_key = {}, 50
+    for key in range(int(size_mb * 1024 * 1024 / (per_key * 60))):
+        index[f"table_{key % 97}.column_{key}"] = [f"value {key}-{i} lorem ipsum" for i in range(per_key)]
+    return index
+
+
+def synthetic_matrix(size_mb: float) -> np.ndarray:
+    rows = int(size_mb * 1024 * 1024 / (1024 * 4))
+    return np.random.default_rng(0).random((rows, 1024), dtype=np.float32)
+
+
+def touch(index: dict, matrix: np.ndarray) -> float:
+    """Read everything, as serving requests does (refcounts change, data does not)."""
+    total = sum(len(values) for values in index.values())
+    return total + float(matrix.sum())
+
+
+def fork_workers(workers: int, load_in_worker) -> list:
+    """Fork `workers` processes holding `load_in_worker()`, return their pids once loaded."""
+    pids, pipes = [], []
+    for _ in range(workers):
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            artifacts = load_in_worker()
+            touch(*artifacts)
+            gc.collect()
+            os.write(write_fd, b"1")
+            signal.pause()
+            os._exit(0)
+        os.close(write_fd)
+        pids.append(pid)
+        pipes.append(read_fd)
+    for fd in pipes:
+        os.read(fd, 1)
+        os.close(fd)
+    return pids
+
+
+def run_strategy(strategy: str, workers: int, size_mb: float) -> list:
+    """
+    Run one loading strategy in a fresh parent process and return the memory
+    of the parent followed by its workers.
+    """
+    read_fd, write_fd = os.pipe()
+    parent = os.fork()
+    if parent == 0:
+        os.close(read_fd)
+        half = size_mb / 2
+        if strategy == "private":
+            load = lambda: (synthetic_index(half), synthetic_matrix(half))  # noqa: E731
+        else:
+            index = synthetic_index(half)
+            if strategy == "pre-fork":
+                matrix = synthetic_matrix(half)
+                load = lambda: (index, matrix)  # noqa: E731
+            else:
+                from helpers import workspace_artifacts
+
+                class Embedder:
+                    model_key = ("benchmark", "synthetic")
+
+                    def encode(self, texts):
+                        return synthetic_matrix(half)
+
+                # The first worker to need the matrix stores it; here the parent does
+                columns = [f"`t`.`c{i}`" for i in range(len(synthetic_matrix(half)))]
+                workspace_artifacts.get_column_embeddings(Embedder(), columns)
+                workspace_artifacts.clear_artifacts()
+                load = lambda: (index, workspace_artifacts.get_column_embeddings(Embedder(), columns))  # noqa: E731
+            gc.collect()
+            gc.freeze()
+        pids = fork_workers(workers, load)
+        measured = [memory_mb(pid) for pid in [os.getpid()] + pids]
+        for pid in pids:
+            os.kill(pid, signal.SIGTERM)
+            os.waitpid(pid, 0)
+        os.write(write_fd, json.dumps(measured).encode())
+        os._exit(0)
+    os.close(write_fd)
+    with os.fdopen(read_fd) as f:
+        measured = json.loads(f.read())
+    os.waitpid(parent, 0)
+    return measured
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workers", default="1,2,4", help="comma-separated worker counts")
+    parser.add_argument("--artifact-mb", type=float, default=200.0)
+    parser.add_argument("--skip-service", action="store_true")
+    args = parser.parse_args()
+    counts = [int(n) for n in args.workers.split(",")]
+
+    if not args.skip_service:
+        header("service (no workspaces preloaded unless Django is reachable)")
+        for workers in counts:
+            benchmark_service(workers)
+
+    os.environ["THOTH_ARTIFACT_DIR"] = tempfile.mkdtemp(prefix="thoth-artifacts-")
+    header(f"synthetic artifacts of {args.artifact_mb:.0f} MB per workspace set")
+    for workers in counts:
+        for strategy in ("private", "pre-fork", "pre-fork + mmap"):
+            measured = run_strategy(strategy, workers, args.artifact_mb)
+            print_row(strategy, measured[0], measured[1:])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Import-time profiling report for the SQL Generator.
+
+Imports a module in a fresh interpreter with `python -X importtime` and
+prints the total import time, the packages that take longest to load (the
+self time of all their modules added up) and the slowest individual
+modules. Use it to check that a change keeps heavy libraries such as
+pydantic-ai, logfire, thoth_dbmanager, thoth_qdrant or pandas off the
+service's startup path.
+
+Usage (from frontend/sql_generator):
+    python dev/profile_imports.py [module ...] [--top N]
+
+The default module is `main`. Passing several modules profiles each one,
+e.g. `python dev/profile_imports.py main thoth_dbmanager thoth_qdrant`
+shows what the first workspace setup loads on top of startup.
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)$")
+WATCHED = ("pydantic_ai", "logfire", "thoth_dbmanager", "thoth_qdrant", "pandas", "numpy")
+
+
+def profile(module: str):
+    """Return [(self_us, cumulative_us, depth, name)] for one import of `module`."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        tail = result.stderr.strip().splitlines()[-1:] or ["unknown error"]
+        raise SystemExit(f"Importing {module} failed: {tail[0]}")
+
+    entries = []
+    for line in result.stderr.splitlines():
+        match = LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            entries.append((int(self_us), int(cumulative_us), (len(indent) - 1) // 2, name))
+    return entries
+
+
+def report(module: str, top: int) -> None:
+    entries = profile(module)
+    roots = [e for e in entries if e[2] == 0]
+    total_us = sum(e[1] for e in roots)
+    loaded = {e[3].split(".")[0] for e in entries}
+
+    print(f"== import {module}: {total_us / 1e6:.3f} s, {len(entries)} modules")
+    print("   heavy libraries loaded: " + (", ".join(w for w in WATCHED if w in loaded) or "none"))
+
+    packages = {}
+    for self_us, _, _, name in entries:
+        package = name.split(".")[0]
+        packages[package] = packages.get(package, 0) + self_us
+    print("\n   slowest packages")
+    for package, self_us in sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]:
+        print(f"   {self_us / 1e3:9.1f} ms  {package}")
+
+    print("\n   slowest modules")
+    for self_us, _, _, name in sorted(entries, key=lambda e: e[0], reverse=True)[:top]:
+        print(f"   {self_us / 1e3:9.1f} ms  {name}")
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("modules", nargs="*", default=["main"])
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+    for module in args.modules:
+        report(module, args.top)
+
+
+if __name__ == "__main__":
+    main()
@@ -19,6 +19,8 @@ import logging
 import httpx
 from typing import List, Dict, Any
 
+from helpers.http_clients import get_http_clients
+
 logger = logging.getLogger(__name__)
 
 def get_db_tables(db_name: str = None) -> List[Dict[str, Any]]:
@@ -48,14 +50,14 @@ def get_db_tables(db_name: str = None) -> List[Dict[str, Any]]:
         
         logger.info(f"Fetching tables from: {url}")
         
-        with httpx.Client() as client:
-            response = client.get(url, headers=headers, timeout=10.0)
-            response.raise_for_status()
-            
-            tables = response.json()
-            logger.info(f"Successfully fetched {len(tables)} tables for database: {db_name}")
-            return tables
-            
+        client = get_http_clients().sync_client()
+        response = client.get(url, headers=headers, timeout=10.0)
+        response.raise_for_status()
+        
+        tables = response.json()
+        logger.info(f"Successfully fetched {len(tables)} tables for database: {db_name}")
+        return tables
+        
     except httpx.HTTPStatusError as e:
         logger.error(f"HTTP error fetching tables for {db_name}: {e.response.status_code} - {e.response.text}")
         return []
@@ -94,14 +96,14 @@ def get_table_info(db_name: str, table_name: str) -> Dict[str, Any]:
         
         logger.info(f"Fetching table info from: {url}")
         
-        with httpx.Client() as client:
-            response = client.get(url, headers=headers, timeout=10.0)
-            response.raise_for_status()
-            
-            table_info = response.json()
-            logger.info(f"Successfully fetched table info for: {db_name}.{table_name}")
-            return table_info
-            
+        client = get_http_clients().sync_client()
+        response = client.get(url, headers=headers, timeout=10.0)
+        response.raise_for_status()
+        
+        table_info = response.json()
+        logger.info(f"Successfully fetched table info for: {db_name}.{table_name}")
+        return table_info
+        
     except httpx.HTTPStatusError as e:
         logger.error(f"HTTP error fetching table info for {db_name}.{table_name}: {e.response.status_code} - {e.response.text}")
         return {}
@@ -140,14 +142,14 @@ def get_table_columns(db_name: str, table_name: str) -> List[Dict[str, Any]]:
         
         logger.info(f"Fetching columns from: {url}")
         
-        with httpx.Client() as client:
-            response = client.get(url, headers=headers, timeout=10.0)
-            response.raise_for_status()
-            
-            columns = response.json()
-            logger.info(f"Successfully fetched {len(columns)} columns for table: {db_name}.{table_name}")
-            return columns
-            
+        client = get_http_clients().sync_client()
+        response = client.get(url, headers=headers, timeout=10.0)
+        response.raise_for_status()
+        
+        columns = response.json()
+        logger.info(f"Successfully fetched {len(columns)} columns for table: {db_name}.{table_name}")
+        return columns
+        
     except httpx.HTTPStatusError as e:
         logger.error(f"HTTP error fetching columns for {db_name}.{table_name}: {e.response.status_code} - {e.response.text}")
         return []
@@ -12,7 +12,6 @@
 
 import logging
 import json
-import pandas as pd
 
 from typing import Dict, List, Any
 
@@ -143,6 +142,8 @@ def load_tables_description(
     Returns:
         Dict[str, Dict[str, Dict[str, str]]]: A dictionary containing table descriptions.
     """
+    import pandas as pd  # only needed here; kept off the service's import path
+
     table_description = {}
     table_list = get_db_tables(db_name)
     for table in table_list:
@@ -22,16 +22,16 @@ Functions provided (one per common level supported by both systems):
 - log_critical
 - log_exception
 
-All functions accept a single string message.
+All functions accept a single string message. Messages logged before
+telemetry is configured (see helpers.telemetry) only reach the app logger.
 """
 
 from __future__ import annotations
 
 from typing import Callable
 
-import logfire
-
 from .logging_config import app_logger as logger
+from .telemetry import get_logfire
 
 
 def _call_if_available(func: Callable[..., None] | None, message: str) -> None:
@@ -60,31 +60,31 @@ def _call_if_available(func: Callable[..., None] | None, message: str) -> None:
 def log_debug(message: str) -> None:
     """Log at DEBUG level to both logger and logfire."""
     logger.debug(message)
-    _call_if_available(getattr(logfire, "debug", None), message)
+    _call_if_available(getattr(get_logfire(), "debug", None), message)
 
 
 def log_info(message: str) -> None:
     """Log at INFO level to both logger and logfire."""
     logger.info(message)
-    _call_if_available(getattr(logfire, "info", None), message)
+    _call_if_available(getattr(get_logfire(), "info", None), message)
 
 
 def log_warning(message: str) -> None:
     """Log at WARNING level to both logger and logfire."""
     logger.warning(message)
-    _call_if_available(getattr(logfire, "warning", None), message)
+    _call_if_available(getattr(get_logfire(), "warning", None), message)
 
 
 def log_error(message: str) -> None:
     """Log at ERROR level to both logger and logfire."""
     logger.error(message)
-    _call_if_available(getattr(logfire, "error", None), message)
+    _call_if_available(getattr(get_logfire(), "error", None), message)
 
 
 def log_critical(message: str) -> None:
     """Log at CRITICAL level to both logger and logfire."""
     logger.critical(message)
-    _call_if_available(getattr(logfire, "critical", None), message)
+    _call_if_available(getattr(get_logfire(), "critical", None), message)
 
 
 def log_exception(message: str) -> None:
@@ -94,10 +94,10 @@ def log_exception(message: str) -> None:
     """
     logger.exception(message)
     # Prefer logfire.exception if available; otherwise fall back to error
-    lf_exc = getattr(logfire, "exception", None)
+    lf_exc = getattr(get_logfire(), "exception", None)
     if lf_exc is not None:
         _call_if_available(lf_exc, message)
     else:
-        _call_if_available(getattr(logfire, "error", None), message)
+        _call_if_available(getattr(get_logfire(), "error", None), message)
 
 
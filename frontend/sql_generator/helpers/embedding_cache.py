@@ -0,0 +1,260 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Process-wide cache of query-time embeddings.
+
+Keywords, question + evidence strings and LSH candidate values are embedded
+on every request, and the same popular values come back again and again.
+`EmbeddingCache.encode()` looks every text up by (model, normalized text):
+first in a bounded in-memory LRU, then in an on-disk float16 store shared
+by all workers. It then embeds only the misses, in one batch. Vectors are
+rounded to float16 whichever tier they come from, so a text always gets the
+same vector.
+
+Settings (environment variables):
+- THOTH_EMBEDDING_CACHE_SIZE: vectors kept in memory (default: 20000, 0
+  disables the cache).
+- THOTH_EMBEDDING_CACHE_PATH: SQLite file of the on-disk store (default:
+  embeddings.sqlite3 in THOTH_ARTIFACT_DIR when that is set, otherwise no
+  disk store).
+- THOTH_EMBEDDING_CACHE_MAX_ROWS: vectors kept on disk before the oldest
+  are pruned (default: 200000).
+
+Hit rates per workspace are served by GET /metrics/embeddings.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+
+from .workspace_artifacts import artifact_dir
+
+logger = logging.getLogger(__name__)
+
+CACHE_SIZE = int(os.getenv("THOTH_EMBEDDING_CACHE_SIZE", "20000"))
+DISK_MAX_ROWS = int(os.getenv("THOTH_EMBEDDING_CACHE_MAX_ROWS", "200000"))
+# SQLite limits the number of parameters of one statement
+_SQL_BATCH = 500
+_PRUNE_EVERY = 1000
+
+
+def normalize_text(text: Any) -> str:
+    """Cache key of a text: NFC form with whitespace runs collapsed."""
+    if text is None:
+        return ""
+    return " ".join(unicodedata.normalize("NFC", str(text)).split())
+
+
+def default_disk_path() -> Optional[str]:
+    path = os.getenv("THOTH_EMBEDDING_CACHE_PATH")
+    if path:
+        return path
+    directory = artifact_dir()
+    return os.path.join(directory, "embeddings.sqlite3") if directory else None
+
+
+class _DiskStore:
+    """float16 vectors in SQLite, one connection per thread (WAL allows concurrent workers)."""
+
+    def __init__(self, path: str, max_rows: int = DISK_MAX_ROWS):
+        self.path = path
+        self.max_rows = max_rows
+        self._local = threading.local()
+        self._inserted = 0
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self._connection() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "model TEXT NOT NULL, text TEXT NOT NULL, vector BLOB NOT NULL, "
+                "PRIMARY KEY (model, text))"
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get_many(self, model: str, texts: Sequence[str]) -> Dict[str, np.ndarray]:
+        found = {}
+        conn = self._connection()
+        for start in range(0, len(texts), _SQL_BATCH):
+            chunk = texts[start:start + _SQL_BATCH]
+            rows = conn.execute(
+                f"SELECT text, vector FROM embeddings WHERE model = ? AND text IN ({','.join('?' * len(chunk))})",
+                (model, *chunk),
+            )
+            for text, blob in rows:
+                found[text] = np.frombuffer(blob, dtype=np.float16)
+        return found
+
+    def put_many(self, model: str, vectors: Dict[str, np.ndarray]) -> None:
+        conn = self._connection()
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (model, text, vector) VALUES (?, ?, ?)",
+                [(model, text, vector.tobytes()) for text, vector in vectors.items()],
+            )
+        self._inserted += len(vectors)
+        if self._inserted >= _PRUNE_EVERY:
+            self._inserted = 0
+            self._prune(conn)
+
+    def _prune(self, conn: sqlite3.Connection) -> None:
+        (rows,) = conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+        if rows <= self.max_rows:
+            return
+        # Oldest first: rowids grow with insertion order
+        excess = rows - int(self.max_rows * 0.9)
+        with conn:
+            conn.execute(
+                "DELETE FROM embeddings WHERE rowid IN (SELECT rowid FROM embeddings ORDER BY rowid LIMIT ?)",
+                (excess,),
+            )
+        logger.info(f"Pruned {excess} vectors from the embedding store {self.path}")
+
+
+class EmbeddingCache:
+    """LRU of float16 vectors in front of an optional on-disk store."""
+
+    def __init__(self, max_size: int = CACHE_SIZE, disk_path: Optional[str] = None):
+        self.max_size = max_size
+        self._memory: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, Dict[str, int]] = {}
+        self._disk: Optional[_DiskStore] = None
+        if disk_path and max_size > 0:
+            try:
+                self._disk = _DiskStore(disk_path)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"Embedding disk store {disk_path} unavailable, using memory only: {e}")
+
+    def _count(self, workspace: str, **counts: int) -> None:
+        with self._lock:
+            metrics = self._metrics.setdefault(
+                workspace, {"requests": 0, "texts": 0, "memory_hits": 0, "disk_hits": 0, "misses": 0}
+            )
+            for name, value in counts.items():
+                metrics[name] += value
+
+    def encode(self, embed, model: str, texts, workspace: Any = None):
+        """
+        Embed `texts` (a string or a list) with `embed(list_of_texts)`,
+        calling it once with the texts found in neither tier. Returns a
+        vector for a string and an (n, dim) float32 array for a list.
+        """
+        single = isinstance(texts, str)
+        items = [normalize_text(text) for text in ([texts] if single else texts)]
+        workspace = str(workspace) if workspace is not None else "unknown"
+        if not items:
+            return np.empty((0, 0), dtype=np.float32)
+
+        if self.max_size <= 0:
+            vectors = np.asarray(embed(items), dtype=np.float32)
+            self._count(workspace, requests=1, texts=len(items), misses=len(set(items)))
+            return vectors[0] if single else vectors
+
+        unique = list(dict.fromkeys(items))
+        found: Dict[str, np.ndarray] = {}
+        with self._lock:
+            for text in unique:
+                vector = self._memory.get((model, text))
+                if vector is not None:
+                    self._memory.move_to_end((model, text))
+                    found[text] = vector
+        memory_hits = len(found)
+
+        missing = [text for text in unique if text not in found]
+        disk_hits = 0
+        if missing and self._disk is not None:
+            try:
+                from_disk = self._disk.get_many(model, missing)
+            except sqlite3.Error as e:
+                logger.warning(f"Embedding disk store lookup failed: {e}")
+                from_disk = {}
+            disk_hits = len(from_disk)
+            found.update(from_disk)
+            self._remember(model, from_disk)
+            missing = [text for text in missing if text not in from_disk]
+
+        if missing:
+            embedded = {
+                text: np.asarray(vector, dtype=np.float32).astype(np.float16)
+                for text, vector in zip(missing, embed(missing))
+            }
+            found.update(embedded)
+            self._remember(model, embedded)
+            if self._disk is not None:
+                try:
+                    self._disk.put_many(model, embedded)
+                except sqlite3.Error as e:
+                    logger.warning(f"Embedding disk store update failed: {e}")
+
+        self._count(
+            workspace, requests=1, texts=len(items),
+            memory_hits=memory_hits, disk_hits=disk_hits, misses=len(missing),
+        )
+        vectors = np.stack([found[text] for text in items]).astype(np.float32)
+        return vectors[0] if single else vectors
+
+    def _remember(self, model: str, vectors: Dict[str, np.ndarray]) -> None:
+        with self._lock:
+            for text, vector in vectors.items():
+                self._memory[(model, text)] = vector
+            while len(self._memory) > self.max_size:
+                self._memory.popitem(last=False)
+
+    def metrics(self) -> Dict[str, Any]:
+        # Request threads keep counting; report a consistent snapshot
+        with self._lock:
+            snapshot = {workspace: dict(counts) for workspace, counts in self._metrics.items()}
+            memory_entries = len(self._memory)
+        workspaces = {}
+        for workspace, counts in sorted(snapshot.items()):
+            lookups = counts["memory_hits"] + counts["disk_hits"] + counts["misses"]
+            hits = counts["memory_hits"] + counts["disk_hits"]
+            workspaces[workspace] = {**counts, "hit_rate": round(hits / lookups, 3) if lookups else None}
+        return {
+            "memory_entries": memory_entries,
+            "memory_max_entries": self.max_size,
+            "disk_store": self._disk.path if self._disk else None,
+            "workspaces": workspaces,
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            self._metrics.clear()
+
+
+_cache: Optional[EmbeddingCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Return the process-wide embedding cache."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = EmbeddingCache(disk_path=default_disk_path())
+    return _cache
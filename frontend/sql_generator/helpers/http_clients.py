@@ -0,0 +1,280 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Application-scoped HTTP clients for the SQL Generator service.
+
+Calls to the Django backend and to the LLM providers used to open a new
+httpx client each time, paying a TCP (and TLS) handshake per request. The
+registry keeps one long-lived client per upstream, each with its own
+keep-alive connection pool, so the connection limits apply per host and
+connections are re-used across requests. HTTP/2 is negotiated with HTTPS
+upstreams (the service depends on httpx[http2]).
+
+The FastAPI lifespan closes the clients on shutdown; code running outside
+the service (scripts, tests) gets clients created lazily on first use.
+
+Configuration (environment variables):
+    THOTH_HTTP2                      enable HTTP/2 (default: true)
+    THOTH_HTTP_MAX_CONNECTIONS       connections per upstream (default: 50)
+    THOTH_HTTP_MAX_KEEPALIVE         idle connections kept per upstream (default: 20)
+    THOTH_HTTP_KEEPALIVE_EXPIRY      seconds an idle connection is kept (default: 60)
+"""
+
+import asyncio
+import importlib.util
+import logging
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+HTTP2_ENABLED = (
+    os.getenv("THOTH_HTTP2", "true").lower() in ("1", "true", "yes", "on")
+    and importlib.util.find_spec("h2") is not None
+)
+MAX_CONNECTIONS = int(os.getenv("THOTH_HTTP_MAX_CONNECTIONS", "50"))
+MAX_KEEPALIVE = int(os.getenv("THOTH_HTTP_MAX_KEEPALIVE", "20"))
+KEEPALIVE_EXPIRY = float(os.getenv("THOTH_HTTP_KEEPALIVE_EXPIRY", "60"))
+
+DJANGO_TIMEOUT = httpx.Timeout(10.0)
+# Same defaults pydantic-ai uses for its own provider clients
+LLM_TIMEOUT = httpx.Timeout(600.0, connect=5.0)
+
+DJANGO = "django"
+
+
+def get_django_server() -> str:
+    return os.getenv("DJANGO_SERVER", os.getenv("DJANGO_BACKEND_URL", "http://localhost:8200"))
+
+
+class _PoolMetrics:
+    """Request counters of one client, updated by its metered transport."""
+
+    def __init__(self):
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def started(self) -> None:
+        with self._lock:
+            self.requests += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def finished(self) -> None:
+        with self._lock:
+            self.in_flight = max(0, self.in_flight - 1)
+
+
+
+class _MeteredTransport(httpx.BaseTransport):
+    """
+    Counts requests around the wrapped transport. Unlike event hooks, the
+    count also comes down when sending fails (connection errors, timeouts).
+    """
+
+    def __init__(self, transport: httpx.HTTPTransport, metrics: _PoolMetrics):
+        self.transport = transport
+        self.metrics = metrics
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        self.metrics.started()
+        try:
+            return self.transport.handle_request(request)
+        finally:
+            self.metrics.finished()
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class _AsyncMeteredTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of _MeteredTransport."""
+
+    def __init__(self, transport: httpx.AsyncHTTPTransport, metrics: _PoolMetrics):
+        self.transport = transport
+        self.metrics = metrics
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.metrics.started()
+        try:
+            return await self.transport.handle_async_request(request)
+        finally:
+            self.metrics.finished()
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+def _pool_connections(client) -> list:
+    # httpcore keeps the pool behind the HTTP transport, wrapped by the metered one
+    transport = getattr(client, "_transport", None)
+    pool = getattr(getattr(transport, "transport", transport), "_pool", None)
+    return list(getattr(pool, "connections", []) or [])
+
+
+class HttpClientRegistry:
+    """Long-lived httpx clients keyed by upstream name."""
+
+    def __init__(
+        self,
+        http2: bool = HTTP2_ENABLED,
+        max_connections: int = MAX_CONNECTIONS,
+        max_keepalive: int = MAX_KEEPALIVE,
+        keepalive_expiry: float = KEEPALIVE_EXPIRY,
+    ):
+        self.http2 = http2
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive,
+            keepalive_expiry=keepalive_expiry,
+        )
+        # Async clients are bound to the event loop that created them
+        self._async_clients: Dict[Tuple[str, int], httpx.AsyncClient] = {}
+        self._loops: Dict[int, asyncio.AbstractEventLoop] = {}
+        self._sync_clients: Dict[str, httpx.Client] = {}
+        self._metrics: Dict[str, _PoolMetrics] = {}
+        self._lock = threading.Lock()
+
+    def _metrics_for(self, name: str) -> _PoolMetrics:
+        if name not in self._metrics:
+            self._metrics[name] = _PoolMetrics()
+        return self._metrics[name]
+
+    def async_client(self, name: str = DJANGO, timeout: Optional[httpx.Timeout] = None) -> httpx.AsyncClient:
+        """Return the shared AsyncClient for `name`, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        key = (name, id(loop))
+        client = self._async_clients.get(key)
+        if client is None or client.is_closed:
+            with self._lock:
+                client = self._async_clients.get(key)
+                if client is None or client.is_closed:
+                    transport = httpx.AsyncHTTPTransport(http2=self.http2, limits=self.limits)
+                    client = httpx.AsyncClient(
+                        transport=_AsyncMeteredTransport(transport, self._metrics_for(name)),
+                        timeout=timeout or DJANGO_TIMEOUT,
+                    )
+                    self._async_clients[key] = client
+                    self._loops[id(loop)] = loop
+                    logger.debug(f"Created shared async HTTP client '{name}' (http2={self.http2})")
+        return client
+
+    def sync_client(self, name: str = DJANGO, timeout: Optional[httpx.Timeout] = None) -> httpx.Client:
+        """Return the shared, thread-safe Client for `name`."""
+        client = self._sync_clients.get(name)
+        if client is None or client.is_closed:
+            with self._lock:
+                client = self._sync_clients.get(name)
+                if client is None or client.is_closed:
+                    transport = httpx.HTTPTransport(http2=self.http2, limits=self.limits)
+                    client = httpx.Client(
+                        transport=_MeteredTransport(transport, self._metrics_for(f"{name}:sync")),
+                        timeout=timeout or DJANGO_TIMEOUT,
+                    )
+                    self._sync_clients[name] = client
+        return client
+
+    def llm_client(self, provider: str, base_url: Optional[str] = None) -> Optional[httpx.AsyncClient]:
+        """
+        Shared AsyncClient for an LLM provider (one pool per provider and
+        base URL). Returns None outside an event loop, so model factories
+        called synchronously fall back to the provider's own client.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+        name = f"llm:{provider.lower()}"
+        if base_url:
+            name = f"{name}:{httpx.URL(base_url).host}"
+        return self.async_client(name, timeout=LLM_TIMEOUT)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Pool utilization of every client: requests, in-flight and connections."""
+        clients = {name: client for (name, _), client in self._async_clients.items()}
+        clients.update({f"{name}:sync": client for name, client in self._sync_clients.items()})
+
+        pools = {}
+        for name, client in sorted(clients.items()):
+            connections = _pool_connections(client)
+            idle = sum(1 for conn in connections if conn.is_idle())
+            http2 = sum(1 for conn in connections if "HTTP/2" in conn.info())
+            metrics = self._metrics_for(name)
+            pools[name] = {
+                "requests": metrics.requests,
+                "in_flight": metrics.in_flight,
+                "max_in_flight": metrics.max_in_flight,
+                "connections": len(connections),
+                "idle_connections": idle,
+                "http2_connections": http2,
+                "utilization": round((len(connections) - idle) / self.limits.max_connections, 3),
+                "closed": client.is_closed,
+            }
+        return {
+            "http2": self.http2,
+            "max_connections_per_host": self.limits.max_connections,
+            "max_keepalive_per_host": self.limits.max_keepalive_connections,
+            "pools": pools,
+        }
+
+    async def aclose(self) -> None:
+        """
+        Close every client. Async clients of another event loop are closed on
+        that loop while it runs; those of a stopped loop cannot be closed any
+        more, so they are logged and kept.
+        """
+        loop_id = id(asyncio.get_running_loop())
+        with self._lock:
+            async_clients, self._async_clients = self._async_clients, {}
+            sync_clients, self._sync_clients = self._sync_clients, {}
+        for (name, client_loop), client in async_clients.items():
+            if client_loop == loop_id:
+                await client.aclose()
+                continue
+            loop = self._loops.get(client_loop)
+            if loop is not None and loop.is_running():
+                try:
+                    await asyncio.wait_for(
+                        asyncio.wrap_future(asyncio.run_coroutine_threadsafe(client.aclose(), loop)), timeout=5.0
+                    )
+                    continue
+                except Exception as e:
+                    logger.warning(f"Could not close async HTTP client '{name}' on its event loop: {e}")
+            else:
+                logger.warning(f"Async HTTP client '{name}' belongs to a stopped event loop and cannot be closed")
+            with self._lock:
+                self._async_clients.setdefault((name, client_loop), client)
+        with self._lock:
+            live = {client_loop for _, client_loop in self._async_clients}
+            self._loops = {loop_key: loop for loop_key, loop in self._loops.items() if loop_key in live}
+        for client in sync_clients.values():
+            client.close()
+
+
+_registry: Optional[HttpClientRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_http_clients() -> HttpClientRegistry:
+    """Return the process-wide client registry."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = HttpClientRegistry()
+    return _registry
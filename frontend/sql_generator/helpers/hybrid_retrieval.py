@@ -0,0 +1,350 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Hybrid BM25 + dense retrieval of evidence and SQL shots.
+
+Dense search alone often misses evidence and stored questions that share an
+exact code, ID or column name with the question, because embeddings blur
+such tokens. `hybrid_search()` ranks the documents of each type two ways:
+- dense: the vector store's similarity search with the type's score
+  threshold. Evidence and SQL are searched in one batched Qdrant request,
+  with the keywords embedded once;
+- sparse: BM25 over a local index of the evidence texts and of the stored
+  questions (with their evidence).
+It then fuses the two rankings with reciprocal rank fusion: a document
+scores sum(1 / (k + rank)) over the rankings it appears in. The dense
+similarity and BM25 scales never have to be compared.
+
+The dense ranking keeps its score thresholds. A BM25 candidate needs its
+own bar, or one shared common word would fill lists the thresholds keep
+empty: the terms it matches must carry THOTH_BM25_MIN_MATCH of the
+query's IDF weight. Query terms found in no document count with the
+highest IDF, since no document can match them.
+
+The BM25 indexes are built per vector store collection from its documents.
+They are built at warm-up, or on the first request, and rebuilt after
+THOTH_SPARSE_INDEX_TTL seconds, so every write path is picked up: uploads,
+CSV imports and edits in the admin. A rebuild runs in a background thread
+and requests keep using the previous index until it is ready. A failed
+scroll of the collection is never cached: the first build raises, and
+hybrid_search() falls back to the dense ranking; a failed rebuild keeps
+the previous index and is retried on the next request. Duplicates are
+removed in linear time by hashing a normalized form of each document,
+with no pairwise substring comparison.
+
+Settings (environment variables):
+- THOTH_HYBRID_RETRIEVAL: "false" for dense-only retrieval (default: "true").
+- THOTH_SPARSE_INDEX_TTL: seconds before a collection's BM25 index is rebuilt
+  (default: 300).
+- THOTH_RRF_K: the k of reciprocal rank fusion (default: 60).
+- THOTH_BM25_MIN_MATCH: share of the query's IDF weight a BM25 candidate
+  must match (default: 0.4).
+"""
+
+import logging
+import math
+import os
+import re
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
+from thoth_qdrant import ThothType
+
+logger = logging.getLogger(__name__)
+
+HYBRID_ENABLED = os.getenv("THOTH_HYBRID_RETRIEVAL", "true").lower() == "true"
+SPARSE_INDEX_TTL = float(os.getenv("THOTH_SPARSE_INDEX_TTL", "300"))
+RRF_K = int(os.getenv("THOTH_RRF_K", "60"))
+BM25_MIN_MATCH = float(os.getenv("THOTH_BM25_MIN_MATCH", "0.4"))
+# Each ranking contributes this many times the requested documents to the fusion
+CANDIDATE_FACTOR = 4
+
+_TOKEN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens; codes such as 01100170109835 or K-12 keep their parts."""
+    return _TOKEN.findall((text or "").lower())
+
+
+def normalized_key(text: str) -> str:
+    """Duplicate-detection key: lowercase, single spaces, no trailing ;.,"""
+    return " ".join((text or "").lower().split()).rstrip(";.,")
+
+
+def document_text(doc: Any) -> str:
+    """The text BM25 indexes: the evidence, or a stored question with its evidence."""
+    if getattr(doc, "thoth_type", None) == ThothType.SQL:
+        return f"{getattr(doc, 'question', '') or ''} {getattr(doc, 'evidence', '') or ''}"
+    return getattr(doc, "evidence", "") or ""
+
+
+class BM25Index:
+    """Okapi BM25 over a fixed list of documents."""
+
+    def __init__(self, documents: Sequence[Any], texts: Sequence[str], k1: float = 1.2, b: float = 0.75):
+        self.documents = list(documents)
+        postings: Dict[str, Tuple[List[int], List[int]]] = {}
+        lengths = np.zeros(len(self.documents), dtype=np.float64)
+        for doc_index, text in enumerate(texts):
+            counts = Counter(tokenize(text))
+            lengths[doc_index] = sum(counts.values())
+            for term, count in counts.items():
+                doc_ids, tfs = postings.setdefault(term, ([], []))
+                doc_ids.append(doc_index)
+                tfs.append(count)
+
+        average_length = lengths.mean() if len(lengths) and lengths.mean() > 0 else 1.0
+        # Per document part of the BM25 denominator, computed once
+        norms = k1 * (1 - b + b * lengths / average_length)
+        n = len(self.documents)
+        # IDF of a term found in a single document, the rarest possible
+        self._max_idf = math.log(1 + (n - 0.5) / 1.5) if n else 0.0
+        self._postings: Dict[str, Tuple[np.ndarray, np.ndarray, float]] = {}
+        for term, (doc_ids, tfs) in postings.items():
+            ids = np.asarray(doc_ids, dtype=np.int32)
+            tf = np.asarray(tfs, dtype=np.float64)
+            idf = math.log(1 + (n - len(ids) + 0.5) / (len(ids) + 0.5))
+            self._postings[term] = (ids, idf * tf * (k1 + 1) / (tf + norms[ids]), idf)
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def search(self, query: str, top_k: int, min_match: float = 0.0) -> List[Any]:
+        """
+        Up to top_k documents, best BM25 score first, whose matched query
+        terms carry at least min_match of the query's IDF weight.
+        """
+        query_terms = list(dict.fromkeys(tokenize(query)))
+        terms = [term for term in query_terms if term in self._postings]
+        if not terms or top_k <= 0:
+            return []
+        query_weight = sum(self._postings[term][2] if term in self._postings else self._max_idf for term in query_terms)
+        scores = np.zeros(len(self.documents))
+        matched_weight = np.zeros(len(self.documents))
+        for term in terms:
+            ids, weights, idf = self._postings[term]
+            scores[ids] += weights
+            matched_weight[ids] += idf
+        matched = np.flatnonzero((scores > 0) & (matched_weight >= min_match * query_weight))
+        best = matched[np.argsort(-scores[matched], kind="stable")[:top_k]]
+        return [self.documents[i] for i in best]
+
+
+def _documents_of_type(vdbmanager, thoth_type: ThothType) -> List[Any]:
+    """
+    All documents of one type. On Qdrant the collection is scrolled here,
+    because the adapter's get_documents_by_type() turns errors into an
+    empty list, which must not become an empty index. Errors propagate.
+    """
+    client = getattr(vdbmanager, "client", None)
+    if client is None or not hasattr(client, "scroll") or not hasattr(vdbmanager, "_payload_to_document"):
+        if hasattr(vdbmanager, "get_documents_by_type"):
+            return vdbmanager.get_documents_by_type(thoth_type)
+        if thoth_type == ThothType.EVIDENCE:
+            return vdbmanager.get_all_evidence_documents()
+        return vdbmanager.get_all_sql_documents()
+
+    from qdrant_client import models
+
+    documents = []
+    offset = None
+    while True:
+        records, offset = client.scroll(
+            collection_name=vdbmanager.collection_name,
+            scroll_filter=models.Filter(
+                must=[models.FieldCondition(key="thoth_type", match=models.MatchValue(value=thoth_type.value))]
+            ),
+            limit=1000,
+            offset=offset,
+            with_payload=True,
+            with_vectors=False,
+        )
+        documents.extend(doc for doc in (vdbmanager._payload_to_document(r.payload) for r in records) if doc)
+        if offset is None:
+            return documents
+
+
+_indexes: Dict[Tuple[str, str], Tuple[float, BM25Index]] = {}
+# Guards _indexes and _build_locks only; indexes are built outside it
+_indexes_lock = threading.Lock()
+# One per collection and type, held while its index is built
+_build_locks: Dict[Tuple[str, str], threading.Lock] = {}
+
+
+def _build_sparse_index(vdbmanager, thoth_type: ThothType, key: Tuple[str, str]) -> BM25Index:
+    started = time.perf_counter()
+    documents = _documents_of_type(vdbmanager, thoth_type)
+    index = BM25Index(documents, [document_text(doc) for doc in documents])
+    with _indexes_lock:
+        _indexes[key] = (time.monotonic(), index)
+    logger.info(
+        f"BM25 index of {key[0]} {thoth_type.value}: {len(index)} documents "
+        f"in {(time.perf_counter() - started) * 1000:.0f} ms"
+    )
+    return index
+
+
+def _rebuild_sparse_index(vdbmanager, thoth_type: ThothType, key: Tuple[str, str], build_lock: threading.Lock) -> None:
+    try:
+        _build_sparse_index(vdbmanager, thoth_type, key)
+    except Exception as e:
+        logger.warning(f"BM25 index of {key[0]} {thoth_type.value} not rebuilt, keeping the previous one: {e}")
+    finally:
+        build_lock.release()
+
+
+def get_sparse_index(vdbmanager, thoth_type: ThothType) -> BM25Index:
+    """
+    The BM25 index of one document type of vdbmanager's collection. The
+    first call builds it; after the TTL it is rebuilt in the background
+    while callers keep getting the previous one. Raises when the first
+    build fails.
+    """
+    key = (str(getattr(vdbmanager, "collection_name", id(vdbmanager))), thoth_type.value)
+    with _indexes_lock:
+        cached = _indexes.get(key)
+        build_lock = _build_locks.setdefault(key, threading.Lock())
+
+    if cached is not None:
+        if time.monotonic() - cached[0] >= SPARSE_INDEX_TTL and build_lock.acquire(blocking=False):
+            threading.Thread(
+                target=_rebuild_sparse_index,
+                args=(vdbmanager, thoth_type, key, build_lock),
+                name=f"bm25-{key[0]}-{key[1]}",
+                daemon=True,
+            ).start()
+        return cached[1]
+
+    # First use: concurrent callers for the same collection wait for one build
+    with build_lock:
+        with _indexes_lock:
+            cached = _indexes.get(key)
+        if cached is not None:
+            return cached[1]
+        return _build_sparse_index(vdbmanager, thoth_type, key)
+
+
+def clear_sparse_indexes() -> None:
+    with _indexes_lock:
+        _indexes.clear()
+
+
+def _dense_search(vdbmanager, query: str, requests: Sequence[Tuple[ThothType, int, float]]) -> List[List[Any]]:
+    """One ranking per (type, limit, score_threshold), in a single batched request on Qdrant."""
+    client = getattr(vdbmanager, "client", None)
+    if client is None or not hasattr(client, "query_batch_points") or not hasattr(vdbmanager, "_payload_to_document"):
+        return [
+            vdbmanager.search_similar(query=query, doc_type=thoth_type, top_k=limit, score_threshold=threshold)
+            for thoth_type, limit, threshold in requests
+        ]
+
+    from qdrant_client import models
+
+    vector = vdbmanager.embedding_manager.encode_query(query)
+    responses = client.query_batch_points(
+        collection_name=vdbmanager.collection_name,
+        requests=[
+            models.QueryRequest(
+                query=vector,
+                filter=models.Filter(
+                    must=[models.FieldCondition(key="thoth_type", match=models.MatchValue(value=thoth_type.value))]
+                ),
+                limit=limit,
+                score_threshold=threshold,
+                with_payload=True,
+            )
+            for thoth_type, limit, threshold in requests
+        ],
+    )
+    rankings = []
+    for response in responses:
+        documents = (vdbmanager._payload_to_document(point.payload) for point in response.points)
+        rankings.append([doc for doc in documents if doc])
+    return rankings
+
+
+def reciprocal_rank_fusion(rankings: Iterable[Sequence[Any]], k: int = RRF_K) -> List[Any]:
+    """Documents of all rankings by sum(1 / (k + rank)); ties keep their first-seen order."""
+    scores: Dict[Any, float] = {}
+    documents: Dict[Any, Any] = {}
+    for ranking in rankings:
+        for rank, doc in enumerate(ranking, start=1):
+            key = getattr(doc, "id", None) or id(doc)
+            scores[key] = scores.get(key, 0.0) + 1.0 / (k + rank)
+            documents.setdefault(key, doc)
+    return [documents[key] for key in sorted(scores, key=lambda key: -scores[key])]
+
+
+def hybrid_search(
+    vdbmanager, keywords: List[str], requests: Sequence[Tuple[ThothType, int, float]]
+) -> List[List[Any]]:
+    """
+    For each (type, top_k, score_threshold) request, the documents of that
+    type ranked by fused dense and BM25 ranks. Each ranking contributes
+    CANDIDATE_FACTOR * top_k candidates, so that the lists stay long enough
+    after deduplication. The caller cuts them to top_k.
+    """
+    query = " ".join(keywords) if keywords else ""
+    if not query.strip():
+        return [[] for _ in requests]
+
+    candidates = [(thoth_type, top_k * CANDIDATE_FACTOR, threshold) for thoth_type, top_k, threshold in requests]
+    dense = _dense_search(vdbmanager, query, candidates)
+    if not HYBRID_ENABLED:
+        return dense
+
+    results = []
+    for (thoth_type, limit, _), dense_ranking in zip(candidates, dense):
+        try:
+            sparse_ranking = get_sparse_index(vdbmanager, thoth_type).search(query, limit, BM25_MIN_MATCH)
+        except Exception as e:
+            # The dense ranking alone is still a valid answer
+            logger.warning(f"BM25 search of {thoth_type.value} failed, using dense results only: {e}")
+            sparse_ranking = []
+        results.append(reciprocal_rank_fusion([dense_ranking, sparse_ranking]))
+    return results
+
+
+def unique_evidence(documents: Iterable[Any], limit: int) -> List[str]:
+    """Up to limit distinct, non-blank evidence texts, in ranking order."""
+    seen = set()
+    evidence = []
+    for doc in documents:
+        text = (getattr(doc, "evidence", "") or "").strip()
+        key = normalized_key(text)
+        if not key or key in seen:
+            continue
+        seen.add(key)
+        evidence.append(text)
+        if len(evidence) >= limit:
+            break
+    return evidence
+
+
+def unique_sql_documents(documents: Iterable[Any], limit: int) -> List[Any]:
+    """Up to limit SQL documents with distinct (question, SQL), in ranking order."""
+    seen = set()
+    unique = []
+    for doc in documents:
+        key = (normalized_key(getattr(doc, "question", "")), normalized_key(getattr(doc, "sql", "")))
+        if key in seen:
+            continue
+        seen.add(key)
+        unique.append(doc)
+        if len(unique) >= limit:
+            break
+    return unique
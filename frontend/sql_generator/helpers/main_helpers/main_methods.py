@@ -17,16 +17,18 @@ import traceback
 from typing import Dict, Any
 
 import httpx
-from thoth_dbmanager import ThothDbFactory
-from thoth_qdrant import VectorStoreFactory
 
+from ..http_clients import get_http_clients
+from ..telemetry import configure_telemetry
 from ..vectordb_config_utils import (
     build_vector_db_params,
     extract_vector_db_config_from_workspace,
     get_supported_vector_backends,
 )
-from agents.core.agent_manager import ThothAgentManager
-from thoth_dbmanager import get_available_databases
+
+# thoth_dbmanager, thoth_qdrant and the agents (pydantic-ai) are imported by
+# the functions using them, so they load on the first workspace setup rather
+# than when the service starts.
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -232,6 +234,8 @@ def initialize_database_plugins():
                 "Database plugins modules unavailable (missing deps): " + ", ".join(failed_plugins)
             )
         
+        from thoth_dbmanager import get_available_databases
+
         # Get available databases based on installed dependencies
         available_databases = get_available_databases()
         
@@ -263,6 +267,8 @@ def initialize_vectordb_backend_plugins():
         Dict[str, bool]: Dictionary mapping backend names to availability status
     """
     try:
+        from thoth_qdrant import VectorStoreFactory
+
         # Ask the installed factory for currently loadable backends
         loadable_backends = set(VectorStoreFactory.list_backends())
 
@@ -344,6 +350,8 @@ def _initialize_vdbmanager(workspace_config, sql_db_config):
             vdbmanager_status = f"Vector database backend '{vect_type}' unavailable - missing dependencies"
             return vdbmanager, vdbmanager_status
             
+        from thoth_qdrant import VectorStoreFactory
+
         # Create vdbmanager instance using the plugin-aware factory
         # Add a small delay to avoid connection issues with Docker-based Qdrant
         import time
@@ -396,14 +404,14 @@ async def _get_workspace_config(workspace_id: int) -> Dict[str, Any]:
         
         logger.info(f"[_get_workspace_config] Fetching workspace config from: {url}")
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers, timeout=10.0)
-            response.raise_for_status()
-            
-            workspace_config = response.json()
-            logger.info(f"Successfully loaded workspace: {workspace_config.get('name', 'Unknown')}")
-            
-            return workspace_config
+        client = get_http_clients().async_client()
+        response = await client.get(url, headers=headers, timeout=10.0)
+        response.raise_for_status()
+        
+        workspace_config = response.json()
+        logger.info(f"Successfully loaded workspace: {workspace_config.get('name', 'Unknown')}")
+        
+        return workspace_config
             
     except httpx.HTTPStatusError as e:
         logger.error(f"HTTP error fetching workspace {workspace_id}: {e.response.status_code} - {e.response.text}")
@@ -434,11 +442,9 @@ def _initialize_dbmanager(sql_db_config):
         db_root_path = os.getenv("DB_ROOT_PATH", "/data/databases")
         db_mode = sql_db_config.get('db_mode', 'dev')
         
-        # Ensure plugins are initialized (this will import the plugins module and register them)
-        initialize_database_plugins()
-        
-        # Get available databases from plugin discovery
-        available_databases = get_available_databases()
+        # Ensure plugins are initialized (this will import the plugins module and register them);
+        # the first call imports them, later calls return the cached availability
+        available_databases = initialize_database_plugins()
         
         # Check if the requested database type is available
         if db_type not in available_databases:
@@ -490,6 +496,8 @@ def _initialize_dbmanager(sql_db_config):
                 'password': sql_db_config.get('password', ''),
             })
         
+        from thoth_dbmanager import ThothDbFactory
+
         # Create the dbmanager using the factory (which uses the plugin system)
         dbmanager = ThothDbFactory.create_manager(**common_params)
         dbmanager_status = f"{db_type.upper()} dbmanager initialized for {sql_db_config.get('db_name', 'unknown')}"
@@ -526,19 +534,19 @@ async def _get_agent_pools(workspace_id: int):
             'Content-Type': 'application/json'
         }
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers, timeout=10.0)
+        client = get_http_clients().async_client()
+        response = await client.get(url, headers=headers, timeout=10.0)
+        
+        if response.status_code == 200:
+            pool_config = response.json()
+            logger.info(f"Successfully fetched agent pools for workspace {workspace_id}")
             
-            if response.status_code == 200:
-                pool_config = response.json()
-                logger.info(f"Successfully fetched agent pools for workspace {workspace_id}")
-                
-                # Convert to AgentPoolConfig model
-                from model.agent_pool_config import AgentPoolConfig
-                return AgentPoolConfig(**pool_config)
-            else:
-                logger.error(f"Failed to fetch agent pools: {response.status_code} - {response.text}")
-                return None
+            # Convert to AgentPoolConfig model
+            from model.agent_pool_config import AgentPoolConfig
+            return AgentPoolConfig(**pool_config)
+        else:
+            logger.error(f"Failed to fetch agent pools: {response.status_code} - {response.text}")
+            return None
                 
     except Exception as e:
         logger.error(f"Error fetching agent pools: {e}")
@@ -574,6 +582,10 @@ async def _setup_dbmanager_and_agents(workspace_id: int, request) -> Dict[str, A
         Dict containing initialized dbmanager, vdbmanager, and agent pool with workspace details
     """
     from helpers.dual_logger import log_error, log_info
+    from agents.core.agent_manager import ThothAgentManager
+    
+    # Agents are traced from their first run on
+    configure_telemetry()
     
     try:
         logger.info(f"Setting up dbmanager, vdbmanager and agents for workspace {workspace_id}...")
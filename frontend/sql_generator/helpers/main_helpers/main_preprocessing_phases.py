@@ -197,9 +197,10 @@ async def _retrieve_context_phase(
     state.execution.context_retrieval_start_time = datetime.now()
     logger.debug(f"Starting context retrieval at {state.execution.context_retrieval_start_time}")
     
-    # Get evidences and SQL shots from vector databases
-    evidence_success, evidence_list, evidence_error = state.get_evidence_from_vector_db()
-    sql_success, sql_examples, sql_error = state.get_sql_from_vector_db()
+    # Get evidences and SQL shots from vector databases, in one hybrid search
+    (evidence_success, evidence_list, evidence_error), (sql_success, sql_examples, sql_error) = (
+        state.get_evidence_and_sql_from_vector_db()
+    )
     
     # Check if vector DB is completely unavailable (critical issue)
     if not state.vdbmanager:
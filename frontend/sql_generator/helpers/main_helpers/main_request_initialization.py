@@ -31,7 +31,7 @@ from helpers.main_helpers.main_methods import (
     _is_positive,
     build_not_ready_error_details
 )
-from helpers.db_info import get_db_schema
+from helpers.workspace_artifacts import get_cached_db_schema
 from helpers.dual_logger import log_error
 from helpers.language_utils import resolve_language_name
 
@@ -220,7 +220,7 @@ async def _initialize_request_state(
     
     # Critical Step 3: Get database schema with error handling
     try:
-        state.full_schema = get_db_schema(state.dbmanager.db_id, state.dbmanager.schema)
+        state.full_schema = get_cached_db_schema(state.dbmanager.db_id, state.dbmanager.schema)
         if not state.full_schema:
             raise ValueError("Database schema is empty - no tables found")
     except Exception as e:
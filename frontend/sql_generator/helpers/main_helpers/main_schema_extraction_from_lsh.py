@@ -24,10 +24,15 @@ Current embedding calls will be deprecated in future versions.
 import logging
 import difflib
 import numpy as np
-from typing import Dict, List, Any, Optional
+from typing import TYPE_CHECKING, Dict, List, Any, Optional
 
-from model.system_state import SystemState
-from ..db_info import get_db_schema
+from ..embedding_cache import get_embedding_cache
+from ..string_similarity import all_pairs_matches, batched_ratios
+from ..value_index import value_index_for
+from ..workspace_artifacts import column_strings_for, get_cached_db_schema, get_column_embeddings
+
+if TYPE_CHECKING:
+    from model.system_state import SystemState
 
 logger = logging.getLogger(__name__)
 
@@ -93,7 +98,52 @@ def format_full_schema_for_display(full_schema: Dict[str, Dict[str, Any]]) -> st
     return "\n".join(lines)
 
 
-def extract_schema_via_lsh(state: SystemState) -> tuple[Dict[str, List[str]], Dict[str, Dict[str, Any]]]:
+class VDBEmbeddingWrapper:
+    """
+    Makes the vdbmanager's embedding manager usable as the LSH code's
+    embedding function, with every encode going through the shared
+    embedding cache (see helpers/embedding_cache.py).
+    """
+
+    def __init__(self, vdb_manager, workspace_id=None):
+        self.vdb_manager = vdb_manager
+        self.workspace_id = workspace_id
+        # Access the embedding_manager directly from the QdrantNativeAdapter
+        if hasattr(vdb_manager, 'embedding_manager'):
+            self.embedding_manager = vdb_manager.embedding_manager
+        else:
+            raise ValueError("VDB Manager does not have an embedding_manager attribute")
+        # Identifies the embedding model, so cached embeddings are never mixed across models
+        provider = getattr(self.embedding_manager, 'provider', None)
+        self.model_key = (
+            getattr(provider, 'provider_name', type(provider).__name__),
+            getattr(provider, 'model', None),
+        )
+
+    def encode(self, texts, **kwargs):
+        """Encode texts using the configured VDB manager's embedding manager."""
+        try:
+            return get_embedding_cache().encode(
+                lambda batch: self.embedding_manager.encode(batch, **kwargs),
+                model=f"{self.model_key[0]}:{self.model_key[1]}",
+                texts=texts,
+                workspace=self.workspace_id,
+            )
+        except Exception as e:
+            error_msg = f"Failed to generate embeddings via vdbmanager: {e}"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+
+
+def simplify_schema(full_schema: Dict[str, Dict[str, Any]]) -> Dict[str, List[str]]:
+    """Reduce a get_db_schema result to {table_name: [column_name, ...]}."""
+    return {
+        table_name: list(table_info["columns"].keys())
+        for table_name, table_info in full_schema.items()
+    }
+
+
+def extract_schema_via_lsh(state: "SystemState") -> tuple[Dict[str, List[str]], Dict[str, Dict[str, Any]]]:
     """
     Estrae schema usando similarity search LSH con parametri configurabili.
     
@@ -115,6 +165,7 @@ def extract_schema_via_lsh(state: SystemState) -> tuple[Dict[str, List[str]], Di
     edit_distance_threshold = setting.get("edit_distance_threshold", 0.2)  # Better default than 0.3
     embedding_similarity_threshold = setting.get("embedding_similarity_threshold", 0.4)  # Better default than 0.6
     max_examples_per_column = setting.get("max_examples_per_column", 10)  # Better default than 5
+    value_index_backend = setting.get("value_index_backend", "lsh")
     
     # Log configuration at DEBUG level with human-friendly formatting
     logger.debug("="*60)
@@ -126,22 +177,21 @@ def extract_schema_via_lsh(state: SystemState) -> tuple[Dict[str, List[str]], Di
     logger.debug(f"  - Edit Distance Threshold: {edit_distance_threshold:.1%}")
     logger.debug(f"  - Embedding Similarity Threshold: {embedding_similarity_threshold:.1%}")
     logger.debug(f"  - Max Examples per Column: {max_examples_per_column}")
+    logger.debug(f"  - Value Index: {value_index_backend}")
     logger.debug("-"*60)
     
     logger.info(f"LSH Configuration from settings: signature_size={signature_size}, top_n={lsh_top_n}, "
                 f"edit_distance={edit_distance_threshold:.2f}, embedding_similarity={embedding_similarity_threshold:.2f}, "
-                f"max_examples={max_examples_per_column}")
+                f"max_examples={max_examples_per_column}, value_index={value_index_backend}")
     
     # Concatena le tre evidence come specificato nelle istruzioni
     evidence = " ".join(state.evidence) if state.evidence else ""
     
     # Get the schema from dbmanager using the correct function
-    tentative_schema = get_db_schema(state.dbmanager.db_id, state.dbmanager.schema)
+    tentative_schema = get_cached_db_schema(state.dbmanager.db_id, state.dbmanager.schema)
     
     # Semplifica lo schema per uso interno (copia da RetrieveEntityTool._simplify_schema)
-    simplified_schema = {}
-    for table_name, table_info in tentative_schema.items():
-        simplified_schema[table_name] = list(table_info["columns"].keys())
+    simplified_schema = simplify_schema(tentative_schema)
     
     # Get embedding function from state's vdbmanager
     # VDB Manager is required for LSH-based schema extraction
@@ -150,28 +200,7 @@ def extract_schema_via_lsh(state: SystemState) -> tuple[Dict[str, List[str]], Di
         logger.error(error_msg)
         raise ValueError(error_msg)
     
-    # Create a wrapper to make vdbmanager compatible with the LSH code expectations
-    class VDBEmbeddingWrapper:
-        def __init__(self, vdb_manager):
-            self.vdb_manager = vdb_manager
-            # Access the embedding_manager directly from the QdrantNativeAdapter
-            if hasattr(vdb_manager, 'embedding_manager'):
-                self.embedding_manager = vdb_manager.embedding_manager
-            else:
-                raise ValueError("VDB Manager does not have an embedding_manager attribute")
-            
-        def encode(self, texts, **kwargs):
-            """Encode texts using the configured VDB manager's embedding manager."""
-            try:
-                # Use the embedding_manager's encode method directly
-                # It already handles both single strings and lists properly
-                return self.embedding_manager.encode(texts, **kwargs)
-            except Exception as e:
-                error_msg = f"Failed to generate embeddings via vdbmanager: {e}"
-                logger.error(error_msg)
-                raise ValueError(error_msg)
-    
-    embedding_function = VDBEmbeddingWrapper(state.vdbmanager)
+    embedding_function = VDBEmbeddingWrapper(state.vdbmanager, workspace_id=state.request.workspace_id)
     
     # Parameters are now configured from workspace settings (see above)
     
@@ -190,7 +219,7 @@ def extract_schema_via_lsh(state: SystemState) -> tuple[Dict[str, List[str]], Di
     
     raw_schema_with_examples = _get_similar_entities_lsh(
         keywords=state.keywords,
-        dbmanager=state.dbmanager,
+        dbmanager=value_index_for(state.dbmanager, value_index_backend),
         signature_size=signature_size,
         lsh_top_n=lsh_top_n,
         edit_distance_threshold=edit_distance_threshold,
@@ -296,15 +325,14 @@ def _get_similar_columns_no_embed_lsh(
             potential_column_names.extend(part.strip() for part in token.split())
 
     # Seleziona colonne con semplice matching
+    pairs = [(table, column_name) for table, columns in schema.items() for column_name in columns]
+    matched = _keyword_column_matches_lsh(potential_column_names, [column for _, column in pairs])
     selected_columns: Dict[str, List[str]] = {}
-    for table, columns in schema.items():
-        for column_name in columns:
-            for candidate in potential_column_names:
-                if _does_keyword_match_column_lsh(candidate, column_name):
-                    selected_columns.setdefault(table, [])
-                    if column_name not in selected_columns[table]:
-                        selected_columns[table].append(column_name)
-                    break
+    for (table, column_name), is_match in zip(pairs, matched):
+        if is_match:
+            selected_columns.setdefault(table, [])
+            if column_name not in selected_columns[table]:
+                selected_columns[table].append(column_name)
     return selected_columns
 
 
@@ -343,6 +371,10 @@ def _extract_paranthesis_lsh(string: str) -> List[str]:
     return paranthesis_matches
 
 
+def _normalize_column_name_lsh(name: str) -> str:
+    return name.lower().replace(" ", "").replace("_", "").rstrip("s")
+
+
 def _does_keyword_match_column_lsh(
     keyword: str, column_name: str, threshold: float = 0.9
 ) -> bool:
@@ -350,12 +382,24 @@ def _does_keyword_match_column_lsh(
     Check if a keyword matches a column name based on similarity.
     Copied from RetrieveEntityTool._does_keyword_match_column
     """
-    keyword = keyword.lower().replace(" ", "").replace("_", "").rstrip("s")
-    column_name = column_name.lower().replace(" ", "").replace("_", "").rstrip("s")
+    keyword = _normalize_column_name_lsh(keyword)
+    column_name = _normalize_column_name_lsh(column_name)
     similarity = difflib.SequenceMatcher(None, column_name, keyword).ratio()
     return similarity >= threshold
 
 
+def _keyword_column_matches_lsh(
+    keywords: List[str], column_names: List[str], threshold: float = 0.9
+) -> np.ndarray:
+    """
+    For each column name, whether any keyword matches it according to
+    _does_keyword_match_column_lsh, computed for all pairs in one batch.
+    """
+    normalized_columns = [_normalize_column_name_lsh(column) for column in column_names]
+    normalized_keywords = list(dict.fromkeys(_normalize_column_name_lsh(keyword) for keyword in keywords))
+    return all_pairs_matches(normalized_columns, normalized_keywords, threshold).any(axis=1)
+
+
 def _get_similar_column_names_lsh(
     keywords: List[str], question: str, evidence: str,
     simplified_schema: Dict[str, List[str]], embedding_function
@@ -383,44 +427,29 @@ def _get_similar_column_names_lsh(
             potential_column_names.extend(part.strip() for part in keyword.split())
 
     # Prepara la lista di stringhe da incorporare
-    column_strings = [
-        f"`{table}`.`{column}`"
-        for table, columns in schema.items()
-        for column in columns
-    ]
+    column_strings = column_strings_for(schema)
 
     if not column_strings:
         return []  # Return an empty list if no columns were found
 
     question_evidence_string = f"{question} {evidence}"
 
-    to_embed_strings = column_strings + [question_evidence_string]
-
-    # Get the embeddings
-    embeddings = embedding_function.encode(to_embed_strings)
-
-    # Separa gli embedding
-    column_embeddings = embeddings[:-1]  # Tutti tranne l'ultimo
-    question_evidence_embedding = embeddings[-1]  # L'ultimo
-
-    # Calcola le similarità
-    similar_column_names = []
-    for i, column_embedding in enumerate(column_embeddings):
-        if i >= len(column_strings):  # Aggiungi controllo di sicurezza
-            break
-        table, column = column_strings[i].split(".")[0].strip("`"), column_strings[
-            i
-        ].split(".")[1].strip("`")
-        for potential_column_name in potential_column_names:
-            if _does_keyword_match_column_lsh(potential_column_name, column):
-                similarity_score = np.dot(column_embedding, question_evidence_embedding)
-                similar_column_names.append((table, column, similarity_score))
-
-    similar_column_names.sort(key=lambda x: x[2], reverse=True)
-    table_column_pairs = list(
-        set([(table, column) for table, column, _ in similar_column_names])
-    )
-    return table_column_pairs
+    # Column embeddings only change with the schema, so they come from the
+    # workspace artifact cache; only the question is embedded per request
+    column_embeddings = get_column_embeddings(embedding_function, column_strings)
+    question_evidence_embedding = np.asarray(embedding_function.encode([question_evidence_string]))[0]
+
+    # Calcola le similarità: one matrix-vector product, name matching in one batch
+    table_column_pairs = [
+        (column_string.split(".")[0].strip("`"), column_string.split(".")[1].strip("`"))
+        for column_string in column_strings
+    ]
+    matched = _keyword_column_matches_lsh(potential_column_names, [column for _, column in table_column_pairs])
+    similarity_scores = column_embeddings[: len(column_strings)] @ question_evidence_embedding
+
+    # Best-scoring columns first, each (table, column) once
+    order = [i for i in np.argsort(-similarity_scores, kind="stable") if matched[i]]
+    return list(dict.fromkeys(table_column_pairs[i] for i in order))
 
 
 def _get_similar_entities_lsh(
@@ -523,6 +552,8 @@ def _get_similar_entities_via_LSH_lsh(
 ) -> List[Dict[str, Any]]:
     """
     Get similar entities via LSH with configurable parameters.
+    dbmanager is anything with query_lsh(): the dbmanager itself or a
+    TrigramValueIndex (see helpers/value_index.py).
     """
     similar_entities_via_LSH = []
     
@@ -591,15 +622,22 @@ def _get_similar_entities_via_edit_distance_lsh(
     Filtra entità per edit distance.
     Copiato da RetrieveEntityTool._get_similar_entities_via_edit_distance
     """
+    substrings: Dict[str, int] = {}
+    values: Dict[str, int] = {}
+    substring_index = [
+        substrings.setdefault(packet["substring"].lower(), len(substrings)) for packet in similar_entities_via_LSH
+    ]
+    value_index = [
+        values.setdefault(packet["similar_value"].lower(), len(values)) for packet in similar_entities_via_LSH
+    ]
+    ratios = batched_ratios(
+        list(substrings), list(values), np.array(substring_index), np.array(value_index), edit_distance_threshold
+    )
+
     similar_entities_via_edit_distance_similarity = []
-    for entity_packet in similar_entities_via_LSH:
-        edit_distance_similarity = difflib.SequenceMatcher(
-            None,
-            entity_packet["substring"].lower(),
-            entity_packet["similar_value"].lower(),
-        ).ratio()
-        if edit_distance_similarity >= edit_distance_threshold:
-            entity_packet["edit_distance_similarity"] = edit_distance_similarity
+    for entity_packet, edit_distance_similarity in zip(similar_entities_via_LSH, ratios):
+        if not np.isnan(edit_distance_similarity):
+            entity_packet["edit_distance_similarity"] = float(edit_distance_similarity)
             similar_entities_via_edit_distance_similarity.append(entity_packet)
     return similar_entities_via_edit_distance_similarity
 
@@ -21,11 +21,21 @@ from typing import List, Tuple, Dict, Any
 from pydantic_ai.settings import ModelSettings
 from pydantic_ai.exceptions import UnexpectedModelBehavior
 from model.state_factory import StateFactory
-from helpers.template_preparation import format_example_shots
+from helpers.template_preparation import TemplateLoader, format_example_shots
 from helpers.main_helpers.main_generate_mschema import generate_dynamic_mschema
 
 logger = logging.getLogger(__name__)
 
+# Map method to template file
+SQL_GENERATION_TEMPLATES = {
+    "query_plan": "template_generate_sql_query_plan.txt",
+    "step_by_step": "template_generate_sql_step_by_step.txt",
+    "divide_and_conquer": "template_generate_sql_divide_and_conquer.txt"
+}
+SQL_GENERATION_VARIABLES = (
+    "QUESTION", "DATABASE_TYPE", "DATABASE_SCHEMA", "DIRECTIVES", "EVIDENCE", "EXAMPLE_SHOTS"
+)
+
 
 def prepare_user_prompt_with_method(
     question: str,
@@ -51,22 +61,10 @@ def prepare_user_prompt_with_method(
     Returns:
         Formatted user prompt with methodology instructions
     """
-    import os
-    from helpers.agents_utils import get_project_root
-    
-    # Map method to template file
-    template_files = {
-        "query_plan": "template_generate_sql_query_plan.txt",
-        "step_by_step": "template_generate_sql_step_by_step.txt",
-        "divide_and_conquer": "template_generate_sql_divide_and_conquer.txt"
-    }
-    
-    template_file = template_files.get(method, "template_generate_sql_query_plan.txt")
-    template_path = os.path.join(get_project_root(), "templates", template_file)
+    template_file = SQL_GENERATION_TEMPLATES.get(method, SQL_GENERATION_TEMPLATES["query_plan"])
     
-    # Load the template
-    with open(template_path, "r") as file:
-        raw_template = file.read()
+    # Parsed once per file version; checked against the variables filled below
+    template = TemplateLoader.compiled(template_file, variables=SQL_GENERATION_VARIABLES)
     
     # Add database-specific NULL handling rules to directives
     db_type_lower = database_type.lower() if database_type else "sqlite"
@@ -89,7 +87,7 @@ DATABASE RULE FOR {database_type}:
     enhanced_directives = (directives or "") + "\n\n" + null_handling_rules
     
     # Fill the template
-    filled_template = raw_template.format(
+    filled_template = template.render(
         QUESTION=question,
         DATABASE_TYPE=database_type or "",
         DATABASE_SCHEMA=schema,
@@ -175,6 +173,9 @@ async def generate_sql_units(state, agents_and_tools, functionality_level, timeo
         return [(False, "") for _ in range(state.number_of_sql_to_generate)]
     
     logger.info(f"Using {functionality_level} SQL agent for {state.number_of_sql_to_generate} generations")
+    # Every candidate comes from this agent; the log groups latencies by it
+    if hasattr(state, 'generation'):
+        state.generation.sql_agent_name = getattr(agent, 'name', None) or f"sql_{level}_agent"
     
     # Define the methods to cycle through
     methods = ["query_plan", "step_by_step", "divide_and_conquer"]
@@ -0,0 +1,204 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Multi-worker serving with artifacts loaded once, before the workers fork.
+
+`serve_prefork()` runs N uvicorn workers on one listening socket (the
+gunicorn --preload model, without the extra dependency). Before forking,
+the parent loads the immutable artifacts of every workspace: LSH indexes and
+schema snapshots. The workers inherit them copy-on-write, and gc.freeze()
+keeps the garbage collector from touching (and so copying) those pages.
+Column-embedding matrices are shared through mmap files in
+THOTH_ARTIFACT_DIR instead, because computing them needs the embedding
+provider.
+
+Per worker, and never shared:
+- event loop, HTTP clients and agents;
+- database and vector store connections;
+- LRU caches filled after the fork.
+
+Settings (environment variables):
+- THOTH_WORKERS: number of workers, or "auto" for one per CPU (default: 1,
+  single-process uvicorn as before).
+- THOTH_PRELOAD: "false" to skip the pre-fork loading (default: "true").
+- THOTH_ARTIFACT_DIR: directory of the mmap-shared artifacts (default in
+  multi-worker mode: thoth-artifacts in the temp directory).
+
+See docs/MULTI_WORKER.md for the memory-per-worker benchmark.
+"""
+
+import asyncio
+import gc
+import logging
+import os
+import signal
+import socket
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+PRELOAD_ENABLED = os.getenv("THOTH_PRELOAD", "true").lower() == "true"
+
+
+def resolve_workers(value: Optional[str] = None) -> int:
+    """Worker count from THOTH_WORKERS ("auto" means one per CPU)."""
+    value = (value if value is not None else os.getenv("THOTH_WORKERS", "1")).strip().lower()
+    if value == "auto":
+        return os.cpu_count() or 1
+    return max(1, int(value))
+
+
+async def _preload(workspace_ids: Optional[List[int]]) -> Dict[int, str]:
+    from .http_clients import get_http_clients
+    from .main_helpers.main_methods import _get_workspace, _initialize_dbmanager
+    from .warmup import _load_lsh, configured_workspace_ids, list_workspace_ids
+    from .workspace_artifacts import get_cached_db_schema
+
+    results = {}
+    try:
+        ids = workspace_ids or configured_workspace_ids() or await list_workspace_ids()
+        for workspace_id in ids:
+            try:
+                workspace_config = await _get_workspace(workspace_id)
+                dbmanager, status = await asyncio.to_thread(
+                    _initialize_dbmanager, workspace_config.get("sql_db", {})
+                )
+                if dbmanager is None:
+                    raise ValueError(status)
+                await asyncio.gather(
+                    asyncio.to_thread(_load_lsh, dbmanager),
+                    asyncio.to_thread(get_cached_db_schema, dbmanager.db_id, dbmanager.schema),
+                )
+                results[workspace_id] = "loaded"
+            except Exception as e:
+                logger.error(f"Pre-fork loading of workspace {workspace_id} failed: {e}")
+                results[workspace_id] = f"failed: {e}"
+    finally:
+        # Clients and their sockets must not be shared with the workers
+        await get_http_clients().aclose()
+    return results
+
+
+def preload_shared_artifacts(workspace_ids: Optional[List[int]] = None) -> Dict[int, str]:
+    """Load LSH indexes and schema snapshots in the parent, before forking."""
+    started = time.perf_counter()
+    try:
+        results = asyncio.run(_preload(workspace_ids))
+    except Exception as e:
+        logger.error(f"Pre-fork loading skipped: {e}")
+        results = {}
+    # Move everything loaded so far out of the collector's reach: a GC pass
+    # in a worker would otherwise write to (and copy) every inherited page
+    gc.collect()
+    gc.freeze()
+    logger.info(
+        f"Pre-fork loading of {len(results)} workspaces took {time.perf_counter() - started:.2f} s, "
+        f"{gc.get_freeze_count()} objects frozen"
+    )
+    return results
+
+
+def after_fork() -> None:
+    """Drop the database connections inherited from the parent."""
+    registry = sys.modules.get("thoth_dbmanager.core.registry")
+    if registry is None:
+        # Nothing was connected before the fork
+        return
+    for plugin in list(registry.DbPluginRegistry._instances.values()):
+        engine = getattr(getattr(plugin, "adapter", None), "engine", None)
+        if engine is not None:
+            # close=False leaves the parent's connections alone and gives this worker a new pool
+            engine.dispose(close=False)
+
+
+def _bind(host: str, port: int) -> socket.socket:
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+def _run_worker(app, sock: socket.socket, uvicorn_options: dict) -> None:
+    import uvicorn
+
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    after_fork()
+    server = uvicorn.Server(uvicorn.Config(app, **uvicorn_options))
+    server.run(sockets=[sock])
+
+
+def serve_prefork(app, host: str, port: int, workers: int, **uvicorn_options) -> None:
+    """
+    Serve `app` with `workers` forked uvicorn workers, restarting any that
+    exits, until SIGTERM or SIGINT.
+    """
+    os.environ.setdefault("THOTH_ARTIFACT_DIR", os.path.join(tempfile.gettempdir(), "thoth-artifacts"))
+    if PRELOAD_ENABLED:
+        preload_shared_artifacts()
+
+    sock = _bind(host, port)
+    children: Dict[int, float] = {}
+    stopping = False
+
+    def spawn() -> None:
+        pid = os.fork()
+        if pid == 0:
+            status = 0
+            try:
+                _run_worker(app, sock, uvicorn_options)
+            except BaseException:
+                logger.exception("Worker crashed")
+                status = 1
+            finally:
+                os._exit(status)
+        children[pid] = time.monotonic()
+
+    def stop(signum, frame) -> None:
+        nonlocal stopping
+        stopping = True
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    logger.info(f"Starting {workers} workers on {host}:{port} (parent pid {os.getpid()})")
+    for _ in range(workers):
+        spawn()
+
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        started = children.pop(pid, None)
+        if stopping or started is None:
+            continue
+        logger.warning(f"Worker {pid} exited with status {os.waitstatus_to_exitcode(status)}, restarting")
+        # Do not spin when a worker dies right after starting
+        if time.monotonic() - started < 1.0:
+            time.sleep(1.0)
+        spawn()
+
+    sock.close()
+    logger.info("All workers stopped")
@@ -0,0 +1,178 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Batched difflib.SequenceMatcher ratios for the LSH filters.
+
+The filters keep exactly the pairs whose `SequenceMatcher(None, a, b).ratio()`
+reaches a threshold. Checking every pair in Python is the costly part. So
+`batched_ratios()` first computes, for all pairs at once with numpy, the
+bound that difflib's `quick_ratio()` gives: twice the size of the multiset
+intersection of the characters of a and b, over the total length. The ratio
+never exceeds this bound, so pairs below the threshold are dropped without
+running SequenceMatcher. The surviving pairs are grouped by b, so b is
+indexed once per group, and duplicate pairs are computed once. A pair where
+one string contains the other is scored directly, since its only matching
+block is the shorter string. Everything else gets the exact ratio from
+`_matching_characters()`, difflib's matching-block search without the
+junk handling and Match objects that isjunk=None and short b never need,
+so results are identical to the pairwise loop.
+"""
+
+import difflib
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+# Pairs per numpy block when computing bounds, to cap temporary memory
+_BLOCK = 4096
+
+
+def _char_counts(strings: Sequence[str]) -> np.ndarray:
+    """(len(strings), alphabet) matrix of character counts, alphabet in first-seen order."""
+    lengths = np.fromiter((len(string) for string in strings), dtype=np.intp, count=len(strings))
+    codes = np.frombuffer("".join(strings).encode("utf-32-le"), dtype=np.uint32)
+    alphabet, columns = np.unique(codes, return_inverse=True)
+    rows = np.repeat(np.arange(len(strings)), lengths)
+    counts = np.zeros((len(strings), len(alphabet)), dtype=np.int32)
+    np.add.at(counts, (rows, columns), 1)
+    return counts
+
+
+def ratio_upper_bounds(
+    a_strings: Sequence[str], b_strings: Sequence[str], a_index: np.ndarray, b_index: np.ndarray
+) -> np.ndarray:
+    """difflib's quick_ratio() of the pairs (a_strings[a_index[k]], b_strings[b_index[k]])."""
+    # One alphabet for both sides, so the count columns line up
+    counts = _char_counts([*a_strings, *b_strings])
+    a_counts, b_counts = counts[: len(a_strings)], counts[len(a_strings):]
+    a_lengths = a_counts.sum(axis=1)
+    b_lengths = b_counts.sum(axis=1)
+
+    bounds = np.empty(len(a_index), dtype=np.float64)
+    for start in range(0, len(a_index), _BLOCK):
+        a_rows = a_index[start:start + _BLOCK]
+        b_rows = b_index[start:start + _BLOCK]
+        matches = np.minimum(a_counts[a_rows], b_counts[b_rows]).sum(axis=1)
+        total = a_lengths[a_rows] + b_lengths[b_rows]
+        # Same formula as difflib._calculate_ratio, so comparisons agree exactly
+        with np.errstate(divide="ignore", invalid="ignore"):
+            bounds[start:start + _BLOCK] = np.where(total > 0, 2.0 * matches / total, 1.0)
+    return bounds
+
+
+# difflib's autojunk drops popular characters of b from 200 characters on
+_AUTOJUNK_LENGTH = 200
+
+
+def _positions(b: str) -> Dict[str, List[int]]:
+    """Positions of each character of b, as SequenceMatcher's b2j without junk."""
+    b2j: Dict[str, List[int]] = {}
+    for j, char in enumerate(b):
+        b2j.setdefault(char, []).append(j)
+    return b2j
+
+
+def _matching_characters(a: str, b: str, b2j: Dict[str, List[int]]) -> int:
+    """
+    Total size of SequenceMatcher(None, a, b).get_matching_blocks() for b
+    shorter than 200 characters: the same longest-match recursion, with the
+    same tie-breaking, so the same blocks are found.
+    """
+    matches = 0
+    queue = [(0, len(a), 0, len(b))]
+    while queue:
+        alo, ahi, blo, bhi = queue.pop()
+        besti, bestj, bestsize = alo, blo, 0
+        # j2len[j]: length of the match ending with a[i - 1] and b[j]
+        j2len: Dict[int, int] = {}
+        for i in range(alo, ahi):
+            newj2len = {}
+            for j in b2j.get(a[i], ()):
+                if j < blo:
+                    continue
+                if j >= bhi:
+                    break
+                k = newj2len[j] = j2len.get(j - 1, 0) + 1
+                if k > bestsize:
+                    besti, bestj, bestsize = i - k + 1, j - k + 1, k
+            j2len = newj2len
+        if bestsize:
+            matches += bestsize
+            if alo < besti and blo < bestj:
+                queue.append((alo, besti, blo, bestj))
+            if besti + bestsize < ahi and bestj + bestsize < bhi:
+                queue.append((besti + bestsize, ahi, bestj + bestsize, bhi))
+    return matches
+
+
+def _ratio(a: str, b: str, b2j: Dict[str, List[int]]) -> float:
+    """SequenceMatcher(None, a, b).ratio(); b2j is _positions(b)."""
+    if len(b) >= _AUTOJUNK_LENGTH:
+        return difflib.SequenceMatcher(None, a, b).ratio()
+    total = len(a) + len(b)
+    if not total:
+        return 1.0
+    # When one string contains the other, the only matching block is the shorter one
+    if a in b or b in a:
+        return 2.0 * min(len(a), len(b)) / total
+    return 2.0 * _matching_characters(a, b, b2j) / total
+
+
+def batched_ratios(
+    a_strings: Sequence[str],
+    b_strings: Sequence[str],
+    a_index: np.ndarray,
+    b_index: np.ndarray,
+    threshold: float,
+) -> np.ndarray:
+    """
+    SequenceMatcher(None, a, b).ratio() for every pair whose ratio is at
+    least `threshold`, NaN for the others.
+    """
+    a_index = np.asarray(a_index, dtype=np.intp)
+    b_index = np.asarray(b_index, dtype=np.intp)
+    ratios = np.full(len(a_index), np.nan)
+    if not len(a_index):
+        return ratios
+
+    candidates = np.flatnonzero(ratio_upper_bounds(a_strings, b_strings, a_index, b_index) >= threshold)
+    # Grouped by b: b is indexed once per group, and duplicate pairs end up
+    # next to each other
+    candidates = candidates[np.lexsort((a_index[candidates], b_index[candidates]))]
+    kept: List[int] = []
+    values: List[float] = []
+    previous = (-1, -1)
+    ratio = 0.0
+    b2j: Dict[str, List[int]] = {}
+    for k, a_row, b_row in zip(
+        candidates.tolist(), a_index[candidates].tolist(), b_index[candidates].tolist()
+    ):
+        if (a_row, b_row) != previous:
+            if b_row != previous[1]:
+                b2j = _positions(b_strings[b_row])
+            ratio = _ratio(a_strings[a_row], b_strings[b_row], b2j)
+            previous = (a_row, b_row)
+        if ratio >= threshold:
+            kept.append(k)
+            values.append(ratio)
+    ratios[kept] = values
+    return ratios
+
+
+def all_pairs_matches(a_strings: List[str], b_strings: List[str], threshold: float) -> np.ndarray:
+    """(len(a_strings), len(b_strings)) mask of ratio(a, b) >= threshold."""
+    if not a_strings or not b_strings:
+        return np.zeros((len(a_strings), len(b_strings)), dtype=bool)
+    a_index, b_index = np.divmod(np.arange(len(a_strings) * len(b_strings)), len(b_strings))
+    ratios = batched_ratios(a_strings, b_strings, a_index, b_index, threshold)
+    return (~np.isnan(ratios)).reshape(len(a_strings), len(b_strings))
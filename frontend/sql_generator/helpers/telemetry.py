@@ -0,0 +1,62 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Logfire telemetry, configured on first use.
+
+Importing logfire (OpenTelemetry) and instrumenting PydanticAI (which
+imports pydantic-ai) used to happen when main.py was imported, delaying
+the first health check of every worker. `configure_telemetry()` now runs
+before the first workspace setup builds or runs agents, so every agent run
+is still traced. Until then `get_logfire()` returns None and the dual
+logger only writes to the application log.
+"""
+
+import logging
+import os
+import threading
+from types import ModuleType
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+_logfire: Optional[ModuleType] = None
+_lock = threading.Lock()
+
+
+def configure_telemetry() -> None:
+    """Configure logfire and instrument PydanticAI once per process."""
+    global _logfire
+    if _logfire is not None:
+        return
+    with _lock:
+        if _logfire is not None:
+            return
+        import logfire
+
+        logfire.configure(
+            send_to_logfire="if-token-present",
+            scrubbing=False,
+        )
+        # Instrument PydanticAI before any agent runs, so all agent activity is tracked
+        logfire.instrument_pydantic_ai()
+        _logfire = logfire
+
+    if os.getenv('LOGFIRE_TOKEN'):
+        logger.debug("Logfire configured and PydanticAI instrumented successfully")
+    else:
+        logger.info("Logfire token not found, telemetry will not be sent to logfire service")
+
+
+def get_logfire() -> Optional[ModuleType]:
+    """Return the logfire module once telemetry is configured, None before."""
+    return _logfire
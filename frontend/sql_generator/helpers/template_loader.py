@@ -6,36 +6,245 @@
 Generic Template Loader
 
 This module provides a unified template loading system to reduce code duplication.
+
+Templates are parsed once into a list of literal and placeholder segments
+(`CompiledTemplate`), so rendering a prompt is a single `str.join` instead
+of a scan of the whole text per variable. Two placeholder syntaxes are
+supported:
+
+- format syntax (default): the `str.format` rules, with `{{`/`}}` escapes;
+- named syntax (`names=...`): only `{name}` for the given names is a
+  placeholder and every other brace is literal, for templates embedding
+  JSON examples (the former "safe" formatting).
+
+Compiled templates are cached per file. When THOTH_TEMPLATE_HOT_RELOAD is
+enabled (default outside Docker) the file's modification time is checked on
+each access and an edited template is recompiled.
 """
 
+import os
+import string
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
 import logging
+import re
+import threading
 
 logger = logging.getLogger(__name__)
 
+_IS_DOCKER = os.getenv('DOCKER_CONTAINER', 'false').lower() == 'true'
+HOT_RELOAD = os.getenv(
+    'THOTH_TEMPLATE_HOT_RELOAD', 'false' if _IS_DOCKER else 'true'
+).lower() in ('1', 'true', 'yes', 'on')
+
+_formatter = string.Formatter()
+
+
+class TemplateVariablesError(ValueError):
+    """Raised when a template and the variables passed to it do not match."""
+
+
+class CompiledTemplate:
+    """
+    A template parsed into segments. `_parts` holds the literal text with
+    an empty slot for each placeholder; rendering fills the slots of a copy
+    and joins it once.
+    """
+
+    __slots__ = ('source', 'origin', 'placeholders', '_parts', '_slots')
+
+    def __init__(self, source: str, names: Optional[Iterable[str]] = None, origin: str = '<string>'):
+        self.source = source
+        self.origin = origin
+        self._parts: List[str] = []
+        # (index in _parts, field name, conversion, format spec)
+        self._slots: List[Tuple[int, str, Optional[str], str]] = []
+
+        if names is None:
+            self._parse_format(source)
+        else:
+            self._parse_named(source, names)
+        self.placeholders: FrozenSet[str] = frozenset(
+            _field_root(name) for _, name, _, _ in self._slots
+        )
+
+    def _parse_format(self, source: str) -> None:
+        try:
+            parsed = list(_formatter.parse(source))
+        except ValueError as e:
+            raise TemplateVariablesError(f"Invalid placeholder syntax in template {self.origin}: {e}") from e
+        for literal, field_name, format_spec, conversion in parsed:
+            if literal:
+                self._parts.append(literal)
+            if field_name is not None:
+                if not field_name:
+                    raise TemplateVariablesError(f"Positional placeholder '{{}}' in template {self.origin}")
+                self._slots.append((len(self._parts), field_name, conversion, format_spec or ''))
+                self._parts.append('')
+
+    def _parse_named(self, source: str, names: Iterable[str]) -> None:
+        names = sorted(set(names), key=len, reverse=True)
+        if not names:
+            self._parts.append(source)
+            return
+        pattern = re.compile('|'.join(re.escape('{' + name + '}') for name in names))
+        position = 0
+        for match in pattern.finditer(source):
+            if match.start() > position:
+                self._parts.append(source[position:match.start()])
+            self._slots.append((len(self._parts), match.group()[1:-1], None, ''))
+            self._parts.append('')
+            position = match.end()
+        if position < len(source):
+            self._parts.append(source[position:])
+
+    def validate(self, variables: Iterable[str]) -> None:
+        """
+        Check the template against the variables its caller provides: a
+        placeholder without a variable is an error, a variable the template
+        never uses is logged.
+        """
+        variables = set(variables)
+        missing = self.placeholders - variables
+        if missing:
+            raise TemplateVariablesError(
+                f"Template {self.origin} uses undefined variables: {', '.join(sorted(missing))}"
+            )
+        unused = variables - self.placeholders
+        if unused:
+            logger.warning(f"Template {self.origin} does not use variables: {', '.join(sorted(unused))}")
+
+    def render(self, **values: Any) -> str:
+        """Fill every placeholder; a missing value raises KeyError, like str.format."""
+        parts = self._parts.copy()
+        for index, name, conversion, format_spec in self._slots:
+            if name in values:
+                value = values[name]
+            else:
+                value = _formatter.get_field(name, (), values)[0]
+            if conversion:
+                value = _formatter.convert_field(value, conversion)
+            parts[index] = value if type(value) is str and not format_spec else format(value, format_spec)
+        return ''.join(parts)
+
+
+def _field_root(field_name: str) -> str:
+    # "dbmanager.db_type" and "items[0]" are looked up on their first name
+    return re.split(r'[.\[]', field_name, maxsplit=1)[0]
+
+
+def compile_template(source: str, names: Optional[Iterable[str]] = None, origin: str = '<string>') -> CompiledTemplate:
+    """Parse a template string (see CompiledTemplate for the two syntaxes)."""
+    return CompiledTemplate(source, names, origin)
+
+
+@dataclass
+class _TemplateEntry:
+    path: Path
+    mtime_ns: int
+    source: str
+    compiled: Dict[Optional[FrozenSet[str]], CompiledTemplate] = field(default_factory=dict)
+    validated: set = field(default_factory=set)
+
 
 class TemplateLoader:
     """Generic template loader with caching support."""
-    
-    _cache: Dict[str, str] = {}
-    
+
+    _cache: Dict[str, _TemplateEntry] = {}
+    _lock = threading.Lock()
+
     @classmethod
     def get_template_path(cls, template_name: str, template_dir: str = "templates") -> Path:
         """
         Get the full path to a template file.
-        
+
         Args:
             template_name: Name of the template file
             template_dir: Directory containing templates (relative to project root)
-            
+
         Returns:
             Path object to the template file
         """
         from helpers.agents_utils import get_project_root
-        project_root = get_project_root()
+        project_root = Path(get_project_root())
         return project_root / template_dir / template_name
-    
+
+    @classmethod
+    def _entry(cls, template_name: str, template_dir: str) -> _TemplateEntry:
+        """
+        Return the cached entry of a template, reading the file on first use
+        and, with hot reload, again whenever it changed on disk.
+
+        Raises:
+            FileNotFoundError: If the template file doesn't exist
+        """
+        cache_key = f"{template_dir}/{template_name}"
+        entry = cls._cache.get(cache_key)
+        if entry is not None and not HOT_RELOAD:
+            return entry
+
+        template_path = entry.path if entry is not None else cls.get_template_path(template_name, template_dir)
+        try:
+            mtime_ns = os.stat(template_path).st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Template not found: {template_path}") from None
+        if entry is not None and entry.mtime_ns == mtime_ns:
+            return entry
+
+        with open(template_path, 'r', encoding='utf-8') as f:
+            source = f.read()
+        entry = _TemplateEntry(path=template_path, mtime_ns=mtime_ns, source=source)
+        with cls._lock:
+            reloaded = cache_key in cls._cache
+            cls._cache[cache_key] = entry
+        logger.debug(f"{'Reloaded' if reloaded else 'Cached'} template: {cache_key}")
+        return entry
+
+    @classmethod
+    def source(cls, template_name: str, template_dir: str = "templates") -> str:
+        """Return the raw text of a template."""
+        return cls._entry(template_name, template_dir).source
+
+    @classmethod
+    def compiled(
+        cls,
+        template_name: str,
+        template_dir: str = "templates",
+        names: Optional[Iterable[str]] = None,
+        variables: Optional[Iterable[str]] = None,
+    ) -> CompiledTemplate:
+        """
+        Return the compiled form of a template, parsing it once per file
+        version.
+
+        Args:
+            template_name: Name of the template file
+            template_dir: Directory containing templates
+            names: Placeholder names for the named syntax; None for format syntax
+            variables: Variables the caller will pass; checked once per file
+                version with CompiledTemplate.validate
+
+        Returns:
+            The compiled template
+
+        Raises:
+            FileNotFoundError: If the template file doesn't exist
+            TemplateVariablesError: If the template uses a variable not in `variables`
+        """
+        entry = cls._entry(template_name, template_dir)
+        names_key = frozenset(names) if names is not None else None
+        compiled = entry.compiled.get(names_key)
+        if compiled is None:
+            compiled = compile_template(entry.source, names_key, origin=f"{template_dir}/{template_name}")
+            entry.compiled[names_key] = compiled
+        if variables is not None:
+            variables_key = (names_key, frozenset(variables))
+            if variables_key not in entry.validated:
+                compiled.validate(variables_key[1])
+                entry.validated.add(variables_key)
+        return compiled
+
     @classmethod
     def load_template(
         cls,
@@ -46,71 +255,53 @@ class TemplateLoader:
     ) -> str:
         """
         Load a template file with optional variable substitution.
-        
+
         Args:
             template_name: Name of the template file
             template_dir: Directory containing templates
             use_cache: Whether to use cached templates
             **kwargs: Variables to substitute in the template
-            
+
         Returns:
             Template content with variables substituted
         """
-        cache_key = f"{template_dir}/{template_name}"
-        
-        # Check cache first
-        if use_cache and cache_key in cls._cache and not kwargs:
-            logger.debug(f"Using cached template: {cache_key}")
-            return cls._cache[cache_key]
-        
+        if not use_cache:
+            cls._cache.pop(f"{template_dir}/{template_name}", None)
+
         try:
-            template_path = cls.get_template_path(template_name, template_dir)
-            
-            if not template_path.exists():
-                logger.error(f"Template not found: {template_path}")
-                return f"# Template {template_name} not found"
-            
-            with open(template_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Substitute variables if provided
-            if kwargs:
-                for key, value in kwargs.items():
-                    placeholder = f"{{{key}}}"
-                    if placeholder in content:
-                        content = content.replace(placeholder, str(value))
-            
-            # Cache if no variables were substituted
-            if use_cache and not kwargs:
-                cls._cache[cache_key] = content
-                logger.debug(f"Cached template: {cache_key}")
-            
-            return content
-            
+            if not kwargs:
+                return cls.source(template_name, template_dir)
+            # Only the {key} placeholders of the given variables are replaced
+            return cls.compiled(template_name, template_dir, names=kwargs).render(**kwargs)
+
+        except FileNotFoundError as e:
+            logger.error(str(e))
+            return f"# Template {template_name} not found"
         except Exception as e:
             logger.error(f"Error loading template {template_name}: {str(e)}")
             return f"# Error loading template {template_name}: {str(e)}"
-    
+
     @classmethod
     def clear_cache(cls):
         """Clear the template cache."""
-        cls._cache.clear()
+        with cls._lock:
+            cls._cache.clear()
         logger.debug("Template cache cleared")
 
 
 def load_system_template(template_name: str, **kwargs) -> str:
     """
     Load a system template from the system_templates directory.
-    
+
     Args:
         template_name: Name of the template file
         **kwargs: Variables to substitute
-        
+
     Returns:
         Template content
     """
     return TemplateLoader.load_template(
-        template_name, 
+        template_name,
         template_dir="templates/system_templates",
         **kwargs
     )
@@ -119,11 +310,11 @@ def load_system_template(template_name: str, **kwargs) -> str:
 def load_user_template(template_name: str, **kwargs) -> str:
     """
     Load a user-facing template from the templates directory.
-    
+
     Args:
         template_name: Name of the template file
         **kwargs: Variables to substitute
-        
+
     Returns:
         Template content
     """
@@ -131,4 +322,4 @@ def load_user_template(template_name: str, **kwargs) -> str:
         template_name,
         template_dir="templates",
         **kwargs
-    )
\ No newline at end of file
+    )
@@ -7,22 +7,20 @@ Unified template management system for ThothAI SQL Generator.
 Provides a single, clean interface for loading and formatting all templates.
 """
 
-import os
 import itertools
-from typing import Dict
 
-from .agents_utils import get_project_root
+from .template_loader import CompiledTemplate, TemplateLoader as CompiledTemplateLoader
 
 
 class TemplateLoader:
     """
     Centralized template management system.
     All templates are accessed through this single class.
+
+    Templates are compiled once per file version by helpers.template_loader,
+    so formatting a template only joins its pre-parsed segments.
     """
     
-    # Cache for loaded templates
-    _cache: Dict[str, str] = {}
-    
     @classmethod
     def load(cls, template_path: str) -> str:
         """
@@ -37,18 +35,23 @@ class TemplateLoader:
         Raises:
             FileNotFoundError: If the template file doesn't exist
         """
-        if template_path in cls._cache:
-            return cls._cache[template_path]
-
-        full_path = os.path.join(get_project_root(), "templates", template_path)
-        
-        if not os.path.exists(full_path):
-            raise FileNotFoundError(f"Template not found: {full_path}")
+        return CompiledTemplateLoader.source(template_path)
+    
+    @classmethod
+    def compiled(cls, template_path: str, safe: bool = False, variables=None) -> CompiledTemplate:
+        """
+        Return the compiled template, validating it against `variables`.
         
-        with open(full_path, "r") as file:
-            content = file.read()
-            cls._cache[template_path] = content
-            return content
+        Args:
+            template_path: The path to the template file (relative to templates/)
+            safe: If True, only the given variables are placeholders (JSON blocks stay literal)
+            variables: Names of the parameters that will be passed to render()
+            
+        Returns:
+            CompiledTemplate: The parsed template
+        """
+        names = variables if safe else None
+        return CompiledTemplateLoader.compiled(template_path, names=names, variables=variables)
     
     @classmethod
     def format(cls, template_path: str, safe: bool = False, **kwargs) -> str:
@@ -63,43 +66,18 @@ class TemplateLoader:
         Returns:
             str: The formatted template
         """
-        template = cls.load(template_path)
-        
         if safe:
             # For templates with JSON blocks or complex braces
-            return cls._format_safe(template, list(kwargs.keys()), **kwargs)
+            template = CompiledTemplateLoader.compiled(template_path, names=kwargs)
         else:
             # Simple format for most templates
-            return template.format(**kwargs)
-    
-    @classmethod
-    def _format_safe(cls, template: str, placeholders: list, **kwargs) -> str:
-        """
-        Safely format a template with brace escaping for JSON blocks.
-        
-        Args:
-            template: The raw template string
-            placeholders: List of placeholder names to format
-            **kwargs: Values to substitute
-            
-        Returns:
-            str: The safely formatted template
-        """
-        # Step 1: escape all braces
-        escaped = template.replace("{", "{{").replace("}", "}}")
-        
-        # Step 2: unescape only allowed placeholders
-        for placeholder in placeholders:
-            # Handle nested placeholders like dbmanager.db_type
-            escaped = escaped.replace("{{" + placeholder + "}}", "{" + placeholder + "}")
-        
-        # Step 3: format with provided kwargs
-        return escaped.format(**kwargs)
+            template = CompiledTemplateLoader.compiled(template_path)
+        return template.render(**kwargs)
     
     @classmethod
     def clear_cache(cls):
         """Clear the template cache."""
-        cls._cache.clear()
+        CompiledTemplateLoader.clear_cache()
 
 
 # =============================================================================
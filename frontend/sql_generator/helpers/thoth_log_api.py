@@ -22,6 +22,8 @@ from datetime import datetime
 import json
 import hashlib
 
+from .http_clients import get_http_clients
+
 logger = logging.getLogger(__name__)
 
 # Track sent logs to prevent duplicates
@@ -297,6 +299,7 @@ async def send_thoth_log(state: Any, workspace_id: int, workspace_name: str = No
             # Directives and agent info (backward compatibility)
             "directives": state.directives if hasattr(state, 'directives') else "",
             "successful_agent_name": state.generation.successful_agent_name if hasattr(state, 'generation') and state.generation.successful_agent_name else "",
+            "sql_agent_name": (state.generation.sql_agent_name or "")[:128] if hasattr(state, 'generation') else "",
             "sql_generation_failure_message": state.execution.sql_generation_failure_message if hasattr(state, 'execution') and state.execution.sql_generation_failure_message else "",
             
             # NEW: SQL status and evaluation case
@@ -392,22 +395,22 @@ async def send_thoth_log(state: Any, workspace_id: int, workspace_name: str = No
             "Content-Type": "application/json"
         }
               
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                url, 
-                json=log_data, 
-                headers=headers, 
-                timeout=10.0
-            )
-            response.raise_for_status()
-            
-            result = response.json()
-            logger.info(f"ThothLog sent successfully, ID: {result.get('id', 'unknown')}")
-            
-            # Mark this log as sent to prevent duplicates
-            _sent_logs.add(log_hash)
-            
-            return result
+        client = get_http_clients().async_client()
+        response = await client.post(
+            url, 
+            json=log_data, 
+            headers=headers, 
+            timeout=10.0
+        )
+        response.raise_for_status()
+        
+        result = response.json()
+        logger.info(f"ThothLog sent successfully, ID: {result.get('id', 'unknown')}")
+        
+        # Mark this log as sent to prevent duplicates
+        _sent_logs.add(log_hash)
+        
+        return result
             
     except httpx.HTTPStatusError as e:
         # Log error concisely
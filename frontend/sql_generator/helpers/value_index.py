@@ -0,0 +1,202 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Trigram inverted index of database values, selectable instead of the MinHash LSH.
+
+Preprocessing writes {db_id}_trigrams.sqlite3 next to the LSH pickles (see
+backend thoth_ai_backend/preprocessing/db_values/trigram_index.py): each
+lowercase character trigram of " value " maps to the ids of the values that
+contain it. A lookup reads the posting lists of the keyword's trigrams,
+counts for each value how many trigrams it shares with the keyword, and
+ranks the values by Jaccard similarity of the trigram sets. This is the
+similarity MinHash estimates, computed exactly, over every value that
+shares a trigram. MinHash instead only sees values whose signature bands
+collide, and so misses short values and multi-token entities.
+
+`TrigramValueIndex.query_lsh()` has the signature and result shape of
+`ThothDbManager.query_lsh()`, so the LSH filters use either one unchanged.
+Workspaces select it with the `value_index_backend` setting ("lsh" or
+"trigram"); see docs/VALUE_INDEX.md for the recall and latency comparison.
+
+Settings (environment variables):
+- THOTH_TRIGRAM_MAX_POSTINGS: posting entries read per lookup (default:
+  200000). When the keyword's trigrams have more, the most common trigrams
+  are left out first, since they say the least about a value.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+MAX_POSTINGS = int(os.getenv("THOTH_TRIGRAM_MAX_POSTINGS", "200000"))
+FORMAT_VERSION = "1"
+
+
+def value_grams(value: str, n_gram: int = 3) -> Set[str]:
+    """Distinct lowercase n-grams of " value ", split as in the backend index builder."""
+    text = " ".join(str(value).lower().split())
+    if not text:
+        return set()
+    padded = f" {text} "
+    return {padded[i:i + n_gram] for i in range(len(padded) - n_gram + 1)}
+
+
+class TrigramValueIndex:
+    """Read-only lookups in a trigram index file, one SQLite connection per thread."""
+
+    def __init__(self, path: str, max_postings: int = MAX_POSTINGS):
+        self.path = path
+        self.max_postings = max_postings
+        self._local = threading.local()
+        conn = self._connection()
+        meta = dict(conn.execute("SELECT key, value FROM meta"))
+        if meta.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported trigram index format {meta.get('version')} in {path}")
+        self.n_gram = int(meta["n_gram"])
+        # Trigram count of every value, by id, for the Jaccard denominator
+        (count,) = conn.execute("SELECT COUNT(*) FROM value_index").fetchone()
+        self._value_grams = np.fromiter(
+            (grams for (grams,) in conn.execute("SELECT grams FROM value_index ORDER BY id")),
+            dtype=np.int32, count=count,
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        # A connection inherited through fork must not be used by the child
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, check_same_thread=False)
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def __len__(self) -> int:
+        return len(self._value_grams)
+
+    def _postings(self, grams: List[str]) -> List[Tuple[str, np.ndarray]]:
+        rows = self._connection().execute(
+            f"SELECT gram, ids FROM postings WHERE gram IN ({','.join('?' * len(grams))})", grams
+        )
+        postings = [(gram, np.frombuffer(ids, dtype="<u4")) for gram, ids in rows]
+        # Rarest trigrams first; stop before the budget of posting entries runs out
+        postings.sort(key=lambda posting: len(posting[1]))
+        kept, total = [], 0
+        for gram, ids in postings:
+            if kept and total + len(ids) > self.max_postings:
+                logger.debug(f"Trigram lookup capped at {total} postings, {len(postings) - len(kept)} trigrams left out")
+                break
+            kept.append((gram, ids))
+            total += len(ids)
+        return kept
+
+    def search(self, keyword: str, top_n: int = 10) -> List[Tuple[int, float]]:
+        """(value id, Jaccard similarity) of the top_n values, best first, ties by id."""
+        grams = sorted(value_grams(keyword, self.n_gram))
+        if not grams or top_n <= 0:
+            return []
+        postings = self._postings(grams)
+        if not postings:
+            return []
+        ids, overlap = np.unique(np.concatenate([ids for _, ids in postings]), return_counts=True)
+        scores = overlap / (len(grams) + self._value_grams[ids] - overlap)
+        if len(ids) > top_n:
+            best = np.argpartition(-scores, top_n - 1)[:top_n]
+            ids, scores = ids[best], scores[best]
+        order = np.lexsort((ids, -scores))
+        return [(int(ids[i]), float(scores[i])) for i in order]
+
+    def query_lsh(
+        self, keyword: str, signature_size: int = 30, n_gram: int = 3, top_n: int = 10
+    ) -> Dict[str, Dict[str, List[str]]]:
+        """
+        Same interface and result as ThothDbManager.query_lsh(): the top_n
+        values most similar to keyword, {table_name: {column_name: [values]}}.
+        signature_size and n_gram only apply to MinHash and are ignored.
+        """
+        matches = self.search(keyword, top_n)
+        if not matches:
+            return {}
+        ids = [value_id for value_id, _ in matches]
+        rows = {
+            row[0]: row[1:]
+            for row in self._connection().execute(
+                f"SELECT id, table_name, column_name, value FROM value_index WHERE id IN ({','.join('?' * len(ids))})",
+                ids,
+            )
+        }
+        similar_values: Dict[str, Dict[str, List[str]]] = {}
+        for value_id in ids:
+            table_name, column_name, value = rows[value_id]
+            similar_values.setdefault(table_name, {}).setdefault(column_name, []).append(value)
+        return similar_values
+
+
+_indexes: Dict[str, Tuple[float, TrigramValueIndex]] = {}
+_indexes_lock = threading.Lock()
+
+
+def trigram_index_path(dbmanager) -> Optional[Path]:
+    """Path of the workspace's trigram index, next to its LSH files."""
+    lsh_manager = getattr(dbmanager, "lsh_manager", None)
+    if lsh_manager is None:
+        return None
+    return Path(lsh_manager.preprocessed_path) / f"{lsh_manager.db_id}_trigrams.sqlite3"
+
+
+def get_trigram_index(dbmanager) -> Optional[TrigramValueIndex]:
+    """
+    The trigram index of the dbmanager's database, opened once per process
+    and reopened when preprocessing rewrites it. None when it was never built.
+    """
+    path = trigram_index_path(dbmanager)
+    if path is None:
+        return None
+    try:
+        mtime = path.stat().st_mtime
+    except OSError:
+        return None
+    key = str(path)
+    with _indexes_lock:
+        cached = _indexes.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        try:
+            index = TrigramValueIndex(key)
+        except (sqlite3.Error, ValueError, KeyError) as e:
+            logger.warning(f"Trigram index {path} unusable: {e}")
+            return None
+        _indexes[key] = (mtime, index)
+        logger.info(f"Trigram index {path.name} opened: {len(index)} values")
+        return index
+
+
+def value_index_for(dbmanager, backend: str):
+    """
+    The object whose query_lsh() the LSH filters call: the trigram index when
+    the workspace selects it and it exists, the dbmanager (MinHash LSH) otherwise.
+    """
+    if backend == "trigram":
+        index = get_trigram_index(dbmanager)
+        if index is not None:
+            return index
+        logger.warning(
+            f"Trigram index not found for {getattr(dbmanager, 'db_id', 'database')}, using the LSH. "
+            "Run the workspace preprocessing to build it."
+        )
+    return dbmanager
@@ -0,0 +1,253 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Warm-start: preload workspace artifacts before the service reports ready.
+
+Without it the first question on each workspace pays for plugin discovery,
+the database and vector store connections, the agent set, the schema
+snapshot (one Django call per table), the LSH index, the column
+embeddings and the BM25 indexes of evidence and SQL shots. The warm-up loads all of them for every workspace returned by
+Django's /api/workspaces, several workspaces at a time, and /health answers
+503 until the startup warm-up has finished or timed out.
+
+Settings (environment variables):
+- THOTH_WARMUP: "true" to warm up on startup (default: "false").
+- THOTH_WARMUP_TIMEOUT: seconds before the service reports ready anyway
+  (default: 120). Workspaces still loading keep loading in the background.
+- THOTH_WARMUP_CONCURRENCY: workspaces loaded at the same time (default: 4).
+- THOTH_WARMUP_WORKSPACES: comma-separated workspace ids to load instead of
+  all of them.
+
+The warm-up can also be run on demand with POST /admin/warmup, which needs
+DJANGO_API_KEY. An on-demand warm-up does not make /health answer 503, and
+is refused while a previous one is still loading, even after a timeout.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Dict, List, Optional
+
+from .http_clients import get_django_server, get_http_clients
+
+logger = logging.getLogger(__name__)
+
+WARMUP_ENABLED = os.getenv("THOTH_WARMUP", "false").lower() == "true"
+WARMUP_TIMEOUT = float(os.getenv("THOTH_WARMUP_TIMEOUT", "120"))
+WARMUP_CONCURRENCY = max(1, int(os.getenv("THOTH_WARMUP_CONCURRENCY", "4")))
+
+
+def configured_workspace_ids() -> Optional[List[int]]:
+    """Workspace ids listed in THOTH_WARMUP_WORKSPACES, None when unset."""
+    value = os.getenv("THOTH_WARMUP_WORKSPACES", "").strip()
+    if not value:
+        return None
+    return [int(part) for part in value.split(",") if part.strip()]
+
+
+class WarmupState:
+    """Progress of the latest warm-up, reported by /health and /admin/warmup."""
+
+    def __init__(self):
+        self.status = "pending" if WARMUP_ENABLED else "disabled"
+        # Only the first warm-up gates /health; later ones run while serving
+        self.startup_complete = not WARMUP_ENABLED
+        self.started_at: Optional[float] = None
+        self.duration: Optional[float] = None
+        self.workspaces: Dict[int, Dict[str, Any]] = {}
+        self.error: Optional[str] = None
+        # Loading task of the latest warm-up; it outlives a timeout
+        self.task: Optional[asyncio.Future] = None
+
+    @property
+    def ready(self) -> bool:
+        return self.startup_complete
+
+    @property
+    def running(self) -> bool:
+        """True while a warm-up is loading, including after it timed out."""
+        return self.status == "running" or (self.task is not None and not self.task.done())
+
+    def as_dict(self) -> Dict[str, Any]:
+        from .workspace_artifacts import artifact_stats
+
+        return {
+            "status": self.status,
+            "startup_complete": self.startup_complete,
+            "loading": self.running,
+            "duration_seconds": round(self.duration, 3) if self.duration is not None else None,
+            "workspaces": self.workspaces,
+            "error": self.error,
+            "artifacts": artifact_stats(),
+        }
+
+
+_state = WarmupState()
+
+
+def get_warmup_state() -> WarmupState:
+    return _state
+
+
+async def list_workspace_ids() -> List[int]:
+    """Ids of all workspaces known to the Django backend."""
+    api_key = os.getenv("DJANGO_API_KEY")
+    if not api_key:
+        raise ValueError("DJANGO_API_KEY not set, cannot list workspaces")
+    client = get_http_clients().async_client()
+    response = await client.get(
+        f"{get_django_server()}/api/workspaces",
+        headers={"X-API-KEY": api_key, "Content-Type": "application/json"},
+    )
+    response.raise_for_status()
+    return [workspace["id"] for workspace in response.json()]
+
+
+def _load_lsh(dbmanager) -> bool:
+    lsh_manager = getattr(dbmanager, "lsh_manager", None)
+    if lsh_manager is None:
+        return False
+    if lsh_manager.lsh is None:
+        return bool(lsh_manager.load_lsh())
+    return True
+
+
+def _load_schema_and_columns(dbmanager, vdbmanager, workspace_id: int) -> Dict[str, int]:
+    from .main_helpers.main_schema_extraction_from_lsh import VDBEmbeddingWrapper, simplify_schema
+    from .workspace_artifacts import column_strings_for, get_cached_db_schema, get_column_embeddings
+
+    schema = get_cached_db_schema(dbmanager.db_id, dbmanager.schema)
+    column_strings = column_strings_for(simplify_schema(schema))
+    if vdbmanager is not None and column_strings:
+        get_column_embeddings(VDBEmbeddingWrapper(vdbmanager, workspace_id), column_strings)
+    return {"tables": len(schema), "columns": len(column_strings)}
+
+
+def _build_sparse_indexes(vdbmanager) -> int:
+    """Build the BM25 indexes of hybrid retrieval; returns the documents indexed."""
+    from thoth_qdrant import ThothType
+
+    from .hybrid_retrieval import HYBRID_ENABLED, get_sparse_index
+
+    if vdbmanager is None or not HYBRID_ENABLED:
+        return 0
+    try:
+        return sum(len(get_sparse_index(vdbmanager, t)) for t in (ThothType.EVIDENCE, ThothType.SQL))
+    except Exception as e:
+        # Retrieval builds them on first use, or falls back to dense search
+        logger.warning(f"BM25 indexes not built during warm-up: {e}")
+        return 0
+
+
+async def warm_workspace(workspace_id: int) -> Dict[str, Any]:
+    """Load every per-process artifact a request on `workspace_id` needs."""
+    from agents.core.agent_manager import ThothAgentManager
+    from .main_helpers.main_methods import (
+        _get_agent_pools,
+        _get_workspace,
+        _initialize_dbmanager,
+        _initialize_vdbmanager,
+    )
+
+    started = time.perf_counter()
+    workspace_config, agent_pool_config = await asyncio.gather(
+        _get_workspace(workspace_id), _get_agent_pools(workspace_id)
+    )
+    sql_db_config = workspace_config.get("sql_db", {})
+    if not sql_db_config:
+        raise ValueError(f"No SQL database configuration found in workspace {workspace_id}")
+
+    # Connections are blocking (the vector store retries with sleeps), so they run in threads
+    (dbmanager, _), (vdbmanager, _) = await asyncio.gather(
+        asyncio.to_thread(_initialize_dbmanager, sql_db_config),
+        asyncio.to_thread(_initialize_vdbmanager, workspace_config, sql_db_config),
+    )
+    if dbmanager is None:
+        raise ValueError(f"Database manager could not be initialized for workspace {workspace_id}")
+
+    # Agents are built on the event loop, where their pooled LLM clients live
+    ThothAgentManager(workspace_config, dbmanager, agent_pool_config).initialize()
+
+    lsh_loaded, schema_info, sparse_documents = await asyncio.gather(
+        asyncio.to_thread(_load_lsh, dbmanager),
+        asyncio.to_thread(_load_schema_and_columns, dbmanager, vdbmanager, workspace_id),
+        asyncio.to_thread(_build_sparse_indexes, vdbmanager),
+    )
+    return {
+        "status": "ready",
+        "name": workspace_config.get("name", "Unknown"),
+        "lsh_loaded": lsh_loaded,
+        "vector_store": vdbmanager is not None,
+        "sparse_documents": sparse_documents,
+        **schema_info,
+        "seconds": round(time.perf_counter() - started, 3),
+    }
+
+
+async def run_warmup(workspace_ids: Optional[List[int]] = None, timeout: float = WARMUP_TIMEOUT) -> WarmupState:
+    """
+    Warm up `workspace_ids` (default: THOTH_WARMUP_WORKSPACES, else all
+    workspaces) and return the state once done or after `timeout` seconds.
+    A failing workspace is reported and does not stop the others.
+    Raises RuntimeError if the previous warm-up is still loading.
+    """
+    from .telemetry import configure_telemetry
+
+    state = _state
+    if state.running:
+        raise RuntimeError("A warm-up is already running")
+    state.status = "running"
+    state.started_at = time.monotonic()
+    state.duration = None
+    state.error = None
+    state.workspaces = {}
+
+    async def warm(workspace_id: int, semaphore: asyncio.Semaphore) -> None:
+        async with semaphore:
+            state.workspaces[workspace_id] = {"status": "running"}
+            try:
+                state.workspaces[workspace_id] = await warm_workspace(workspace_id)
+            except Exception as e:
+                logger.error(f"Warm-up of workspace {workspace_id} failed: {e}")
+                state.workspaces[workspace_id] = {"status": "failed", "error": str(e)}
+
+    async def warm_all() -> None:
+        configure_telemetry()
+        ids = workspace_ids or configured_workspace_ids() or await list_workspace_ids()
+        logger.info(f"Warming up {len(ids)} workspaces: {ids}")
+        semaphore = asyncio.Semaphore(WARMUP_CONCURRENCY)
+        await asyncio.gather(*(warm(workspace_id, semaphore) for workspace_id in ids))
+
+    task = state.task = asyncio.ensure_future(warm_all())
+    try:
+        # shield: on timeout the service reports ready, but loading goes on
+        await asyncio.wait_for(asyncio.shield(task), timeout=timeout)
+        failed = [i for i, result in state.workspaces.items() if result.get("status") == "failed"]
+        state.status = "ready" if not failed else "partial"
+    except asyncio.CancelledError:
+        task.cancel()
+        state.status = "cancelled"
+        state.startup_complete = True
+        raise
+    except asyncio.TimeoutError:
+        state.status = "timeout"
+        logger.warning(f"Warm-up did not finish within {timeout:.0f} s, reporting ready anyway")
+    except Exception as e:
+        state.status = "failed"
+        state.error = str(e)
+        logger.error(f"Warm-up failed: {e}")
+    state.duration = time.monotonic() - state.started_at
+    state.startup_complete = True
+    logger.info(f"Warm-up {state.status} after {state.duration:.2f} s")
+    return state
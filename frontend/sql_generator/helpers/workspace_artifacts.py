@@ -0,0 +1,172 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Per-process cache of workspace artifacts reused across requests.
+
+- Schema snapshots: `get_db_schema` makes one Django call per table and was
+  called twice per question. Snapshots are kept for THOTH_SCHEMA_CACHE_TTL
+  seconds (default: 300, 0 disables the cache) and every caller gets its
+  own copy, since the pipeline edits the schema it receives.
+- Column-embedding matrices: LSH schema extraction embeds every
+  `table`.`column` string of the database on each question. The matrix is
+  cached per embedding model and column list (at most
+  THOTH_COLUMN_EMBEDDING_CACHE_SIZE matrices, default: 64), so a question
+  only embeds its own text. When THOTH_ARTIFACT_DIR is set, matrices are
+  also written there as .npy files and opened with mmap, so all workers on
+  the host share one copy through the page cache (see helpers/prefork.py).
+
+Both caches are filled by the warm-up stage (helpers.warmup) and on first use.
+"""
+
+import copy
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_CACHE_TTL = float(os.getenv("THOTH_SCHEMA_CACHE_TTL", "300"))
+COLUMN_EMBEDDING_CACHE_SIZE = max(1, int(os.getenv("THOTH_COLUMN_EMBEDDING_CACHE_SIZE", "64")))
+
+
+def artifact_dir() -> Optional[str]:
+    """Directory of the mmap-shared artifacts, None when sharing is off."""
+    return os.getenv("THOTH_ARTIFACT_DIR") or None
+
+
+_schemas: Dict[Tuple[str, Optional[str]], Tuple[float, Dict[str, Any]]] = {}
+_column_embeddings: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+_lock = threading.Lock()
+_stats = {"schema_hits": 0, "schema_misses": 0, "embedding_hits": 0, "embedding_misses": 0}
+
+
+def get_cached_db_schema(db_id: str, db_schema: Optional[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Return a copy of the database schema (see db_info.get_db_schema),
+    fetching it from Django at most once per SCHEMA_CACHE_TTL seconds.
+    """
+    from helpers.db_info import get_db_schema
+
+    if SCHEMA_CACHE_TTL <= 0:
+        return get_db_schema(db_id, db_schema)
+
+    key = (db_id, db_schema)
+    cached = _schemas.get(key)
+    if cached is not None and time.monotonic() - cached[0] < SCHEMA_CACHE_TTL:
+        _stats["schema_hits"] += 1
+        return copy.deepcopy(cached[1])
+
+    _stats["schema_misses"] += 1
+    schema = get_db_schema(db_id, db_schema)
+    if schema:
+        with _lock:
+            _schemas[key] = (time.monotonic(), copy.deepcopy(schema))
+    return schema
+
+
+def column_strings_for(schema: Dict[str, List[str]]) -> List[str]:
+    """The `table`.`column` strings embedded for column selection."""
+    return [
+        f"`{table}`.`{column}`"
+        for table, columns in schema.items()
+        for column in columns
+    ]
+
+
+def get_column_embeddings(embedding_function, column_strings: List[str]) -> np.ndarray:
+    """
+    Return the embeddings of `column_strings`, one row per string. Matrices
+    are cached when the embedding function exposes a `model_key`.
+    """
+    model_key = getattr(embedding_function, "model_key", None)
+    if model_key is None:
+        return np.asarray(embedding_function.encode(column_strings))
+
+    digest = hashlib.sha256("\n".join(column_strings).encode("utf-8")).hexdigest()
+    key = (model_key, digest)
+    with _lock:
+        matrix = _column_embeddings.get(key)
+        if matrix is not None:
+            _column_embeddings.move_to_end(key)
+            _stats["embedding_hits"] += 1
+            return matrix
+
+    _stats["embedding_misses"] += 1
+    path = _shared_matrix_path(key)
+    matrix = _load_shared_matrix(path) if path else None
+    if matrix is None:
+        matrix = np.asarray(embedding_function.encode(column_strings))
+        matrix.setflags(write=False)
+        if path:
+            matrix = _store_shared_matrix(path, matrix)
+    with _lock:
+        _column_embeddings[key] = matrix
+        if len(_column_embeddings) > COLUMN_EMBEDDING_CACHE_SIZE:
+            _column_embeddings.popitem(last=False)
+    logger.debug(f"Cached column embeddings for {len(column_strings)} columns ({model_key})")
+    return matrix
+
+
+def _shared_matrix_path(key: tuple) -> Optional[str]:
+    directory = artifact_dir()
+    if directory is None:
+        return None
+    name = hashlib.sha256(repr(key).encode("utf-8")).hexdigest()
+    return os.path.join(directory, "column_embeddings", f"{name}.npy")
+
+
+def _load_shared_matrix(path: str) -> Optional[np.ndarray]:
+    try:
+        return np.load(path, mmap_mode="r")
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable shared artifact {path}: {e}")
+        return None
+
+
+def _store_shared_matrix(path: str, matrix: np.ndarray) -> np.ndarray:
+    """Write `matrix` atomically and return it memory-mapped from disk."""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.save(f, matrix)
+        os.replace(tmp_path, path)
+        return np.load(path, mmap_mode="r")
+    except OSError as e:
+        logger.warning(f"Could not share column embeddings in {path}: {e}")
+        return matrix
+
+
+def artifact_stats() -> Dict[str, Any]:
+    return {
+        **_stats,
+        "cached_schemas": len(_schemas),
+        "cached_column_matrices": len(_column_embeddings),
+        "shared_column_matrices": sum(
+            isinstance(m, np.memmap) for m in list(_column_embeddings.values())
+        ),
+    }
+
+
+def clear_artifacts() -> None:
+    with _lock:
+        _schemas.clear()
+        _column_embeddings.clear()
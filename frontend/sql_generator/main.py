@@ -16,42 +16,33 @@ This module provides the main FastAPI application for handling SQL generation re
 It exposes a single API endpoint: generate_sql that receives question and workspace.
 """
 
+import asyncio
+import hmac
 import logging
 import os
 import time
 import json
-import logfire
 
 from dotenv import load_dotenv
 from contextlib import asynccontextmanager
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 from pathlib import Path
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Header, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 
-from helpers.main_helpers.main_methods import  _get_workspace, initialize_database_plugins 
 from model.sql_explanation import SqlExplanationRequest, SqlExplanationResponse
 from services.paginated_query_service import PaginatedQueryService, PaginationRequest, PaginationResponse
-from helpers.session_cache import ensure_cached_setup
-from helpers.dual_logger import log_error, log_debug
-from helpers.main_helpers.main_request_initialization import _initialize_request_state
-from helpers.main_helpers.main_preprocessing_phases import (
-    _validate_question_phase,
-    _extract_keywords_phase,
-    _retrieve_context_phase
-)
-from helpers.main_helpers.main_generation_phases import (
-    _generate_sql_candidates_phase,
-    _evaluate_and_select_phase,
-    _precompute_tests_phase
-)
-from helpers.main_helpers.main_response_preparation import (
-    _prepare_final_response_phase
-)
-from helpers.main_helpers.main_methods import _setup_dbmanager_and_agents
+from helpers.http_clients import get_http_clients
+from agents.core.agent_registry import get_agent_registry
+from helpers.warmup import WARMUP_ENABLED, get_warmup_state, run_warmup
+from helpers.dual_logger import log_error
 
+# The pipeline modules (pydantic-ai agents, thoth_dbmanager, thoth_qdrant,
+# pandas) are imported by the endpoints on first use, and database plugins
+# and logfire are initialized by the first workspace setup, so a worker
+# answers /health without loading them. See dev/profile_imports.py.
 
 
 # Load environment variables FIRST, before any other imports
@@ -74,17 +65,6 @@ else:
     else:
         config_source = "No .env.local file found - using system environment variables"
 
-# Configure logfire and instrument PydanticAI at startup
-logfire.configure(
-    send_to_logfire="if-token-present",
-    scrubbing=False,
-)
-# Instrument PydanticAI immediately after configuring logfire
-# This ensures ALL PydanticAI agent activity is tracked from the beginning
-logfire.instrument_pydantic_ai()
-
-# Logfire configuration will be confirmed after logging is set up
-
 # Configure logging using centralized configuration
 from helpers.logging_config import configure_root_logger, get_logging_level
 
@@ -115,15 +95,6 @@ if not validate_environment():
         import sys
         sys.exit(1)
 
-# Initialize database plugins
-available_plugins = initialize_database_plugins()
-
-# Log confirmation that logfire and PydanticAI are configured
-if os.getenv('LOGFIRE_TOKEN'):
-    log_debug("Logfire configured and PydanticAI instrumented successfully")
-else:
-    logger.info("Logfire token not found, telemetry will not be sent to logfire service")
-
 
 
 # Simple in-memory cache to reuse setup across calls in the same session/workspace
@@ -162,9 +133,17 @@ async def lifespan(app: FastAPI):  # noqa: F811
     """Manage application lifespan events."""
     if log_level <= logging.INFO:
         logger.info("Starting SQL Generator service...")
+    # Keep-alive HTTP clients shared by all requests to Django and LLM providers
+    app.state.http_clients = get_http_clients()
+    # Warm-start: the server accepts connections at once, /health reports
+    # ready when the workspace artifacts are loaded (see helpers/warmup.py)
+    app.state.warmup_task = asyncio.create_task(run_warmup()) if WARMUP_ENABLED else None
     yield
     if log_level <= logging.INFO:
         logger.info("Shutting down SQL Generator service...")
+    if app.state.warmup_task is not None and not app.state.warmup_task.done():
+        app.state.warmup_task.cancel()
+    await app.state.http_clients.aclose()
 
 
 # Create FastAPI application
@@ -207,15 +186,69 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+class WarmupRequest(BaseModel):
+    """Request model for an on-demand warm-up."""
+    workspace_ids: Optional[List[int]] = Field(None, description="Workspaces to warm up (default: all)")
+
+
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
-    """Health check endpoint."""
+    """Health check endpoint. Answers 503 while the startup warm-up is running."""
+    warmup = get_warmup_state()
+    if not warmup.ready:
+        return JSONResponse(
+            status_code=503,
+            content=HealthResponse(
+                status="warming",
+                message=f"SQL Generator is warming up {len(warmup.workspaces)} workspaces"
+            ).model_dump()
+        )
     return HealthResponse(
         status="healthy",
         message="SQL Generator service is running"
     )
 
 
+@app.get("/admin/warmup")
+async def warmup_status():
+    """Progress and per-workspace results of the latest warm-up."""
+    return get_warmup_state().as_dict()
+
+
+@app.post("/admin/warmup")
+async def warmup(request: Optional[WarmupRequest] = None, x_api_key: Optional[str] = Header(None)):
+    """Preload the artifacts of all (or the given) workspaces and report the result."""
+    api_key = os.getenv("DJANGO_API_KEY")
+    if not api_key:
+        raise HTTPException(status_code=403, detail="On-demand warm-up is disabled: DJANGO_API_KEY is not set")
+    if x_api_key is None or not hmac.compare_digest(x_api_key.encode(), api_key.encode()):
+        raise HTTPException(status_code=401, detail="Invalid or missing X-API-KEY")
+    # Also covers a startup warm-up that timed out but is still loading
+    if get_warmup_state().running:
+        raise HTTPException(status_code=409, detail="A warm-up is already running")
+    state = await run_warmup(request.workspace_ids if request else None)
+    return state.as_dict()
+
+
+@app.get("/metrics/http-pools")
+async def http_pool_metrics():
+    """Connection pool utilization of the shared HTTP clients."""
+    return get_http_clients().metrics()
+
+
+@app.get("/metrics/embeddings")
+async def embedding_cache_metrics():
+    """Hit rates of the shared embedding cache per workspace."""
+    from helpers.embedding_cache import get_embedding_cache
+    return get_embedding_cache().metrics()
+
+
+@app.get("/metrics/agents")
+async def agent_registry_metrics():
+    """Agents built and re-used per role by the shared agent registry."""
+    return get_agent_registry().stats()
+
+
 @app.post("/generate-sql")
 async def generate_sql(request: GenerateSQLRequest, http_request: Request):
     """
@@ -226,6 +259,19 @@ async def generate_sql(request: GenerateSQLRequest, http_request: Request):
     2. Sets up dbmanager and agent pool based on workspace ID
     3. Returns streaming response with query results, hints, and agent config
     """
+    from helpers.main_helpers.main_request_initialization import _initialize_request_state
+    from helpers.main_helpers.main_preprocessing_phases import (
+        _validate_question_phase,
+        _extract_keywords_phase,
+        _retrieve_context_phase
+    )
+    from helpers.main_helpers.main_generation_phases import (
+        _generate_sql_candidates_phase,
+        _evaluate_and_select_phase,
+        _precompute_tests_phase
+    )
+    from helpers.main_helpers.main_response_preparation import _prepare_final_response_phase
+
     # Initialize and validate request state
     state, error_response = await _initialize_request_state(request, http_request)
     if error_response:
@@ -313,6 +359,9 @@ async def explain_sql(request: SqlExplanationRequest):
     2. Uses the SQL explainer agent to generate a human-readable explanation
     3. Returns the explanation in the requested language (Italian/English)
     """
+    from helpers.main_helpers.main_methods import _get_workspace
+    from helpers.session_cache import ensure_cached_setup
+
     start_time = time.time()
     
     try:
@@ -406,6 +455,8 @@ async def execute_query(request: PaginationRequest):
     3. Executes query with pagination
     4. Returns paginated results for AGGrid
     """
+    from helpers.main_helpers.main_methods import _setup_dbmanager_and_agents
+
     try:
         logger.debug(f"execute-query endpoint called for workspace {request.workspace_id}")
         logger.debug(f"SQL: {request.sql[:200]}..." if len(request.sql) > 200 else f"SQL: {request.sql}")
@@ -96,7 +96,12 @@ class GenerationResults(BaseModel):
     
     successful_agent_name: Optional[str] = Field(
         default=None,
-        description="Name of the agent that generated the successful SQL"
+        description="How the selected SQL was chosen: candidate count and selection reason"
+    )
+
+    sql_agent_name: Optional[str] = Field(
+        default=None,
+        description="Name of the SQL generation agent that produced the candidate SQLs"
     )
     
     selection_metrics: Optional[Dict[str, Any]] = Field(
@@ -24,7 +24,8 @@ class SqlGenerationDeps(BaseModel):
     Minimal and pickleable dependencies for SQL generation agents.
     
     This class contains only the essential information needed by SQL generation
-    agents and their validators, without any complex non-pickleable objects.
+    agents and their validators. Apart from the per-run dbmanager and evaluator
+    agent, which are excluded from serialization, it holds simple types only.
     """
     
     # Read-only database information (simple strings/bool)
@@ -54,6 +55,12 @@ class SqlGenerationDeps(BaseModel):
     relevance_guard_events: List[Dict[str, Any]] = Field(default_factory=list)
     relevance_guard_summary: Dict[str, Any] = Field(default_factory=dict)
     model_retry_events: List[Dict[str, Any]] = Field(default_factory=list)
+
+    # Per-run resources read by the SQL validator: agents are shared across
+    # workspaces, so the database and evaluator come with each run. Excluded
+    # from serialization.
+    dbmanager: Any = Field(default=None, exclude=True)
+    evaluator_agent: Any = Field(default=None, exclude=True)
     
     class Config:
         """Pydantic configuration"""
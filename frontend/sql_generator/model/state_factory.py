@@ -211,6 +211,8 @@ class StateFactory:
                 evidence_critical_tests=evidence_critical_tests,
                 question_language=resolve_language_code(getattr(state, 'original_language', None)),
                 db_language=resolve_language_code(getattr(state.request, 'language', None)),
+                dbmanager=state.dbmanager,
+                evaluator_agent=getattr(state.agents_and_tools, 'evaluator_agent', None),
             )
             
         elif agent_type == "evaluator":
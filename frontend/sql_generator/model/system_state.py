@@ -905,71 +905,7 @@ class SystemState(BaseModel):
                 - evidence_list: List of unique evidence strings
                 - error_message: Detailed error message if operation failed
         """
-        
-        # Check if vdbmanager is available
-        if not self.vdbmanager:
-            error_msg = (
-                "VECTOR DATABASE UNAVAILABLE\n"
-                "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-                "The vector database service is not accessible.\n\n"
-                "Impact:\n"
-                "• Cannot retrieve contextual hints and evidence\n"
-                "• SQL generation will proceed without semantic context\n"
-                "• Results may be less accurate\n\n"
-                "Recommended Actions:\n"
-                "1. Verify Qdrant service is running on the configured port\n"
-                "2. Check network connectivity to the vector database\n"
-                "3. Confirm vector database configuration in workspace settings\n"
-            )
-            logging.getLogger(__name__).warning("Vector DB manager not available - cannot retrieve evidence")
-            self.semantic.evidence = []
-            return False, [], error_msg
-        
-        # Convert keywords list to a search query string
-        query = " ".join(self.keywords) if self.keywords else ""
-        
-        try:
-            similar_evidence = self.vdbmanager.search_similar(
-                query=query,
-                doc_type=ThothType.EVIDENCE,
-                top_k=3,
-                score_threshold=0.35)
-
-            if not similar_evidence:
-                self.semantic.evidence = []
-                return True, [], ""  # Success but no evidence found
-
-            # Remove duplicates by content comparison and filter out white text evidence
-            # Optimize: Use dict.fromkeys() for order-preserving deduplication
-            unique_evidence = list(dict.fromkeys(
-                evidence.evidence.strip()
-                for evidence in similar_evidence
-                if evidence.evidence and evidence.evidence.strip()
-            ))
-            self.semantic.evidence = unique_evidence
-            return True, unique_evidence, ""
-            
-        except VectorDatabaseError as e:
-            error_msg = f"Vector database error during evidence retrieval: {e}"
-            log_error(error_msg)
-            self.semantic.evidence = []
-            return False, [], error_msg
-            
-        except Exception as e:
-            error_msg = (
-                f"UNEXPECTED ERROR in evidence retrieval\n"
-                f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-                f"Failed to retrieve evidence from vector database.\n\n"
-                f"Error Details:\n"
-                f"• {str(e)}\n\n"
-                f"Impact:\n"
-                f"• Cannot retrieve contextual hints\n"
-                f"• SQL generation will proceed with reduced accuracy\n\n"
-                f"The system will continue but results may be suboptimal.\n"
-            )
-            log_error(f"Unexpected error retrieving evidence: {e}")
-            self.semantic.evidence = []
-            return False, [], error_msg
+        return self._retrieve_from_vector_db(evidence=True, sql=False)[0]
 
     def get_sql_from_vector_db(self) -> tuple[bool, List[Tuple[str, str, str]], str]:
         """
@@ -977,7 +913,6 @@ class SystemState(BaseModel):
 
         Uses the keywords stored in self.keywords and the vdbmanager stored in self.vdbmanager.
         Also stores the results in self.sql_shots for later use.
-        Now uses a more permissive similarity search to always get 5 examples.
 
         Returns:
             tuple[bool, List[Tuple[str, str, str]], str]: (success, sql_examples, error_message)
@@ -985,93 +920,133 @@ class SystemState(BaseModel):
                 - sql_examples: List of tuples (question, sql, hint) with duplicates removed
                 - error_message: Detailed error message if operation failed
         """
-        
-        # Check if vdbmanager is available
-        if not self.vdbmanager:
-            error_msg = (
-                "VECTOR DATABASE UNAVAILABLE\n"
-                "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-                "The vector database service is not accessible.\n\n"
-                "Impact:\n"
-                "• Cannot retrieve similar SQL examples\n"
-                "• SQL generation will proceed without reference examples\n"
-                "• Generated SQL may be less idiomatic or optimized\n\n"
-                "Recommended Actions:\n"
-                "1. Verify Qdrant service is running on the configured port\n"
-                "2. Check network connectivity to the vector database\n"
-                "3. Confirm vector database configuration in workspace settings\n"
-            )
-            logging.getLogger(__name__).warning("Vector DB manager not available - cannot retrieve SQL examples")
+        return self._retrieve_from_vector_db(evidence=False, sql=True)[1]
+
+    def get_evidence_and_sql_from_vector_db(self) -> tuple[tuple[bool, List[str], str], tuple[bool, List[Tuple[str, str, str]], str]]:
+        """
+        Retrieves evidence and SQL examples with one batched hybrid search
+        (BM25 + dense, see helpers/hybrid_retrieval.py).
+
+        Returns:
+            The results of get_evidence_from_vector_db() and get_sql_from_vector_db().
+        """
+        return self._retrieve_from_vector_db(evidence=True, sql=True)
+
+    def _retrieve_from_vector_db(self, evidence: bool, sql: bool) -> tuple[tuple[bool, List[str], str], tuple[bool, List[Tuple[str, str, str]], str]]:
+        from helpers.hybrid_retrieval import hybrid_search, unique_evidence, unique_sql_documents
+
+        evidence_result: tuple[bool, List[str], str] = (True, [], "")
+        sql_result: tuple[bool, List[Tuple[str, str, str]], str] = (True, [], "")
+        if evidence:
+            self.semantic.evidence = []
+        if sql:
             self.semantic.sql_shots = []
             self.semantic.sql_documents = []
-            return False, [], error_msg
-        
-        # Convert keywords list to a search query string
-        query = " ".join(self.keywords) if self.keywords else ""
-        
+
+        # Check if vdbmanager is available
+        if not self.vdbmanager:
+            if evidence:
+                logging.getLogger(__name__).warning("Vector DB manager not available - cannot retrieve evidence")
+                evidence_result = (False, [], (
+                    "VECTOR DATABASE UNAVAILABLE\n"
+                    "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
+                    "The vector database service is not accessible.\n\n"
+                    "Impact:\n"
+                    "• Cannot retrieve contextual hints and evidence\n"
+                    "• SQL generation will proceed without semantic context\n"
+                    "• Results may be less accurate\n\n"
+                    "Recommended Actions:\n"
+                    "1. Verify Qdrant service is running on the configured port\n"
+                    "2. Check network connectivity to the vector database\n"
+                    "3. Confirm vector database configuration in workspace settings\n"
+                ))
+            if sql:
+                logging.getLogger(__name__).warning("Vector DB manager not available - cannot retrieve SQL examples")
+                sql_result = (False, [], (
+                    "VECTOR DATABASE UNAVAILABLE\n"
+                    "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
+                    "The vector database service is not accessible.\n\n"
+                    "Impact:\n"
+                    "• Cannot retrieve similar SQL examples\n"
+                    "• SQL generation will proceed without reference examples\n"
+                    "• Generated SQL may be less idiomatic or optimized\n\n"
+                    "Recommended Actions:\n"
+                    "1. Verify Qdrant service is running on the configured port\n"
+                    "2. Check network connectivity to the vector database\n"
+                    "3. Confirm vector database configuration in workspace settings\n"
+                ))
+            return evidence_result, sql_result
+
+        # Evidence: top 3 above 0.35; SQL: top 5 above a permissive 0.1, so
+        # that examples are almost always found
+        requests = []
+        if evidence:
+            requests.append((ThothType.EVIDENCE, 3, 0.35))
+        if sql:
+            requests.append((ThothType.SQL, 5, 0.1))
+
         try:
-            # Use a very low threshold to get more results, even if not closely related
-            # We want to get at least 5 examples, so use a permissive threshold
-            similar_sqls = self.vdbmanager.search_similar(
-                query=query,
-                doc_type=ThothType.SQL,
-                top_k=5,
-                score_threshold=0.1  # Much lower threshold for more permissive search
-            )
-            
-            if not similar_sqls:
-                self.semantic.sql_shots = []
-                self.semantic.sql_documents = []
-                return True, [], ""  # Success but no examples found
-            
-            # Remove duplicates by SQL content comparison and extract values
-            seen_sqls = set()
-            unique_sql_tuples = []
-            for sql_doc in similar_sqls:
-                # Use both question and SQL as unique identifier to avoid duplicates
-                sql_key = f"{sql_doc.question.strip().lower()}||{sql_doc.sql.strip().lower()}"
-                if sql_key not in seen_sqls:
-                    seen_sqls.add(sql_key)
-                    # Extract question, sql, and hint from the SqlDocument
-                    question = sql_doc.question.strip() if hasattr(sql_doc, 'question') and sql_doc.question else ""
-                    sql = sql_doc.sql.strip() if hasattr(sql_doc, 'sql') and sql_doc.sql else ""
-                    hint = sql_doc.hint.strip() if hasattr(sql_doc, 'hint') and sql_doc.hint else ""
-                    unique_sql_tuples.append((question, sql, hint))
-            
-            # Store the SQL shots in the system state for logging
-            self.semantic.sql_shots = unique_sql_tuples
-            
-            # Also store the actual SqlDocument objects for template formatting
-            # Only store unique ones based on the same key
-            unique_sql_documents = []
-            seen_keys = set()
-            for sql_doc in similar_sqls:
-                sql_key = f"{sql_doc.question.strip().lower()}||{sql_doc.sql.strip().lower()}"
-                if sql_key not in seen_keys:
-                    seen_keys.add(sql_key)
-                    unique_sql_documents.append(sql_doc)
-            
-            self.semantic.sql_documents = unique_sql_documents[:5]  # Ensure we have at most 5
-            
-            return True, unique_sql_tuples, ""
-            
+            rankings = hybrid_search(self.vdbmanager, self.keywords, requests)
+        except VectorDatabaseError as e:
+            if evidence:
+                log_error(f"Vector database error during evidence retrieval: {e}")
+                evidence_result = (False, [], f"Vector database error during evidence retrieval: {e}")
+            if sql:
+                sql_result = (False, [], self._sql_retrieval_error(e))
+            return evidence_result, sql_result
         except Exception as e:
-            error_msg = (
-                f"VECTOR DATABASE ERROR\n"
-                f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-                f"Failed to retrieve SQL examples from vector database.\n\n"
-                f"Error Details:\n"
-                f"• {str(e)}\n\n"
-                f"Impact:\n"
-                f"• Cannot retrieve similar SQL patterns\n"
-                f"• SQL generation will proceed without examples\n"
-                f"• Generated SQL may not follow database conventions\n\n"
-                f"The system will continue but SQL quality may be reduced.\n"
-            )
-            log_error(f"Error retrieving SQL examples: {e}")
-            self.semantic.sql_shots = []
-            self.semantic.sql_documents = []
-            return False, [], error_msg
+            if evidence:
+                log_error(f"Unexpected error retrieving evidence: {e}")
+                evidence_result = (False, [], (
+                    f"UNEXPECTED ERROR in evidence retrieval\n"
+                    f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
+                    f"Failed to retrieve evidence from vector database.\n\n"
+                    f"Error Details:\n"
+                    f"• {str(e)}\n\n"
+                    f"Impact:\n"
+                    f"• Cannot retrieve contextual hints\n"
+                    f"• SQL generation will proceed with reduced accuracy\n\n"
+                    f"The system will continue but results may be suboptimal.\n"
+                ))
+            if sql:
+                sql_result = (False, [], self._sql_retrieval_error(e))
+            return evidence_result, sql_result
+
+        rankings = iter(rankings)
+        if evidence:
+            # Duplicates removed by normalized text, blank evidence skipped
+            self.semantic.evidence = unique_evidence(next(rankings), 3)
+            evidence_result = (True, self.semantic.evidence, "")
+        if sql:
+            sql_documents = unique_sql_documents(next(rankings), 5)
+            # Store the SQL shots in the system state for logging, and the
+            # SqlDocument objects for template formatting
+            self.semantic.sql_shots = [
+                (
+                    (getattr(sql_doc, 'question', None) or "").strip(),
+                    (getattr(sql_doc, 'sql', None) or "").strip(),
+                    (getattr(sql_doc, 'hint', None) or "").strip(),
+                )
+                for sql_doc in sql_documents
+            ]
+            self.semantic.sql_documents = sql_documents
+            sql_result = (True, self.semantic.sql_shots, "")
+        return evidence_result, sql_result
+
+    def _sql_retrieval_error(self, e: Exception) -> str:
+        log_error(f"Error retrieving SQL examples: {e}")
+        return (
+            f"VECTOR DATABASE ERROR\n"
+            f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
+            f"Failed to retrieve SQL examples from vector database.\n\n"
+            f"Error Details:\n"
+            f"• {str(e)}\n\n"
+            f"Impact:\n"
+            f"• Cannot retrieve similar SQL patterns\n"
+            f"• SQL generation will proceed without examples\n"
+            f"• Generated SQL may not follow database conventions\n\n"
+            f"The system will continue but SQL quality may be reduced.\n"
+        )
 
     def extract_schema_via_lsh(self) -> None:
         """
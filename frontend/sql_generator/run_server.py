@@ -17,6 +17,8 @@ Direct runner for SQL Generator FastAPI application.
 
 This script runs the FastAPI application directly without module imports,
 avoiding the relative import issues.
+
+Set THOTH_WORKERS to run several pre-forked workers (see helpers/prefork.py).
 """
 
 import sys
@@ -45,6 +47,13 @@ if __name__ == "__main__":
     # Disable access logs completely if WARNING or higher
     access_log = log_level <= logging.INFO
     
-    print(f"Starting SQL Generator service on port {port} with log level {logging.getLevelName(log_level)}...")
-    uvicorn.run(app, host="0.0.0.0", port=port, log_config=uvicorn_log_config, access_log=access_log)
+    from helpers.prefork import resolve_workers, serve_prefork
+    workers = resolve_workers()
+
+    print(f"Starting SQL Generator service on port {port} with log level {logging.getLevelName(log_level)} "
+          f"and {workers} worker(s)...")
+    if workers > 1:
+        serve_prefork(app, "0.0.0.0", port, workers, log_config=uvicorn_log_config, access_log=access_log)
+    else:
+        uvicorn.run(app, host="0.0.0.0", port=port, log_config=uvicorn_log_config, access_log=access_log)
 